@@ -9,6 +9,7 @@ nanopb_version = "nanopb-0.4.0-dev"
 import sys
 import re
 import codecs
+import math
 import copy
 from functools import reduce
 
@@ -114,6 +115,40 @@ datatypes = {
     (FieldD.TYPE_UINT64, nanopb_pb2.IS_64):   ('uint64_t','UINT64', 10,  8),
 }
 
+# Value ranges of the C integer types, for min_value and max_value options
+ctype_ranges = {
+    'int8_t':   (-2**7,  2**7 - 1),
+    'int16_t':  (-2**15, 2**15 - 1),
+    'int32_t':  (-2**31, 2**31 - 1),
+    'int64_t':  (-2**63, 2**63 - 1),
+    'uint8_t':  (0, 2**8 - 1),
+    'uint16_t': (0, 2**16 - 1),
+    'uint32_t': (0, 2**32 - 1),
+    'uint64_t': (0, 2**64 - 1),
+}
+
+def int_literal(value, ctype):
+    '''Format an integer constant so that it has the type needed to
+    compare against a value of ctype.'''
+    if ctype.startswith('u'):
+        return str(value) + ('u' if value < 2**32 else 'ull')
+    elif value == -2**63:
+        # 9223372036854775808ll would overflow before negation
+        return '(-9223372036854775807ll - 1)'
+    elif -2**31 < value < 2**31:
+        literal = str(value)
+    else:
+        literal = str(value) + 'll'
+
+    if value < 0:
+        # Negative values are parenthesized so that they can be used
+        # safely in macros, e.g. x-Msg_field_min_value.
+        literal = '(' + literal + ')'
+    return literal
+
+# Initializer values that are all zeros
+zero_initializers = ('0', '""', '{0}', '{0, {0}}', '{NULL, 0}', '{{NULL, 0}, NULL}')
+
 # String types (for python 2 / python 3 compatibility)
 try:
     strtypes = (unicode, str)
@@ -300,6 +335,19 @@ class FieldMaxSize:
         self.checks.extend(extend.checks)
 
 class Field:
+    # Index of the presence bit in has_bits array, or None if the
+    # field has a separate has_ member or no presence at all.
+    has_bit_index = None
+
+    # Range of stored integer values from min_value and max_value options,
+    # and the fixed_point_scale option.
+    min_value = None
+    max_value = None
+    fixed_point_scale = None
+
+    # Set by the callback_items option
+    callback_items = False
+
     def __init__(self, struct_name, desc, field_options):
         '''desc is FieldDescriptorProto'''
         self.tag = desc.number
@@ -315,6 +363,7 @@ class Field:
         self.ctype = None
         self.fixed_count = False
         self.callback_datatype = field_options.callback_datatype
+        self.callback_items = field_options.callback_items
 
         if field_options.type == nanopb_pb2.FT_INLINE:
             # Before nanopb-0.3.8, fixed length bytes arrays were specified
@@ -337,6 +386,9 @@ class Field:
         if desc.HasField('default_value'):
             self.default = desc.default_value
 
+        if field_options.HasField("fixed_point_scale"):
+            self.fixed_point_scale = field_options.fixed_point_scale
+
         # Check field rules, i.e. required/optional/repeated.
         can_be_static = True
         if desc.label == FieldD.LABEL_REPEATED:
@@ -365,6 +417,27 @@ class Field:
         if desc.type == FieldD.TYPE_BYTES and self.max_size is None:
             can_be_static = False
 
+        if field_options.type == nanopb_pb2.FT_VIEW:
+            if desc.type not in (FieldD.TYPE_STRING, FieldD.TYPE_BYTES) or field_options.fixed_length:
+                raise Exception("Field '%s' is defined as view, but only string "
+                                "and bytes fields can be views." % self.name)
+
+            if self.rules == 'REPEATED' and self.max_count is None:
+                raise Exception("Field '%s' is defined as view, but max_count "
+                                "is not given." % self.name)
+
+        if field_options.lazy:
+            if desc.type != FieldD.TYPE_MESSAGE or desc.label == FieldD.LABEL_REPEATED:
+                raise Exception("Field '%s' is defined as lazy, but only non-repeated "
+                                "submessage fields can be lazy." % self.name)
+
+            if field_options.type not in (nanopb_pb2.FT_DEFAULT, nanopb_pb2.FT_STATIC):
+                raise Exception("Field '%s' is defined as lazy, which cannot be "
+                                "combined with the type option." % self.name)
+
+            # Lazy submessages are stored as views to the encoded data
+            field_options.type = nanopb_pb2.FT_VIEW
+
         # Decide how the field data will be allocated
         if field_options.type == nanopb_pb2.FT_DEFAULT:
             if can_be_static:
@@ -386,6 +459,8 @@ class Field:
             self.allocation = 'POINTER'
         elif field_options.type == nanopb_pb2.FT_CALLBACK:
             self.allocation = 'CALLBACK'
+        elif field_options.type == nanopb_pb2.FT_VIEW:
+            self.allocation = 'VIEW'
         else:
             raise NotImplementedError(field_options.type)
 
@@ -393,9 +468,16 @@ class Field:
         if desc.type in datatypes:
             self.ctype, self.pbtype, self.enc_size, self.data_item_size = datatypes[desc.type]
 
+            int_size = field_options.int_size
+            if field_options.HasField("min_value") or field_options.HasField("max_value"):
+                int_size = self.parse_value_range(desc, field_options)
+
             # Override the field size if user wants to use smaller integers
-            if (desc.type, field_options.int_size) in datatypes:
-                self.ctype, self.pbtype, self.enc_size, self.data_item_size = datatypes[(desc.type, field_options.int_size)]
+            if (desc.type, int_size) in datatypes:
+                self.ctype, self.pbtype, self.enc_size, self.data_item_size = datatypes[(desc.type, int_size)]
+
+            if self.min_value is not None:
+                self.enc_size = min(self.enc_size, self.range_encoded_size())
         elif desc.type == FieldD.TYPE_ENUM:
             self.pbtype = 'ENUM'
             self.data_item_size = 4
@@ -406,7 +488,9 @@ class Field:
         elif desc.type == FieldD.TYPE_STRING:
             self.pbtype = 'STRING'
             self.ctype = 'char'
-            if self.allocation == 'STATIC':
+            if self.allocation == 'VIEW':
+                self.ctype = 'pb_bytes_view_t'
+            elif self.allocation == 'STATIC':
                 self.ctype = 'char'
                 self.array_decl += '[%d]' % self.max_size
                 # -1 because of null terminator. Both pb_encode and pb_decode
@@ -426,12 +510,16 @@ class Field:
             else:
                 self.pbtype = 'BYTES'
                 self.ctype = 'pb_bytes_array_t'
-                if self.allocation == 'STATIC':
+                if self.allocation == 'VIEW':
+                    self.ctype = 'pb_bytes_view_t'
+                elif self.allocation == 'STATIC':
                     self.ctype = self.struct_name + self.name + 't'
                     self.enc_size = varint_max_size(self.max_size) + self.max_size
         elif desc.type == FieldD.TYPE_MESSAGE:
             self.pbtype = 'MESSAGE'
             self.ctype = self.submsgname = names_from_type_name(desc.type_name)
+            if self.allocation == 'VIEW':
+                self.ctype = 'pb_lazy_t'
             self.enc_size = None # Needs to be filled in after the message type is available
         else:
             raise NotImplementedError(desc.type)
@@ -459,7 +547,7 @@ class Field:
         elif self.allocation == 'CALLBACK':
             result += '    %s %s;' % (self.callback_datatype, self.name)
         else:
-            if self.rules == 'OPTIONAL':
+            if self.rules == 'OPTIONAL' and self.has_bit_index is None:
                 result += '    bool has_' + self.name + ';\n'
             elif self.rules == 'REPEATED':
                 result += '    pb_size_t ' + self.name + '_count;\n'
@@ -481,18 +569,32 @@ class Field:
         else:
             return []
 
-    def get_initializer(self, null_init, inner_init_only = False):
+    def get_initializer(self, null_init, inner_init_only = False, dependencies = None):
         '''Return literal expression for this field's default value.
         null_init: If True, initialize to a 0 value instead of default from .proto
         inner_init_only: If True, exclude initialization for any count/has fields
+        dependencies: Used for finding out if enum and submessage values are zero
         '''
 
         inner_init = None
-        if self.pbtype == 'MESSAGE':
+        if self.pbtype == 'MESSAGE' and self.allocation == 'VIEW':
+            inner_init = '{{NULL, 0}, NULL}'
+        elif self.pbtype == 'MESSAGE':
             if null_init:
                 inner_init = '%s_init_zero' % self.ctype
             else:
                 inner_init = '%s_init_default' % self.ctype
+        elif self.allocation == 'VIEW':
+            if self.default is None or null_init:
+                inner_init = '{NULL, 0}'
+            else:
+                if self.pbtype == 'STRING':
+                    data = self.default.encode('utf-8')
+                    escaped = codecs.escape_encode(data)[0].decode('ascii')
+                else:
+                    data = codecs.escape_decode(self.default)[0]
+                    escaped = ''.join('\\%03o' % c for c in bytearray(data))
+                inner_init = '{(const pb_byte_t*)"%s", %d}' % (escaped, len(data))
         elif self.default is None or null_init:
             if self.pbtype == 'STRING':
                 inner_init = '""'
@@ -535,12 +637,18 @@ class Field:
             return inner_init
 
         outer_init = None
-        if self.allocation == 'STATIC':
+        if self.allocation in ('STATIC', 'VIEW'):
             if self.rules == 'REPEATED':
-                outer_init = '0, {' + ', '.join([inner_init] * self.max_count) + '}'
+                # Contents of the array are not used while count is 0, so
+                # the rest of the entries can be left zero-initialized.
+                outer_init = '0, {' + inner_init + '}'
             elif self.rules == 'FIXARRAY':
-                outer_init = '{' + ', '.join([inner_init] * self.max_count) + '}'
-            elif self.rules == 'OPTIONAL':
+                if self.initializer_is_zero(null_init, dependencies or {}):
+                    # Rest of the entries are zero-initialized by the compiler
+                    outer_init = '{' + inner_init + '}'
+                else:
+                    outer_init = '{' + ', '.join([inner_init] * self.max_count) + '}'
+            elif self.rules == 'OPTIONAL' and self.has_bit_index is None:
                 outer_init = 'false, ' + inner_init
             else:
                 outer_init = inner_init
@@ -557,6 +665,26 @@ class Field:
 
         return outer_init
 
+    def initializer_is_zero(self, null_init, dependencies):
+        '''Return True if the initial value of this field, or of a single
+        array entry, is all zeros. Arrays of such values can be left to
+        the zero initialization done by the compiler.'''
+        if self.allocation in ('POINTER', 'CALLBACK'):
+            return True
+        elif self.pbtype == 'MESSAGE' and self.allocation == 'STATIC':
+            submsg = dependencies.get(str(self.submsgname))
+            return submsg is not None and submsg.initializer_is_zero(null_init, dependencies)
+        elif self.pbtype in ('ENUM', 'UENUM'):
+            enum = dependencies.get(str(self.ctype))
+            if enum is None:
+                return False
+            elif self.default is None or null_init:
+                return min(v for n, v in enum.values) == 0
+            else:
+                return any(str(n) == str(self.default) and v == 0 for n, v in enum.values)
+        else:
+            return self.get_initializer(null_init, True) in zero_initializers
+
     def tags(self):
         '''Return the #define for the tag number of this field.'''
         identifier = '%s_%s_tag' % (self.struct_name, self.name)
@@ -566,7 +694,64 @@ class Field:
         '''Return the FIELDLIST macro entry for this field.
         Format is: X(a, ATYPE, HTYPE, LTYPE, field_name, tag)
         '''
+        return 'X(a, %s)' % self.fieldlist_args()
+
+    def field_info(self, width):
+        '''Return the PB_FIELDINFO_ entry for this field, with the offsets
+        given directly instead of through the FIELDLIST expansion in
+        PB_BIND. This is used by the --plain-descriptors option.'''
+        rules = self.rules
+        if self.has_bit_index is not None:
+            rules = 'SINGULAR'
+
+        if self.rules == 'ONEOF' and not self.anonymous:
+            member = self.union_name + '.' + self.name
+        else:
+            member = self.name
+
+        struct_name = self.struct_name
+        array = rules in ('REPEATED', 'FIXARRAY')
+        if self.allocation == 'POINTER' or (array and self.allocation != 'CALLBACK'):
+            data_size = 'pb_membersize(%s, %s[0])' % (struct_name, member)
+        else:
+            data_size = 'pb_membersize(%s, %s)' % (struct_name, member)
+
+        size_offset = '0'
+        if self.allocation != 'CALLBACK':
+            if rules == 'ONEOF':
+                size_offset = 'pb_delta(%s, %s, which_%s)' % (struct_name, member, self.union_name)
+            elif rules == 'REPEATED':
+                size_offset = 'pb_delta(%s, %s, %s_count)' % (struct_name, member, self.name)
+            elif rules == 'OPTIONAL' and self.allocation != 'POINTER':
+                size_offset = 'pb_delta(%s, %s, has_%s)' % (struct_name, member, self.name)
+
+        if array and self.allocation in ('STATIC', 'VIEW'):
+            array_size = 'pb_arraysize(%s, %s)' % (struct_name, member)
+        else:
+            array_size = '1'
+
+        if width == 'AUTO':
+            # Same choice as PB_FIELDINFO_WIDTH_AUTO
+            if (self.allocation == 'CALLBACK' or array or
+                    self.pbtype in ('BYTES', 'MESSAGE', 'STRING', 'FIXED_LENGTH_BYTES')):
+                width = 2
+            else:
+                width = 1
+
+        return '(%d, PB_ATYPE_%s | PB_HTYPE_%s | PB_LTYPE_MAP_%s, offsetof(%s, %s), %s, %s, %s)' % (
+            self.tag, self.allocation, rules, self.pbtype, struct_name, member,
+            data_size, size_offset, array_size), width
+
+    def fieldlist_args(self):
+        '''Return the ATYPE, HTYPE, LTYPE, field_name, tag arguments
+        used in FIELDLIST macro entries.'''
         name = self.name
+        rules = self.rules
+
+        if self.has_bit_index is not None:
+            # Without has_ member the descriptor is the same as for a
+            # singular field, the presence is found from has_bits.
+            rules = 'SINGULAR'
 
         if self.rules == "ONEOF":
           # For oneofs, make a tuple of the union name, union member name,
@@ -576,7 +761,7 @@ class Field:
           else:
             name = '(%s,%s,%s)' % (self.union_name, self.name, self.name)
 
-        return 'X(a, %s, %s, %s, %s, %d)' % (self.allocation, self.rules, self.pbtype, name, self.tag)
+        return '%s, %s, %s, %s, %d' % (self.allocation, rules, self.pbtype, name, self.tag)
 
     def data_size(self, dependencies):
         '''Return estimated size of this field in the C struct.
@@ -588,6 +773,8 @@ class Field:
             size = 8
         elif self.allocation == 'CALLBACK':
             size = 16
+        elif self.allocation == 'VIEW':
+            size = 16
         elif self.pbtype == 'MESSAGE':
             if str(self.submsgname) in dependencies:
                 size = dependencies[str(self.submsgname)].data_size(dependencies)
@@ -602,7 +789,7 @@ class Field:
         else:
             raise Exception("Unhandled field type: %s" % self.pbtype)
 
-        if self.rules in ['REPEATED', 'FIXARRAY'] and self.allocation == 'STATIC':
+        if self.rules in ['REPEATED', 'FIXARRAY'] and self.allocation in ('STATIC', 'VIEW'):
             size *= self.max_count
 
         if self.rules not in ('REQUIRED', 'SINGULAR'):
@@ -614,6 +801,46 @@ class Field:
 
         return size
 
+    def struct_members(self, size_t_bytes):
+        '''Return estimated (size, alignment) of each C struct member that
+        this field generates, in declaration order. The has_ or _count
+        member comes before the field data. size_t_bytes is the assumed
+        size of pb_size_t. Used for ordering the struct members with the
+        optimize_layout option.'''
+        members = []
+        if self.allocation in ('STATIC', 'VIEW'):
+            if self.rules == 'OPTIONAL' and self.has_bit_index is None:
+                members.append((1, 1))
+            elif self.rules == 'REPEATED':
+                members.append((size_t_bytes, size_t_bytes))
+        elif self.allocation == 'POINTER' and self.rules == 'REPEATED':
+            members.append((size_t_bytes, size_t_bytes))
+
+        if self.allocation == 'POINTER' or self.pbtype == 'EXTENSION':
+            size, align = 8, 8
+        elif self.allocation in ('CALLBACK', 'VIEW'):
+            size, align = 16, 8
+        elif self.pbtype == 'MESSAGE':
+            # Submessages may contain pointers. The size of a struct is a
+            # multiple of its alignment, so it does not affect padding.
+            size, align = 8, 8
+        elif self.pbtype in ('STRING', 'FIXED_LENGTH_BYTES'):
+            size, align = self.max_size, 1
+        elif self.pbtype == 'BYTES':
+            # PB_BYTES_ARRAY_T has a pb_size_t member before the data
+            align = size_t_bytes
+            size = (size_t_bytes + self.max_size + align - 1) // align * align
+        elif self.ctype == 'bool':
+            size, align = 1, 1
+        else:
+            size, align = self.data_item_size, self.data_item_size
+
+        if self.rules in ('REPEATED', 'FIXARRAY') and self.allocation in ('STATIC', 'VIEW'):
+            size *= self.max_count
+
+        members.append((size, align))
+        return members
+
     def encoded_size(self, dependencies):
         '''Return the maximum size that this field can take when encoded,
         including the field tag. If the size cannot be determined, returns
@@ -679,12 +906,253 @@ class Field:
 
         return encsize
 
+    def parse_value_range(self, desc, field_options):
+        '''Store the range of integer values given by min_value, max_value
+        and fixed_point_scale options. Returns the int_size to use, which
+        is the smallest one that covers the range unless int_size has been
+        given explicitly.'''
+        if self.pbtype not in ('INT32', 'INT64', 'SINT32', 'SINT64', 'UINT32', 'UINT64'):
+            raise Exception("Field '%s' has min_value or max_value option, "
+                            "which is only supported for varint integer types." % self.name)
+
+        scale = self.fixed_point_scale or 1
+        type_min, type_max = ctype_ranges[self.ctype]
+        min_value, max_value = type_min, type_max
+        if field_options.HasField("min_value"):
+            min_value = int(math.floor(field_options.min_value * scale))
+        if field_options.HasField("max_value"):
+            max_value = int(math.ceil(field_options.max_value * scale))
+
+        if min_value < type_min or max_value > type_max or min_value > max_value:
+            raise Exception("Field '%s' has invalid value range %d to %d for type %s."
+                            % (self.name, min_value, max_value, self.pbtype.lower()))
+
+        self.min_value = min_value
+        self.max_value = max_value
+
+        if field_options.int_size != nanopb_pb2.IS_DEFAULT:
+            ctype = datatypes[(desc.type, field_options.int_size)][0]
+            size_min, size_max = ctype_ranges[ctype]
+            if min_value < size_min or max_value > size_max:
+                raise Exception("Value range of field '%s' does not fit in %s given by int_size."
+                                % (self.name, ctype))
+            return field_options.int_size
+
+        for int_size in (nanopb_pb2.IS_8, nanopb_pb2.IS_16, nanopb_pb2.IS_32, nanopb_pb2.IS_64):
+            size_min, size_max = ctype_ranges[datatypes[(desc.type, int_size)][0]]
+            if size_min <= min_value and max_value <= size_max:
+                return int_size
+
+    def range_encoded_size(self):
+        '''Maximum encoded size of a value within min_value..max_value.'''
+        if self.pbtype in ('SINT32', 'SINT64'):
+            zigzag = max(2 * v if v >= 0 else -2 * v - 1 for v in (self.min_value, self.max_value))
+            return varint_max_size(zigzag)
+        elif self.min_value < 0:
+            # Negative values of int32 and int64 are encoded as 64-bit
+            return 10
+        else:
+            return varint_max_size(self.max_value)
+
+    def range_defines(self):
+        '''Return the #defines for value range and scale of the field.'''
+        result = ''
+        if self.min_value is not None:
+            identifier = '%s_%s_min_value' % (self.struct_name, self.name)
+            result += '#define %-40s %s\n' % (identifier, int_literal(self.min_value, self.ctype))
+            identifier = '%s_%s_max_value' % (self.struct_name, self.name)
+            result += '#define %-40s %s\n' % (identifier, int_literal(self.max_value, self.ctype))
+        if self.fixed_point_scale:
+            identifier = '%s_%s_scale' % (self.struct_name, self.name)
+            result += '#define %-40s %r\n' % (identifier, float(self.fixed_point_scale))
+        return result
+
+    def range_check(self, dependencies):
+        '''Return the C code that checks the value range of this field, and
+        of the fields of its submessage, in the _check_ranges function.'''
+        if self.allocation != 'STATIC':
+            return ''
+
+        if self.rules == 'ONEOF' and not self.anonymous:
+            member = 'msg->%s.%s' % (self.union_name, self.name)
+        else:
+            member = 'msg->%s' % self.name
+
+        if self.rules in ('REPEATED', 'FIXARRAY'):
+            member += '[i]'
+
+        if self.min_value is not None:
+            type_min, type_max = ctype_ranges[self.ctype]
+            conditions = []
+            if self.min_value > type_min:
+                conditions.append('%s < %s' % (member, int_literal(self.min_value, self.ctype)))
+            if self.max_value < type_max:
+                conditions.append('%s > %s' % (member, int_literal(self.max_value, self.ctype)))
+            if not conditions:
+                return ''
+            check = ' || '.join(conditions)
+        elif self.pbtype == 'MESSAGE':
+            submsg = dependencies.get(str(self.submsgname))
+            if submsg is None or not submsg.has_range_checks(dependencies):
+                return ''
+            check = '!%s_check_ranges(&%s)' % (self.submsgname, member)
+        else:
+            return ''
+
+        if self.rules == 'OPTIONAL':
+            if self.has_bit_index is not None:
+                check = 'PB_HAS_BIT(msg->has_bits, %d) && (%s)' % (self.has_bit_index, check)
+            else:
+                check = 'msg->has_%s && (%s)' % (self.name, check)
+        elif self.rules == 'ONEOF':
+            check = 'msg->which_%s == %s_%s_tag && (%s)' % (self.union_name, self.struct_name, self.name, check)
+
+        result = ''
+        indent = '    '
+        if self.rules == 'REPEATED':
+            result += '    for (i = 0; i < msg->%s_count; i++)\n' % self.name
+            indent += '    '
+        elif self.rules == 'FIXARRAY':
+            result += '    for (i = 0; i < %d; i++)\n' % self.max_count
+            indent += '    '
+        result += '%sif (%s)\n' % (indent, check)
+        result += '%s    return false;\n' % indent
+        return result
+
     def requires_custom_field_callback(self):
         if self.allocation == 'CALLBACK' and self.callback_datatype != 'pb_callback_t':
             return True
         else:
             return False
 
+    def lazy_accessor(self):
+        '''Return the #define for the accessor of a lazy submessage field.'''
+        if self.pbtype != 'MESSAGE' or self.allocation != 'VIEW':
+            return ''
+
+        if self.rules == 'ONEOF' and not self.anonymous:
+            member = '%s.%s' % (self.union_name, self.name)
+        else:
+            member = self.name
+
+        identifier = '%s_%s_get(msg, dest)' % (self.struct_name, self.name)
+        return '#define %-40s ((%s*)pb_decode_lazy(&(msg)->%s, &%s_msg, (dest)))\n' % (
+            identifier, self.submsgname, member, self.submsgname)
+
+    def has_callback_items(self):
+        '''Check if element-by-element functions are generated for this
+        field. Strings and bytes have no fixed size storage for an element.'''
+        return (self.callback_items and self.allocation == 'CALLBACK' and
+                self.rules == 'REPEATED' and
+                self.pbtype not in ('STRING', 'BYTES', 'FIXED_LENGTH_BYTES', 'EXTENSION'))
+
+    def callback_items_prototypes(self):
+        '''Return the prototypes of the functions that decode and encode
+        the elements of a repeated callback field one at a time.'''
+        if not self.has_callback_items():
+            return []
+
+        identifier = '%s_%s' % (self.struct_name, self.name)
+        return ['bool %s_foreach(pb_istream_t *stream, const pb_field_iter_t *field, '
+                'bool (*fn)(const %s *item, void *ctx), void *ctx)' % (identifier, self.ctype),
+                'bool %s_encode_items(pb_ostream_t *stream, const pb_field_iter_t *field, '
+                'bool (*next)(%s *item, void *ctx), void *ctx)' % (identifier, self.ctype)]
+
+    def callback_items_definitions(self):
+        '''Return the definitions of the functions from callback_items_prototypes().'''
+        prototypes = self.callback_items_prototypes()
+        if not prototypes:
+            return ''
+
+        result = prototypes[0] + '\n{\n'
+        if self.pbtype == 'MESSAGE':
+            # The decode callback gets a stream with one submessage
+            result += '    %s item = %s_init_zero;\n' % (self.ctype, self.ctype)
+            result += '    return pb_decode_callback_item(stream, field, &item, sizeof(item)) && fn(&item, ctx);\n'
+        else:
+            # One element for unpacked fields, all of them for packed fields
+            result += '    %s item;\n' % self.ctype
+            result += '    while (stream->bytes_left > 0)\n'
+            result += '    {\n'
+            result += '        if (!pb_decode_callback_item(stream, field, &item, sizeof(item)) || !fn(&item, ctx))\n'
+            result += '            return false;\n'
+            result += '    }\n'
+            result += '    return true;\n'
+        result += '}\n\n'
+
+        result += prototypes[1] + '\n{\n'
+        result += '    %s item;\n' % self.ctype
+        result += '    while (next(&item, ctx))\n'
+        result += '    {\n'
+        result += '        if (!pb_encode_callback_item(stream, field, &item, sizeof(item)))\n'
+        result += '            return false;\n'
+        result += '    }\n'
+        result += '    return true;\n'
+        result += '}\n\n'
+        return result
+
+    def arena_size(self, dependencies, visited = ()):
+        '''Return list of terms for the worst-case pb_arena_t usage when
+        decoding this field, or None if it cannot be determined.'''
+        if self.pbtype == 'MESSAGE' and self.allocation in ('STATIC', 'POINTER'):
+            if str(self.submsgname) in visited:
+                return None # Recursive message, size is not bounded
+            if str(self.submsgname) not in dependencies:
+                return None # Message is in other file and not known
+            submsg = dependencies[str(self.submsgname)]
+            subsize = submsg.arena_size(dependencies, visited)
+            if subsize is None:
+                return None
+        else:
+            subsize = []
+
+        count = 1
+        if self.rules in ['REPEATED', 'FIXARRAY']:
+            count = self.max_count
+
+        def repeat(terms):
+            if count == 1 or not terms:
+                return terms
+            return ['%d * (%s)' % (count, ' + '.join(terms))]
+
+        if self.allocation == 'STATIC':
+            return repeat(subsize)
+        elif self.allocation != 'POINTER':
+            return []
+
+        if self.pbtype == 'STRING':
+            if self.max_size is None:
+                return None
+            item = 'PB_ARENA_ALLOCSIZE(%d)' % self.max_size
+        elif self.pbtype == 'BYTES':
+            if self.max_size is None:
+                return None
+            item = 'PB_ARENA_ALLOCSIZE(PB_BYTES_ARRAY_T_ALLOCSIZE(%d))' % self.max_size
+        else:
+            item = None
+
+        if self.pbtype == 'FIXED_LENGTH_BYTES':
+            elemsize = 'sizeof(pb_byte_t[%d])' % self.max_size
+        else:
+            elemsize = 'sizeof(%s)' % self.ctype
+
+        if self.rules in ['REPEATED', 'FIXARRAY']:
+            if count is None:
+                return None
+
+            if item is not None:
+                elemsize = 'sizeof(void*)'
+
+            terms = ['PB_ARENA_ARRAYSIZE(%d, %s, %d)' % (count, elemsize, count.bit_length() + 1)]
+            if item is not None:
+                terms += repeat([item])
+        elif item is not None:
+            terms = [item]
+        else:
+            terms = ['PB_ARENA_ALLOCSIZE(%s)' % elemsize]
+
+        return terms + repeat(subsize)
+
 
 class ExtensionRange(Field):
     def __init__(self, struct_name, range_start, field_options):
@@ -726,6 +1194,10 @@ class ExtensionRange(Field):
         # way the value remains useful if extensions are not used.
         return EncodedSize(0)
 
+    def arena_size(self, dependencies, visited = ()):
+        # Extensions are similarly excluded, they have their own storage.
+        return []
+
 class ExtensionField(Field):
     def __init__(self, fullname, desc, field_options):
         self.fullname = fullname
@@ -826,8 +1298,21 @@ class OneOf(Field):
             deps += f.get_dependencies()
         return deps
 
-    def get_initializer(self, null_init):
-        return '0, {' + self.fields[0].get_initializer(null_init) + '}'
+    def get_initializer(self, null_init, dependencies = None):
+        return '0, {' + self.fields[0].get_initializer(null_init, dependencies = dependencies) + '}'
+
+    def initializer_is_zero(self, null_init, dependencies):
+        return self.fields[0].initializer_is_zero(null_init, dependencies)
+
+    def struct_members(self, size_t_bytes):
+        size = 0
+        align = 1
+        for f in self.fields:
+            fsize, falign = f.struct_members(size_t_bytes)[-1]
+            size = max(size, fsize)
+            align = max(align, falign)
+        size = (size + align - 1) // align * align
+        return [(size_t_bytes, size_t_bytes), (size, align)]
 
     def tags(self):
         return ''.join([f.tags() for f in self.fields])
@@ -838,6 +1323,16 @@ class OneOf(Field):
     def data_size(self, dependencies):
         return max(f.data_size(dependencies) for f in self.fields)
 
+    def arena_size(self, dependencies, visited = ()):
+        '''Each member of the union could get allocated in turn.'''
+        terms = []
+        for f in self.fields:
+            fsize = f.arena_size(dependencies, visited)
+            if fsize is None:
+                return None
+            terms += fsize
+        return terms
+
     def encoded_size(self, dependencies):
         '''Returns the size of the largest oneof field.'''
         largest = 0
@@ -874,6 +1369,13 @@ class OneOf(Field):
 
 
 class Message:
+    # Earlier message with identical structure, whose field descriptor
+    # arrays are shared with this one (--dedup-descriptors).
+    alias_of = None
+
+    # Generate descriptor arrays without PB_BIND (--plain-descriptors).
+    plain_descriptor = False
+
     def __init__(self, names, desc, message_options):
         self.name = names
         self.fields = []
@@ -897,6 +1399,22 @@ class Message:
 
         self.packed = message_options.packed_struct
         self.descriptorsize = message_options.descriptorsize
+        self.expanded_descriptor = message_options.expanded_descriptor and bool(self.fields)
+        self.optimize_layout = message_options.optimize_layout
+        self.generate_field_indexes = message_options.field_indexes
+        self.generate_equal_macro = message_options.equal_macro
+        self.default_instance = message_options.default_instance
+
+        self.has_bits_words = 0
+        if message_options.has_bits and any(f.rules == 'SINGULAR' for f in self.descriptor_fields()):
+            # The runtime cannot tell proto3 singular fields apart from
+            # optional fields that have their presence in has_bits.
+            sys.stderr.write('Note: has_bits option ignored for %s, which has proto3 singular fields\n' % self.name)
+        elif message_options.has_bits:
+            for index, field in enumerate(self.descriptor_fields()):
+                if field.rules == 'OPTIONAL' and field.allocation in ('STATIC', 'VIEW'):
+                    field.has_bit_index = index
+                    self.has_bits_words = index // 32 + 1
 
     def load_fields(self, desc, message_options):
         '''Load field list from DescriptorProto'''
@@ -954,7 +1472,10 @@ class Message:
             # Therefore add a dummy field if an empty message occurs.
             result += '    char dummy_field;'
 
-        result += '\n'.join([str(f) for f in sorted(self.fields)])
+        if self.has_bits_words:
+            result += '    uint32_t has_bits[%d];\n' % self.has_bits_words
+
+        result += '\n'.join([str(f) for f in self.layout_fields()])
         result += '\n/* @@protoc_insertion_point(struct:%s) */' % self.name
         result += '\n}'
 
@@ -972,15 +1493,80 @@ class Message:
     def types(self):
         return ''.join([f.types() for f in self.fields])
 
-    def get_initializer(self, null_init):
+    def get_initializer(self, null_init, dependencies = None):
         if not self.fields:
             return '{0}'
 
         parts = []
-        for field in sorted(self.fields):
-            parts.append(field.get_initializer(null_init))
+        if self.has_bits_words:
+            parts.append('{0}')
+        for field in self.layout_fields():
+            parts.append(field.get_initializer(null_init, dependencies = dependencies))
         return '{' + ', '.join(parts) + '}'
 
+    def initializer_is_zero(self, null_init, dependencies):
+        '''Return True if the initializer of the message is all zeros.'''
+        return all(f.initializer_is_zero(null_init, dependencies) for f in self.fields)
+
+    def layout_fields(self):
+        '''Return the fields in the order they are declared in the struct.
+        This is the tag order, unless the optimize_layout option finds an
+        order with less padding. The has_ and _count members stay right
+        before their data, as the descriptor stores their offset relative
+        to it. The reordering is only used if the simulated struct is not
+        larger with either 16-bit or 32-bit pb_size_t.'''
+        result = sorted(self.fields)
+        if not self.optimize_layout:
+            return result
+
+        best = self.struct_sizes(result)
+        candidates = [self.packed_order(2), self.packed_order(4),
+                      sorted(result, key = lambda f: -f.struct_members(2)[-1][1])]
+        for candidate in candidates:
+            sizes = self.struct_sizes(candidate)
+            if sizes != best and all(x <= y for x, y in zip(sizes, best)):
+                result = candidate
+                best = sizes
+
+        return result
+
+    def struct_sizes(self, fields):
+        '''Return simulated sizeof(struct) with fields in the given order,
+        as a tuple for 16-bit and 32-bit pb_size_t.'''
+        sizes = []
+        for size_t_bytes in (2, 4):
+            offset = 4 * self.has_bits_words
+            max_align = 4 if self.has_bits_words else 1
+            for field in fields:
+                for size, align in field.struct_members(size_t_bytes):
+                    offset = (offset + align - 1) // align * align + size
+                    max_align = max(max_align, align)
+            sizes.append((offset + max_align - 1) // max_align * max_align)
+        return tuple(sizes)
+
+    def packed_order(self, size_t_bytes):
+        '''Order the fields greedily, always picking next the field that
+        needs the least padding at the current offset. Ties are broken by
+        larger alignment first, and then by tag number.'''
+        offset = 4 * self.has_bits_words
+        remaining = sorted(self.fields)
+        result = []
+        while remaining:
+            choices = []
+            for field in remaining:
+                members = field.struct_members(size_t_bytes)
+                pos = offset
+                padding = 0
+                for size, align in members:
+                    aligned = (pos + align - 1) // align * align
+                    padding += aligned - pos
+                    pos = aligned + size
+                choices.append((padding, -members[-1][1], field.tag, pos, field))
+            padding, align, tag, offset, field = min(choices, key = lambda c: c[:3])
+            remaining.remove(field)
+            result.append(field)
+        return result
+
     def count_required_fields(self):
         '''Returns number of required fields inside this message'''
         count = 0
@@ -990,6 +1576,16 @@ class Message:
                     count += 1
         return count
 
+    def descriptor_fields(self):
+        '''Iterate over fields in the order of the FIELDLIST macro and
+        the field descriptor, with oneof members in place of the oneof.'''
+        for f in sorted(self.fields):
+            if isinstance(f, OneOf):
+                for f2 in f.fields:
+                    yield f2
+            else:
+                yield f
+
     def all_fields(self):
         '''Iterate over all fields in this message, including nested OneOfs.'''
         for f in self.fields:
@@ -1017,6 +1613,20 @@ class Message:
                 count += 1
         return count
 
+    def field_indexes(self):
+        '''Return the #defines for the field indexes used in the bits of
+        pb_field_mask_t, and the number of words needed for them.'''
+        result = ''
+        count = 0
+        for index, field in enumerate(self.descriptor_fields()):
+            count = index + 1
+            if not isinstance(field, ExtensionRange):
+                identifier = '%s_%s_index' % (field.struct_name, field.name)
+                result += '#define %-40s %d\n' % (identifier, index)
+        identifier = '%s_MASK_WORDS' % self.name
+        result += '#define %-40s %d\n' % (identifier, max(1, (count + 31) // 32))
+        return result
+
     def fields_declaration(self, dependencies):
         '''Return X-macro declaration of all fields in this message.'''
         result = '#define %s_FIELDLIST(X, a) \\\n' % (self.name)
@@ -1032,19 +1642,38 @@ class Message:
             result += "#define %s_CALLBACK NULL\n" % self.name
 
         defval = self.default_value(dependencies)
-        if defval:
+        if self.alias_of:
+            result += '#define %s_DEFAULT %s_DEFAULT\n' % (self.name, self.alias_of.name)
+        elif defval:
             hexcoded = ''.join("\\x%02x" % ord(defval[i:i+1]) for i in range(len(defval)))
             result += '#define %s_DEFAULT (const uint8_t*)"%s\\x00"\n' % (self.name, hexcoded)
         else:
             result += '#define %s_DEFAULT NULL\n' % self.name
 
+        if self.alias_of:
+            result += '#define %s_DEFAULT_INSTANCE %s_DEFAULT_INSTANCE\n' % (self.name, self.alias_of.name)
+        elif self.has_default_instance(dependencies):
+            result += '#define %s_DEFAULT_INSTANCE &%s_default_instance\n' % (self.name, self.name)
+        else:
+            result += '#define %s_DEFAULT_INSTANCE NULL\n' % self.name
+
+        if self.expanded_descriptor:
+            result += '#define %s_FIELD_RECORDS %s_field_records\n' % (self.name, self.name)
+        else:
+            result += '#define %s_FIELD_RECORDS NULL\n' % self.name
+
+        if self.has_bits_words:
+            result += '#define %s_MSGFLAGS PB_MSGFLAG_HAS_BITS\n' % self.name
+        else:
+            result += '#define %s_MSGFLAGS 0\n' % self.name
+
         for field in sorted(self.fields):
             if field.pbtype == 'MESSAGE':
-                result += "#define %s_%s_MSGTYPE %s\n" % (self.name, field.name, field.ctype)
+                result += "#define %s_%s_MSGTYPE %s\n" % (self.name, field.name, field.submsgname)
             elif field.rules == 'ONEOF':
                 for member in field.fields:
                     if member.pbtype == 'MESSAGE':
-                        result += "#define %s_%s_%s_MSGTYPE %s\n" % (self.name, member.union_name, member.name, member.ctype)
+                        result += "#define %s_%s_%s_MSGTYPE %s\n" % (self.name, member.union_name, member.name, member.submsgname)
 
         return result
 
@@ -1064,9 +1693,131 @@ class Message:
         if width == 1:
           width = 'AUTO'
 
-        result = 'PB_BIND(%s, %s, %s)\n' % (self.name, self.name, width)
+        result = ''
+        if self.alias_of:
+            result += 'PB_BIND_ALIAS(%s, %s, %s)\n' % (self.name, self.name, self.alias_of.name)
+        else:
+            if self.has_default_instance(dependencies):
+                result += 'const %s %s_default_instance = %s_init_default;\n' % (self.name, self.name, self.name)
+
+            if self.expanded_descriptor:
+                result += self.field_records_definition()
+
+            if self.plain_descriptor:
+                result += self.plain_fields_definition(width)
+            elif (self.has_default_instance(dependencies) or
+                  self.expanded_descriptor or self.has_bits_words):
+                result += 'PB_BIND_EXT(%s, %s, %s)\n' % (self.name, self.name, width)
+            else:
+                result += 'PB_BIND(%s, %s, %s)\n' % (self.name, self.name, width)
+
+        if self.has_range_checks(dependencies):
+            result += '\n' + self.range_check_definition(dependencies)
+
         return result
 
+    def plain_fields_definition(self, width):
+        '''Return the field_info and submsg_info arrays and the message
+        descriptor as plain initializers, equivalent to PB_BIND.'''
+        entries = [field.field_info(width) for field in self.descriptor_fields()]
+
+        result = 'const uint32_t %s_field_info[] =\n{\n' % self.name
+        for args, field_width in entries:
+            result += '    PB_FIELDINFO_%d%s\n' % (field_width, args)
+        result += '    0\n};\n'
+
+        result += 'const pb_msgdesc_t* %s_submsg_info[] =\n{\n' % self.name
+        for field in self.descriptor_fields():
+            if field.pbtype == 'MESSAGE':
+                result += '    &%s_msg,\n' % field.submsgname
+        result += '    NULL\n};\n'
+
+        result += 'const pb_msgdesc_t %s_msg =\n{\n' % self.name
+        result += '    %d,\n' % len(entries)
+        result += '    %d,\n' % len([f for f in self.descriptor_fields() if f.rules == 'REQUIRED'])
+        result += '    %s_field_info,\n' % self.name
+        result += '    %s_submsg_info,\n' % self.name
+        result += '    %s_DEFAULT,\n' % self.name
+        result += '    %s_CALLBACK,\n' % self.name
+        result += '    %s_DEFAULT_INSTANCE,\n' % self.name
+        result += '    sizeof(%s),\n' % self.name
+        result += '    %s_FIELD_RECORDS,\n' % self.name
+        result += '    %s_MSGFLAGS,\n' % self.name
+        result += '};\n'
+
+        for args, field_width in entries:
+            result += 'PB_FIELDINFO_ASSERT_%d%s\n' % (field_width, args)
+        return result
+
+    def field_records_definition(self):
+        '''Return the array of unpacked field records for the
+        expanded_descriptor option. The entries are in the same order
+        as in the FIELDLIST macro.'''
+        result = 'const pb_field_record_t %s_field_records[] =\n{\n' % self.name
+        submsg_index = 0
+        required_index = 0
+        for field in self.descriptor_fields():
+            result += '    PB_FIELD_RECORD(%s, %s, %d, %d),\n' % (self.name, field.fieldlist_args(), submsg_index, required_index)
+            if field.pbtype == 'MESSAGE':
+                submsg_index += 1
+            if field.rules == 'REQUIRED':
+                required_index += 1
+
+        result += '};\n'
+        return result
+
+    def structure_key(self, dependencies):
+        '''Return a value that is equal for messages that have the same
+        fields, struct layout and default values, and can therefore share
+        the field descriptor arrays.'''
+        return (tuple(str(field) for field in self.layout_fields()),
+                tuple(field.fieldlist() for field in sorted(self.fields)),
+                self.has_bits_words,
+                self.default_value(dependencies),
+                self.has_default_instance(dependencies),
+                self.callback_function,
+                self.required_descriptor_width(dependencies))
+
+    def has_range_checks(self, dependencies):
+        '''Return True if the message or its static submessages have
+        fields with min_value or max_value options.'''
+        return any(field.range_check(dependencies) for field in self.descriptor_fields())
+
+    def range_check_definition(self, dependencies):
+        '''Return the definition of the _check_ranges function.'''
+        fields = list(self.descriptor_fields())
+        checks = [field.range_check(dependencies) for field in fields]
+        result = 'bool %s_check_ranges(const %s *msg)\n{\n' % (self.name, self.name)
+        if any(field.rules in ('REPEATED', 'FIXARRAY') and check
+               for field, check in zip(fields, checks)):
+            result += '    pb_size_t i;\n'
+        result += ''.join(checks)
+        result += '    return true;\n'
+        result += '}\n'
+        return result
+
+    def has_default_instance(self, dependencies):
+        '''Return True if the default_instance option is enabled and the
+        message can be initialized by copying a constant instance.'''
+        return self.default_instance and self.is_all_static(dependencies)
+
+    def is_all_static(self, dependencies):
+        '''Return True if all fields, including those of submessages,
+        are statically allocated.'''
+        if not self.desc:
+            return False
+
+        for field in self.all_fields():
+            if field.allocation not in ('STATIC', 'VIEW'):
+                return False
+
+            if field.pbtype == 'MESSAGE' and field.allocation == 'STATIC':
+                submsg = dependencies.get(str(field.submsgname))
+                if submsg is None or not submsg.is_all_static(dependencies):
+                    return False
+
+        return True
+
     def required_descriptor_width(self, dependencies):
         '''Estimate how many words are necessary for each field descriptor.'''
         if self.descriptorsize != nanopb_pb2.DS_AUTO:
@@ -1096,7 +1847,10 @@ class Message:
 
     def data_size(self, dependencies):
         '''Return approximate sizeof(struct) in the compiled code.'''
-        return sum(f.data_size(dependencies) for f in self.fields)
+        # The optimize_layout option never makes the struct larger, so the
+        # estimate for the tag order applies to it also.
+        size = 4 * self.has_bits_words
+        return size + sum(f.data_size(dependencies) for f in self.fields)
 
     def encoded_size(self, dependencies):
         '''Return the maximum size that this message can take when encoded.
@@ -1111,6 +1865,25 @@ class Message:
 
         return size
 
+    def arena_size(self, dependencies, visited = ()):
+        '''Return list of terms for the worst-case pb_arena_t usage when
+        decoding this message, or None if it cannot be determined. Terms of
+        submessages are replaced with references to their own define.'''
+        visited = visited + (str(self.name),)
+        terms = []
+        for field in self.fields:
+            fsize = field.arena_size(dependencies, visited)
+            if fsize is None:
+                return None
+            terms += fsize
+
+        if not terms:
+            return []
+        elif visited[0] == str(self.name):
+            return terms
+        else:
+            return ['%s_arena_size' % self.name]
+
     def default_value(self, dependencies):
         '''Generate serialized protobuf message that contains the
         default values for optional fields.'''
@@ -1128,7 +1901,7 @@ class Message:
         # The iteration is done in reverse order to avoid remove() messing up iteration.
         for field in reversed(list(optional_only.field)):
             parsed_field = self.field_for_tag(field.number)
-            if parsed_field is None or parsed_field.allocation != 'STATIC':
+            if parsed_field is None or parsed_field.allocation not in ('STATIC', 'VIEW'):
                 optional_only.field.remove(field)
             elif (field.label == FieldD.LABEL_REPEATED or
                   field.type == FieldD.TYPE_MESSAGE or
@@ -1358,148 +2131,376 @@ class ProtoFile:
                         if field.pbtype == 'ENUM' and field.ctype == enum.names:
                             field.pbtype = 'UENUM'
 
+    def find_identical_messages(self):
+        '''Find messages that are structurally identical to an earlier
+        message in the same file, and mark them to share its descriptor.'''
+        seen = {}
+        for msg in self.messages:
+            if msg.expanded_descriptor:
+                continue
+
+            key = msg.structure_key(self.dependencies)
+            if key in seen:
+                msg.alias_of = seen[key]
+            else:
+                seen[key] = msg
+
     def generate_header(self, includes, headername, options):
         '''Generate content for a header file.
         Generates strings, which should be concatenated and stored to file.
         '''
 
-        yield '/* Automatically generated nanopb header */\n'
+        for part in self.header_begin(includes, headername, options):
+            yield part
+
+        for part in self.header_body(self.enums, self.messages, self.extensions):
+            yield part
+
+        for part in self.msgid_declarations(headername, self.messages):
+            yield part
+
+        for part in self.header_end(self.messages, options):
+            yield part
+
+    def generate_split_headers(self, includes, headername, header_names, options):
+        '''Generate an umbrella header and separate headers for enums
+        and each message. header_names maps message names and the special
+        key None for the enum header to the #include names of the headers.
+
+        Returns a list of (key, data) where key is None for the enum header,
+        message name for message headers and '' for the umbrella header.
+        '''
+        results = []
+        local_includes = []
+        if self.enums:
+            enum_header = header_names[None]
+            data = self.header_begin(includes, enum_header, options)
+            data += self.header_body(self.enums, [], [])
+            data += self.header_end([], options)
+            results.append((None, ''.join(data)))
+            local_includes.append(enum_header)
+
+        static_deps = dict((str(msg.name), set(msg.get_dependencies())) for msg in self.messages)
+
+        def contains(name, other):
+            '''Check if struct name contains struct other, directly or
+            through its submessages.'''
+            todo = [name]
+            seen = set()
+            while todo:
+                deps = static_deps.get(todo.pop(), set()) - seen
+                if other in deps:
+                    return True
+                seen |= deps
+                todo += list(deps)
+            return False
+
+        for msg in self.messages:
+            # Include only the headers of messages in this file that
+            # the struct depends on. Accessors of lazy fields also need the
+            # submessage declarations, unless the submessage struct contains
+            # this one, in which case its header has to be included instead.
+            lazy_deps = set(str(field.submsgname) for field in msg.all_fields()
+                            if field.lazy_accessor())
+            deps = []
+            for depmsg in sort_dependencies(self.messages):
+                depname = str(depmsg.name)
+                if depmsg is msg:
+                    continue
+                elif (depname in static_deps[str(msg.name)] or
+                      (depname in lazy_deps and not contains(depname, str(msg.name)))):
+                    deps.append(header_names[depname])
+
+            msg_header = header_names[str(msg.name)]
+            data = self.header_begin(includes, msg_header, options, local_includes + deps)
+            data += self.header_body([], [msg], [])
+            data += self.header_end([msg], options)
+            results.append((str(msg.name), ''.join(data)))
+
+        # Umbrella header includes everything for compatibility
+        all_headers = local_includes + [header_names[str(msg.name)] for msg in sort_dependencies(self.messages)]
+        data = self.header_begin(includes, headername, options, all_headers)
+        data += self.header_body([], [], self.extensions)
+        data += self.msgid_declarations(headername, self.messages)
+        data += self.header_end([], options)
+        results.append(('', ''.join(data)))
+        return results
+
+    def header_begin(self, includes, headername, options, local_headers = []):
+        '''Return the beginning of a header file up to extern "C".
+        includes are the .proto files whose headers are included, and
+        local_headers are other headers generated from this file.'''
+        result = []
+        result.append('/* Automatically generated nanopb header */\n')
         if options.notimestamp:
-            yield '/* Generated by %s */\n\n' % (nanopb_version)
+            result.append('/* Generated by %s */\n\n' % (nanopb_version))
         else:
-            yield '/* Generated by %s at %s. */\n\n' % (nanopb_version, time.asctime())
+            result.append('/* Generated by %s at %s. */\n\n' % (nanopb_version, time.asctime()))
 
         if self.fdesc.package:
             symbol = make_identifier(self.fdesc.package + '_' + headername)
         else:
             symbol = make_identifier(headername)
-        yield '#ifndef PB_%s_INCLUDED\n' % symbol
-        yield '#define PB_%s_INCLUDED\n' % symbol
+        result.append('#ifndef PB_%s_INCLUDED\n' % symbol)
+        result.append('#define PB_%s_INCLUDED\n' % symbol)
         try:
-            yield options.libformat % ('pb.h')
+            result.append(options.libformat % ('pb.h'))
         except TypeError:
             # no %s specified - use whatever was passed in as options.libformat
-            yield options.libformat
-        yield '\n'
+            result.append(options.libformat)
+        result.append('\n')
 
         for incfile in includes:
             noext = os.path.splitext(incfile)[0]
-            yield options.genformat % (noext + options.extension + options.header_extension)
-            yield '\n'
+            result.append(options.genformat % (noext + options.extension + options.header_extension))
+            result.append('\n')
 
-        yield '/* @@protoc_insertion_point(includes) */\n'
+        for incfile in local_headers:
+            result.append(options.genformat % (incfile))
+            result.append('\n')
 
-        yield '#if PB_PROTO_HEADER_VERSION != 40\n'
-        yield '#error Regenerate this file with the current version of nanopb generator.\n'
-        yield '#endif\n'
-        yield '\n'
+        result.append('/* @@protoc_insertion_point(includes) */\n')
 
-        yield '#ifdef __cplusplus\n'
-        yield 'extern "C" {\n'
-        yield '#endif\n\n'
+        result.append('#if PB_PROTO_HEADER_VERSION != 40\n')
+        result.append('#error Regenerate this file with the current version of nanopb generator.\n')
+        result.append('#endif\n')
+        result.append('\n')
 
-        if self.enums:
-            yield '/* Enum definitions */\n'
-            for enum in self.enums:
-                yield str(enum) + '\n\n'
-
-        if self.messages:
-            yield '/* Struct definitions */\n'
-            for msg in sort_dependencies(self.messages):
-                yield msg.types()
-                yield str(msg) + '\n\n'
-
-        if self.extensions:
-            yield '/* Extensions */\n'
-            for extension in self.extensions:
-                yield extension.extension_decl()
-            yield '\n'
+        result.append('#ifdef __cplusplus\n')
+        result.append('extern "C" {\n')
+        result.append('#endif\n\n')
+        return result
 
-        if self.messages:
-            yield '/* Initializer values for message structs */\n'
-            for msg in self.messages:
+    def header_body(self, enums, messages, extensions):
+        '''Return the declarations for the given enums, messages and
+        extensions.'''
+        result = []
+        if enums:
+            result.append('/* Enum definitions */\n')
+            for enum in enums:
+                result.append(str(enum) + '\n\n')
+
+        if messages:
+            result.append('/* Struct definitions */\n')
+            for msg in sort_dependencies(messages):
+                result.append(msg.types())
+                result.append(str(msg) + '\n\n')
+
+        if extensions:
+            result.append('/* Extensions */\n')
+            for extension in extensions:
+                result.append(extension.extension_decl())
+            result.append('\n')
+
+        if messages:
+            result.append('/* Initializer values for message structs */\n')
+            for msg in messages:
                 identifier = '%s_init_default' % msg.name
-                yield '#define %-40s %s\n' % (identifier, msg.get_initializer(False))
-            for msg in self.messages:
+                result.append('#define %-40s %s\n' % (identifier, msg.get_initializer(False, self.dependencies)))
+            for msg in messages:
                 identifier = '%s_init_zero' % msg.name
-                yield '#define %-40s %s\n' % (identifier, msg.get_initializer(True))
-            yield '\n'
+                result.append('#define %-40s %s\n' % (identifier, msg.get_initializer(True, self.dependencies)))
+            result.append('\n')
 
-            yield '/* Field tags (for use in manual encoding/decoding) */\n'
-            for msg in sort_dependencies(self.messages):
+        if messages or extensions:
+            result.append('/* Field tags (for use in manual encoding/decoding) */\n')
+            for msg in sort_dependencies(messages):
                 for field in msg.fields:
-                    yield field.tags()
-            for extension in self.extensions:
-                yield extension.tags()
-            yield '\n'
-
-            yield '/* Struct field encoding specification for nanopb */\n'
-            for msg in self.messages:
-                yield msg.fields_declaration(self.dependencies) + '\n'
-            for msg in self.messages:
-                yield 'extern const pb_msgdesc_t %s_msg;\n' % msg.name
-            yield '\n'
-
-            yield '/* Defines for backwards compatibility with code written before nanopb-0.4.0 */\n'
-            for msg in self.messages:
-              yield '#define %s_fields &%s_msg\n' % (msg.name, msg.name)
-            yield '\n'
-
-            yield '/* Maximum encoded size of messages (where known) */\n'
-            for msg in self.messages:
+                    result.append(field.tags())
+            for extension in extensions:
+                result.append(extension.tags())
+            result.append('\n')
+
+        indexed_messages = [msg for msg in messages if msg.generate_field_indexes]
+        if indexed_messages:
+            result.append('/* Field indexes for pb_decode_masked() */\n')
+            for msg in indexed_messages:
+                result.append(msg.field_indexes())
+            result.append('\n')
+
+        if messages:
+            result.append('/* Struct field encoding specification for nanopb */\n')
+            for msg in messages:
+                result.append(msg.fields_declaration(self.dependencies) + '\n')
+            for msg in messages:
+                result.append('extern const pb_msgdesc_t %s_msg;\n' % msg.name)
+            for msg in messages:
+                if msg.has_default_instance(self.dependencies) and not msg.alias_of:
+                    result.append('extern const %s %s_default_instance;\n' % (msg.name, msg.name))
+            for msg in messages:
+                if msg.expanded_descriptor:
+                    result.append('extern const pb_field_record_t %s_field_records[];\n' % msg.name)
+            result.append('\n')
+
+            result.append('/* Defines for backwards compatibility with code written before nanopb-0.4.0 */\n')
+            for msg in messages:
+              result.append('#define %s_fields &%s_msg\n' % (msg.name, msg.name))
+            result.append('\n')
+
+            compared_messages = [msg for msg in messages if msg.generate_equal_macro]
+            if compared_messages:
+                result.append('/* Comparison of message structures, used with pb_encode_delta() */\n')
+                for msg in compared_messages:
+                    identifier = '%s_equal(a, b)' % msg.name
+                    result.append('#define %-40s pb_message_equal(%s_fields, (a), (b))\n' % (identifier, msg.name))
+                result.append('\n')
+
+            lazy_accessors = [field.lazy_accessor() for msg in messages for field in msg.all_fields()]
+            if [a for a in lazy_accessors if a]:
+                result.append('/* Accessors for lazily decoded submessages */\n')
+                for accessor in lazy_accessors:
+                    result.append(accessor)
+                result.append('\n')
+
+            item_prototypes = [p for msg in messages for field in msg.all_fields()
+                               for p in field.callback_items_prototypes()]
+            if item_prototypes:
+                result.append('/* Element-by-element access to repeated callback fields */\n')
+                for prototype in item_prototypes:
+                    result.append(prototype + ';\n')
+                result.append('\n')
+
+            has_bit_fields = [(msg, field) for msg in messages for field in msg.all_fields()
+                              if field.has_bit_index is not None]
+            if has_bit_fields:
+                result.append('/* Accessors for presence of optional fields in has_bits */\n')
+                for msg, field in has_bit_fields:
+                    for fmt, macro in (('%s_has_%s(msg)', 'PB_HAS_BIT'),
+                                       ('%s_set_has_%s(msg)', 'PB_SET_HAS_BIT'),
+                                       ('%s_clear_has_%s(msg)', 'PB_CLEAR_HAS_BIT')):
+                        identifier = fmt % (msg.name, field.name)
+                        result.append('#define %-40s %s((msg)->has_bits, %d)\n' % (identifier, macro, field.has_bit_index))
+                result.append('\n')
+
+            range_defines = [field.range_defines() for msg in messages for field in msg.descriptor_fields()]
+            range_msgs = [msg for msg in messages if msg.has_range_checks(self.dependencies)]
+            if [d for d in range_defines if d] or range_msgs:
+                result.append('/* Value ranges of integer fields */\n')
+                for define in range_defines:
+                    result.append(define)
+                if range_msgs:
+                    result.append('\n/* Check that the field values are within min_value and max_value */\n')
+                for msg in range_msgs:
+                    result.append('bool %s_check_ranges(const %s *msg);\n' % (msg.name, msg.name))
+                result.append('\n')
+
+            result.append('/* Maximum encoded size of messages (where known) */\n')
+            for msg in messages:
                 msize = msg.encoded_size(self.dependencies)
                 identifier = '%s_size' % msg.name
                 if msize is not None:
-                    yield '#define %-40s %s\n' % (identifier, msize)
+                    result.append('#define %-40s %s\n' % (identifier, msize))
                 else:
-                    yield '/* %s depends on runtime parameters */\n' % identifier
-            yield '\n'
+                    result.append('/* %s depends on runtime parameters */\n' % identifier)
+            result.append('\n')
+
+            arena_sizes = [(msg, msg.arena_size(self.dependencies)) for msg in messages]
+            if [m for m, a in arena_sizes if a != []]:
+                result.append('/* Arena memory needed for decoding pointer fields (where known) */\n')
+                for msg, asize in arena_sizes:
+                    identifier = '%s_arena_size' % msg.name
+                    if asize is None:
+                        result.append('/* %s depends on runtime parameters */\n' % identifier)
+                    elif asize:
+                        result.append('#define %-40s (%s)\n' % (identifier, ' + '.join(asize)))
+                result.append('\n')
 
-            if [msg for msg in self.messages if hasattr(msg,'msgid')]:
-              yield '/* Message IDs (where set with "msgid" option) */\n'
-              yield '#ifdef PB_MSGID\n'
-              for msg in self.messages:
-                  if hasattr(msg,'msgid'):
-                      yield '#define PB_MSG_%d %s\n' % (msg.msgid, msg.name)
-              yield '\n'
-
-              symbol = make_identifier(headername.split('.')[0])
-              yield '#define %s_MESSAGES \\\n' % symbol
-
-              for msg in self.messages:
-                  m = "-1"
-                  msize = msg.encoded_size(self.dependencies)
-                  if msize is not None:
-                      m = msize
-                  if hasattr(msg,'msgid'):
-                      yield '\tPB_MSG(%d,%s,%s) \\\n' % (msg.msgid, m, msg.name)
-              yield '\n'
-
-              for msg in self.messages:
-                  if hasattr(msg,'msgid'):
-                      yield '#define %s_msgid %d\n' % (msg.name, msg.msgid)
-              yield '\n'
-              yield '#endif\n\n'
-
-        yield '#ifdef __cplusplus\n'
-        yield '} /* extern "C" */\n'
-        yield '#endif\n'
+        return result
 
-        if options.cpp_descriptors:
-            yield '\n'
-            yield '#ifdef __cplusplus\n'
-            yield '/* Message descriptors for nanopb */\n'
-            yield 'namespace nanopb {\n'
-            for msg in self.messages:
-                yield msg.fields_declaration_cpp_lookup() + '\n'
-            yield '}  // namespace nanopb\n'
-            yield '\n'
-            yield '#endif  /* __cplusplus */\n'
-            yield '\n'
+    def msgid_declarations(self, headername, messages):
+        '''Return the defines for messages that have the msgid option.'''
+        result = []
+        if [msg for msg in messages if hasattr(msg,'msgid')]:
+          result.append('/* Message IDs (where set with "msgid" option) */\n')
+          result.append('#ifdef PB_MSGID\n')
+          for msg in messages:
+              if hasattr(msg,'msgid'):
+                  result.append('#define PB_MSG_%d %s\n' % (msg.msgid, msg.name))
+          result.append('\n')
+
+          symbol = make_identifier(headername.split('.')[0])
+          result.append('#define %s_MESSAGES \\\n' % symbol)
+
+          for msg in messages:
+              m = "-1"
+              msize = msg.encoded_size(self.dependencies)
+              if msize is not None:
+                  m = msize
+              if hasattr(msg,'msgid'):
+                  result.append('\tPB_MSG(%d,%s,%s) \\\n' % (msg.msgid, m, msg.name))
+          result.append('\n')
+
+          for msg in messages:
+              if hasattr(msg,'msgid'):
+                  result.append('#define %s_msgid %d\n' % (msg.name, msg.msgid))
+          result.append('\n')
+          result.append('#endif\n\n')
+
+          result.append('/* Dispatch by message ID, see pb_decode_by_msgid() */\n')
+          result.append('typedef union {\n')
+          for msg in self.msgid_messages(messages):
+              result.append('    %s msg_%s;\n' % (msg.name, msg.name))
+          result.append('} %s_msgid_union;\n\n' % symbol)
+          result.append('extern const pb_msgid_table_t %s_msgid_table;\n' % symbol)
+
+          # Size of the largest message together with its msgid and length
+          sizes = [(msg.msgid, msg.encoded_size(self.dependencies)) for msg in self.msgid_messages(messages)]
+          if all(msize is not None and not msize.symbols for msgid, msize in sizes):
+              frame = max(varint_max_size(msgid) + varint_max_size(msize.value) + msize.value
+                          for msgid, msize in sizes)
+              result.append('#define %-40s %d\n' % (symbol + '_msgid_size', frame))
+          result.append('\n')
+        return result
+
+    def msgid_messages(self, messages):
+        '''Return the messages that have the msgid option, sorted by msgid.'''
+        result = sorted([msg for msg in messages if hasattr(msg,'msgid')], key = lambda m: m.msgid)
+        for prev, msg in zip(result, result[1:]):
+            if prev.msgid == msg.msgid:
+                raise Exception("Messages %s and %s have the same msgid %d" % (prev.name, msg.name, msg.msgid))
+        return result
+
+    def msgid_definitions(self, headername):
+        '''Return the msgid table for messages that have the msgid option.'''
+        result = []
+        msgs = self.msgid_messages(self.messages)
+        if msgs:
+            symbol = make_identifier(headername.split('.')[0])
+            result.append('static const pb_msgid_entry_t %s_msgid_entries[%d] = {\n' % (symbol, len(msgs)))
+            for msg in msgs:
+                if msg.encoded_size(self.dependencies) is not None:
+                    size = '%s_size' % msg.name
+                else:
+                    size = '0'
+                result.append('    {%d, &%s_msg, %s},\n' % (msg.msgid, msg.name, size))
+            result.append('};\n')
+            result.append('const pb_msgid_table_t %s_msgid_table = {%s_msgid_entries, %d};\n'
+                          % (symbol, symbol, len(msgs)))
+        return result
+
+    def header_end(self, messages, options):
+        '''Return the end of a header file after the declarations.'''
+        result = []
+        result.append('#ifdef __cplusplus\n')
+        result.append('} /* extern "C" */\n')
+        result.append('#endif\n')
+
+        if options.cpp_descriptors and messages:
+            result.append('\n')
+            result.append('#ifdef __cplusplus\n')
+            result.append('/* Message descriptors for nanopb */\n')
+            result.append('namespace nanopb {\n')
+            for msg in messages:
+                result.append(msg.fields_declaration_cpp_lookup() + '\n')
+            result.append('}  // namespace nanopb\n')
+            result.append('\n')
+            result.append('#endif  /* __cplusplus */\n')
+            result.append('\n')
 
         # End of header
-        yield '/* @@protoc_insertion_point(eof) */\n'
-        yield '\n#endif\n'
+        result.append('/* @@protoc_insertion_point(eof) */\n')
+        result.append('\n#endif\n')
+        return result
 
     def generate_source(self, headername, options):
         '''Generate content for a source file.'''
@@ -1510,6 +2511,14 @@ class ProtoFile:
         else:
             yield '/* Generated by %s at %s. */\n\n' % (nanopb_version, time.asctime())
         yield options.genformat % (headername)
+        item_fields = [field for msg in self.messages for field in msg.all_fields()
+                       if field.has_callback_items()]
+        if item_fields:
+            for libheader in ('pb_decode.h', 'pb_encode.h'):
+                try:
+                    yield options.libformat % libheader
+                except TypeError:
+                    yield '#include <%s>\n' % libheader
         yield '\n'
         yield '/* @@protoc_insertion_point(includes) */\n'
 
@@ -1524,6 +2533,12 @@ class ProtoFile:
         for ext in self.extensions:
             yield ext.extension_def(self.dependencies) + '\n'
 
+        for part in self.msgid_definitions(headername):
+            yield part
+
+        for field in item_fields:
+            yield field.callback_items_definitions()
+
         for enum in self.enums:
             yield enum.enum_to_string_definition() + '\n'
 
@@ -1687,6 +2702,12 @@ optparser.add_option("--no-strip-path", dest="strip_path", action="store_false",
     help="Opposite of --strip-path (default since 0.4.0)")
 optparser.add_option("--cpp-descriptors", action="store_true",
     help="Generate C++ descriptors to lookup by type (e.g. pb_field_t for a message)")
+optparser.add_option("--dedup-descriptors", dest="dedup_descriptors", action="store_true", default=False,
+    help="Share field descriptors between structurally identical messages in a file")
+optparser.add_option("--plain-descriptors", dest="plain_descriptors", action="store_true", default=False,
+    help="Generate field descriptors as plain arrays instead of PB_BIND macro expansion")
+optparser.add_option("--split-headers", dest="split_headers", action="store_true", default=False,
+    help="Generate a separate header for each message, included by the .pb.h file")
 optparser.add_option("-T", "--no-timestamp", dest="notimestamp", action="store_true", default=True,
     help="Don't add timestamp to .pb.h and .pb.c preambles (default since 0.4.0)")
 optparser.add_option("-t", "--timestamp", dest="notimestamp", action="store_false", default=True,
@@ -1752,7 +2773,8 @@ def process_file(filename, fdesc, options, other_files = {}):
         {'headername': Name of header file,
          'headerdata': Data for the .h header file,
          'sourcename': Name of the source code file,
-         'sourcedata': Data for the .c source code file
+         'sourcedata': Data for the .c source code file,
+         'extra_headers': List of (name, data) for --split-headers
         }
     '''
     f = parse_file(filename, fdesc, options)
@@ -1781,7 +2803,34 @@ def process_file(filename, fdesc, options, other_files = {}):
     if options.strip_path:
         includes = [os.path.basename(d) for d in includes]
 
-    headerdata = ''.join(f.generate_header(includes, headerbasename, options))
+    if options.dedup_descriptors:
+        f.find_identical_messages()
+
+    if options.plain_descriptors:
+        for msg in f.messages:
+            msg.plain_descriptor = True
+
+    extra_headers = []
+    if options.split_headers:
+        # Separate header for enums and each message, named after the
+        # .proto file and the message.
+        split_names = {None: noext + '_enums' + options.extension + options.header_extension}
+        for msg in f.messages:
+            split_names[str(msg.name)] = noext + '_' + str(msg.name) + options.extension + options.header_extension
+
+        if options.strip_path:
+            include_names = dict((k, os.path.basename(v)) for k, v in split_names.items())
+        else:
+            include_names = split_names
+
+        for key, data in f.generate_split_headers(includes, headerbasename, include_names, options):
+            if key == '':
+                headerdata = data
+            else:
+                extra_headers.append((split_names[key], data))
+    else:
+        headerdata = ''.join(f.generate_header(includes, headerbasename, options))
+
     sourcedata = ''.join(f.generate_source(headerbasename, options))
 
     # Check if there were any lines in .options that did not match a member
@@ -1793,7 +2842,8 @@ def process_file(filename, fdesc, options, other_files = {}):
             sys.stderr.write("Use  protoc --nanopb-out=-v:.   to see a list of the field names.\n")
 
     return {'headername': headername, 'headerdata': headerdata,
-            'sourcename': sourcename, 'sourcedata': sourcedata}
+            'sourcename': sourcename, 'sourcedata': sourcedata,
+            'extra_headers': extra_headers}
 
 def main_cli():
     '''Main function when invoked directly from the command line.'''
@@ -1825,6 +2875,7 @@ def main_cli():
             (os.path.join(base_dir, results['headername']), results['headerdata']),
             (os.path.join(base_dir, results['sourcename']), results['sourcedata']),
         ]
+        to_write += [(os.path.join(base_dir, name), data) for name, data in results['extra_headers']]
 
         if not options.quiet:
             paths = " and ".join([x[0] for x in to_write])
@@ -1910,6 +2961,11 @@ def main_plugin():
                 f.name = results['sourcename']
                 f.content = results['sourcedata']
 
+                for name, data in results['extra_headers']:
+                    f = response.file.add()
+                    f.name = name
+                    f.content = data
+
     io.open(sys.stdout.fileno(), "wb").write(response.SerializeToString())
 
 if __name__ == '__main__':
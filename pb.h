@@ -119,6 +119,25 @@ extern "C" {
 #define PB_UNUSED(x) (void)(x)
 #endif
 
+/* Detect whether the CPU is little endian and has 8-bit bytes. On such
+ * platforms the memory representation of fixed32, fixed64, float and double
+ * values matches the protobuf wire format, so they can be copied directly.
+ * If the detection does not work for your compiler, you can define
+ * PB_LITTLE_ENDIAN_8BIT as 1 or 0 on the compiler command line.
+ */
+#ifndef PB_LITTLE_ENDIAN_8BIT
+#if ((defined(__BYTE_ORDER) && __BYTE_ORDER == __LITTLE_ENDIAN) || \
+     (defined(__BYTE_ORDER__) && __BYTE_ORDER__ == __ORDER_LITTLE_ENDIAN__) || \
+      defined(__LITTLE_ENDIAN__) || defined(__ARMEL__) || \
+      defined(__THUMBEL__) || defined(__AARCH64EL__) || defined(_MIPSEL) || \
+      defined(_M_IX86) || defined(_M_X64) || defined(_M_ARM)) \
+     && CHAR_BIT == 8
+#define PB_LITTLE_ENDIAN_8BIT 1
+#else
+#define PB_LITTLE_ENDIAN_8BIT 0
+#endif
+#endif
+
 /* Compile-time assertion, used for checking compatible compilation options.
  * If this does not work properly on your compiler, use
  * #define PB_NO_STATIC_ASSERT to disable it.
@@ -215,6 +234,7 @@ typedef uint_least8_t pb_type_t;
 #define PB_ATYPE_STATIC   0x00U
 #define PB_ATYPE_POINTER  0x80U
 #define PB_ATYPE_CALLBACK 0x40U
+#define PB_ATYPE_VIEW     0xC0U
 #define PB_ATYPE_MASK     0xC0U
 
 #define PB_ATYPE(x) ((x) & PB_ATYPE_MASK)
@@ -244,6 +264,23 @@ typedef struct pb_istream_s pb_istream_t;
 typedef struct pb_ostream_s pb_ostream_t;
 typedef struct pb_field_iter_s pb_field_iter_t;
 
+/* Unpacked field description, used by messages that have the
+ * expanded_descriptor option. Contains the same information as the packed
+ * field_info words, and the precomputed indexes of the field among the
+ * submessage and required fields.
+ */
+typedef struct pb_field_record_s pb_field_record_t;
+struct pb_field_record_s {
+    uint32_t data_offset;
+    pb_size_t tag;
+    pb_size_t data_size;
+    pb_size_t array_size;
+    pb_size_t size_offset;
+    pb_size_t submsg_index;
+    pb_size_t required_index;
+    pb_type_t type;
+};
+
 /* This structure is used in auto-generated constants
  * to specify struct fields.
  */
@@ -251,14 +288,35 @@ PB_PACKED_STRUCT_START
 typedef struct pb_msgdesc_s pb_msgdesc_t;
 struct pb_msgdesc_s {
     pb_size_t field_count;
+    pb_size_t required_field_count;
     const uint32_t *field_info;
     const pb_msgdesc_t **submsg_info;
     const pb_byte_t *default_value;
 
     bool (*field_callback)(pb_istream_t *istream, pb_ostream_t *ostream, const pb_field_iter_t *field);
+
+    /* Constant message initialized to default values, or NULL if the
+     * message has pointer, callback or extension fields. */
+    const void *default_instance;
+    size_t struct_size;
+
+    /* Unpacked copy of field_info, or NULL if not generated. */
+    const pb_field_record_t *field_records;
+
+    /* Combination of PB_MSGFLAG_* values */
+    uint8_t flags;
 } pb_packed;
 PB_PACKED_STRUCT_END
 
+/* Presence of optional fields is stored in an uint32_t has_bits[] array
+ * at the start of the message, with one bit for each field index. */
+#define PB_MSGFLAG_HAS_BITS 0x01U
+
+/* Access to the bits in has_bits array */
+#define PB_HAS_BIT(bits, index) (((bits)[(index) >> 5] >> ((index) & 31)) & 1U)
+#define PB_SET_HAS_BIT(bits, index) ((bits)[(index) >> 5] |= (uint32_t)1 << ((index) & 31))
+#define PB_CLEAR_HAS_BIT(bits, index) ((bits)[(index) >> 5] &= ~((uint32_t)1 << ((index) & 31)))
+
 /* Iterator for message descriptor */
 struct pb_field_iter_s {
     const pb_msgdesc_t *descriptor;  /* Pointer to message descriptor constant */
@@ -308,6 +366,29 @@ struct pb_bytes_array_s {
 };
 typedef struct pb_bytes_array_s pb_bytes_array_t;
 
+/* This structure is used for string and bytes fields with FT_VIEW allocation.
+ * Instead of copying the data, the decoder sets ptr to point directly into
+ * the input buffer. The data is therefore only valid for as long as the
+ * buffer is, and strings are not null terminated.
+ */
+typedef struct pb_bytes_view_s pb_bytes_view_t;
+struct pb_bytes_view_s {
+    const pb_byte_t *ptr;
+    pb_size_t size;
+};
+
+/* This structure is used for submessage fields with the lazy option.
+ * The decoder only stores the location of the encoded submessage in the
+ * input buffer. The submessage is decoded when it is first accessed with
+ * pb_decode_lazy(), which stores the pointer to the decoded message in msg.
+ * When encoding, the original data is copied if msg is NULL.
+ */
+typedef struct pb_lazy_s pb_lazy_t;
+struct pb_lazy_s {
+    pb_bytes_view_t data;
+    void *msg;
+};
+
 /* This structure is used for giving the callback function.
  * It is stored in the message structure and filled in by the method that
  * calls pb_decode.
@@ -348,6 +429,10 @@ struct pb_callback_s {
 
 extern bool pb_default_field_callback(pb_istream_t *istream, pb_ostream_t *ostream, const pb_field_t *field);
 
+/* Compare two message structures of the same type, field by field.
+ * Used by the generated MyMessage_equal() macros, see pb_common.h. */
+extern bool pb_message_equal(const pb_msgdesc_t *fields, const void *a, const void *b);
+
 /* Wire types. Library user needs these only in encoder callbacks. */
 typedef enum {
     PB_WT_VARINT = 0,
@@ -405,6 +490,80 @@ struct pb_extension_s {
     bool found;
 };
 
+/* Memory arena for allocating pointer fields from a caller-provided
+ * buffer instead of pb_realloc(), when PB_ENABLE_MALLOC is defined.
+ * See pb_arena_init() in pb_decode.h.
+ * Each allocation is preceded by one pb_arena_align_t that stores its
+ * capacity; the union also defines the alignment of the allocations. */
+typedef union {
+    size_t capacity;
+    void *ptr;
+    double dbl;
+    long lng;
+} pb_arena_align_t;
+
+typedef struct pb_arena_s pb_arena_t;
+struct pb_arena_s {
+    pb_byte_t *buffer;
+    size_t size;
+    size_t used;
+};
+
+/* Entry of the message id table that the generator creates for the messages
+ * of a .proto file that have the msgid option. See pb_decode_by_msgid(). */
+typedef struct pb_msgid_entry_s pb_msgid_entry_t;
+struct pb_msgid_entry_s {
+    uint32_t msgid;
+    const pb_msgdesc_t *fields;
+    size_t size;        /* Maximum encoded size, or 0 if not known */
+};
+
+/* Table of message ids, with the entries sorted by msgid. */
+typedef struct pb_msgid_table_s pb_msgid_table_t;
+struct pb_msgid_table_s {
+    const pb_msgid_entry_t *entries;
+    pb_size_t count;
+};
+
+/* Array or ring buffer of message structures, used for reading and writing
+ * a sequence of length-delimited messages with pb_decode_batch() and
+ * pb_encode_batch(). The messages are stored at indexes start, start + 1, ...
+ * wrapping around at capacity. The size of each structure is taken from
+ * the message descriptor. */
+typedef struct pb_batch_s pb_batch_t;
+struct pb_batch_s {
+    void *messages;     /* Array of capacity message structures */
+    bool *valid;        /* Decoding result of each message, or NULL */
+    size_t capacity;
+    size_t start;       /* Index of the first message */
+    size_t count;       /* Number of messages in the batch */
+};
+
+/* Selection of fields to decode with pb_decode_masked(). The bits array has
+ * one bit for each field index, in the same layout as has_bits, and can be
+ * filled with PB_SET_HAS_BIT() and the generated MyMessage_myfield_index
+ * defines. Its size is given by MyMessage_MASK_WORDS.
+ *
+ * The optional submasks array is also indexed by field index, and selects
+ * the fields to decode in static submessage fields. A NULL entry decodes
+ * the whole submessage. */
+typedef struct pb_field_mask_s pb_field_mask_t;
+struct pb_field_mask_s {
+    const uint32_t *bits;
+    const pb_field_mask_t * const *submasks;
+};
+
+/* Worst-case arena usage of a single allocation of size bytes. */
+#define PB_ARENA_ALLOCSIZE(size) (sizeof(pb_arena_align_t) * \
+    (((size) + sizeof(pb_arena_align_t) - 1) / sizeof(pb_arena_align_t) + 1))
+
+/* Worst-case arena usage of an array that is grown up to count entries of
+ * elemsize bytes. Arrays are grown by at least doubling the capacity, so
+ * the total is less than 4 * count * elemsize, spread over at most steps
+ * allocations. These are used by the generated _arena_size defines. */
+#define PB_ARENA_ARRAYSIZE(count, elemsize, steps) \
+    (4 * (count) * (elemsize) + 2 * sizeof(pb_arena_align_t) * (steps))
+
 /* Memory allocation functions to use. You can define pb_realloc and
  * pb_free to custom functions if you want. */
 #ifdef PB_ENABLE_MALLOC
@@ -414,6 +573,7 @@ struct pb_extension_s {
 #   ifndef pb_free
 #       define pb_free(ptr) free(ptr)
 #   endif
+
 #endif
 
 /* This is used to inform about need to regenerate .pb.h/.pb.c files. */
@@ -432,6 +592,17 @@ struct pb_extension_s {
 
 /* Binding of a message field set into a specific structure */
 #define PB_BIND(msgname, structname, width) \
+    PB_BIND_INFO(msgname, structname, width, NULL, NULL, 0)
+
+/* Binding of a message that also has a default instance, expanded field
+ * records or message flags. These are given by the msgname_DEFAULT_INSTANCE,
+ * msgname_FIELD_RECORDS and msgname_MSGFLAGS macros. Headers generated by
+ * older versions do not define them and use PB_BIND instead. */
+#define PB_BIND_EXT(msgname, structname, width) \
+    PB_BIND_INFO(msgname, structname, width, msgname ## _DEFAULT_INSTANCE, \
+                 msgname ## _FIELD_RECORDS, msgname ## _MSGFLAGS)
+
+#define PB_BIND_INFO(msgname, structname, width, instance, records, flags) \
     const uint32_t structname ## _field_info[] = \
     { \
         msgname ## _FIELDLIST(PB_GEN_FIELD_INFO_ ## width, structname) \
@@ -445,14 +616,51 @@ struct pb_extension_s {
     const pb_msgdesc_t structname ## _msg = \
     { \
        0 msgname ## _FIELDLIST(PB_GEN_FIELD_COUNT, structname), \
+       0 msgname ## _FIELDLIST(PB_GEN_REQ_FIELD_COUNT, structname), \
        structname ## _field_info, \
        structname ## _submsg_info, \
        msgname ## _DEFAULT, \
        msgname ## _CALLBACK, \
+       instance, \
+       sizeof(structname), \
+       records, \
+       flags, \
     }; \
     msgname ## _FIELDLIST(PB_GEN_FIELD_INFO_ASSERT_ ## width, structname)
 
+/* Binding of a message that has the same fields and struct layout as an
+ * earlier message basename. The field_info and submsg_info arrays of the
+ * earlier message are shared, and the layout is verified at compile time. */
+#define PB_BIND_ALIAS(msgname, structname, basename) \
+    const pb_msgdesc_t structname ## _msg = \
+    { \
+       0 msgname ## _FIELDLIST(PB_GEN_FIELD_COUNT, structname), \
+       0 msgname ## _FIELDLIST(PB_GEN_REQ_FIELD_COUNT, structname), \
+       basename ## _field_info, \
+       basename ## _submsg_info, \
+       msgname ## _DEFAULT, \
+       msgname ## _CALLBACK, \
+       msgname ## _DEFAULT_INSTANCE, \
+       sizeof(structname), \
+       msgname ## _FIELD_RECORDS, \
+       msgname ## _MSGFLAGS, \
+    }; \
+    PB_STATIC_ASSERT(sizeof(structname) == sizeof(basename), ALIAS_SIZE_MISMATCH_ ## structname) \
+    msgname ## _FIELDLIST(PB_GEN_ALIAS_ASSERT, (structname, basename))
+
+#define PB_GEN_ALIAS_ASSERT(structnames, atype, htype, ltype, fieldname, tag) \
+    PB_GEN_ALIAS_ASSERT2(PB_ALIAS_STRUCT structnames, PB_ALIAS_BASE structnames, atype, htype, fieldname, tag)
+#define PB_ALIAS_STRUCT(structname, basename) structname
+#define PB_ALIAS_BASE(structname, basename) basename
+#define PB_GEN_ALIAS_ASSERT2(structname, basename, atype, htype, fieldname, tag) \
+    PB_STATIC_ASSERT(PB_DATA_OFFSET_ ## atype(htype, structname, fieldname) == PB_DATA_OFFSET_ ## atype(htype, basename, fieldname) && \
+                     PB_DATA_SIZE_ ## atype(htype, structname, fieldname) == PB_DATA_SIZE_ ## atype(htype, basename, fieldname) && \
+                     PB_SIZE_OFFSET_ ## atype(htype, structname, fieldname) == PB_SIZE_OFFSET_ ## atype(htype, basename, fieldname), \
+                     ALIAS_LAYOUT_MISMATCH_field ## tag)
+
 #define PB_GEN_FIELD_COUNT(structname, atype, htype, ltype, fieldname, tag) +1
+#define PB_GEN_REQ_FIELD_COUNT(structname, atype, htype, ltype, fieldname, tag) \
+    + (PB_HTYPE_ ## htype == PB_HTYPE_REQUIRED)
 
 #define PB_GEN_FIELD_INFO_1(structname, atype, htype, ltype, fieldname, tag) \
     PB_GEN_FIELD_INFO(1, structname, atype, htype, ltype, fieldname, tag)
@@ -504,9 +712,22 @@ struct pb_extension_s {
                    PB_SIZE_OFFSET_ ## atype(htype, structname, fieldname), \
                    PB_ARRAY_SIZE_ ## atype(htype, structname, fieldname))
 
+/* Entry in the field_records array of a message. The generator gives the
+ * submessage and required field indexes, which depend on preceding fields. */
+#define PB_FIELD_RECORD(structname, atype, htype, ltype, fieldname, tag, submsg_index, required_index) \
+    {PB_DATA_OFFSET_ ## atype(htype, structname, fieldname), \
+     tag, \
+     PB_DATA_SIZE_ ## atype(htype, structname, fieldname), \
+     PB_ARRAY_SIZE_ ## atype(htype, structname, fieldname), \
+     PB_SIZE_OFFSET_ ## atype(htype, structname, fieldname), \
+     submsg_index, \
+     required_index, \
+     PB_ATYPE_ ## atype | PB_HTYPE_ ## htype | PB_LTYPE_MAP_ ## ltype}
+
 #define PB_DATA_OFFSET_STATIC(htype, structname, fieldname) PB_DATA_OFFSET_ ## htype(structname, fieldname)
 #define PB_DATA_OFFSET_POINTER(htype, structname, fieldname) PB_DATA_OFFSET_ ## htype(structname, fieldname)
 #define PB_DATA_OFFSET_CALLBACK(htype, structname, fieldname) PB_DATA_OFFSET_ ## htype(structname, fieldname)
+#define PB_DATA_OFFSET_VIEW(htype, structname, fieldname) PB_DATA_OFFSET_STATIC(htype, structname, fieldname)
 #define PB_DATA_OFFSET_REQUIRED(structname, fieldname) offsetof(structname, fieldname)
 #define PB_DATA_OFFSET_SINGULAR(structname, fieldname) offsetof(structname, fieldname)
 #define PB_DATA_OFFSET_ONEOF(structname, fieldname) offsetof(structname, PB_ONEOF_NAME(FULL, fieldname))
@@ -517,6 +738,7 @@ struct pb_extension_s {
 #define PB_SIZE_OFFSET_STATIC(htype, structname, fieldname) PB_SIZE_OFFSET_ ## htype(structname, fieldname)
 #define PB_SIZE_OFFSET_POINTER(htype, structname, fieldname) PB_SIZE_OFFSET_PTR_ ## htype(structname, fieldname)
 #define PB_SIZE_OFFSET_CALLBACK(htype, structname, fieldname) 0
+#define PB_SIZE_OFFSET_VIEW(htype, structname, fieldname) PB_SIZE_OFFSET_STATIC(htype, structname, fieldname)
 #define PB_SIZE_OFFSET_REQUIRED(structname, fieldname) 0
 #define PB_SIZE_OFFSET_SINGULAR(structname, fieldname) 0
 #define PB_SIZE_OFFSET_ONEOF(structname, fieldname) PB_SIZE_OFFSET_ONEOF2(structname, PB_ONEOF_NAME(FULL, fieldname), PB_ONEOF_NAME(UNION, fieldname))
@@ -535,6 +757,7 @@ struct pb_extension_s {
 #define PB_ARRAY_SIZE_STATIC(htype, structname, fieldname) PB_ARRAY_SIZE_ ## htype(structname, fieldname)
 #define PB_ARRAY_SIZE_POINTER(htype, structname, fieldname) 1
 #define PB_ARRAY_SIZE_CALLBACK(htype, structname, fieldname) 1
+#define PB_ARRAY_SIZE_VIEW(htype, structname, fieldname) PB_ARRAY_SIZE_STATIC(htype, structname, fieldname)
 #define PB_ARRAY_SIZE_REQUIRED(structname, fieldname) 1
 #define PB_ARRAY_SIZE_SINGULAR(structname, fieldname) 1
 #define PB_ARRAY_SIZE_OPTIONAL(structname, fieldname) 1
@@ -545,6 +768,7 @@ struct pb_extension_s {
 #define PB_DATA_SIZE_STATIC(htype, structname, fieldname) PB_DATA_SIZE_ ## htype(structname, fieldname)
 #define PB_DATA_SIZE_POINTER(htype, structname, fieldname) PB_DATA_SIZE_PTR_ ## htype(structname, fieldname)
 #define PB_DATA_SIZE_CALLBACK(htype, structname, fieldname) pb_membersize(structname, fieldname)
+#define PB_DATA_SIZE_VIEW(htype, structname, fieldname) PB_DATA_SIZE_STATIC(htype, structname, fieldname)
 #define PB_DATA_SIZE_REQUIRED(structname, fieldname) pb_membersize(structname, fieldname)
 #define PB_DATA_SIZE_SINGULAR(structname, fieldname) pb_membersize(structname, fieldname)
 #define PB_DATA_SIZE_OPTIONAL(structname, fieldname) pb_membersize(structname, fieldname)
@@ -685,6 +909,7 @@ struct pb_extension_s {
 #define PB_FIELDINFO_WIDTH_STATIC(htype, ltype) PB_FIELDINFO_WIDTH_ ## htype(ltype)
 #define PB_FIELDINFO_WIDTH_POINTER(htype, ltype) PB_FIELDINFO_WIDTH_ ## htype(ltype)
 #define PB_FIELDINFO_WIDTH_CALLBACK(htype, ltype) 2
+#define PB_FIELDINFO_WIDTH_VIEW(htype, ltype) PB_FIELDINFO_WIDTH_STATIC(htype, ltype)
 #define PB_FIELDINFO_WIDTH_REQUIRED(ltype) PB_FIELDINFO_WIDTH_ ## ltype
 #define PB_FIELDINFO_WIDTH_SINGULAR(ltype) PB_FIELDINFO_WIDTH_ ## ltype
 #define PB_FIELDINFO_WIDTH_OPTIONAL(ltype) PB_FIELDINFO_WIDTH_ ## ltype
@@ -5,15 +5,11 @@
 
 #include "pb_common.h"
 
-static bool load_descriptor_values(pb_field_iter_t *iter)
+/* Unpack the field information from the variable width field_info words */
+static void unpack_field_info(pb_field_iter_t *iter, uint32_t *data_offset, int8_t *size_offset)
 {
     uint32_t word0;
-    uint32_t data_offset;
     uint8_t format;
-    int8_t size_offset;
-
-    if (iter->index >= iter->descriptor->field_count)
-        return false;
 
     word0 = iter->descriptor->field_info[iter->field_info_index];
     format = word0 & 3;
@@ -24,8 +20,8 @@ static bool load_descriptor_values(pb_field_iter_t *iter)
     {
         /* 1-word format */
         iter->array_size = 1;
-        size_offset = (int8_t)((word0 >> 24) & 0x0F);
-        data_offset = (word0 >> 16) & 0xFF;
+        *size_offset = (int8_t)((word0 >> 24) & 0x0F);
+        *data_offset = (word0 >> 16) & 0xFF;
         iter->data_size = (pb_size_t)((word0 >> 28) & 0x0F);
     }
     else if (format == 1)
@@ -35,8 +31,8 @@ static bool load_descriptor_values(pb_field_iter_t *iter)
 
         iter->array_size = (pb_size_t)((word0 >> 16) & 0x0FFF);
         iter->tag = (pb_size_t)(iter->tag | ((word1 >> 28) << 6));
-        size_offset = (int8_t)((word0 >> 28) & 0x0F);
-        data_offset = word1 & 0xFFFF;
+        *size_offset = (int8_t)((word0 >> 28) & 0x0F);
+        *data_offset = word1 & 0xFFFF;
         iter->data_size = (pb_size_t)((word1 >> 16) & 0x0FFF);
     }
     else if (format == 2)
@@ -48,8 +44,8 @@ static bool load_descriptor_values(pb_field_iter_t *iter)
 
         iter->array_size = (pb_size_t)(word0 >> 16);
         iter->tag = (pb_size_t)(iter->tag | ((word1 >> 8) << 6));
-        size_offset = (int8_t)(word1 & 0xFF);
-        data_offset = word2;
+        *size_offset = (int8_t)(word1 & 0xFF);
+        *data_offset = word2;
         iter->data_size = (pb_size_t)word3;
     }
     else
@@ -62,10 +58,37 @@ static bool load_descriptor_values(pb_field_iter_t *iter)
 
         iter->array_size = (pb_size_t)word4;
         iter->tag = (pb_size_t)(iter->tag | ((word1 >> 8) << 6));
-        size_offset = (int8_t)(word1 & 0xFF);
-        data_offset = word2;
+        *size_offset = (int8_t)(word1 & 0xFF);
+        *data_offset = word2;
         iter->data_size = (pb_size_t)word3;
     }
+}
+
+static bool load_descriptor_values(pb_field_iter_t *iter)
+{
+    uint32_t data_offset;
+    int8_t size_offset;
+
+    if (iter->index >= iter->descriptor->field_count)
+        return false;
+
+    if (iter->descriptor->field_records != NULL)
+    {
+        /* Expanded descriptor, values can be copied directly */
+        const pb_field_record_t *record = &iter->descriptor->field_records[iter->index];
+        iter->tag = record->tag;
+        iter->type = record->type;
+        iter->array_size = record->array_size;
+        iter->data_size = record->data_size;
+        iter->submessage_index = record->submsg_index;
+        iter->required_field_index = record->required_index;
+        size_offset = (int8_t)record->size_offset;
+        data_offset = record->data_offset;
+    }
+    else
+    {
+        unpack_field_info(iter, &data_offset, &size_offset);
+    }
 
     iter->pField = (char*)iter->message + data_offset;
 
@@ -73,9 +96,18 @@ static bool load_descriptor_values(pb_field_iter_t *iter)
     {
         iter->pSize = (char*)iter->pField - size_offset;
     }
+    else if (PB_HTYPE(iter->type) == PB_HTYPE_OPTIONAL &&
+             (iter->descriptor->flags & PB_MSGFLAG_HAS_BITS) &&
+             (PB_ATYPE(iter->type) == PB_ATYPE_STATIC ||
+              PB_ATYPE(iter->type) == PB_ATYPE_VIEW))
+    {
+        /* Presence bit in the has_bits array at start of message */
+        iter->pSize = (uint32_t*)iter->message + (iter->index >> 5);
+    }
     else if (PB_HTYPE(iter->type) == PB_HTYPE_REPEATED &&
              (PB_ATYPE(iter->type) == PB_ATYPE_STATIC ||
-              PB_ATYPE(iter->type) == PB_ATYPE_POINTER))
+              PB_ATYPE(iter->type) == PB_ATYPE_POINTER ||
+              PB_ATYPE(iter->type) == PB_ATYPE_VIEW))
     {
         /* Fixed count array */
         iter->pSize = &iter->array_size;
@@ -118,6 +150,10 @@ static void advance_iterator(pb_field_iter_t *iter)
         iter->submessage_index = 0;
         iter->required_field_index = 0;
     }
+    else if (iter->descriptor->field_records != NULL)
+    {
+        /* Indexes are loaded from the field record */
+    }
     else
     {
         /* Increment indexes based on previous field type.
@@ -191,7 +227,7 @@ bool pb_field_iter_find(pb_field_iter_t *iter, uint32_t tag)
     else
     {
         pb_size_t start = iter->index;
-        uint32_t fieldinfo;
+        uint32_t fieldtag;
 
         do
         {
@@ -199,9 +235,12 @@ bool pb_field_iter_find(pb_field_iter_t *iter, uint32_t tag)
             advance_iterator(iter);
 
             /* Do fast check for tag number match */
-            fieldinfo = iter->descriptor->field_info[iter->field_info_index];
+            if (iter->descriptor->field_records != NULL)
+                fieldtag = iter->descriptor->field_records[iter->index].tag;
+            else
+                fieldtag = (iter->descriptor->field_info[iter->field_info_index] >> 2) & 0x3F;
 
-            if (((fieldinfo >> 2) & 0x3F) == (tag & 0x3F))
+            if ((fieldtag & 0x3F) == (tag & 0x3F))
             {
                 /* Good candidate, check further */
                 (void)load_descriptor_values(iter);
@@ -221,6 +260,49 @@ bool pb_field_iter_find(pb_field_iter_t *iter, uint32_t tag)
     }
 }
 
+/* Read a bool value without causing undefined behavior even if the value
+ * is invalid. See issue #434 and
+ * https://stackoverflow.com/questions/27661768/weird-results-for-conditional
+ */
+bool pb_safe_read_bool(const void *pSize)
+{
+    const char *p = (const char *)pSize;
+    size_t i;
+    for (i = 0; i < sizeof(bool); i++)
+    {
+        if (p[i] != 0)
+            return true;
+    }
+    return false;
+}
+
+bool pb_field_is_present(const pb_field_iter_t *field)
+{
+    if (field->descriptor->flags & PB_MSGFLAG_HAS_BITS)
+    {
+        return PB_HAS_BIT((const uint32_t*)field->message, field->index) != 0;
+    }
+    else
+    {
+        return pb_safe_read_bool(field->pSize);
+    }
+}
+
+void pb_field_set_present(const pb_field_iter_t *field, bool present)
+{
+    if (field->descriptor->flags & PB_MSGFLAG_HAS_BITS)
+    {
+        if (present)
+            PB_SET_HAS_BIT((uint32_t*)field->message, field->index);
+        else
+            PB_CLEAR_HAS_BIT((uint32_t*)field->message, field->index);
+    }
+    else
+    {
+        *(bool*)field->pSize = present;
+    }
+}
+
 bool pb_default_field_callback(pb_istream_t *istream, pb_ostream_t *ostream, const pb_field_t *field)
 {
     if (field->data_size == sizeof(pb_callback_t))
@@ -253,4 +335,181 @@ bool pb_default_field_callback(pb_istream_t *istream, pb_ostream_t *ostream, con
 
 }
 
+const pb_msgid_entry_t *pb_msgid_find(const pb_msgid_table_t *table, uint32_t msgid)
+{
+    const pb_msgid_entry_t *entries = table->entries;
+    pb_size_t low = 0;
+    pb_size_t high = table->count;
+
+    if (high == 0)
+        return NULL;
+
+    /* Consecutive ids can be indexed directly */
+    if (msgid >= entries[0].msgid && msgid - entries[0].msgid < table->count)
+    {
+        const pb_msgid_entry_t *entry = &entries[msgid - entries[0].msgid];
+        if (entry->msgid == msgid)
+            return entry;
+    }
+
+    while (low < high)
+    {
+        pb_size_t mid = (pb_size_t)(low + (high - low) / 2);
+
+        if (entries[mid].msgid < msgid)
+            low = (pb_size_t)(mid + 1);
+        else
+            high = mid;
+    }
+
+    if (low < table->count && entries[low].msgid == msgid)
+        return &entries[low];
+
+    return NULL;
+}
+
+/* Compare one value of a field, i.e. one entry of an array. For pointer-type
+ * strings and bytes, a and b are the pointers stored in the structure. */
+static bool value_equal(const pb_field_iter_t *field, const void *a, const void *b)
+{
+    if (a == b)
+        return true;
+
+    if (a == NULL || b == NULL)
+        return false; /* Pointer field that is only allocated in one message */
+
+    if (PB_ATYPE(field->type) == PB_ATYPE_VIEW)
+    {
+        const pb_bytes_view_t *view_a = (const pb_bytes_view_t*)a;
+        const pb_bytes_view_t *view_b = (const pb_bytes_view_t*)b;
+
+        if (PB_LTYPE(field->type) == PB_LTYPE_SUBMESSAGE &&
+            (((const pb_lazy_t*)a)->msg != NULL || ((const pb_lazy_t*)b)->msg != NULL))
+        {
+            /* Lazy submessage that has been accessed, and may have been modified */
+            return false;
+        }
+
+        return view_a->size == view_b->size &&
+               (view_a->size == 0 || memcmp(view_a->ptr, view_b->ptr, view_a->size) == 0);
+    }
+
+    switch (PB_LTYPE(field->type))
+    {
+        case PB_LTYPE_BYTES:
+        {
+            const pb_bytes_array_t *bytes_a = (const pb_bytes_array_t*)a;
+            const pb_bytes_array_t *bytes_b = (const pb_bytes_array_t*)b;
+            return bytes_a->size == bytes_b->size &&
+                   memcmp(bytes_a->bytes, bytes_b->bytes, bytes_a->size) == 0;
+        }
+
+        case PB_LTYPE_STRING:
+            if (PB_ATYPE(field->type) == PB_ATYPE_POINTER)
+                return strcmp((const char*)a, (const char*)b) == 0;
+            else
+                return strncmp((const char*)a, (const char*)b, field->data_size) == 0;
+
+        case PB_LTYPE_SUBMESSAGE:
+            return field->submsg_desc != NULL && pb_message_equal(field->submsg_desc, a, b);
+
+        default:
+            /* Integer, float and fixed length bytes values.
+             * The data_size does not include any padding. */
+            return memcmp(a, b, field->data_size) == 0;
+    }
+}
+
+bool pb_field_equal(const pb_field_iter_t *a, const pb_field_iter_t *b)
+{
+    pb_type_t type = a->type;
+
+    if (PB_LTYPE(type) == PB_LTYPE_EXTENSION)
+    {
+        /* Extensions can only be compared when there are none */
+        return *(pb_extension_t* const*)a->pData == NULL &&
+               *(pb_extension_t* const*)b->pData == NULL;
+    }
+    else if (PB_ATYPE(type) == PB_ATYPE_CALLBACK)
+    {
+        /* The data of callback fields is not available */
+        return false;
+    }
+    else if (PB_HTYPE(type) == PB_HTYPE_REPEATED)
+    {
+        pb_size_t count = *(const pb_size_t*)a->pSize;
+        pb_size_t i;
+
+        if (count != *(const pb_size_t*)b->pSize)
+            return false;
+
+        for (i = 0; i < count; i++)
+        {
+            const void *item_a = (const char*)a->pData + (size_t)a->data_size * i;
+            const void *item_b = (const char*)b->pData + (size_t)b->data_size * i;
+
+            if (PB_ATYPE(type) == PB_ATYPE_POINTER &&
+                (PB_LTYPE(type) == PB_LTYPE_STRING || PB_LTYPE(type) == PB_LTYPE_BYTES))
+            {
+                /* Array of pointers to the values */
+                item_a = *(const void* const*)item_a;
+                item_b = *(const void* const*)item_b;
+            }
+
+            if (!value_equal(a, item_a, item_b))
+                return false;
+        }
+
+        return true;
+    }
+    else if (PB_HTYPE(type) == PB_HTYPE_ONEOF)
+    {
+        bool present = (*(const pb_size_t*)a->pSize == a->tag);
+
+        if (present != (*(const pb_size_t*)b->pSize == b->tag))
+            return false;
+
+        if (!present)
+            return true;
+    }
+    else if (PB_HTYPE(type) == PB_HTYPE_OPTIONAL && a->pSize != NULL)
+    {
+        bool present = pb_field_is_present(a);
+
+        if (present != pb_field_is_present(b))
+            return false;
+
+        if (!present)
+            return true;
+    }
+
+    return value_equal(a, a->pData, b->pData);
+}
+
+bool pb_message_equal(const pb_msgdesc_t *fields, const void *a, const void *b)
+{
+    pb_field_iter_t iter_a;
+    pb_field_iter_t iter_b;
+
+    /* The iterators take non-const pointers, but are only used for reading */
+    union {
+        void *p1;
+        const void *p2;
+    } msg_a, msg_b;
+    msg_a.p2 = a;
+    msg_b.p2 = b;
+
+    if (!pb_field_iter_begin(&iter_a, fields, msg_a.p1) ||
+        !pb_field_iter_begin(&iter_b, fields, msg_b.p1))
+    {
+        return true; /* Empty message type */
+    }
 
+    do
+    {
+        if (!pb_field_equal(&iter_a, &iter_b))
+            return false;
+    } while (pb_field_iter_next(&iter_a) && pb_field_iter_next(&iter_b));
+
+    return true;
+}
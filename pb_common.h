@@ -26,6 +26,27 @@ bool pb_field_iter_next(pb_field_iter_t *iter);
  * Returns false if no such field exists. */
 bool pb_field_iter_find(pb_field_iter_t *iter, uint32_t tag);
 
+/* Read a bool value without causing undefined behavior even if the value
+ * is invalid. */
+bool pb_safe_read_bool(const void *pSize);
+
+/* Get or set the presence of an optional field that has field->pSize set.
+ * Handles both has_ fields and the has_bits array of messages. */
+bool pb_field_is_present(const pb_field_iter_t *field);
+void pb_field_set_present(const pb_field_iter_t *field, bool present);
+
+/* Find the entry of a message id from a generated msgid table.
+ * Returns NULL if the id is not in the table. */
+const pb_msgid_entry_t *pb_msgid_find(const pb_msgid_table_t *table, uint32_t msgid);
+
+/* Compare the values of a field in two messages of the same type. This is
+ * also used by pb_message_equal(), declared in pb.h, for whole messages.
+ * Presence of optional fields, array counts and submessages are compared
+ * recursively, and padding bytes are ignored. Callback fields are never
+ * equal because their data is not available, and neither are extension
+ * fields unless both messages have none. */
+bool pb_field_equal(const pb_field_iter_t *a, const pb_field_iter_t *b);
+
 #ifdef __cplusplus
 } /* extern "C" */
 #endif
@@ -22,6 +22,14 @@
  **************************************/
 
 static bool checkreturn buf_read(pb_istream_t *stream, pb_byte_t *buf, size_t count);
+#ifndef PB_BUFFER_ONLY
+static bool checkreturn buffered_fill(pb_istream_t *stream);
+static bool checkreturn buffered_read(pb_istream_t *stream, pb_byte_t *buf, size_t count);
+#endif
+static const pb_byte_t *peek_input(pb_istream_t *stream, size_t *avail);
+static const pb_byte_t *peek_varint(pb_istream_t *stream, size_t *avail);
+static void consume_input(pb_istream_t *stream, size_t count);
+static bool checkreturn buf_decode_varint32(pb_istream_t *stream, const pb_byte_t *buf, size_t avail, uint32_t *dest, bool *eof);
 static bool checkreturn pb_decode_varint32_eof(pb_istream_t *stream, uint32_t *dest, bool *eof);
 static bool checkreturn read_raw_value(pb_istream_t *stream, pb_wire_type_t wire_type, pb_byte_t *buf, size_t *size);
 static bool checkreturn decode_basic_field(pb_istream_t *stream, pb_field_iter_t *field);
@@ -29,9 +37,12 @@ static bool checkreturn decode_static_field(pb_istream_t *stream, pb_wire_type_t
 static bool checkreturn decode_pointer_field(pb_istream_t *stream, pb_wire_type_t wire_type, pb_field_iter_t *field);
 static bool checkreturn decode_callback_field(pb_istream_t *stream, pb_wire_type_t wire_type, pb_field_iter_t *field);
 static bool checkreturn decode_field(pb_istream_t *stream, pb_wire_type_t wire_type, pb_field_iter_t *field);
+static bool checkreturn decode_masked_submessage(pb_istream_t *stream, pb_wire_type_t wire_type, pb_field_iter_t *field, const pb_field_mask_t *mask);
+static bool checkreturn decode_message(pb_istream_t *stream, const pb_msgdesc_t *fields, void *dest_struct, unsigned int flags, const pb_field_mask_t *mask);
 static bool checkreturn default_extension_decoder(pb_istream_t *stream, pb_extension_t *extension, uint32_t tag, pb_wire_type_t wire_type);
 static bool checkreturn decode_extension(pb_istream_t *stream, uint32_t tag, pb_wire_type_t wire_type, pb_field_iter_t *iter);
 static bool checkreturn find_extension_field(pb_field_iter_t *iter);
+static bool checkreturn check_required_fields(pb_istream_t *stream, const pb_msgdesc_t *fields, const uint32_t *fields_seen);
 static bool pb_message_set_to_defaults(pb_field_iter_t *iter);
 static bool checkreturn pb_dec_bool(pb_istream_t *stream, const pb_field_iter_t *field);
 static bool checkreturn pb_dec_varint(pb_istream_t *stream, const pb_field_iter_t *field);
@@ -40,10 +51,13 @@ static bool checkreturn pb_dec_bytes(pb_istream_t *stream, const pb_field_iter_t
 static bool checkreturn pb_dec_string(pb_istream_t *stream, const pb_field_iter_t *field);
 static bool checkreturn pb_dec_submessage(pb_istream_t *stream, const pb_field_iter_t *field);
 static bool checkreturn pb_dec_fixed_length_bytes(pb_istream_t *stream, const pb_field_iter_t *field);
+static bool checkreturn pb_dec_view(pb_istream_t *stream, const pb_field_iter_t *field);
 static bool checkreturn pb_skip_varint(pb_istream_t *stream);
 static bool checkreturn pb_skip_string(pb_istream_t *stream);
 
 #ifdef PB_ENABLE_MALLOC
+static bool arena_contains(const pb_arena_t *arena, const void *ptr);
+static void *arena_realloc(pb_arena_t *arena, void *ptr, size_t size);
 static bool checkreturn allocate_field(pb_istream_t *stream, void *pData, size_t data_size, size_t array_size);
 static void initialize_pointer_field(void *pItem, pb_field_iter_t *field);
 static bool checkreturn pb_release_union_field(pb_istream_t *stream, pb_field_iter_t *field);
@@ -68,19 +82,177 @@ typedef struct {
 
 static bool checkreturn buf_read(pb_istream_t *stream, pb_byte_t *buf, size_t count)
 {
-    size_t i;
     const pb_byte_t *source = (const pb_byte_t*)stream->state;
     stream->state = (pb_byte_t*)stream->state + count;
     
     if (buf != NULL)
     {
-        for (i = 0; i < count; i++)
-            buf[i] = source[i];
+        memcpy(buf, source, count);
     }
     
     return true;
 }
 
+/* Memory buffer streams are handled directly in the decoding functions,
+ * without going through the callback for every byte. */
+#ifdef PB_BUFFER_ONLY
+#define PB_IS_BUFFER_STREAM(stream) true
+#else
+#define PB_IS_BUFFER_STREAM(stream) ((stream)->callback == buf_read)
+#endif
+
+#ifndef PB_BUFFER_ONLY
+/* Pass a read error from the source on to a buffered stream. A source
+ * signals end of input by setting bytes_left to 0 and failing the read.
+ * The buffer is empty at this point, so the buffered stream has reached
+ * the end too, and pb_decode_tag() can report it as eof. */
+static void buffered_source_error(pb_istream_t *stream)
+{
+    pb_istream_buffer_t *state = (pb_istream_buffer_t*)stream->state;
+
+    if (state->source->bytes_left == 0)
+        stream->bytes_left = 0;
+
+#ifndef PB_NO_ERRMSG
+    stream->errmsg = state->source->errmsg;
+#endif
+}
+
+/* Read the next block from the source of a buffered stream, after all the
+ * data in the buffer has been consumed. */
+static bool checkreturn buffered_fill(pb_istream_t *stream)
+{
+    pb_istream_buffer_t *state = (pb_istream_buffer_t*)stream->state;
+    size_t count = state->size;
+
+    if (count > state->source->bytes_left)
+        count = state->source->bytes_left;
+
+    if (count == 0)
+    {
+        stream->bytes_left = 0;
+        PB_RETURN_ERROR(stream, "end-of-stream");
+    }
+
+    if (!pb_read(state->source, state->buffer, count))
+    {
+        buffered_source_error(stream);
+        return false;
+    }
+
+    state->pos = 0;
+    state->end = count;
+    return true;
+}
+
+static bool checkreturn buffered_read(pb_istream_t *stream, pb_byte_t *buf, size_t count)
+{
+    pb_istream_buffer_t *state = (pb_istream_buffer_t*)stream->state;
+
+    while (count > 0)
+    {
+        size_t avail = state->end - state->pos;
+
+        if (avail == 0)
+        {
+            if (count >= state->size)
+            {
+                /* Large reads go directly to the destination */
+                if (!pb_read(state->source, buf, count))
+                {
+                    buffered_source_error(stream);
+                    return false;
+                }
+                return true;
+            }
+
+            if (!buffered_fill(stream))
+                return false;
+
+            avail = state->end;
+        }
+
+        if (avail > count)
+            avail = count;
+
+        memcpy(buf, state->buffer + state->pos, avail);
+        state->pos += avail;
+        buf += avail;
+        count -= avail;
+    }
+
+    return true;
+}
+#endif
+
+/* Get the input data that can be accessed directly in memory: the rest of
+ * a memory buffer stream, or the data read ahead by a buffered stream.
+ * Returns NULL for other callback streams. */
+static const pb_byte_t *peek_input(pb_istream_t *stream, size_t *avail)
+{
+    if (PB_IS_BUFFER_STREAM(stream))
+    {
+        *avail = stream->bytes_left;
+        return (const pb_byte_t*)stream->state;
+    }
+
+#ifndef PB_BUFFER_ONLY
+    if (stream->callback == buffered_read)
+    {
+        pb_istream_buffer_t *state = (pb_istream_buffer_t*)stream->state;
+
+        if (state->pos == state->end && stream->bytes_left > 0)
+        {
+            if (!buffered_fill(stream))
+                return NULL;
+        }
+
+        *avail = state->end - state->pos;
+        if (*avail > stream->bytes_left)
+            *avail = stream->bytes_left;
+
+        return state->buffer + state->pos;
+    }
+#endif
+
+    return NULL;
+}
+
+/* Like peek_input(), but returns data from a buffered stream only if the
+ * whole varint is contained in it. Otherwise the caller has to fall back
+ * to reading it byte by byte. */
+static const pb_byte_t *peek_varint(pb_istream_t *stream, size_t *avail)
+{
+    const pb_byte_t *buf = peek_input(stream, avail);
+
+    if (buf != NULL && *avail < stream->bytes_left)
+    {
+        size_t i;
+        for (i = 0; i < *avail; i++)
+        {
+            if ((buf[i] & 0x80) == 0)
+                return buf;
+        }
+
+        return NULL;
+    }
+
+    return buf;
+}
+
+/* Mark bytes returned by peek_input() as read. */
+static void consume_input(pb_istream_t *stream, size_t count)
+{
+#ifndef PB_BUFFER_ONLY
+    if (stream->callback == buffered_read)
+        ((pb_istream_buffer_t*)stream->state)->pos += count;
+    else
+#endif
+        stream->state = (pb_byte_t*)stream->state + count;
+
+    stream->bytes_left -= count;
+}
+
 bool checkreturn pb_read(pb_istream_t *stream, pb_byte_t *buf, size_t count)
 {
     if (count == 0)
@@ -125,12 +297,16 @@ static bool checkreturn pb_readbyte(pb_istream_t *stream, pb_byte_t *buf)
     if (stream->bytes_left == 0)
         PB_RETURN_ERROR(stream, "end-of-stream");
 
+    if (PB_IS_BUFFER_STREAM(stream))
+    {
+        *buf = *(const pb_byte_t*)stream->state;
+        stream->state = (pb_byte_t*)stream->state + 1;
+    }
 #ifndef PB_BUFFER_ONLY
-    if (!stream->callback(stream, buf, 1))
+    else if (!stream->callback(stream, buf, 1))
+    {
         PB_RETURN_ERROR(stream, "io error");
-#else
-    *buf = *(const pb_byte_t*)stream->state;
-    stream->state = (pb_byte_t*)stream->state + 1;
+    }
 #endif
 
     stream->bytes_left--;
@@ -138,6 +314,30 @@ static bool checkreturn pb_readbyte(pb_istream_t *stream, pb_byte_t *buf)
     return true;    
 }
 
+#ifndef PB_BUFFER_ONLY
+pb_istream_t pb_istream_buffered(pb_istream_buffer_t *state, pb_istream_t *source,
+                                 pb_byte_t *buffer, size_t bufsize)
+{
+    pb_istream_t stream;
+    state->source = source;
+    state->buffer = buffer;
+    state->size = bufsize;
+    state->pos = 0;
+    state->end = 0;
+
+    stream.callback = &buffered_read;
+    stream.state = state;
+    stream.bytes_left = source->bytes_left;
+#ifndef PB_NO_ERRMSG
+    stream.errmsg = NULL;
+#endif
+#ifdef PB_ENABLE_MALLOC
+    stream.arena = NULL;
+#endif
+    return stream;
+}
+#endif
+
 pb_istream_t pb_istream_from_buffer(const pb_byte_t *buf, size_t bufsize)
 {
     pb_istream_t stream;
@@ -158,6 +358,9 @@ pb_istream_t pb_istream_from_buffer(const pb_byte_t *buf, size_t bufsize)
     stream.bytes_left = bufsize;
 #ifndef PB_NO_ERRMSG
     stream.errmsg = NULL;
+#endif
+#ifdef PB_ENABLE_MALLOC
+    stream.arena = NULL;
 #endif
     return stream;
 }
@@ -166,11 +369,79 @@ pb_istream_t pb_istream_from_buffer(const pb_byte_t *buf, size_t bufsize)
  * Helper functions *
  ********************/
 
+/* Decode a varint directly from the data returned by peek_varint().
+ * The accepted encodings and the error messages are the same as in the
+ * generic version below. */
+static bool checkreturn buf_decode_varint32(pb_istream_t *stream, const pb_byte_t *buf, size_t avail, uint32_t *dest, bool *eof)
+{
+    size_t pos = 1;
+    pb_byte_t byte;
+    uint32_t result;
+
+    if (avail == 0)
+    {
+        if (eof)
+        {
+            *eof = true;
+        }
+
+        PB_RETURN_ERROR(stream, "end-of-stream");
+    }
+
+    byte = buf[0];
+    result = byte;
+
+    if (byte & 0x80)
+    {
+        uint_fast8_t bitpos = 7;
+        result = byte & 0x7F;
+
+        do
+        {
+            if (pos >= avail)
+                PB_RETURN_ERROR(stream, "end-of-stream");
+
+            byte = buf[pos++];
+
+            if (bitpos >= 32)
+            {
+                /* Note: The varint could have trailing 0x80 bytes, or 0xFF for negative. */
+                uint8_t sign_extension = (bitpos < 63) ? 0xFF : 0x01;
+
+                if ((byte & 0x7F) != 0x00 && ((result >> 31) == 0 || byte != sign_extension))
+                {
+                    PB_RETURN_ERROR(stream, "varint overflow");
+                }
+            }
+            else
+            {
+                result |= (uint32_t)(byte & 0x7F) << bitpos;
+            }
+            bitpos = (uint_fast8_t)(bitpos + 7);
+        } while (byte & 0x80);
+
+        if (bitpos == 35 && (byte & 0x70) != 0)
+        {
+            /* The last byte was at bitpos=28, so only bottom 4 bits fit. */
+            PB_RETURN_ERROR(stream, "varint overflow");
+        }
+    }
+
+    consume_input(stream, pos);
+    *dest = result;
+    return true;
+}
+
 static bool checkreturn pb_decode_varint32_eof(pb_istream_t *stream, uint32_t *dest, bool *eof)
 {
     pb_byte_t byte;
     uint32_t result;
+    size_t avail;
+    const pb_byte_t *buf = peek_varint(stream, &avail);
     
+    if (buf != NULL)
+        return buf_decode_varint32(stream, buf, avail, dest, eof);
+
     if (!pb_readbyte(stream, &byte))
     {
         if (stream->bytes_left == 0)
@@ -239,7 +510,31 @@ bool checkreturn pb_decode_varint(pb_istream_t *stream, uint64_t *dest)
     pb_byte_t byte;
     uint_fast8_t bitpos = 0;
     uint64_t result = 0;
+    size_t avail;
+    const pb_byte_t *buf = peek_varint(stream, &avail);
     
+    if (buf != NULL)
+    {
+        size_t pos = 0;
+
+        do
+        {
+            if (bitpos >= 64)
+                PB_RETURN_ERROR(stream, "varint overflow");
+
+            if (pos >= avail)
+                PB_RETURN_ERROR(stream, "end-of-stream");
+
+            byte = buf[pos++];
+            result |= (uint64_t)(byte & 0x7F) << bitpos;
+            bitpos = (uint_fast8_t)(bitpos + 7);
+        } while (byte & 0x80);
+
+        consume_input(stream, pos);
+        *dest = result;
+        return true;
+    }
+
     do
     {
         if (bitpos >= 64)
@@ -260,6 +555,25 @@ bool checkreturn pb_decode_varint(pb_istream_t *stream, uint64_t *dest)
 bool checkreturn pb_skip_varint(pb_istream_t *stream)
 {
     pb_byte_t byte;
+    size_t avail;
+    const pb_byte_t *buf = peek_varint(stream, &avail);
+
+    if (buf != NULL)
+    {
+        size_t pos = 0;
+
+        do
+        {
+            if (pos >= avail)
+                PB_RETURN_ERROR(stream, "end-of-stream");
+
+            byte = buf[pos++];
+        } while (byte & 0x80);
+
+        consume_input(stream, pos);
+        return true;
+    }
+
     do
     {
         if (!pb_read(stream, &byte, 1))
@@ -424,7 +738,7 @@ static bool checkreturn decode_static_field(pb_istream_t *stream, pb_wire_type_t
             
         case PB_HTYPE_OPTIONAL:
             if (field->pSize != NULL)
-                *(bool*)field->pSize = true;
+                pb_field_set_present(field, true);
             return decode_basic_field(stream, field);
     
         case PB_HTYPE_REPEATED:
@@ -440,6 +754,26 @@ static bool checkreturn decode_static_field(pb_istream_t *stream, pb_wire_type_t
                 if (!pb_make_string_substream(stream, &substream))
                     return false;
 
+#if PB_LITTLE_ENDIAN_8BIT
+                if ((PB_LTYPE(field->type) == PB_LTYPE_FIXED32 && field->data_size == 4) ||
+                    (PB_LTYPE(field->type) == PB_LTYPE_FIXED64 && field->data_size == 8))
+                {
+                    /* The wire format matches the memory representation,
+                     * so all the values can be copied at once. */
+                    size_t count = substream.bytes_left / field->data_size;
+                    size_t space = 0;
+                    if (*size < field->array_size)
+                        space = (size_t)(field->array_size - *size);
+                    if (count > space)
+                        count = space;
+
+                    if (pb_read(&substream, (pb_byte_t*)field->pData, count * field->data_size))
+                        *size = (pb_size_t)(*size + count);
+                    else
+                        status = false;
+                }
+                else
+#endif
                 while (substream.bytes_left > 0 && *size < field->array_size)
                 {
                     if (!decode_basic_field(&substream, field))
@@ -471,13 +805,17 @@ static bool checkreturn decode_static_field(pb_istream_t *stream, pb_wire_type_t
             }
 
         case PB_HTYPE_ONEOF:
-            *(pb_size_t*)field->pSize = field->tag;
-            if (PB_LTYPE(field->type) == PB_LTYPE_SUBMESSAGE)
+            if (PB_LTYPE(field->type) == PB_LTYPE_SUBMESSAGE &&
+                (PB_ATYPE(field->type) != PB_ATYPE_VIEW ||
+                 *(pb_size_t*)field->pSize != field->tag))
             {
                 /* We memset to zero so that any callbacks are set to NULL.
-                 * pb_dec_submessage() will set any default values. */
+                 * pb_dec_submessage() will set any default values.
+                 * A lazy submessage that is already stored in the oneof
+                 * is kept, so that pb_dec_submessage() can detect it. */
                 memset(field->pData, 0, field->data_size);
             }
+            *(pb_size_t*)field->pSize = field->tag;
             return decode_basic_field(stream, field);
 
         default:
@@ -486,6 +824,88 @@ static bool checkreturn decode_static_field(pb_istream_t *stream, pb_wire_type_t
 }
 
 #ifdef PB_ENABLE_MALLOC
+void pb_arena_init(pb_arena_t *arena, void *buffer, size_t size)
+{
+    arena->buffer = (pb_byte_t*)buffer;
+    arena->size = size;
+    arena->used = 0;
+}
+
+void pb_arena_reset(pb_arena_t *arena)
+{
+    arena->used = 0;
+}
+
+/* Check that ptr has been allocated from the arena since its last reset,
+ * so that it is preceded by an allocation header. */
+static bool arena_contains(const pb_arena_t *arena, const void *ptr)
+{
+    const pb_byte_t *p = (const pb_byte_t*)ptr;
+    return p >= arena->buffer + sizeof(pb_arena_align_t) &&
+           p < arena->buffer + arena->used;
+}
+
+/* Reallocate memory from an arena, with the same semantics as realloc().
+ * The most recent allocation is grown in place. Other allocations are
+ * moved, and the capacity is at least doubled so that growing an array
+ * one entry at a time does not use up the arena. The old memory is
+ * not reused until pb_arena_reset().
+ */
+static void *arena_realloc(pb_arena_t *arena, void *ptr, size_t size)
+{
+    const size_t unit = sizeof(pb_arena_align_t);
+    size_t old_capacity = 0;
+    size_t capacity;
+    pb_arena_align_t *header;
+
+    if (size > arena->size)
+        return NULL;
+
+    /* Round up to keep following allocations aligned */
+    size = (size + unit - 1) / unit * unit;
+
+    if (ptr != NULL)
+    {
+        header = (pb_arena_align_t*)ptr - 1;
+        old_capacity = header->capacity;
+
+        if (size <= old_capacity)
+            return ptr;
+
+        if ((pb_byte_t*)ptr + old_capacity == arena->buffer + arena->used)
+        {
+            /* Last allocation, grow in place */
+            if (size - old_capacity > arena->size - arena->used)
+                return NULL;
+
+            arena->used += size - old_capacity;
+            header->capacity = size;
+            return ptr;
+        }
+    }
+
+    capacity = size;
+    if (capacity < 2 * old_capacity)
+        capacity = 2 * old_capacity;
+
+    if (capacity + unit > arena->size - arena->used)
+    {
+        /* Not enough space for doubling, try the exact size */
+        capacity = size;
+        if (capacity + unit > arena->size - arena->used)
+            return NULL;
+    }
+
+    header = (pb_arena_align_t*)(void*)(arena->buffer + arena->used);
+    header->capacity = capacity;
+    arena->used += unit + capacity;
+
+    if (ptr != NULL)
+        memcpy(header + 1, ptr, old_capacity);
+
+    return header + 1;
+}
+
 /* Allocate storage for the field and store the pointer at iter->pData.
  * array_size is the number of entries to reserve in an array.
  * Zero size is not allowed, use pb_free() for releasing.
@@ -517,9 +937,21 @@ static bool checkreturn allocate_field(pb_istream_t *stream, void *pData, size_t
     /* Allocate new or expand previous allocation */
     /* Note: on failure the old pointer will remain in the structure,
      * the message must be freed by caller also on error return. */
-    ptr = pb_realloc(ptr, array_size * data_size);
-    if (ptr == NULL)
-        PB_RETURN_ERROR(stream, "realloc failed");
+    if (stream->arena != NULL)
+    {
+        if (ptr != NULL && !arena_contains(stream->arena, ptr))
+            PB_RETURN_ERROR(stream, "pointer not from arena");
+
+        ptr = arena_realloc(stream->arena, ptr, array_size * data_size);
+        if (ptr == NULL)
+            PB_RETURN_ERROR(stream, "arena full");
+    }
+    else
+    {
+        ptr = pb_realloc(ptr, array_size * data_size);
+        if (ptr == NULL)
+            PB_RETURN_ERROR(stream, "realloc failed");
+    }
     
     *(void**)pData = ptr;
     return true;
@@ -561,9 +993,10 @@ static bool checkreturn decode_pointer_field(pb_istream_t *stream, pb_wire_type_
         case PB_HTYPE_OPTIONAL:
         case PB_HTYPE_ONEOF:
             if (PB_LTYPE(field->type) == PB_LTYPE_SUBMESSAGE &&
-                *(void**)field->pField != NULL)
+                *(void**)field->pField != NULL && stream->arena == NULL)
             {
-                /* Duplicate field, have to release the old allocation first. */
+                /* Duplicate field, have to release the old allocation first.
+                 * With an arena, the old allocation is simply reused. */
                 /* FIXME: Does this work correctly for oneofs? */
                 pb_release_single_field(field);
             }
@@ -725,6 +1158,7 @@ static bool checkreturn decode_field(pb_istream_t *stream, pb_wire_type_t wire_t
     switch (PB_ATYPE(field->type))
     {
         case PB_ATYPE_STATIC:
+        case PB_ATYPE_VIEW:
             return decode_static_field(stream, wire_type, field);
         
         case PB_ATYPE_POINTER:
@@ -738,40 +1172,98 @@ static bool checkreturn decode_field(pb_istream_t *stream, pb_wire_type_t wire_t
     }
 }
 
-/* Default handler for extension fields. Expects to have a pb_msgdesc_t
- * pointer in the extension->type->arg field, pointing to a message with
- * only one field in it.  */
-static bool checkreturn default_extension_decoder(pb_istream_t *stream,
-    pb_extension_t *extension, uint32_t tag, pb_wire_type_t wire_type)
+/* Decode a static submessage field, storing only the fields selected by
+ * mask. This does the same as decode_static_field() and pb_dec_submessage()
+ * do for unmasked submessages. */
+static bool checkreturn decode_masked_submessage(pb_istream_t *stream, pb_wire_type_t wire_type, pb_field_iter_t *field, const pb_field_mask_t *mask)
 {
-    pb_field_iter_t iter;
+    unsigned int flags = PB_DECODE_DELIMITED;
 
-    if (!pb_field_iter_begin_extension(&iter, extension))
-        PB_RETURN_ERROR(stream, "invalid extension");
+    if (PB_ATYPE(field->type) != PB_ATYPE_STATIC ||
+        PB_LTYPE(field->type) != PB_LTYPE_SUBMESSAGE)
+    {
+        /* Other submessage types are decoded in full */
+        return decode_field(stream, wire_type, field);
+    }
 
-    if (iter.tag != tag)
-        return true;
+    if (wire_type != PB_WT_STRING)
+        PB_RETURN_ERROR(stream, "wrong wire type");
 
-    extension->found = true;
-    return decode_field(stream, wire_type, &iter);
-}
+    if (field->submsg_desc == NULL)
+        PB_RETURN_ERROR(stream, "invalid field descriptor");
 
-/* Try to decode an unknown field as an extension field. Tries each extension
- * decoder in turn, until one of them handles the field or loop ends. */
-static bool checkreturn decode_extension(pb_istream_t *stream,
-    uint32_t tag, pb_wire_type_t wire_type, pb_field_iter_t *iter)
-{
-    pb_extension_t *extension = *(pb_extension_t* const *)iter->pData;
-    size_t pos = stream->bytes_left;
-    
-    while (extension != NULL && pos == stream->bytes_left)
+    switch (PB_HTYPE(field->type))
     {
-        bool status;
-        if (extension->type->decode)
-            status = extension->type->decode(stream, extension, tag, wire_type);
-        else
-            status = default_extension_decoder(stream, extension, tag, wire_type);
-
+        case PB_HTYPE_REQUIRED:
+            flags |= PB_DECODE_NOINIT;
+            break;
+
+        case PB_HTYPE_OPTIONAL:
+            if (field->pSize != NULL)
+                pb_field_set_present(field, true);
+            flags |= PB_DECODE_NOINIT;
+            break;
+
+        case PB_HTYPE_REPEATED:
+        {
+            pb_size_t *size = (pb_size_t*)field->pSize;
+            field->pData = (char*)field->pField + field->data_size * (*size);
+
+            if ((*size)++ >= field->array_size)
+                PB_RETURN_ERROR(stream, "array overflow");
+            break;
+        }
+
+        case PB_HTYPE_ONEOF:
+#ifdef PB_ENABLE_MALLOC
+            if (!pb_release_union_field(stream, field))
+                return false;
+#endif
+            *(pb_size_t*)field->pSize = field->tag;
+            memset(field->pData, 0, field->data_size);
+            break;
+
+        default:
+            PB_RETURN_ERROR(stream, "invalid field type");
+    }
+
+    return decode_message(stream, field->submsg_desc, field->pData, flags, mask);
+}
+
+/* Default handler for extension fields. Expects to have a pb_msgdesc_t
+ * pointer in the extension->type->arg field, pointing to a message with
+ * only one field in it.  */
+static bool checkreturn default_extension_decoder(pb_istream_t *stream,
+    pb_extension_t *extension, uint32_t tag, pb_wire_type_t wire_type)
+{
+    pb_field_iter_t iter;
+
+    if (!pb_field_iter_begin_extension(&iter, extension))
+        PB_RETURN_ERROR(stream, "invalid extension");
+
+    if (iter.tag != tag)
+        return true;
+
+    extension->found = true;
+    return decode_field(stream, wire_type, &iter);
+}
+
+/* Try to decode an unknown field as an extension field. Tries each extension
+ * decoder in turn, until one of them handles the field or loop ends. */
+static bool checkreturn decode_extension(pb_istream_t *stream,
+    uint32_t tag, pb_wire_type_t wire_type, pb_field_iter_t *iter)
+{
+    pb_extension_t *extension = *(pb_extension_t* const *)iter->pData;
+    size_t pos = stream->bytes_left;
+    
+    while (extension != NULL && pos == stream->bytes_left)
+    {
+        bool status;
+        if (extension->type->decode)
+            status = extension->type->decode(stream, extension, tag, wire_type);
+        else
+            status = default_extension_decoder(stream, extension, tag, wire_type);
+
         if (!status)
             return false;
         
@@ -818,14 +1310,18 @@ static bool pb_field_set_to_default(pb_field_iter_t *field)
             ext = ext->next;
         }
     }
-    else if (PB_ATYPE(type) == PB_ATYPE_STATIC)
+    else if (PB_ATYPE(type) == PB_ATYPE_STATIC || PB_ATYPE(type) == PB_ATYPE_VIEW)
     {
         bool init_data = true;
         if (PB_HTYPE(type) == PB_HTYPE_OPTIONAL && field->pSize != NULL)
         {
             /* Set has_field to false. Still initialize the optional field
-             * itself also. */
-            *(bool*)field->pSize = false;
+             * itself also. With has_bits, the whole word is cleared so that
+             * the bits of non-optional fields are zero as well. */
+            if (field->descriptor->flags & PB_MSGFLAG_HAS_BITS)
+                *(uint32_t*)field->pSize = 0;
+            else
+                pb_field_set_present(field, false);
         }
         else if (PB_HTYPE(type) == PB_HTYPE_REPEATED ||
                  PB_HTYPE(type) == PB_HTYPE_ONEOF)
@@ -838,7 +1334,8 @@ static bool pb_field_set_to_default(pb_field_iter_t *field)
 
         if (init_data)
         {
-            if (PB_LTYPE(field->type) == PB_LTYPE_SUBMESSAGE)
+            if (PB_LTYPE(field->type) == PB_LTYPE_SUBMESSAGE &&
+                PB_ATYPE(field->type) != PB_ATYPE_VIEW)
             {
                 /* Initialize submessage to defaults */
                 pb_field_iter_t submsg_iter;
@@ -860,227 +1357,1122 @@ static bool pb_field_set_to_default(pb_field_iter_t *field)
         /* Initialize the pointer to NULL. */
         *(void**)field->pField = NULL;
 
-        /* Initialize array count to 0. */
-        if (PB_HTYPE(type) == PB_HTYPE_REPEATED ||
-            PB_HTYPE(type) == PB_HTYPE_ONEOF)
-        {
-            *(pb_size_t*)field->pSize = 0;
-        }
+        /* Initialize array count to 0. */
+        if (PB_HTYPE(type) == PB_HTYPE_REPEATED ||
+            PB_HTYPE(type) == PB_HTYPE_ONEOF)
+        {
+            *(pb_size_t*)field->pSize = 0;
+        }
+    }
+    else if (PB_ATYPE(type) == PB_ATYPE_CALLBACK)
+    {
+        /* Don't overwrite callback */
+    }
+
+    return true;
+}
+
+static bool pb_message_set_to_defaults(pb_field_iter_t *iter)
+{
+    pb_istream_t defstream = PB_ISTREAM_EMPTY;
+    uint32_t tag = 0;
+    pb_wire_type_t wire_type = PB_WT_VARINT;
+    bool eof;
+
+    if (iter->descriptor->default_instance)
+    {
+        /* All fields are static, so the precomputed defaults can be
+         * copied over the whole structure. */
+        memcpy(iter->message, iter->descriptor->default_instance, iter->descriptor->struct_size);
+        return true;
+    }
+
+    if (iter->descriptor->default_value)
+    {
+        defstream = pb_istream_from_buffer(iter->descriptor->default_value, (size_t)-1);
+        if (!pb_decode_tag(&defstream, &wire_type, &tag, &eof))
+            return false;
+    }
+
+    do
+    {
+        if (!pb_field_set_to_default(iter))
+            return false;
+
+        if (tag != 0 && iter->tag == tag)
+        {
+            /* We have a default value for this field in the defstream */
+            if (!decode_field(&defstream, wire_type, iter))
+                return false;
+            if (!pb_decode_tag(&defstream, &wire_type, &tag, &eof))
+                return false;
+
+            if (iter->pSize)
+                pb_field_set_present(iter, false);
+        }
+    } while (pb_field_iter_next(iter));
+
+    return true;
+}
+
+/*********************
+ * Decode all fields *
+ *********************/
+
+/* Check the bits set for the required fields that were found. */
+static bool checkreturn check_required_fields(pb_istream_t *stream, const pb_msgdesc_t *fields, const uint32_t *fields_seen)
+{
+    const uint32_t allbits = ~(uint32_t)0;
+    unsigned req_field_count = fields->required_field_count;
+    unsigned i;
+
+    if (req_field_count > PB_MAX_REQUIRED_FIELDS)
+        req_field_count = PB_MAX_REQUIRED_FIELDS;
+
+    if (req_field_count > 0)
+    {
+        /* Check the whole words */
+        for (i = 0; i < (req_field_count >> 5); i++)
+        {
+            if (fields_seen[i] != allbits)
+                PB_RETURN_ERROR(stream, "missing required field");
+        }
+
+        /* Check the remaining bits (if any) */
+        if ((req_field_count & 31) != 0)
+        {
+            if (fields_seen[req_field_count >> 5] !=
+                (allbits >> (32 - (req_field_count & 31))))
+            {
+                PB_RETURN_ERROR(stream, "missing required field");
+            }
+        }
+    }
+
+    return true;
+}
+
+static bool checkreturn pb_decode_inner(pb_istream_t *stream, const pb_msgdesc_t *fields, void *dest_struct, unsigned int flags, const pb_field_mask_t *mask)
+{
+    uint32_t extension_range_start = 0;
+
+    /* 'fixed_count_field' and 'fixed_count_size' track position of a repeated fixed
+     * count field. This can only handle _one_ repeated fixed count field that
+     * is unpacked and unordered among other (non repeated fixed count) fields.
+     */
+    pb_size_t fixed_count_field = PB_SIZE_MAX;
+    pb_size_t fixed_count_size = 0;
+    pb_size_t fixed_count_total_size = 0;
+
+    pb_fields_seen_t fields_seen = {{0, 0}};
+    pb_field_iter_t iter;
+
+    /* Return value ignored, as empty message types will be correctly handled by
+     * pb_field_iter_find() anyway. */
+    (void)pb_field_iter_begin(&iter, fields, dest_struct);
+
+    while (stream->bytes_left)
+    {
+        uint32_t tag;
+        pb_wire_type_t wire_type;
+        bool eof;
+
+        if (!pb_decode_tag(stream, &wire_type, &tag, &eof))
+        {
+            if (eof)
+                break;
+            else
+                return false;
+        }
+
+        if (tag == 0)
+        {
+          if (flags & PB_DECODE_NULLTERMINATED)
+          {
+            break;
+          }
+          else
+          {
+            PB_RETURN_ERROR(stream, "zero tag");
+          }
+        }
+
+        if (!pb_field_iter_find(&iter, tag) || PB_LTYPE(iter.type) == PB_LTYPE_EXTENSION)
+        {
+            /* No match found, check if it matches an extension. */
+            if (tag >= extension_range_start)
+            {
+                if (!find_extension_field(&iter))
+                    extension_range_start = (uint32_t)-1;
+                else
+                    extension_range_start = iter.tag;
+
+                if (tag >= extension_range_start)
+                {
+                    size_t pos = stream->bytes_left;
+
+                    if (!decode_extension(stream, tag, wire_type, &iter))
+                        return false;
+
+                    if (pos != stream->bytes_left)
+                    {
+                        /* The field was handled */
+                        continue;
+                    }
+                }
+            }
+
+            /* No match found, skip data */
+            if (!pb_skip_field(stream, wire_type))
+                return false;
+            continue;
+        }
+
+        if (mask != NULL && !PB_HAS_BIT(mask->bits, iter.index))
+        {
+            /* Field is not selected, skip data */
+            if (!pb_skip_field(stream, wire_type))
+                return false;
+            continue;
+        }
+
+        /* If a repeated fixed count field was found, get size from
+         * 'fixed_count_field' as there is no counter contained in the struct.
+         */
+        if (PB_HTYPE(iter.type) == PB_HTYPE_REPEATED && iter.pSize == &iter.array_size)
+        {
+            if (fixed_count_field != iter.index) {
+                /* If the new fixed count field does not match the previous one,
+                 * check that the previous one is NULL or that it finished
+                 * receiving all the expected data.
+                 */
+                if (fixed_count_field != PB_SIZE_MAX &&
+                    fixed_count_size != fixed_count_total_size)
+                {
+                    PB_RETURN_ERROR(stream, "wrong size for fixed count field");
+                }
+
+                fixed_count_field = iter.index;
+                fixed_count_size = 0;
+                fixed_count_total_size = iter.array_size;
+            }
+
+            iter.pSize = &fixed_count_size;
+        }
+
+        if (PB_HTYPE(iter.type) == PB_HTYPE_REQUIRED
+            && iter.required_field_index < PB_MAX_REQUIRED_FIELDS)
+        {
+            uint32_t tmp = ((uint32_t)1 << (iter.required_field_index & 31));
+            fields_seen.bitfield[iter.required_field_index >> 5] |= tmp;
+        }
+
+        if (mask != NULL && mask->submasks != NULL && mask->submasks[iter.index] != NULL)
+        {
+            if (!decode_masked_submessage(stream, wire_type, &iter, mask->submasks[iter.index]))
+                return false;
+        }
+        else if (!decode_field(stream, wire_type, &iter))
+        {
+            return false;
+        }
+    }
+
+    /* Check that all elements of the last decoded fixed count field were present. */
+    if (fixed_count_field != PB_SIZE_MAX &&
+        fixed_count_size != fixed_count_total_size)
+    {
+        PB_RETURN_ERROR(stream, "wrong size for fixed count field");
+    }
+
+    /* Required fields outside the mask are not expected to be present. */
+    if (mask != NULL && pb_field_iter_begin(&iter, fields, dest_struct))
+    {
+        do
+        {
+            if (PB_HTYPE(iter.type) == PB_HTYPE_REQUIRED
+                && iter.required_field_index < PB_MAX_REQUIRED_FIELDS
+                && !PB_HAS_BIT(mask->bits, iter.index))
+            {
+                uint32_t tmp = ((uint32_t)1 << (iter.required_field_index & 31));
+                fields_seen.bitfield[iter.required_field_index >> 5] |= tmp;
+            }
+        } while (pb_field_iter_next(&iter));
+    }
+
+    /* Check that all required fields were present. */
+    return check_required_fields(stream, fields, fields_seen.bitfield);
+}
+
+static bool checkreturn decode_message(pb_istream_t *stream, const pb_msgdesc_t *fields, void *dest_struct, unsigned int flags, const pb_field_mask_t *mask)
+{
+    bool status;
+
+    if ((flags & PB_DECODE_NOINIT) == 0)
+    {
+        pb_field_iter_t iter;
+
+        if (pb_field_iter_begin(&iter, fields, dest_struct))
+        {
+            if (!pb_message_set_to_defaults(&iter))
+                PB_RETURN_ERROR(stream, "failed to set defaults");
+        }
+    }
+
+    if ((flags & PB_DECODE_DELIMITED) == 0)
+    {
+      status = pb_decode_inner(stream, fields, dest_struct, flags, mask);
+    }
+    else
+    {
+      pb_istream_t substream;
+      if (!pb_make_string_substream(stream, &substream))
+        return false;
+
+      status = pb_decode_inner(&substream, fields, dest_struct, flags, mask);
+
+      if (!pb_close_string_substream(stream, &substream))
+        return false;
+    }
+    
+#ifdef PB_ENABLE_MALLOC
+    if (!status && stream->arena == NULL)
+        pb_release(fields, dest_struct);
+#endif
+    
+    return status;
+}
+
+bool checkreturn pb_decode_ex(pb_istream_t *stream, const pb_msgdesc_t *fields, void *dest_struct, unsigned int flags)
+{
+#ifdef PB_ENABLE_MALLOC
+    stream->arena = NULL;
+#endif
+    return decode_message(stream, fields, dest_struct, flags, NULL);
+}
+
+#ifdef PB_ENABLE_MALLOC
+bool checkreturn pb_decode_arena(pb_istream_t *stream, const pb_msgdesc_t *fields, void *dest_struct, pb_arena_t *arena, unsigned int flags)
+{
+    bool status;
+    stream->arena = arena;
+    status = decode_message(stream, fields, dest_struct, flags, NULL);
+    stream->arena = NULL;
+    return status;
+}
+#endif
+
+bool checkreturn pb_decode(pb_istream_t *stream, const pb_msgdesc_t *fields, void *dest_struct)
+{
+  return pb_decode_ex(stream, fields, dest_struct, 0);
+}
+
+bool checkreturn pb_decode_masked(pb_istream_t *stream, const pb_msgdesc_t *fields, void *dest_struct, const pb_field_mask_t *mask, unsigned int flags)
+{
+#ifdef PB_ENABLE_MALLOC
+    stream->arena = NULL;
+#endif
+    return decode_message(stream, fields, dest_struct, flags, mask);
+}
+
+bool checkreturn pb_decode_batch(pb_istream_t *stream, const pb_msgdesc_t *fields, pb_batch_t *batch, unsigned int flags)
+{
+#ifdef PB_ENABLE_MALLOC
+    stream->arena = NULL;
+#endif
+
+    while (batch->count < batch->capacity)
+    {
+        size_t index = batch->start + batch->count;
+        void *dest_struct;
+        pb_istream_t substream;
+        uint32_t size;
+        bool eof = false;
+        bool defaults = true;
+        bool status;
+
+        if (index >= batch->capacity)
+            index -= batch->capacity;
+
+        dest_struct = (char*)batch->messages + index * fields->struct_size;
+
+        if (!pb_decode_varint32_eof(stream, &size, &eof))
+            return eof; /* End of stream between messages */
+
+        substream = *stream;
+        if (substream.bytes_left < size)
+            PB_RETURN_ERROR(stream, "parent stream too short");
+
+        substream.bytes_left = size;
+        stream->bytes_left -= size;
+
+        if ((flags & PB_DECODE_NOINIT) == 0)
+        {
+            pb_field_iter_t iter;
+
+            if (pb_field_iter_begin(&iter, fields, dest_struct))
+                defaults = pb_message_set_to_defaults(&iter);
+        }
+
+        status = defaults && pb_decode_inner(&substream, fields, dest_struct, flags, NULL);
+
+#ifdef PB_ENABLE_MALLOC
+        if (!status && stream->arena == NULL)
+            pb_release(fields, dest_struct);
+#endif
+
+        /* The length prefix allows continuing after an error in the message */
+        if (!pb_close_string_substream(stream, &substream))
+            return false;
+
+        if (!defaults)
+            PB_SET_ERROR(stream, "failed to set defaults");
+
+        if (batch->valid)
+            batch->valid[index] = status;
+        else if (!status)
+            return false;
+
+        batch->count++;
+    }
+
+    return true;
+}
+
+bool checkreturn pb_decode_callback_item(pb_istream_t *stream, const pb_field_iter_t *field, void *dest, size_t dest_size)
+{
+    pb_field_iter_t item = *field;
+
+    switch (PB_LTYPE(field->type))
+    {
+        case PB_LTYPE_BOOL:
+        case PB_LTYPE_VARINT:
+        case PB_LTYPE_UVARINT:
+        case PB_LTYPE_SVARINT:
+        case PB_LTYPE_FIXED32:
+        case PB_LTYPE_FIXED64:
+            item.type = (pb_type_t)(PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE(field->type));
+            item.pData = dest;
+            item.pSize = NULL;
+            item.data_size = (pb_size_t)dest_size;
+            return decode_basic_field(stream, &item);
+
+        case PB_LTYPE_SUBMESSAGE:
+            /* The stream contains only the submessage */
+            if (field->submsg_desc == NULL)
+                PB_RETURN_ERROR(stream, "invalid field descriptor");
+
+            return decode_message(stream, field->submsg_desc, dest, 0, NULL);
+
+        default:
+            PB_RETURN_ERROR(stream, "invalid field type");
+    }
+}
+
+bool checkreturn pb_decode_by_msgid(pb_istream_t *stream, const pb_msgid_table_t *table, void *dest_union, uint32_t *msgid)
+{
+    const pb_msgid_entry_t *entry;
+
+    if (!pb_decode_varint32(stream, msgid))
+        return false;
+
+    entry = pb_msgid_find(table, *msgid);
+    if (entry == NULL)
+    {
+        /* Skip the message to stay in sync with the input */
+        pb_istream_t substream;
+        if (!pb_make_string_substream(stream, &substream) ||
+            !pb_close_string_substream(stream, &substream))
+        {
+            return false;
+        }
+
+        PB_RETURN_ERROR(stream, "unknown msgid");
+    }
+
+    return pb_decode_ex(stream, entry->fields, dest_union, PB_DECODE_DELIMITED);
+}
+
+void *pb_decode_lazy(pb_lazy_t *lazy, const pb_msgdesc_t *fields, void *dest_struct)
+{
+    if (lazy->msg == NULL)
+    {
+        pb_istream_t stream = pb_istream_from_buffer(lazy->data.ptr, lazy->data.size);
+
+        if (!pb_decode(&stream, fields, dest_struct))
+            return NULL;
+
+        lazy->msg = dest_struct;
+    }
+
+    return lazy->msg;
+}
+
+/***********************
+ * Incremental decoder *
+ ***********************/
+
+/* Values for pb_decoder_t.state */
+#define PB_DSTATE_TAG       0 /* Tag of the next field */
+#define PB_DSTATE_PREFIX    1 /* Length prefix of a delimited message */
+#define PB_DSTATE_VALUE     2 /* Varint or fixed size field value */
+#define PB_DSTATE_LENGTH    3 /* Length of a string type field */
+#define PB_DSTATE_BYTES     4 /* Data of a static string or bytes field */
+#define PB_DSTATE_PACKED    5 /* Values of a static packed array */
+#define PB_DSTATE_SKIP      6 /* Data of an unknown field */
+#define PB_DSTATE_SCRATCH   7 /* Data collected into the scratch buffer */
+#define PB_DSTATE_DONE      8
+#define PB_DSTATE_ERROR     9
+
+/* Values for pb_decoder_t.target */
+#define PB_DTARGET_FIELD     0
+#define PB_DTARGET_EXTENSION 1
+#define PB_DTARGET_UNKNOWN   2
+
+static void decoder_init_frame(pb_decoder_frame_t *frame, const pb_msgdesc_t *fields, void *dest_struct, size_t end)
+{
+    /* Return value ignored, as empty message types will be correctly handled by
+     * pb_field_iter_find() anyway. */
+    (void)pb_field_iter_begin(&frame->iter, fields, dest_struct);
+    frame->end = end;
+    memset(frame->fields_seen, 0, sizeof(frame->fields_seen));
+    frame->extension_range_start = 0;
+    frame->fixed_count_field = PB_SIZE_MAX;
+    frame->fixed_count_size = 0;
+    frame->fixed_count_total_size = 0;
+}
+
+/* Pass the error message from a temporary stream to the decoder. */
+static bool decoder_stream_error(pb_decoder_t *decoder, pb_istream_t *stream)
+{
+#ifndef PB_NO_ERRMSG
+    decoder->errmsg = stream->errmsg;
+#else
+    PB_UNUSED(decoder);
+    PB_UNUSED(stream);
+#endif
+    return false;
+}
+
+/* Get the next varint (fixed_size 0) or fixed size value from the input.
+ * If the whole value is in the input, *item points to it directly.
+ * Otherwise the bytes are collected to decoder->partial, and *item is set
+ * to NULL until the rest of the value arrives. The value must end before
+ * the input position given by end. */
+static bool checkreturn decoder_item(pb_decoder_t *decoder, const pb_byte_t **data, size_t *size,
+                                     size_t end, size_t fixed_size, const pb_byte_t **item, size_t *length)
+{
+    const pb_byte_t *buf = *data;
+    size_t avail = *size;
+    size_t count = 0;
+    bool complete = false;
+
+    if (avail > end - decoder->pos)
+        avail = end - decoder->pos;
+
+    if (decoder->partial_len == 0)
+    {
+        if (fixed_size > 0)
+        {
+            count = fixed_size;
+            complete = (avail >= fixed_size);
+        }
+        else
+        {
+            while (count < avail && count < sizeof(decoder->partial) && !complete)
+                complete = ((buf[count++] & 0x80) == 0);
+
+            complete = complete || (count == sizeof(decoder->partial));
+        }
+
+        if (complete)
+        {
+            *item = buf;
+            *length = count;
+            *data += count;
+            *size -= count;
+            decoder->pos += count;
+            return true;
+        }
+    }
+
+    /* Value is split between input pieces */
+    count = 0;
+    while (count < avail && !complete)
+    {
+        pb_byte_t byte = buf[count++];
+        decoder->partial[decoder->partial_len++] = byte;
+
+        if (fixed_size > 0)
+            complete = (decoder->partial_len == fixed_size);
+        else
+            complete = ((byte & 0x80) == 0 || decoder->partial_len == sizeof(decoder->partial));
+    }
+
+    *data += count;
+    *size -= count;
+    decoder->pos += count;
+
+    if (complete)
+    {
+        *item = decoder->partial;
+        *length = decoder->partial_len;
+        decoder->partial_len = 0;
+        return true;
+    }
+
+    if (decoder->pos == end)
+        PB_RETURN_ERROR(decoder, "end-of-stream");
+
+    *item = NULL;
+    return true;
+}
+
+static bool checkreturn decoder_varint32(pb_decoder_t *decoder, const pb_byte_t *item, size_t length, uint32_t *dest)
+{
+    pb_istream_t stream = pb_istream_from_buffer(item, length);
+
+    if (!pb_decode_varint32(&stream, dest))
+        return decoder_stream_error(decoder, &stream);
+
+    return true;
+}
+
+/* Check the end of a message, like at the end of pb_decode_inner(). */
+static bool checkreturn decoder_end_message(pb_decoder_t *decoder, pb_decoder_frame_t *frame)
+{
+    pb_istream_t stream = PB_ISTREAM_EMPTY;
+
+    if (frame->fixed_count_field != PB_SIZE_MAX &&
+        frame->fixed_count_size != frame->fixed_count_total_size)
+    {
+        PB_RETURN_ERROR(decoder, "wrong size for fixed count field");
+    }
+
+    if (!check_required_fields(&stream, frame->iter.descriptor, frame->fields_seen))
+        return decoder_stream_error(decoder, &stream);
+
+    return true;
+}
+
+/* Check if an extension registered in the message may handle the tag, so
+ * that the field has to be collected in the scratch buffer. Extensions with
+ * a custom decode callback can handle any tag. */
+static bool decoder_has_extension(const pb_field_iter_t *iter, uint32_t tag)
+{
+    pb_extension_t *extension = *(pb_extension_t* const *)iter->pData;
+
+    while (extension != NULL)
+    {
+        pb_field_iter_t ext_iter;
+
+        if (extension->type->decode)
+            return true;
+
+        /* An invalid extension is reported by decode_extension() */
+        if (!pb_field_iter_begin_extension(&ext_iter, extension) || ext_iter.tag == tag)
+            return true;
+
+        extension = extension->next;
+    }
+
+    return false;
+}
+
+/* Find the field for a tag, like in pb_decode_inner(). */
+static bool checkreturn decoder_begin_field(pb_decoder_t *decoder, pb_decoder_frame_t *frame)
+{
+    pb_field_iter_t *iter = &frame->iter;
+    uint32_t tag = decoder->tag;
+
+    if (!pb_field_iter_find(iter, tag) || PB_LTYPE(iter->type) == PB_LTYPE_EXTENSION)
+    {
+        decoder->target = PB_DTARGET_UNKNOWN;
+
+        if (tag >= frame->extension_range_start)
+        {
+            if (!find_extension_field(iter))
+                frame->extension_range_start = (uint32_t)-1;
+            else
+                frame->extension_range_start = iter->tag;
+
+            if (tag >= frame->extension_range_start &&
+                decoder_has_extension(iter, tag))
+            {
+                decoder->target = PB_DTARGET_EXTENSION;
+            }
+        }
+    }
+    else
+    {
+        decoder->target = PB_DTARGET_FIELD;
+
+        if (PB_HTYPE(iter->type) == PB_HTYPE_REPEATED && iter->pSize == &iter->array_size)
+        {
+            if (frame->fixed_count_field != iter->index)
+            {
+                if (frame->fixed_count_field != PB_SIZE_MAX &&
+                    frame->fixed_count_size != frame->fixed_count_total_size)
+                {
+                    PB_RETURN_ERROR(decoder, "wrong size for fixed count field");
+                }
+
+                frame->fixed_count_field = iter->index;
+                frame->fixed_count_size = 0;
+                frame->fixed_count_total_size = iter->array_size;
+            }
+
+            iter->pSize = &frame->fixed_count_size;
+        }
+
+        if (PB_HTYPE(iter->type) == PB_HTYPE_REQUIRED
+            && iter->required_field_index < PB_MAX_REQUIRED_FIELDS)
+        {
+            uint32_t tmp = ((uint32_t)1 << (iter->required_field_index & 31));
+            frame->fields_seen[iter->required_field_index >> 5] |= tmp;
+        }
+
+        if (PB_ATYPE(iter->type) != PB_ATYPE_CALLBACK)
+        {
+            /* Like decode_basic_field() in pb_decode(), read the data according
+             * to the field type. The wire type only selects packed arrays. */
+            pb_type_t ltype = PB_LTYPE(iter->type);
+
+            if (decoder->wire_type != PB_WT_STRING ||
+                PB_HTYPE(iter->type) != PB_HTYPE_REPEATED ||
+                ltype > PB_LTYPE_LAST_PACKABLE)
+            {
+                if (ltype == PB_LTYPE_FIXED32)
+                    decoder->wire_type = PB_WT_32BIT;
+                else if (ltype == PB_LTYPE_FIXED64)
+                    decoder->wire_type = PB_WT_64BIT;
+                else if (ltype <= PB_LTYPE_LAST_PACKABLE)
+                    decoder->wire_type = PB_WT_VARINT;
+                else
+                    decoder->wire_type = PB_WT_STRING;
+            }
+        }
+    }
+
+    switch (decoder->wire_type)
+    {
+        case PB_WT_VARINT:
+        case PB_WT_64BIT:
+        case PB_WT_32BIT:
+            decoder->state = PB_DSTATE_VALUE;
+            return true;
+
+        case PB_WT_STRING:
+            decoder->state = PB_DSTATE_LENGTH;
+            return true;
+
+        default:
+            PB_RETURN_ERROR(decoder, "invalid wire_type");
+    }
+}
+
+/* Decode a field from data that is completely in memory, using the same
+ * functions as pb_decode(). */
+static bool checkreturn decoder_decode_field(pb_decoder_t *decoder, pb_decoder_frame_t *frame,
+                                             const pb_byte_t *buf, size_t length)
+{
+    pb_istream_t stream = pb_istream_from_buffer(buf, length);
+    bool status = true;
+#ifdef PB_ENABLE_MALLOC
+    stream.arena = decoder->arena;
+#endif
+
+    if (decoder->target == PB_DTARGET_FIELD)
+        status = decode_field(&stream, decoder->wire_type, &frame->iter);
+    else if (decoder->target == PB_DTARGET_EXTENSION)
+        status = decode_extension(&stream, decoder->tag, decoder->wire_type, &frame->iter);
+
+    if (!status)
+        return decoder_stream_error(decoder, &stream);
+
+    return true;
+}
+
+/* Update the size, presence or oneof tag of a static field, like
+ * decode_static_field() does before decoding the value. */
+static bool checkreturn decoder_static_field(pb_decoder_t *decoder, pb_field_iter_t *iter)
+{
+#ifdef PB_ENABLE_MALLOC
+    if (PB_HTYPE(iter->type) == PB_HTYPE_ONEOF)
+    {
+        pb_istream_t stream = PB_ISTREAM_EMPTY;
+        stream.arena = decoder->arena;
+        if (!pb_release_union_field(&stream, iter))
+            return decoder_stream_error(decoder, &stream);
+    }
+#endif
+
+    switch (PB_HTYPE(iter->type))
+    {
+        case PB_HTYPE_REQUIRED:
+            return true;
+
+        case PB_HTYPE_OPTIONAL:
+            if (iter->pSize != NULL)
+                pb_field_set_present(iter, true);
+            return true;
+
+        case PB_HTYPE_REPEATED:
+        {
+            pb_size_t *size = (pb_size_t*)iter->pSize;
+            iter->pData = (char*)iter->pField + iter->data_size * (*size);
+
+            if ((*size)++ >= iter->array_size)
+                PB_RETURN_ERROR(decoder, "array overflow");
+
+            return true;
+        }
+
+        case PB_HTYPE_ONEOF:
+            *(pb_size_t*)iter->pSize = iter->tag;
+            return true;
+
+        default:
+            PB_RETURN_ERROR(decoder, "invalid field type");
+    }
+}
+
+/* Start decoding a static submessage in place. */
+static bool checkreturn decoder_push(pb_decoder_t *decoder, pb_field_iter_t *iter)
+{
+    pb_decoder_frame_t *child;
+
+    if (decoder->depth + 1 >= PB_DECODER_MAX_DEPTH)
+        PB_RETURN_ERROR(decoder, "max depth exceeded");
+
+    if (iter->submsg_desc == NULL)
+        PB_RETURN_ERROR(decoder, "invalid field descriptor");
+
+    if (!decoder_static_field(decoder, iter))
+        return false;
+
+    /* New array entries and oneof members need to be initialized, like
+     * in pb_dec_submessage(). */
+    if (PB_HTYPE(iter->type) == PB_HTYPE_ONEOF)
+        memset(iter->pData, 0, iter->data_size);
+
+    if (PB_HTYPE(iter->type) == PB_HTYPE_REPEATED ||
+        PB_HTYPE(iter->type) == PB_HTYPE_ONEOF)
+    {
+        pb_field_iter_t defaults;
+        if (pb_field_iter_begin(&defaults, iter->submsg_desc, iter->pData))
+        {
+            if (!pb_message_set_to_defaults(&defaults))
+                PB_RETURN_ERROR(decoder, "failed to set defaults");
+        }
+    }
+
+    child = &decoder->stack[++decoder->depth];
+    decoder_init_frame(child, iter->submsg_desc, iter->pData, decoder->data_end);
+    decoder->state = PB_DSTATE_TAG;
+    return true;
+}
+
+/* Prepare to copy the data of a static string or bytes field directly
+ * into the structure, with the same checks as in pb_dec_bytes(),
+ * pb_dec_string() and pb_dec_fixed_length_bytes(). */
+static bool checkreturn decoder_begin_bytes(pb_decoder_t *decoder, pb_field_iter_t *iter, uint32_t size)
+{
+    if (!decoder_static_field(decoder, iter))
+        return false;
+
+    if (PB_LTYPE(iter->type) == PB_LTYPE_BYTES)
+    {
+        pb_bytes_array_t *dest = (pb_bytes_array_t*)iter->pData;
+        size_t alloc_size = PB_BYTES_ARRAY_T_ALLOCSIZE(size);
+
+        if (size > PB_SIZE_MAX)
+            PB_RETURN_ERROR(decoder, "bytes overflow");
+
+        if (size > alloc_size)
+            PB_RETURN_ERROR(decoder, "size too large");
+
+        if (alloc_size > iter->data_size)
+            PB_RETURN_ERROR(decoder, "bytes overflow");
+
+        dest->size = (pb_size_t)size;
+        decoder->dest = dest->bytes;
+    }
+    else if (PB_LTYPE(iter->type) == PB_LTYPE_STRING)
+    {
+        pb_byte_t *dest = (pb_byte_t*)iter->pData;
+        size_t alloc_size = (size_t)size + 1;
+
+        if (alloc_size < size)
+            PB_RETURN_ERROR(decoder, "size too large");
+
+        if (alloc_size > iter->data_size)
+            PB_RETURN_ERROR(decoder, "string overflow");
+
+        dest[size] = 0;
+        decoder->dest = dest;
     }
-    else if (PB_ATYPE(type) == PB_ATYPE_CALLBACK)
+    else
     {
-        /* Don't overwrite callback */
+        if (size == 0)
+            memset(iter->pData, 0, iter->data_size);
+        else if (size != iter->data_size)
+            PB_RETURN_ERROR(decoder, "incorrect fixed length bytes size");
+
+        decoder->dest = (pb_byte_t*)iter->pData;
     }
 
+    decoder->state = PB_DSTATE_BYTES;
     return true;
 }
 
-static bool pb_message_set_to_defaults(pb_field_iter_t *iter)
+/* Choose how to handle the data of a string type field. The length
+ * varint is given in item, and its value in size. */
+static bool checkreturn decoder_begin_string(pb_decoder_t *decoder, pb_decoder_frame_t *frame,
+                                             const pb_byte_t *item, size_t length, uint32_t size)
 {
-    pb_istream_t defstream = PB_ISTREAM_EMPTY;
-    uint32_t tag = 0;
-    pb_wire_type_t wire_type = PB_WT_VARINT;
-    bool eof;
+    pb_field_iter_t *iter = &frame->iter;
 
-    if (iter->descriptor->default_value)
+    if (size > frame->end - decoder->pos)
+        PB_RETURN_ERROR(decoder, "parent stream too short");
+
+    decoder->data_end = decoder->pos + size;
+
+    if (decoder->target == PB_DTARGET_UNKNOWN)
     {
-        defstream = pb_istream_from_buffer(iter->descriptor->default_value, (size_t)-1);
-        if (!pb_decode_tag(&defstream, &wire_type, &tag, &eof))
-            return false;
+        decoder->state = PB_DSTATE_SKIP;
+        return true;
     }
 
-    do
+    if (decoder->target == PB_DTARGET_FIELD && PB_ATYPE(iter->type) == PB_ATYPE_STATIC)
     {
-        if (!pb_field_set_to_default(iter))
-            return false;
+        pb_type_t ltype = PB_LTYPE(iter->type);
 
-        if (tag != 0 && iter->tag == tag)
-        {
-            /* We have a default value for this field in the defstream */
-            if (!decode_field(&defstream, wire_type, iter))
-                return false;
-            if (!pb_decode_tag(&defstream, &wire_type, &tag, &eof))
-                return false;
+        if (ltype == PB_LTYPE_SUBMESSAGE)
+            return decoder_push(decoder, iter);
 
-            if (iter->pSize)
-                *(bool*)iter->pSize = false;
+        if (ltype == PB_LTYPE_BYTES || ltype == PB_LTYPE_STRING ||
+            ltype == PB_LTYPE_FIXED_LENGTH_BYTES)
+            return decoder_begin_bytes(decoder, iter, size);
+
+        if (PB_HTYPE(iter->type) == PB_HTYPE_REPEATED && ltype <= PB_LTYPE_LAST_PACKABLE)
+        {
+            decoder->state = PB_DSTATE_PACKED;
+            return true;
         }
-    } while (pb_field_iter_next(iter));
+    }
 
+    /* Other fields are collected into the scratch buffer, including the
+     * length prefix, and then decoded as usual. */
+    if (length + size > decoder->scratch_size - decoder->scratch_used)
+        PB_RETURN_ERROR(decoder, "scratch full");
+
+    decoder->scratch_start = decoder->scratch_used;
+    memcpy(decoder->scratch + decoder->scratch_used, item, length);
+    decoder->scratch_used += length;
+    decoder->dest = decoder->scratch + decoder->scratch_used;
+    decoder->scratch_used += size;
+    decoder->state = PB_DSTATE_SCRATCH;
     return true;
 }
 
-/*********************
- * Decode all fields *
- *********************/
-
-static bool checkreturn pb_decode_inner(pb_istream_t *stream, const pb_msgdesc_t *fields, void *dest_struct, unsigned int flags)
+/* Decode one value of a packed array. */
+static bool checkreturn decoder_packed_value(pb_decoder_t *decoder, pb_field_iter_t *iter,
+                                             const pb_byte_t *item, size_t length)
 {
-    uint32_t extension_range_start = 0;
+    pb_istream_t stream = pb_istream_from_buffer(item, length);
+    pb_size_t *size = (pb_size_t*)iter->pSize;
 
-    /* 'fixed_count_field' and 'fixed_count_size' track position of a repeated fixed
-     * count field. This can only handle _one_ repeated fixed count field that
-     * is unpacked and unordered among other (non repeated fixed count) fields.
-     */
-    pb_size_t fixed_count_field = PB_SIZE_MAX;
-    pb_size_t fixed_count_size = 0;
-    pb_size_t fixed_count_total_size = 0;
+    if (*size >= iter->array_size)
+        PB_RETURN_ERROR(decoder, "array overflow");
 
-    pb_fields_seen_t fields_seen = {{0, 0}};
-    const uint32_t allbits = ~(uint32_t)0;
-    pb_field_iter_t iter;
+    iter->pData = (char*)iter->pField + iter->data_size * (*size);
 
-    /* Return value ignored, as empty message types will be correctly handled by
-     * pb_field_iter_find() anyway. */
-    (void)pb_field_iter_begin(&iter, fields, dest_struct);
+    if (!decode_basic_field(&stream, iter))
+        return decoder_stream_error(decoder, &stream);
 
-    while (stream->bytes_left)
-    {
-        uint32_t tag;
-        pb_wire_type_t wire_type;
-        bool eof;
+    (*size)++;
+    return true;
+}
 
-        if (!pb_decode_tag(stream, &wire_type, &tag, &eof))
-        {
-            if (eof)
-                break;
-            else
-                return false;
-        }
+/* Process as much of the input as possible. */
+static bool checkreturn decoder_run(pb_decoder_t *decoder, const pb_byte_t **data, size_t *size)
+{
+    for (;;)
+    {
+        pb_decoder_frame_t *frame = &decoder->stack[decoder->depth];
+        const pb_byte_t *item = NULL;
+        size_t length = 0;
+        uint32_t value;
 
-        if (tag == 0)
+        switch (decoder->state)
         {
-          if (flags & PB_DECODE_NULLTERMINATED)
-          {
-            break;
-          }
-          else
-          {
-            PB_RETURN_ERROR(stream, "zero tag");
-          }
-        }
+            case PB_DSTATE_PREFIX:
+                if (!decoder_item(decoder, data, size, frame->end, 0, &item, &length))
+                    return false;
+                if (item == NULL)
+                    return true;
+                if (!decoder_varint32(decoder, item, length, &value))
+                    return false;
 
-        if (!pb_field_iter_find(&iter, tag) || PB_LTYPE(iter.type) == PB_LTYPE_EXTENSION)
-        {
-            /* No match found, check if it matches an extension. */
-            if (tag >= extension_range_start)
-            {
-                if (!find_extension_field(&iter))
-                    extension_range_start = (uint32_t)-1;
-                else
-                    extension_range_start = iter.tag;
+                frame->end = decoder->pos + value;
+                decoder->state = PB_DSTATE_TAG;
+                break;
 
-                if (tag >= extension_range_start)
+            case PB_DSTATE_TAG:
+                if (decoder->pos == frame->end && decoder->partial_len == 0)
                 {
-                    size_t pos = stream->bytes_left;
-
-                    if (!decode_extension(stream, tag, wire_type, &iter))
+                    if (!decoder_end_message(decoder, frame))
                         return false;
 
-                    if (pos != stream->bytes_left)
+                    if (decoder->depth == 0)
                     {
-                        /* The field was handled */
-                        continue;
+                        decoder->state = PB_DSTATE_DONE;
+                        return true;
                     }
+
+                    decoder->depth--;
+                    break;
                 }
-            }
 
-            /* No match found, skip data */
-            if (!pb_skip_field(stream, wire_type))
-                return false;
-            continue;
-        }
+                if (!decoder_item(decoder, data, size, frame->end, 0, &item, &length))
+                    return false;
+                if (item == NULL)
+                    return true;
+                if (!decoder_varint32(decoder, item, length, &value))
+                    return false;
 
-        /* If a repeated fixed count field was found, get size from
-         * 'fixed_count_field' as there is no counter contained in the struct.
-         */
-        if (PB_HTYPE(iter.type) == PB_HTYPE_REPEATED && iter.pSize == &iter.array_size)
-        {
-            if (fixed_count_field != iter.index) {
-                /* If the new fixed count field does not match the previous one,
-                 * check that the previous one is NULL or that it finished
-                 * receiving all the expected data.
-                 */
-                if (fixed_count_field != PB_SIZE_MAX &&
-                    fixed_count_size != fixed_count_total_size)
-                {
-                    PB_RETURN_ERROR(stream, "wrong size for fixed count field");
-                }
+                decoder->tag = value >> 3;
+                decoder->wire_type = (pb_wire_type_t)(value & 7);
 
-                fixed_count_field = iter.index;
-                fixed_count_size = 0;
-                fixed_count_total_size = iter.array_size;
-            }
+                if (decoder->tag == 0)
+                    PB_RETURN_ERROR(decoder, "zero tag");
 
-            iter.pSize = &fixed_count_size;
-        }
+                if (!decoder_begin_field(decoder, frame))
+                    return false;
+                break;
 
-        if (PB_HTYPE(iter.type) == PB_HTYPE_REQUIRED
-            && iter.required_field_index < PB_MAX_REQUIRED_FIELDS)
-        {
-            uint32_t tmp = ((uint32_t)1 << (iter.required_field_index & 31));
-            fields_seen.bitfield[iter.required_field_index >> 5] |= tmp;
-        }
+            case PB_DSTATE_VALUE:
+                length = (decoder->wire_type == PB_WT_64BIT) ? 8 :
+                         (decoder->wire_type == PB_WT_32BIT) ? 4 : 0;
+                if (!decoder_item(decoder, data, size, frame->end, length, &item, &length))
+                    return false;
+                if (item == NULL)
+                    return true;
+                if (!decoder_decode_field(decoder, frame, item, length))
+                    return false;
 
-        if (!decode_field(stream, wire_type, &iter))
-            return false;
-    }
+                decoder->state = PB_DSTATE_TAG;
+                break;
 
-    /* Check that all elements of the last decoded fixed count field were present. */
-    if (fixed_count_field != PB_SIZE_MAX &&
-        fixed_count_size != fixed_count_total_size)
-    {
-        PB_RETURN_ERROR(stream, "wrong size for fixed count field");
-    }
+            case PB_DSTATE_LENGTH:
+                if (!decoder_item(decoder, data, size, frame->end, 0, &item, &length))
+                    return false;
+                if (item == NULL)
+                    return true;
+                if (!decoder_varint32(decoder, item, length, &value))
+                    return false;
+                if (!decoder_begin_string(decoder, frame, item, length, value))
+                    return false;
+                break;
 
-    /* Check that all required fields were present. */
-    {
-        /* First figure out the number of required fields by
-         * seeking to the end of the field array. Usually we
-         * are already close to end after decoding.
-         */
-        unsigned req_field_count;
-        pb_type_t last_type;
-        unsigned i;
-        do {
-            req_field_count = iter.required_field_index;
-            last_type = iter.type;
-        } while (pb_field_iter_next(&iter));
+            case PB_DSTATE_PACKED:
+                if (decoder->pos == decoder->data_end && decoder->partial_len == 0)
+                {
+                    decoder->state = PB_DSTATE_TAG;
+                    break;
+                }
 
-        /* Fixup if last field was also required. */
-        if (PB_HTYPE(last_type) == PB_HTYPE_REQUIRED && iter.tag != 0)
-            req_field_count++;
+                length = (PB_LTYPE(frame->iter.type) == PB_LTYPE_FIXED64) ? 8 :
+                         (PB_LTYPE(frame->iter.type) == PB_LTYPE_FIXED32) ? 4 : 0;
+                if (!decoder_item(decoder, data, size, decoder->data_end, length, &item, &length))
+                    return false;
+                if (item == NULL)
+                    return true;
+                if (!decoder_packed_value(decoder, &frame->iter, item, length))
+                    return false;
+                break;
 
-        if (req_field_count > PB_MAX_REQUIRED_FIELDS)
-            req_field_count = PB_MAX_REQUIRED_FIELDS;
+            case PB_DSTATE_BYTES:
+            case PB_DSTATE_SKIP:
+            case PB_DSTATE_SCRATCH:
+                length = decoder->data_end - decoder->pos;
+                if (length > *size)
+                    length = *size;
 
-        if (req_field_count > 0)
-        {
-            /* Check the whole words */
-            for (i = 0; i < (req_field_count >> 5); i++)
-            {
-                if (fields_seen.bitfield[i] != allbits)
-                    PB_RETURN_ERROR(stream, "missing required field");
-            }
+                if (decoder->state != PB_DSTATE_SKIP)
+                {
+                    memcpy(decoder->dest, *data, length);
+                    decoder->dest += length;
+                }
 
-            /* Check the remaining bits (if any) */
-            if ((req_field_count & 31) != 0)
-            {
-                if (fields_seen.bitfield[req_field_count >> 5] !=
-                    (allbits >> (32 - (req_field_count & 31))))
+                *data += length;
+                *size -= length;
+                decoder->pos += length;
+
+                if (decoder->pos != decoder->data_end)
+                    return true;
+
+                if (decoder->state == PB_DSTATE_SCRATCH)
                 {
-                    PB_RETURN_ERROR(stream, "missing required field");
+                    if (!decoder_decode_field(decoder, frame, decoder->scratch + decoder->scratch_start,
+                                              decoder->scratch_used - decoder->scratch_start))
+                        return false;
+
+                    /* Views point into the scratch buffer, so it is reused
+                     * only after other fields. */
+                    if (decoder->target == PB_DTARGET_FIELD &&
+                        PB_ATYPE(frame->iter.type) != PB_ATYPE_VIEW)
+                    {
+                        decoder->scratch_used = decoder->scratch_start;
+                    }
                 }
-            }
+
+                decoder->state = PB_DSTATE_TAG;
+                break;
+
+            default:
+                return true;
         }
     }
+}
 
-    return true;
+/* Put the decoder into error state, releasing any allocated fields like
+ * pb_decode_ex() does. */
+static void decoder_fail(pb_decoder_t *decoder)
+{
+    decoder->state = PB_DSTATE_ERROR;
+
+#ifdef PB_ENABLE_MALLOC
+    if (decoder->arena == NULL)
+        pb_release(decoder->stack[0].iter.descriptor, decoder->stack[0].iter.message);
+#endif
 }
 
-bool checkreturn pb_decode_ex(pb_istream_t *stream, const pb_msgdesc_t *fields, void *dest_struct, unsigned int flags)
+bool pb_decoder_init(pb_decoder_t *decoder, const pb_msgdesc_t *fields, void *dest_struct,
+                     pb_byte_t *scratch, size_t scratch_size, unsigned int flags)
 {
-    bool status;
+    decoder->depth = 0;
+    decoder->state = (flags & PB_DECODE_DELIMITED) ? PB_DSTATE_PREFIX : PB_DSTATE_TAG;
+    decoder->target = PB_DTARGET_UNKNOWN;
+    decoder->partial_len = 0;
+    decoder->wire_type = PB_WT_VARINT;
+    decoder->tag = 0;
+    decoder->pos = 0;
+    decoder->data_end = 0;
+    decoder->dest = NULL;
+    decoder->scratch = scratch;
+    decoder->scratch_size = scratch_size;
+    decoder->scratch_used = 0;
+    decoder->scratch_start = 0;
+#ifdef PB_ENABLE_MALLOC
+    decoder->arena = NULL;
+#endif
+#ifndef PB_NO_ERRMSG
+    decoder->errmsg = NULL;
+#endif
+
+    decoder_init_frame(&decoder->stack[0], fields, dest_struct, (size_t)-1);
 
     if ((flags & PB_DECODE_NOINIT) == 0)
     {
@@ -1089,37 +2481,63 @@ bool checkreturn pb_decode_ex(pb_istream_t *stream, const pb_msgdesc_t *fields,
         if (pb_field_iter_begin(&iter, fields, dest_struct))
         {
             if (!pb_message_set_to_defaults(&iter))
-                PB_RETURN_ERROR(stream, "failed to set defaults");
+            {
+                decoder->state = PB_DSTATE_ERROR;
+                PB_RETURN_ERROR(decoder, "failed to set defaults");
+            }
         }
     }
 
-    if ((flags & PB_DECODE_DELIMITED) == 0)
+    return true;
+}
+
+pb_decoder_status_t pb_decoder_feed(pb_decoder_t *decoder, const pb_byte_t *data, size_t size, size_t *consumed)
+{
+    const pb_byte_t *start = data;
+    bool status = true;
+
+    if (decoder->state != PB_DSTATE_ERROR && decoder->state != PB_DSTATE_DONE)
     {
-      status = pb_decode_inner(stream, fields, dest_struct, flags);
+        status = decoder_run(decoder, &data, &size);
     }
+
+    if (consumed)
+        *consumed = (size_t)(data - start);
+
+    if (!status)
+        decoder_fail(decoder);
+
+    if (decoder->state == PB_DSTATE_ERROR)
+        return PB_DECODER_ERROR;
+    else if (decoder->state == PB_DSTATE_DONE)
+        return PB_DECODER_DONE;
     else
-    {
-      pb_istream_t substream;
-      if (!pb_make_string_substream(stream, &substream))
+        return PB_DECODER_NEED_MORE;
+}
+
+bool pb_decoder_finish(pb_decoder_t *decoder)
+{
+    if (decoder->state == PB_DSTATE_DONE)
+        return true;
+
+    if (decoder->state == PB_DSTATE_ERROR)
         return false;
 
-      status = pb_decode_inner(&substream, fields, dest_struct, flags);
+    if (decoder->state != PB_DSTATE_TAG || decoder->depth != 0 ||
+        decoder->partial_len != 0 || decoder->stack[0].end != (size_t)-1)
+    {
+        decoder_fail(decoder);
+        PB_RETURN_ERROR(decoder, "end-of-stream");
+    }
 
-      if (!pb_close_string_substream(stream, &substream))
+    if (!decoder_end_message(decoder, &decoder->stack[0]))
+    {
+        decoder_fail(decoder);
         return false;
     }
-    
-#ifdef PB_ENABLE_MALLOC
-    if (!status)
-        pb_release(fields, dest_struct);
-#endif
-    
-    return status;
-}
 
-bool checkreturn pb_decode(pb_istream_t *stream, const pb_msgdesc_t *fields, void *dest_struct)
-{
-  return pb_decode_ex(stream, fields, dest_struct, 0);
+    decoder->state = PB_DSTATE_DONE;
+    return true;
 }
 
 #ifdef PB_ENABLE_MALLOC
@@ -1137,6 +2555,15 @@ static bool pb_release_union_field(pb_istream_t *stream, pb_field_iter_t *field)
     if (old_tag == new_tag)
         return true; /* Ok, old data is of same type => merge */
 
+    if (stream->arena != NULL)
+    {
+        /* Arena memory is released all at once by pb_arena_reset(),
+         * just make sure the old pointer is not reused. */
+        if (PB_ATYPE(field->type) == PB_ATYPE_POINTER)
+            *(void**)field->pField = NULL;
+        return true;
+    }
+
     /* Release old data. The find can fail if the message struct contains
      * invalid data. */
     if (!pb_field_iter_find(&old_field, old_tag))
@@ -1175,7 +2602,8 @@ static void pb_release_single_field(pb_field_iter_t *field)
             ext = ext->next;
         }
     }
-    else if (PB_LTYPE(type) == PB_LTYPE_SUBMESSAGE && PB_ATYPE(type) != PB_ATYPE_CALLBACK)
+    else if (PB_LTYPE(type) == PB_LTYPE_SUBMESSAGE &&
+             PB_ATYPE(type) != PB_ATYPE_CALLBACK && PB_ATYPE(type) != PB_ATYPE_VIEW)
     {
         /* Release fields in submessage or submsg array */
         pb_size_t count = 1;
@@ -1291,7 +2719,7 @@ bool pb_decode_fixed32(pb_istream_t *stream, void *dest)
     if (!pb_read(stream, u.bytes, 4))
         return false;
 
-#if defined(__BYTE_ORDER) && __BYTE_ORDER == __LITTLE_ENDIAN && CHAR_BIT == 8
+#if PB_LITTLE_ENDIAN_8BIT
     /* fast path - if we know that we're on little endian, assign directly */
     *(uint32_t*)dest = u.fixed32;
 #else
@@ -1314,7 +2742,7 @@ bool pb_decode_fixed64(pb_istream_t *stream, void *dest)
     if (!pb_read(stream, u.bytes, 8))
         return false;
 
-#if defined(__BYTE_ORDER) && __BYTE_ORDER == __LITTLE_ENDIAN && CHAR_BIT == 8
+#if PB_LITTLE_ENDIAN_8BIT
     /* fast path - if we know that we're on little endian, assign directly */
     *(uint64_t*)dest = u.fixed64;
 #else
@@ -1432,6 +2860,9 @@ static bool checkreturn pb_dec_bytes(pb_istream_t *stream, const pb_field_iter_t
     size_t alloc_size;
     pb_bytes_array_t *dest;
     
+    if (PB_ATYPE(field->type) == PB_ATYPE_VIEW)
+        return pb_dec_view(stream, field);
+
     if (!pb_decode_varint32(stream, &size))
         return false;
     
@@ -1469,6 +2900,9 @@ static bool checkreturn pb_dec_string(pb_istream_t *stream, const pb_field_iter_
     size_t alloc_size;
     pb_byte_t *dest = (pb_byte_t*)field->pData;
 
+    if (PB_ATYPE(field->type) == PB_ATYPE_VIEW)
+        return pb_dec_view(stream, field);
+
     if (!pb_decode_varint32(stream, &size))
         return false;
     
@@ -1503,6 +2937,18 @@ static bool checkreturn pb_dec_submessage(pb_istream_t *stream, const pb_field_i
     bool status;
     pb_istream_t substream;
 
+    if (PB_ATYPE(field->type) == PB_ATYPE_VIEW)
+    {
+        /* Lazy submessage, it is decoded later by pb_decode_lazy().
+         * Only one location can be stored, so a submessage that occurs
+         * again cannot be merged with the earlier data. */
+        const pb_lazy_t *lazy = (const pb_lazy_t*)field->pData;
+        if (lazy->msg != NULL || lazy->data.size != 0)
+            PB_RETURN_ERROR(stream, "lazy submessage repeated");
+
+        return pb_dec_view(stream, field);
+    }
+
     if (!pb_make_string_substream(stream, &substream))
         return false;
     
@@ -1513,9 +2959,9 @@ static bool checkreturn pb_dec_submessage(pb_istream_t *stream, const pb_field_i
      * submessages have already been initialized in the top-level pb_decode. */
     if (PB_HTYPE(field->type) == PB_HTYPE_REPEATED ||
         PB_HTYPE(field->type) == PB_HTYPE_ONEOF)
-        status = pb_decode(&substream, field->submsg_desc, field->pData);
+        status = decode_message(&substream, field->submsg_desc, field->pData, 0, NULL);
     else
-        status = pb_decode_noinit(&substream, field->submsg_desc, field->pData);
+        status = decode_message(&substream, field->submsg_desc, field->pData, PB_DECODE_NOINIT, NULL);
     
     if (!pb_close_string_substream(stream, &substream))
         return false;
@@ -1546,3 +2992,28 @@ static bool checkreturn pb_dec_fixed_length_bytes(pb_istream_t *stream, const pb
     return pb_read(stream, (pb_byte_t*)field->pData, field->data_size);
 }
 
+/* Decode a string or bytes field by storing a pointer to the data in the
+ * input buffer. Only memory buffer streams can be used for this, as the
+ * data of callback streams is not available after reading it. */
+static bool checkreturn pb_dec_view(pb_istream_t *stream, const pb_field_iter_t *field)
+{
+    uint32_t size;
+    pb_bytes_view_t *dest = (pb_bytes_view_t*)field->pData;
+
+    if (!PB_IS_BUFFER_STREAM(stream))
+        PB_RETURN_ERROR(stream, "view needs buffer stream");
+
+    if (!pb_decode_varint32(stream, &size))
+        return false;
+
+    if (size > PB_SIZE_MAX)
+        PB_RETURN_ERROR(stream, "bytes overflow");
+
+    if (stream->bytes_left < size)
+        PB_RETURN_ERROR(stream, "end-of-stream");
+
+    dest->ptr = (const pb_byte_t*)stream->state;
+    dest->size = (pb_size_t)size;
+    return pb_read(stream, NULL, size);
+}
+
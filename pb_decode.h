@@ -43,14 +43,36 @@ struct pb_istream_s
 #ifndef PB_NO_ERRMSG
     const char *errmsg;
 #endif
+
+#ifdef PB_ENABLE_MALLOC
+    /* Private to pb_decode.c: the arena given to pb_decode_arena(), shared
+     * by substreams. The decoding functions set it before it is used, so it
+     * does not need to be initialized. */
+    pb_arena_t *arena;
+#endif
 };
 
-#ifndef PB_NO_ERRMSG
+#if !defined(PB_NO_ERRMSG) && defined(PB_ENABLE_MALLOC)
+#define PB_ISTREAM_EMPTY {0,0,0,0,0}
+#elif !defined(PB_NO_ERRMSG) || defined(PB_ENABLE_MALLOC)
 #define PB_ISTREAM_EMPTY {0,0,0,0}
 #else
 #define PB_ISTREAM_EMPTY {0,0,0}
 #endif
 
+#ifndef PB_BUFFER_ONLY
+/* State of a buffered input stream, see pb_istream_buffered(). */
+typedef struct pb_istream_buffer_s pb_istream_buffer_t;
+struct pb_istream_buffer_s
+{
+    pb_istream_t *source; /* Underlying callback stream */
+    pb_byte_t *buffer;    /* Read-ahead buffer given by the caller */
+    size_t size;          /* Size of the buffer */
+    size_t pos;           /* Position of the next unread byte in buffer */
+    size_t end;           /* End of the data read into buffer */
+};
+#endif
+
 /***************************
  * Main decoding functions *
  ***************************/
@@ -107,12 +129,220 @@ bool pb_decode_ex(pb_istream_t *stream, const pb_msgdesc_t *fields, void *dest_s
 #define pb_decode_delimited_noinit(s,f,d) pb_decode_ex(s,f,d, PB_DECODE_DELIMITED | PB_DECODE_NOINIT)
 #define pb_decode_nullterminated(s,f,d) pb_decode_ex(s,f,d, PB_DECODE_NULLTERMINATED)
 
+/* Decode a sequence of length-delimited messages into the free entries of
+ * batch, until the batch is full or the stream ends between two messages.
+ * Each message is decoded as with pb_decode_ex() and the flags are passed
+ * to it; PB_DECODE_DELIMITED is implied.
+ *
+ * If batch->valid is not NULL, a message that fails to decode is stored with
+ * its valid entry set to false and decoding continues with the next one,
+ * leaving the error message of the last such failure in the stream.
+ * Otherwise decoding stops at the first failure. Returns false on errors
+ * and on broken length prefixes, which make the rest of the input unusable.
+ *
+ * Example usage:
+ *    MyMessage msgs[16];
+ *    pb_batch_t batch = {msgs, NULL, 16, 0, 0};
+ *
+ *    if (pb_decode_batch(&stream, MyMessage_fields, &batch, 0))
+ *        // ... process batch.count messages starting at msgs[batch.start] ...
+ */
+bool pb_decode_batch(pb_istream_t *stream, const pb_msgdesc_t *fields, pb_batch_t *batch, unsigned int flags);
+
+/* Same as pb_decode_ex(), but decodes only the fields selected by mask.
+ * Other fields are skipped with pb_skip_field() without storing them, and
+ * required fields outside the mask are not checked for presence.
+ *
+ * Example usage:
+ *    uint32_t bits[MyMessage_MASK_WORDS] = {0};
+ *    pb_field_mask_t mask = {bits, NULL};
+ *    PB_SET_HAS_BIT(bits, MyMessage_myfield_index);
+ *
+ *    if (!pb_decode_masked(&stream, MyMessage_fields, &msg, &mask, 0))
+ *        return false;
+ */
+bool pb_decode_masked(pb_istream_t *stream, const pb_msgdesc_t *fields, void *dest_struct, const pb_field_mask_t *mask, unsigned int flags);
+
+/* Decode one element of a repeated callback field inside its decode
+ * callback. The element type is taken from the field descriptor, and dest
+ * must point to a variable of the matching C type with size dest_size, or
+ * to the message structure for submessage fields. String and bytes fields
+ * are not supported.
+ *
+ * The callback is called for each element of unpacked fields and once for
+ * all elements of packed fields, so call this while stream->bytes_left > 0.
+ * The generated MyMessage_field_foreach() functions do this for fields with
+ * the callback_items option.
+ */
+bool pb_decode_callback_item(pb_istream_t *stream, const pb_field_iter_t *field, void *dest, size_t dest_size);
+
+/* Decode a message that is prefixed with its message id, as written by
+ * pb_encode_with_msgid(). The id is stored in *msgid and the message type
+ * is looked up from a msgid table, usually the one generated for a .proto
+ * file. The message is decoded into dest_union, which must be large enough
+ * for all messages in the table, such as the generated msgid union.
+ *
+ * A message with an unknown id is skipped, so that the next message can
+ * still be decoded, and "unknown msgid" is returned as the error.
+ *
+ * Example usage:
+ *    myproto_msgid_union rx;
+ *    uint32_t msgid;
+ *
+ *    if (pb_decode_by_msgid(&stream, &myproto_msgid_table, &rx, &msgid))
+ *    {
+ *        if (msgid == MyMessage_msgid)
+ *            handle_mymessage(&rx.msg_MyMessage);
+ *    }
+ */
+bool pb_decode_by_msgid(pb_istream_t *stream, const pb_msgid_table_t *table, void *dest_union, uint32_t *msgid);
+
+/* Get the submessage of a field with the lazy option, decoding it into
+ * dest_struct when the field is accessed for the first time. Later calls
+ * return the previously decoded submessage and leave dest_struct unused.
+ * Returns NULL if decoding fails. The input buffer of the message
+ * containing the field must still be available at the first access.
+ *
+ * The generator defines a MyMessage_field_get(msg, dest) macro for each
+ * lazy field, which calls this function with the correct arguments.
+ */
+void *pb_decode_lazy(pb_lazy_t *lazy, const pb_msgdesc_t *fields, void *dest_struct);
+
+
+/***********************
+ * Incremental decoder *
+ ***********************/
+
+/* Maximum nesting depth of submessages in pb_decoder_t, including the
+ * top level message. Must be the same in all compilation units. */
+#ifndef PB_DECODER_MAX_DEPTH
+#define PB_DECODER_MAX_DEPTH 8
+#endif
+
+/* Decoding state of one message level in pb_decoder_t. */
+typedef struct pb_decoder_frame_s pb_decoder_frame_t;
+struct pb_decoder_frame_s
+{
+    pb_field_iter_t iter;    /* Message and the last decoded field */
+    size_t end;              /* Input position where the message ends */
+    uint32_t fields_seen[(PB_MAX_REQUIRED_FIELDS + 31) / 32];
+    uint32_t extension_range_start;
+    pb_size_t fixed_count_field;
+    pb_size_t fixed_count_size;
+    pb_size_t fixed_count_total_size;
+};
+
+/* State of an incremental decoder, see pb_decoder_init().
+ * The members are private to pb_decode.c, except for arena. */
+typedef struct pb_decoder_s pb_decoder_t;
+struct pb_decoder_s
+{
+    pb_decoder_frame_t stack[PB_DECODER_MAX_DEPTH];
+    uint_least8_t depth;     /* Index of the current message in stack */
+    uint_least8_t state;     /* What the next input bytes are */
+    uint_least8_t target;    /* Whether the field is known, an extension or unknown */
+    uint_least8_t partial_len;
+    pb_byte_t partial[10];   /* Partially received varint or fixed size value */
+    pb_wire_type_t wire_type;
+    uint32_t tag;
+    size_t pos;              /* Number of bytes consumed so far */
+    size_t data_end;         /* Input position where the field data ends */
+    pb_byte_t *dest;         /* Destination of string and bytes data */
+    pb_byte_t *scratch;      /* Buffer for fields that are decoded as a whole */
+    size_t scratch_size;
+    size_t scratch_used;
+    size_t scratch_start;    /* Start of the current field in scratch */
+
+#ifdef PB_ENABLE_MALLOC
+    /* Arena for pointer fields, like in pb_istream_t. */
+    pb_arena_t *arena;
+#endif
+
+#ifndef PB_NO_ERRMSG
+    const char *errmsg;
+#endif
+};
+
+/* Return values of pb_decoder_feed(). */
+typedef enum {
+    PB_DECODER_ERROR = 0,     /* Decoding failed, see PB_GET_ERROR(decoder) */
+    PB_DECODER_NEED_MORE = 1, /* All input was consumed, message is not complete */
+    PB_DECODER_DONE = 2       /* A delimited message is complete */
+} pb_decoder_status_t;
+
+/* Start decoding a message that is given to pb_decoder_feed() in pieces of
+ * any size, for example as received from a non-blocking socket. The state
+ * of the decoder is kept in the pb_decoder_t, so each byte is parsed only
+ * once and the whole message never needs to be in memory at the same time.
+ *
+ * Static string and bytes fields are copied directly to the destination
+ * structure and static submessages are decoded in place. Other fields that
+ * have length-delimited data (callback, pointer and view fields, and
+ * extensions) are collected into the scratch buffer first, so it must be
+ * large enough for the largest of them. Views point into the scratch
+ * buffer, which must remain valid as long as they are used.
+ *
+ * The flags are the same as for pb_decode_ex(), except that
+ * PB_DECODE_NULLTERMINATED is not supported.
+ *
+ * Example usage:
+ *    pb_decoder_t decoder;
+ *    pb_decoder_init(&decoder, MyMessage_fields, &msg, NULL, 0, PB_DECODE_DELIMITED);
+ *
+ *    while ((count = recv(fd, buf, sizeof(buf), 0)) > 0)
+ *    {
+ *        status = pb_decoder_feed(&decoder, buf, count, &used);
+ *        if (status != PB_DECODER_NEED_MORE)
+ *            break;
+ *    }
+ */
+bool pb_decoder_init(pb_decoder_t *decoder, const pb_msgdesc_t *fields, void *dest_struct,
+                     pb_byte_t *scratch, size_t scratch_size, unsigned int flags);
+
+/* Decode the next piece of input. Returns PB_DECODER_NEED_MORE until a
+ * delimited message is complete. If consumed is not NULL, it is set to the
+ * number of bytes used, which is less than size only when the message
+ * ended before the input or an error occurred. */
+pb_decoder_status_t pb_decoder_feed(pb_decoder_t *decoder, const pb_byte_t *data, size_t size, size_t *consumed);
+
+/* Signal the end of input. Returns true if the message is complete and all
+ * required fields were present. Needed for messages that are not
+ * delimited, as they do not have any end marker. */
+bool pb_decoder_finish(pb_decoder_t *decoder);
+
 #ifdef PB_ENABLE_MALLOC
 /* Release any allocated pointer fields. If you use dynamic allocation, you should
  * call this for any successfully decoded message when you are done with it. If
  * pb_decode() returns with an error, the message is already released.
  */
 void pb_release(const pb_msgdesc_t *fields, void *dest_struct);
+
+/* Initialize a memory arena for decoding pointer fields without using
+ * malloc(). The buffer must be aligned for pb_arena_align_t, which is
+ * easiest to ensure by declaring it as an array of that type.
+ * The generated MyMessage_arena_size define gives the worst-case size
+ * needed, when it can be determined from max_size and max_count options.
+ *
+ * Example usage:
+ *    pb_arena_align_t storage[MyMessage_arena_size / sizeof(pb_arena_align_t) + 1];
+ *    pb_arena_t arena;
+ *    pb_istream_t stream = pb_istream_from_buffer(buffer, count);
+ *
+ *    pb_arena_init(&arena, storage, sizeof(storage));
+ *    pb_decode_arena(&stream, MyMessage_fields, &msg, &arena, 0);
+ *
+ * Messages decoded into an arena must not be passed to pb_release().
+ * Instead all of their memory is released at once by pb_arena_reset().
+ */
+void pb_arena_init(pb_arena_t *arena, void *buffer, size_t size);
+void pb_arena_reset(pb_arena_t *arena);
+
+/* Same as pb_decode_ex(), but allocates pointer fields from the arena
+ * instead of using pb_realloc(). Pointer fields that already have a value
+ * must have been allocated from the same arena after its last reset,
+ * otherwise decoding fails with "pointer not from arena". Without the
+ * PB_DECODE_NOINIT flag, all pointer fields are set to NULL first. */
+bool pb_decode_arena(pb_istream_t *stream, const pb_msgdesc_t *fields, void *dest_struct, pb_arena_t *arena, unsigned int flags);
 #endif
 
 
@@ -127,6 +357,40 @@ void pb_release(const pb_msgdesc_t *fields, void *dest_struct);
  */
 pb_istream_t pb_istream_from_buffer(const pb_byte_t *buf, size_t bufsize);
 
+#ifndef PB_BUFFER_ONLY
+/* Create an input stream that reads ahead from another stream into a
+ * buffer. Callback streams such as sockets otherwise get one callback call
+ * for every byte of each tag and varint. The decoder works directly on the
+ * data already in the buffer, and reads the next block from the source
+ * stream only when the buffer runs empty. Reads larger than the buffer go
+ * directly to the source.
+ *
+ * The source is asked for whole blocks of bufsize bytes, and the read-ahead
+ * goes past the current message up to source->bytes_left. A source that
+ * blocks until it gets all the requested bytes, such as a socket, must
+ * therefore have bytes_left set to the length of the data. An unbounded
+ * source can end the input by setting its bytes_left to 0 and failing the
+ * read, which the buffered stream reports as end of input after the
+ * buffered bytes. Data of a partially filled block is lost in that case.
+ * The state and buffer must remain valid while the stream is in use.
+ * Substreams share the same buffer.
+ *
+ * Bytes that have been read ahead but not yet consumed stay in the buffer
+ * (state->end - state->pos) and are returned by the next read, for example
+ * when decoding several delimited messages in a row.
+ *
+ * Example usage:
+ *    pb_byte_t buffer[256];
+ *    pb_istream_buffer_t state;
+ *    pb_istream_t socket = pb_istream_from_socket(fd);
+ *    socket.bytes_left = total_length;
+ *    pb_istream_t stream = pb_istream_buffered(&state, &socket, buffer, sizeof(buffer));
+ *    pb_decode_delimited(&stream, MyMessage_fields, &msg);
+ */
+pb_istream_t pb_istream_buffered(pb_istream_buffer_t *state, pb_istream_t *source,
+                                 pb_byte_t *buffer, size_t bufsize);
+#endif
+
 /* Function to read from a pb_istream_t. You can use this if you need to
  * read some custom header data, or to read data in field callbacks.
  */
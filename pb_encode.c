@@ -21,6 +21,12 @@
  * Declarations internal to this file *
  **************************************/
 static bool checkreturn buf_write(pb_ostream_t *stream, const pb_byte_t *buf, size_t count);
+#ifndef PB_BUFFER_ONLY
+static bool checkreturn buffered_write(pb_ostream_t *stream, const pb_byte_t *buf, size_t count);
+static bool checkreturn buffered_flush(pb_ostream_t *stream, pb_ostream_buffer_t *state);
+static bool checkreturn segment_write(pb_ostream_t *stream, const pb_byte_t *buf, size_t count);
+#endif
+static bool checkreturn encode_field_data(pb_ostream_t *stream, const pb_byte_t *buffer, size_t size);
 static bool checkreturn encode_array(pb_ostream_t *stream, pb_field_iter_t *field);
 static bool checkreturn pb_check_proto3_default_value(const pb_field_iter_t *field);
 static bool checkreturn encode_basic_field(pb_ostream_t *stream, const pb_field_iter_t *field);
@@ -28,15 +34,21 @@ static bool checkreturn encode_callback_field(pb_ostream_t *stream, const pb_fie
 static bool checkreturn encode_field(pb_ostream_t *stream, pb_field_iter_t *field);
 static bool checkreturn encode_extension_field(pb_ostream_t *stream, const pb_field_iter_t *field);
 static bool checkreturn default_extension_encoder(pb_ostream_t *stream, const pb_extension_t *extension);
+static bool checkreturn encode_message(pb_ostream_t *stream, const pb_msgdesc_t *fields, const void *prev_struct, const void *src_struct);
+static bool checkreturn encode_submessage(pb_ostream_t *stream, const pb_msgdesc_t *fields, const void *prev_struct, const void *src_struct);
+static bool checkreturn encode_delta_array(pb_ostream_t *stream, const pb_field_iter_t *prev, pb_field_iter_t *field);
+static bool checkreturn encode_delta_field(pb_ostream_t *stream, const pb_field_iter_t *prev, pb_field_iter_t *field);
+static bool checkreturn field_merges_onto(const pb_field_iter_t *prev, const pb_field_iter_t *field);
+static bool checkreturn submsg_merges_onto(const pb_msgdesc_t *fields, const void *prev_struct, const void *src_struct);
 static void *pb_const_cast(const void *p);
 static bool checkreturn pb_encode_varint_32(pb_ostream_t *stream, uint32_t low, uint32_t high);
 static bool checkreturn pb_enc_bool(pb_ostream_t *stream, const pb_field_iter_t *field);
 static bool checkreturn pb_enc_varint(pb_ostream_t *stream, const pb_field_iter_t *field);
 static bool checkreturn pb_enc_fixed(pb_ostream_t *stream, const pb_field_iter_t *field);
+static bool checkreturn get_field_data(pb_ostream_t *stream, const pb_field_iter_t *field, const pb_byte_t **data, size_t *size);
 static bool checkreturn pb_enc_bytes(pb_ostream_t *stream, const pb_field_iter_t *field);
 static bool checkreturn pb_enc_string(pb_ostream_t *stream, const pb_field_iter_t *field);
 static bool checkreturn pb_enc_submessage(pb_ostream_t *stream, const pb_field_iter_t *field);
-static bool checkreturn pb_enc_fixed_length_bytes(pb_ostream_t *stream, const pb_field_iter_t *field);
 
 #ifdef PB_WITHOUT_64BIT
 #define pb_int64_t int32_t
@@ -52,12 +64,10 @@ static bool checkreturn pb_enc_fixed_length_bytes(pb_ostream_t *stream, const pb
 
 static bool checkreturn buf_write(pb_ostream_t *stream, const pb_byte_t *buf, size_t count)
 {
-    size_t i;
     pb_byte_t *dest = (pb_byte_t*)stream->state;
     stream->state = dest + count;
     
-    for (i = 0; i < count; i++)
-        dest[i] = buf[i];
+    memcpy(dest, buf, count);
     
     return true;
 }
@@ -79,6 +89,138 @@ pb_ostream_t pb_ostream_from_buffer(pb_byte_t *buf, size_t bufsize)
     return stream;
 }
 
+#ifndef PB_BUFFER_ONLY
+/* Pass the data waiting in the buffer to the destination stream. */
+static bool checkreturn buffered_flush(pb_ostream_t *stream, pb_ostream_buffer_t *state)
+{
+    size_t count = state->count;
+    state->count = 0;
+    PB_UNUSED(stream);
+
+    if (!pb_write(state->dest, state->buffer, count))
+    {
+#ifndef PB_NO_ERRMSG
+        stream->errmsg = state->dest->errmsg;
+#endif
+        return false;
+    }
+
+    return true;
+}
+
+static bool checkreturn buffered_write(pb_ostream_t *stream, const pb_byte_t *buf, size_t count)
+{
+    pb_ostream_buffer_t *state = (pb_ostream_buffer_t*)stream->state;
+
+    if (count > state->size - state->count)
+    {
+        if (!buffered_flush(stream, state))
+            return false;
+
+        if (count >= state->size)
+        {
+            /* Large writes go directly to the destination */
+            if (!pb_write(state->dest, buf, count))
+            {
+#ifndef PB_NO_ERRMSG
+                stream->errmsg = state->dest->errmsg;
+#endif
+                return false;
+            }
+            return true;
+        }
+    }
+
+    memcpy(state->buffer + state->count, buf, count);
+    state->count += count;
+    return true;
+}
+
+pb_ostream_t pb_ostream_buffered(pb_ostream_buffer_t *state, pb_ostream_t *dest,
+                                 pb_byte_t *buffer, size_t bufsize)
+{
+    pb_ostream_t stream;
+    state->dest = dest;
+    state->buffer = buffer;
+    state->size = bufsize;
+    state->count = 0;
+
+    stream.callback = &buffered_write;
+    stream.state = state;
+    stream.max_size = dest->max_size - dest->bytes_written;
+    stream.bytes_written = 0;
+#ifndef PB_NO_ERRMSG
+    stream.errmsg = NULL;
+#endif
+    return stream;
+}
+
+bool pb_ostream_flush(pb_ostream_t *stream)
+{
+    if (stream->callback != &buffered_write)
+        return true;
+
+    if (!buffered_flush(stream, (pb_ostream_buffer_t*)stream->state))
+        PB_RETURN_ERROR(stream, "io error");
+
+    return true;
+}
+
+/* Copy data to the scratch buffer of a segment stream. If the previous
+ * segment ends at the current scratch position, it is extended. */
+static bool checkreturn segment_write(pb_ostream_t *stream, const pb_byte_t *buf, size_t count)
+{
+    pb_ostream_segments_t *state = (pb_ostream_segments_t*)stream->state;
+    pb_byte_t *dest = state->scratch + state->scratch_used;
+    pb_segment_t *last = NULL;
+
+    if (count > state->scratch_size - state->scratch_used)
+        PB_RETURN_ERROR(stream, "scratch full");
+
+    if (state->segment_count > 0)
+        last = &state->segments[state->segment_count - 1];
+
+    if (last == NULL || last->data + last->size != dest)
+    {
+        if (state->segment_count >= state->max_segments)
+            PB_RETURN_ERROR(stream, "too many segments");
+
+        last = &state->segments[state->segment_count++];
+        last->data = dest;
+        last->size = 0;
+    }
+
+    memcpy(dest, buf, count);
+    state->scratch_used += count;
+    last->size += count;
+    return true;
+}
+
+pb_ostream_t pb_ostream_segments(pb_ostream_segments_t *state,
+                                 pb_segment_t *segments, size_t max_segments,
+                                 pb_byte_t *scratch, size_t scratch_size,
+                                 size_t threshold)
+{
+    pb_ostream_t stream;
+    state->segments = segments;
+    state->max_segments = max_segments;
+    state->segment_count = 0;
+    state->scratch = scratch;
+    state->scratch_size = scratch_size;
+    state->scratch_used = 0;
+    state->threshold = threshold;
+
+    stream.callback = &segment_write;
+    stream.state = state;
+    stream.max_size = (size_t)-1;
+    stream.bytes_written = 0;
+#ifndef PB_NO_ERRMSG
+    stream.errmsg = NULL;
+#endif
+    return stream;
+}
+#endif
+
 bool checkreturn pb_write(pb_ostream_t *stream, const pb_byte_t *buf, size_t count)
 {
     if (count > 0 && stream->callback != NULL)
@@ -103,22 +245,6 @@ bool checkreturn pb_write(pb_ostream_t *stream, const pb_byte_t *buf, size_t cou
  * Encode a single field *
  *************************/
 
-/* Read a bool value without causing undefined behavior even if the value
- * is invalid. See issue #434 and
- * https://stackoverflow.com/questions/27661768/weird-results-for-conditional
- */
-static bool safe_read_bool(const void *pSize)
-{
-    const char *p = (const char *)pSize;
-    size_t i;
-    for (i = 0; i < sizeof(bool); i++)
-    {
-        if (p[i] != 0)
-            return true;
-    }
-    return false;
-}
-
 /* Encode a static array. Handles the size calculations and possible packing. */
 static bool checkreturn encode_array(pb_ostream_t *stream, pb_field_iter_t *field)
 {
@@ -172,6 +298,16 @@ static bool checkreturn encode_array(pb_ostream_t *stream, pb_field_iter_t *fiel
         if (stream->callback == NULL)
             return pb_write(stream, NULL, size); /* Just sizing.. */
         
+#if PB_LITTLE_ENDIAN_8BIT
+        if ((PB_LTYPE(field->type) == PB_LTYPE_FIXED32 && field->data_size == 4) ||
+            (PB_LTYPE(field->type) == PB_LTYPE_FIXED64 && field->data_size == 8))
+        {
+            /* The memory representation matches the wire format,
+             * so all the values can be written at once. */
+            return pb_write(stream, (const pb_byte_t*)field->pData, size);
+        }
+#endif
+
         /* Write the data */
         for (i = 0; i < count; i++)
         {
@@ -240,7 +376,7 @@ static bool checkreturn pb_check_proto3_default_value(const pb_field_iter_t *fie
 {
     pb_type_t type = field->type;
 
-    if (PB_ATYPE(type) == PB_ATYPE_STATIC)
+    if (PB_ATYPE(type) == PB_ATYPE_STATIC || PB_ATYPE(type) == PB_ATYPE_VIEW)
     {
         if (PB_HTYPE(type) == PB_HTYPE_REQUIRED)
         {
@@ -260,11 +396,24 @@ static bool checkreturn pb_check_proto3_default_value(const pb_field_iter_t *fie
         else if (PB_HTYPE(type) == PB_HTYPE_OPTIONAL && field->pSize != NULL)
         {
             /* Proto2 optional fields inside proto3 submessage */
-            return safe_read_bool(field->pSize) == false;
+            return !pb_field_is_present(field);
         }
 
         /* Rest is proto3 singular fields */
-        if (PB_LTYPE(type) == PB_LTYPE_BYTES)
+        if (PB_ATYPE(type) == PB_ATYPE_VIEW)
+        {
+            const pb_bytes_view_t *view = (const pb_bytes_view_t*)field->pData;
+
+            if (PB_LTYPE(type) == PB_LTYPE_SUBMESSAGE &&
+                ((const pb_lazy_t*)field->pData)->msg != NULL)
+            {
+                /* Lazy submessage that has been accessed */
+                return false;
+            }
+
+            return view->size == 0;
+        }
+        else if (PB_LTYPE(type) == PB_LTYPE_BYTES)
         {
             const pb_bytes_array_t *bytes = (const pb_bytes_array_t*)field->pData;
             return bytes->size == 0;
@@ -352,6 +501,7 @@ static bool checkreturn encode_basic_field(pb_ostream_t *stream, const pb_field_
             return pb_enc_fixed(stream, field);
 
         case PB_LTYPE_BYTES:
+        case PB_LTYPE_FIXED_LENGTH_BYTES:
             return pb_enc_bytes(stream, field);
 
         case PB_LTYPE_STRING:
@@ -360,9 +510,6 @@ static bool checkreturn encode_basic_field(pb_ostream_t *stream, const pb_field_
         case PB_LTYPE_SUBMESSAGE:
             return pb_enc_submessage(stream, field);
 
-        case PB_LTYPE_FIXED_LENGTH_BYTES:
-            return pb_enc_fixed_length_bytes(stream, field);
-
         default:
             PB_RETURN_ERROR(stream, "invalid field type");
     }
@@ -400,7 +547,8 @@ static bool checkreturn encode_field(pb_ostream_t *stream, pb_field_iter_t *fiel
     }
     else if (PB_HTYPE(field->type) == PB_HTYPE_OPTIONAL)
     {
-        if (PB_ATYPE(field->type) == PB_ATYPE_STATIC)
+        if (PB_ATYPE(field->type) == PB_ATYPE_STATIC ||
+            PB_ATYPE(field->type) == PB_ATYPE_VIEW)
         {
             if (!field->pSize)
             {
@@ -408,7 +556,7 @@ static bool checkreturn encode_field(pb_ostream_t *stream, pb_field_iter_t *fiel
                 if (pb_check_proto3_default_value(field))
                     return true;
             }
-            else if (safe_read_bool(field->pSize) == false)
+            else if (!pb_field_is_present(field))
             {
                 /* Missing optional field */
                 return true;
@@ -531,135 +679,841 @@ bool checkreturn pb_encode_ex(pb_ostream_t *stream, const pb_msgdesc_t *fields,
   }
 }
 
-bool pb_get_encoded_size(size_t *size, const pb_msgdesc_t *fields, const void *src_struct)
+bool checkreturn pb_encode_callback_item(pb_ostream_t *stream, const pb_field_iter_t *field, const void *src, size_t src_size)
 {
-    pb_ostream_t stream = PB_OSTREAM_SIZING;
-    
-    if (!pb_encode(&stream, fields, src_struct))
-        return false;
-    
-    *size = stream.bytes_written;
-    return true;
+    pb_field_iter_t item = *field;
+
+    switch (PB_LTYPE(field->type))
+    {
+        case PB_LTYPE_BOOL:
+        case PB_LTYPE_VARINT:
+        case PB_LTYPE_UVARINT:
+        case PB_LTYPE_SVARINT:
+        case PB_LTYPE_FIXED32:
+        case PB_LTYPE_FIXED64:
+        case PB_LTYPE_SUBMESSAGE:
+            item.type = (pb_type_t)(PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE(field->type));
+            item.pData = pb_const_cast(src);
+            item.pSize = NULL;
+            item.data_size = (pb_size_t)src_size;
+            return encode_basic_field(stream, &item);
+
+        default:
+            PB_RETURN_ERROR(stream, "invalid field type");
+    }
 }
 
-/********************
- * Helper functions *
- ********************/
+bool checkreturn pb_encode_with_msgid(pb_ostream_t *stream, const pb_msgid_table_t *table, uint32_t msgid, const void *src_struct)
+{
+    const pb_msgid_entry_t *entry = pb_msgid_find(table, msgid);
 
-/* This function avoids 64-bit shifts as they are quite slow on many platforms. */
-static bool checkreturn pb_encode_varint_32(pb_ostream_t *stream, uint32_t low, uint32_t high)
+    if (entry == NULL)
+        PB_RETURN_ERROR(stream, "unknown msgid");
+
+    if (!pb_encode_varint(stream, msgid))
+        return false;
+
+    return pb_encode_submessage(stream, entry->fields, src_struct);
+}
+
+bool checkreturn pb_encode_batch(pb_ostream_t *stream, const pb_msgdesc_t *fields, const pb_batch_t *batch)
 {
-    size_t i = 0;
-    pb_byte_t buffer[10];
-    pb_byte_t byte = (pb_byte_t)(low & 0x7F);
-    low >>= 7;
+    size_t i;
 
-    while (i < 4 && (low != 0 || high != 0))
+    for (i = 0; i < batch->count; i++)
     {
-        byte |= 0x80;
-        buffer[i++] = byte;
-        byte = (pb_byte_t)(low & 0x7F);
-        low >>= 7;
+        size_t index = batch->start + i;
+
+        if (index >= batch->capacity)
+            index -= batch->capacity;
+
+        if (batch->valid && !batch->valid[index])
+            continue;
+
+        if (!pb_encode_submessage(stream, fields, (const char*)batch->messages + index * fields->struct_size))
+            return false;
     }
 
-    if (high)
-    {
-        byte = (pb_byte_t)(byte | ((high & 0x07) << 4));
-        high >>= 3;
+    return true;
+}
 
-        while (high)
-        {
-            byte |= 0x80;
-            buffer[i++] = byte;
-            byte = (pb_byte_t)(high & 0x7F);
-            high >>= 7;
-        }
+/* Encode the elements added to the end of an array. Other changes to arrays
+ * cannot be expressed, because the decoder appends to the existing array. */
+static bool checkreturn encode_delta_array(pb_ostream_t *stream, const pb_field_iter_t *prev, pb_field_iter_t *field)
+{
+    pb_field_iter_t head = *field;
+    pb_field_iter_t tail = *field;
+    pb_size_t prev_count = *(const pb_size_t*)prev->pSize;
+    pb_size_t count = *(const pb_size_t*)field->pSize;
+
+    if (field->pSize == &field->array_size)
+    {
+        /* Fixed count arrays are always decoded from the start */
+        return encode_array(stream, field);
     }
 
-    buffer[i++] = byte;
+    head.pSize = &prev_count;
+    if (count < prev_count || !pb_field_equal(prev, &head))
+        PB_RETURN_ERROR(stream, "delta not representable");
 
-    return pb_write(stream, buffer, i);
+    count = (pb_size_t)(count - prev_count);
+    tail.pData = (char*)field->pData + (size_t)field->data_size * prev_count;
+    tail.pSize = &count;
+    return encode_array(stream, &tail);
 }
 
-bool checkreturn pb_encode_varint(pb_ostream_t *stream, pb_uint64_t value)
+/* Check if the full encoding of a field gives its new value also when it is
+ * merged into the previous value, as protobuf decoders do for submessages
+ * that are already present. Every field present in the previous value has
+ * to be encoded again, and arrays of the previous value must be empty so
+ * that no entries are appended to them. */
+static bool checkreturn field_merges_onto(const pb_field_iter_t *prev, const pb_field_iter_t *field)
 {
-    if (value <= 0x7F)
+    bool present;
+    bool prev_present;
+
+    if (PB_LTYPE(field->type) == PB_LTYPE_EXTENSION)
     {
-        /* Fast path: single byte */
-        pb_byte_t byte = (pb_byte_t)value;
-        return pb_write(stream, &byte, 1);
+        return *(pb_extension_t* const *)prev->pData == NULL;
     }
-    else
+    else if (PB_ATYPE(field->type) == PB_ATYPE_CALLBACK)
     {
-#ifdef PB_WITHOUT_64BIT
-        return pb_encode_varint_32(stream, value, 0);
-#else
-        return pb_encode_varint_32(stream, (uint32_t)value, (uint32_t)(value >> 32));
-#endif
+        /* Previous contents are not known */
+        return false;
     }
-}
+    else if (PB_HTYPE(field->type) == PB_HTYPE_REPEATED)
+    {
+        return *(const pb_size_t*)prev->pSize == 0;
+    }
+    else if (PB_HTYPE(field->type) == PB_HTYPE_ONEOF)
+    {
+        present = (*(const pb_size_t*)field->pSize == field->tag);
+        prev_present = (*(const pb_size_t*)prev->pSize == prev->tag);
 
-bool checkreturn pb_encode_svarint(pb_ostream_t *stream, pb_int64_t value)
-{
-    pb_uint64_t zigzagged;
-    if (value < 0)
-        zigzagged = ~((pb_uint64_t)value << 1);
+        /* Another member of the oneof replaces this one */
+        if (!present && *(const pb_size_t*)field->pSize != 0)
+            return true;
+    }
+    else if (PB_ATYPE(field->type) == PB_ATYPE_POINTER)
+    {
+        present = (field->pData != NULL);
+        prev_present = (prev->pData != NULL);
+    }
+    else if (PB_HTYPE(field->type) == PB_HTYPE_REQUIRED)
+    {
+        present = prev_present = true;
+    }
+    else if (field->pSize != NULL)
+    {
+        present = pb_field_is_present(field);
+        prev_present = pb_field_is_present(prev);
+    }
     else
-        zigzagged = (pb_uint64_t)value << 1;
-    
-    return pb_encode_varint(stream, zigzagged);
-}
+    {
+        present = !pb_check_proto3_default_value(field);
+        prev_present = !pb_check_proto3_default_value(prev);
+    }
 
-bool checkreturn pb_encode_fixed32(pb_ostream_t *stream, const void *value)
-{
-    uint32_t val = *(const uint32_t*)value;
-    pb_byte_t bytes[4];
-    bytes[0] = (pb_byte_t)(val & 0xFF);
-    bytes[1] = (pb_byte_t)((val >> 8) & 0xFF);
-    bytes[2] = (pb_byte_t)((val >> 16) & 0xFF);
-    bytes[3] = (pb_byte_t)((val >> 24) & 0xFF);
-    return pb_write(stream, bytes, 4);
-}
+    if (!prev_present)
+        return true;
 
-#ifndef PB_WITHOUT_64BIT
-bool checkreturn pb_encode_fixed64(pb_ostream_t *stream, const void *value)
-{
-    uint64_t val = *(const uint64_t*)value;
-    pb_byte_t bytes[8];
-    bytes[0] = (pb_byte_t)(val & 0xFF);
-    bytes[1] = (pb_byte_t)((val >> 8) & 0xFF);
-    bytes[2] = (pb_byte_t)((val >> 16) & 0xFF);
-    bytes[3] = (pb_byte_t)((val >> 24) & 0xFF);
-    bytes[4] = (pb_byte_t)((val >> 32) & 0xFF);
-    bytes[5] = (pb_byte_t)((val >> 40) & 0xFF);
-    bytes[6] = (pb_byte_t)((val >> 48) & 0xFF);
-    bytes[7] = (pb_byte_t)((val >> 56) & 0xFF);
-    return pb_write(stream, bytes, 8);
+    if (!present)
+        return false;
+
+    if (PB_LTYPE(field->type) == PB_LTYPE_SUBMESSAGE)
+    {
+        /* Lazy submessages are not decoded, so their contents are not known */
+        if (PB_ATYPE(field->type) == PB_ATYPE_VIEW || field->submsg_desc == NULL)
+            return false;
+
+        return submsg_merges_onto(field->submsg_desc, prev->pData, field->pData);
+    }
+
+    return true;
 }
-#endif
 
-bool checkreturn pb_encode_tag(pb_ostream_t *stream, pb_wire_type_t wiretype, uint32_t field_number)
+static bool checkreturn submsg_merges_onto(const pb_msgdesc_t *fields, const void *prev_struct, const void *src_struct)
 {
-    pb_uint64_t tag = ((pb_uint64_t)field_number << 3) | wiretype;
-    return pb_encode_varint(stream, tag);
+    pb_field_iter_t prev;
+    pb_field_iter_t iter;
+
+    if (!pb_field_iter_begin(&prev, fields, pb_const_cast(prev_struct)) ||
+        !pb_field_iter_begin(&iter, fields, pb_const_cast(src_struct)))
+    {
+        return true; /* Empty message type */
+    }
+
+    do {
+        if (!field_merges_onto(&prev, &iter))
+            return false;
+    } while (pb_field_iter_next(&prev) && pb_field_iter_next(&iter));
+
+    return true;
 }
 
-bool pb_encode_tag_for_field ( pb_ostream_t* stream, const pb_field_iter_t* field )
+/* Encode a field if it has changed from the previous message. */
+static bool checkreturn encode_delta_field(pb_ostream_t *stream, const pb_field_iter_t *prev, pb_field_iter_t *field)
 {
-    pb_wire_type_t wiretype;
-    switch (PB_LTYPE(field->type))
+    bool present;
+    bool prev_present;
+
+    /* Only static submessages are merged by the decoder, others are
+     * replaced and have to be encoded in full. */
+    bool merged = PB_LTYPE(field->type) == PB_LTYPE_SUBMESSAGE &&
+                  PB_ATYPE(field->type) == PB_ATYPE_STATIC &&
+                  PB_HTYPE(field->type) != PB_HTYPE_ONEOF &&
+                  PB_HTYPE(field->type) != PB_HTYPE_REPEATED &&
+                  field->submsg_desc != NULL;
+
+    if (PB_LTYPE(field->type) == PB_LTYPE_EXTENSION)
     {
-        case PB_LTYPE_BOOL:
-        case PB_LTYPE_VARINT:
-        case PB_LTYPE_UVARINT:
-        case PB_LTYPE_SVARINT:
-            wiretype = PB_WT_VARINT;
-            break;
-        
-        case PB_LTYPE_FIXED32:
-            wiretype = PB_WT_32BIT;
-            break;
-        
+        /* Extensions are always encoded in full */
+        return encode_extension_field(stream, field);
+    }
+    else if (PB_ATYPE(field->type) == PB_ATYPE_CALLBACK)
+    {
+        /* Callbacks decide themselves what to encode */
+        return encode_callback_field(stream, field);
+    }
+    else if (PB_HTYPE(field->type) == PB_HTYPE_REQUIRED)
+    {
+        /* Required fields are always included, so that the decoder
+         * finds them in the delta. */
+        if (merged)
+        {
+            return pb_encode_tag_for_field(stream, field) &&
+                   encode_submessage(stream, field->submsg_desc, prev->pData, field->pData);
+        }
+
+        if (PB_LTYPE(field->type) == PB_LTYPE_SUBMESSAGE && !field_merges_onto(prev, field))
+            PB_RETURN_ERROR(stream, "delta not representable");
+
+        return encode_field(stream, field);
+    }
+
+    if (pb_field_equal(prev, field))
+        return true;
+
+    if (PB_HTYPE(field->type) == PB_HTYPE_REPEATED)
+    {
+        return encode_delta_array(stream, prev, field);
+    }
+    else if (PB_HTYPE(field->type) == PB_HTYPE_ONEOF)
+    {
+        present = (*(const pb_size_t*)field->pSize == field->tag);
+        prev_present = (*(const pb_size_t*)prev->pSize == prev->tag);
+
+        if (!present && prev_present && *(const pb_size_t*)field->pSize == 0)
+            PB_RETURN_ERROR(stream, "delta not representable");
+    }
+    else if (PB_ATYPE(field->type) == PB_ATYPE_POINTER)
+    {
+        present = (field->pData != NULL);
+        prev_present = (prev->pData != NULL);
+    }
+    else if (field->pSize != NULL)
+    {
+        present = pb_field_is_present(field);
+        prev_present = pb_field_is_present(prev);
+    }
+    else
+    {
+        /* Proto3 singular field, changes to the default value are
+         * encoded explicitly. */
+        present = prev_present = true;
+    }
+
+    if (!present)
+    {
+        /* Removed optional field, or a oneof member that was replaced */
+        if (prev_present && PB_HTYPE(field->type) != PB_HTYPE_ONEOF)
+            PB_RETURN_ERROR(stream, "delta not representable");
+
+        return true;
+    }
+
+    if (merged && prev_present)
+    {
+        return pb_encode_tag_for_field(stream, field) &&
+               encode_submessage(stream, field->submsg_desc, prev->pData, field->pData);
+    }
+
+    /* Other submessages are replaced by the nanopb decoder, but protobuf
+     * decoders in general merge them into the previous value of the same
+     * field. The full encoding is correct only if both give the same. */
+    if (PB_LTYPE(field->type) == PB_LTYPE_SUBMESSAGE && prev_present &&
+        !field_merges_onto(prev, field))
+    {
+        PB_RETURN_ERROR(stream, "delta not representable");
+    }
+
+    return encode_basic_field(stream, field);
+}
+
+bool checkreturn pb_encode_delta(pb_ostream_t *stream, const pb_msgdesc_t *fields, const void *prev_struct, const void *src_struct)
+{
+    pb_field_iter_t prev;
+    pb_field_iter_t iter;
+
+    if (!pb_field_iter_begin(&prev, fields, pb_const_cast(prev_struct)) ||
+        !pb_field_iter_begin(&iter, fields, pb_const_cast(src_struct)))
+    {
+        return true; /* Empty message type */
+    }
+
+    do {
+        if (!encode_delta_field(stream, &prev, &iter))
+            return false;
+    } while (pb_field_iter_next(&prev) && pb_field_iter_next(&iter));
+
+    return true;
+}
+
+bool pb_get_encoded_size(size_t *size, const pb_msgdesc_t *fields, const void *src_struct)
+{
+    pb_ostream_t stream = PB_OSTREAM_SIZING;
+    
+    if (!pb_encode(&stream, fields, src_struct))
+        return false;
+    
+    *size = stream.bytes_written;
+    return true;
+}
+
+/*******************
+ * Chunked encoder *
+ *******************/
+
+#ifndef PB_BUFFER_ONLY
+
+/* Values of pb_encoder_t.state */
+#define PB_ESTATE_PREFIX  0   /* Length prefix of a delimited message */
+#define PB_ESTATE_FIELD   1   /* Field at the current position */
+#define PB_ESTATE_HEADER  2   /* Tag and length of a submessage or data item */
+#define PB_ESTATE_DATA    3   /* Contents of a bytes or string item */
+#define PB_ESTATE_DONE    4
+#define PB_ESTATE_ERROR   5
+
+/* Stream callback that copies into the current chunk of the encoder.
+ * The first encoder->skip bytes were written into an earlier chunk
+ * already, so they are left out. */
+static bool checkreturn chunk_write(pb_ostream_t *stream, const pb_byte_t *buf, size_t count)
+{
+    pb_encoder_t *encoder = (pb_encoder_t*)stream->state;
+    size_t space = encoder->chunk_size - encoder->chunk_pos;
+
+    if (encoder->skip >= count)
+    {
+        encoder->skip -= count;
+        return true;
+    }
+
+    buf += encoder->skip;
+    count -= encoder->skip;
+    encoder->skip = 0;
+
+    if (count > space)
+    {
+        memcpy(encoder->chunk + encoder->chunk_pos, buf, space);
+        encoder->chunk_pos += space;
+        encoder->full = true;
+        return false;
+    }
+
+    memcpy(encoder->chunk + encoder->chunk_pos, buf, count);
+    encoder->chunk_pos += count;
+    return true;
+}
+
+/* Check if the field is written item by item instead of as a whole.
+ * Submessages are descended into, up to PB_ENCODER_MAX_DEPTH levels, and
+ * the contents of bytes and string fields are copied straight from the
+ * structure, so a large field is not encoded again for every chunk. */
+static bool encoder_is_split(const pb_encoder_t *encoder, const pb_field_iter_t *field)
+{
+    if (PB_ATYPE(field->type) == PB_ATYPE_CALLBACK)
+        return false;
+
+    switch (PB_LTYPE(field->type))
+    {
+        case PB_LTYPE_SUBMESSAGE:
+            /* Lazy submessages are encoded as a whole */
+            return PB_ATYPE(field->type) != PB_ATYPE_VIEW &&
+                   encoder->depth + 1 < PB_ENCODER_MAX_DEPTH;
+
+        case PB_LTYPE_BYTES:
+        case PB_LTYPE_STRING:
+        case PB_LTYPE_FIXED_LENGTH_BYTES:
+            return true;
+
+        default:
+            return false;
+    }
+}
+
+/* Get the number of items to encode from a submessage, bytes or string
+ * field. Follows the same rules as encode_field(). */
+static bool checkreturn encoder_item_count(pb_encoder_t *encoder, const pb_field_iter_t *field, pb_size_t *count)
+{
+    *count = 0;
+
+    if (PB_ATYPE(field->type) == PB_ATYPE_POINTER && !field->pData)
+    {
+        /* Missing pointer field */
+        if (PB_HTYPE(field->type) == PB_HTYPE_REQUIRED)
+            PB_RETURN_ERROR(encoder, "missing required field");
+
+        return true;
+    }
+
+    if (PB_HTYPE(field->type) == PB_HTYPE_REQUIRED)
+    {
+        *count = 1;
+    }
+    else if (PB_HTYPE(field->type) == PB_HTYPE_OPTIONAL)
+    {
+        if (PB_ATYPE(field->type) == PB_ATYPE_POINTER)
+        {
+            *count = 1;
+        }
+        else if (!field->pSize)
+        {
+            /* Proto3 singular field */
+            if (!pb_check_proto3_default_value(field))
+                *count = 1;
+        }
+        else if (pb_field_is_present(field))
+        {
+            *count = 1;
+        }
+    }
+    else if (PB_HTYPE(field->type) == PB_HTYPE_ONEOF)
+    {
+        if (*(const pb_size_t*)field->pSize == field->tag)
+            *count = 1;
+    }
+    else if (PB_HTYPE(field->type) == PB_HTYPE_REPEATED)
+    {
+        *count = *(const pb_size_t*)field->pSize;
+
+        if (PB_ATYPE(field->type) != PB_ATYPE_POINTER && *count > field->array_size)
+            PB_RETURN_ERROR(encoder, "array max size exceeded");
+    }
+    else
+    {
+        PB_RETURN_ERROR(encoder, "invalid field type");
+    }
+
+    if (*count > 0 && PB_LTYPE(field->type) == PB_LTYPE_SUBMESSAGE &&
+        field->submsg_desc == NULL)
+    {
+        PB_RETURN_ERROR(encoder, "invalid field descriptor");
+    }
+
+    return true;
+}
+
+/* Get a pointer to the item at the current index of the frame. */
+static void *encoder_item_ptr(const pb_encoder_frame_t *frame)
+{
+    if (PB_HTYPE(frame->iter.type) == PB_HTYPE_REPEATED)
+    {
+        void *item = (char*)frame->iter.pData + (size_t)frame->iter.data_size * frame->index;
+
+        /* Arrays of pointer-type strings and bytes contain pointers */
+        if (PB_ATYPE(frame->iter.type) == PB_ATYPE_POINTER &&
+            (PB_LTYPE(frame->iter.type) == PB_LTYPE_STRING ||
+             PB_LTYPE(frame->iter.type) == PB_LTYPE_BYTES))
+        {
+            item = *(void* const*)item;
+        }
+
+        return item;
+    }
+    else
+    {
+        return frame->iter.pData;
+    }
+}
+
+/* Write the current item into the chunk: a length prefix, the header of
+ * a submessage or data item, the contents of a data item or a whole field.
+ * If the chunk fills up, the item is written again for the next chunk,
+ * skipping the bytes that were already written. Data contents are copied
+ * directly, so skipping them costs nothing.
+ * Returns false when the chunk is full or on error. */
+static bool checkreturn encoder_item(pb_encoder_t *encoder)
+{
+    pb_encoder_frame_t *frame = &encoder->stack[encoder->depth];
+    pb_field_iter_t field = frame->iter; /* encode_array() modifies pData */
+    size_t start = encoder->chunk_pos;
+    pb_ostream_t stream;
+    bool status;
+
+    stream.callback = &chunk_write;
+    stream.state = encoder;
+    stream.max_size = SIZE_MAX;
+    stream.bytes_written = 0;
+#ifndef PB_NO_ERRMSG
+    stream.errmsg = NULL;
+#endif
+
+    encoder->skip = encoder->offset;
+
+    if (encoder->state == PB_ESTATE_PREFIX)
+    {
+        status = pb_encode_varint(&stream, (pb_uint64_t)encoder->msgsize);
+    }
+    else if (encoder->state == PB_ESTATE_HEADER)
+    {
+        status = pb_encode_tag_for_field(&stream, &field) &&
+                 pb_encode_varint(&stream, (pb_uint64_t)encoder->msgsize);
+    }
+    else if (encoder->state == PB_ESTATE_DATA)
+    {
+        status = pb_write(&stream, encoder->data, encoder->msgsize);
+    }
+    else if (PB_LTYPE(field.type) == PB_LTYPE_EXTENSION)
+    {
+        status = encode_extension_field(&stream, &field);
+    }
+    else
+    {
+        status = encode_field(&stream, &field);
+    }
+
+    encoder->total += encoder->chunk_pos - start;
+
+    if (status)
+    {
+        encoder->offset = 0;
+        return true;
+    }
+    else if (encoder->full)
+    {
+        encoder->offset += encoder->chunk_pos - start;
+        return false;
+    }
+    else
+    {
+#ifndef PB_NO_ERRMSG
+        encoder->errmsg = stream.errmsg;
+#endif
+        encoder->state = PB_ESTATE_ERROR;
+        return false;
+    }
+}
+
+/* Move to the next field, returning from finished submessages. */
+static bool checkreturn encoder_next(pb_encoder_t *encoder)
+{
+    pb_encoder_frame_t *frame = &encoder->stack[encoder->depth];
+
+    frame->index = 0;
+    while (!pb_field_iter_next(&frame->iter))
+    {
+        if (encoder->depth == 0)
+        {
+            encoder->state = PB_ESTATE_DONE;
+            return true;
+        }
+
+        if (encoder->total - frame->start != frame->size)
+            PB_RETURN_ERROR(encoder, "submsg size changed");
+
+        /* Continue with the next item of the parent submessage field */
+        encoder->depth--;
+        encoder->stack[encoder->depth].index++;
+        return true;
+    }
+
+    return true;
+}
+
+/* Start the next item of the current split field, or move to the next
+ * field if all of them have been written. The size of a submessage is
+ * calculated here, and the data of a bytes or string item is located. */
+static bool checkreturn encoder_begin_item(pb_encoder_t *encoder)
+{
+    pb_encoder_frame_t *frame = &encoder->stack[encoder->depth];
+    pb_size_t count;
+
+    if (!encoder_item_count(encoder, &frame->iter, &count))
+        return false;
+
+    if (frame->index >= count)
+        return encoder_next(encoder);
+
+    if (PB_LTYPE(frame->iter.type) == PB_LTYPE_SUBMESSAGE)
+    {
+        if (!pb_get_encoded_size(&encoder->msgsize, frame->iter.submsg_desc, encoder_item_ptr(frame)))
+            PB_RETURN_ERROR(encoder, "submsg size failed");
+    }
+    else
+    {
+        pb_ostream_t stream = PB_OSTREAM_SIZING;
+        pb_field_iter_t field = frame->iter;
+        field.pData = encoder_item_ptr(frame);
+
+        if (!get_field_data(&stream, &field, &encoder->data, &encoder->msgsize))
+            PB_RETURN_ERROR(encoder, PB_GET_ERROR(&stream));
+    }
+
+    encoder->state = PB_ESTATE_HEADER;
+    return true;
+}
+
+/* Descend into the submessage after its header has been written. */
+static bool checkreturn encoder_push(pb_encoder_t *encoder)
+{
+    pb_encoder_frame_t *frame = &encoder->stack[encoder->depth];
+    pb_encoder_frame_t *child;
+
+    encoder->state = PB_ESTATE_FIELD;
+
+    child = &encoder->stack[encoder->depth + 1];
+    if (!pb_field_iter_begin(&child->iter, frame->iter.submsg_desc, encoder_item_ptr(frame)))
+    {
+        /* Empty message type */
+        frame->index++;
+        return true;
+    }
+
+    child->index = 0;
+    child->start = encoder->total;
+    child->size = encoder->msgsize;
+    encoder->depth++;
+    return true;
+}
+
+bool pb_encoder_init(pb_encoder_t *encoder, const pb_msgdesc_t *fields, const void *src_struct, unsigned int flags)
+{
+    pb_encoder_frame_t *frame = &encoder->stack[0];
+
+    encoder->depth = 0;
+    encoder->state = PB_ESTATE_FIELD;
+    encoder->full = false;
+    encoder->offset = 0;
+    encoder->total = 0;
+    encoder->msgsize = 0;
+    encoder->data = NULL;
+    encoder->chunk = NULL;
+    encoder->chunk_size = 0;
+    encoder->chunk_pos = 0;
+    encoder->skip = 0;
+#ifndef PB_NO_ERRMSG
+    encoder->errmsg = NULL;
+#endif
+
+    frame->index = 0;
+    frame->start = 0;
+    frame->size = 0;
+
+    if (!pb_field_iter_begin(&frame->iter, fields, pb_const_cast(src_struct)))
+        encoder->state = PB_ESTATE_DONE; /* Empty message type */
+
+    if ((flags & PB_ENCODE_DELIMITED) != 0)
+    {
+        if (!pb_get_encoded_size(&encoder->msgsize, fields, src_struct))
+        {
+            encoder->state = PB_ESTATE_ERROR;
+            PB_RETURN_ERROR(encoder, "size failed");
+        }
+
+        encoder->state = PB_ESTATE_PREFIX;
+    }
+
+    return true;
+}
+
+pb_encoder_status_t pb_encoder_write(pb_encoder_t *encoder, pb_byte_t *chunk, size_t size, size_t *count)
+{
+    encoder->chunk = chunk;
+    encoder->chunk_size = size;
+    encoder->chunk_pos = 0;
+    encoder->full = false;
+
+    while (encoder->state != PB_ESTATE_DONE && encoder->state != PB_ESTATE_ERROR)
+    {
+        pb_encoder_frame_t *frame = &encoder->stack[encoder->depth];
+        bool status;
+
+        if (encoder->state == PB_ESTATE_FIELD &&
+            encoder_is_split(encoder, &frame->iter))
+        {
+            status = encoder_begin_item(encoder);
+        }
+        else if (!encoder_item(encoder))
+        {
+            if (encoder->full)
+            {
+                *count = encoder->chunk_pos;
+                return PB_ENCODER_MORE;
+            }
+
+            status = false;
+        }
+        else if (encoder->state == PB_ESTATE_PREFIX)
+        {
+            /* Fields of an empty message would not write anything, and
+             * there may not be any to iterate. */
+            encoder->state = (encoder->msgsize == 0) ? PB_ESTATE_DONE : PB_ESTATE_FIELD;
+            status = true;
+        }
+        else if (encoder->state == PB_ESTATE_HEADER &&
+                 PB_LTYPE(frame->iter.type) == PB_LTYPE_SUBMESSAGE)
+        {
+            status = encoder_push(encoder);
+        }
+        else if (encoder->state == PB_ESTATE_HEADER)
+        {
+            encoder->state = PB_ESTATE_DATA;
+            status = true;
+        }
+        else if (encoder->state == PB_ESTATE_DATA)
+        {
+            /* Continue with the next item of the field */
+            frame->index++;
+            encoder->state = PB_ESTATE_FIELD;
+            status = true;
+        }
+        else
+        {
+            status = encoder_next(encoder);
+        }
+
+        if (!status)
+            encoder->state = PB_ESTATE_ERROR;
+    }
+
+    *count = encoder->chunk_pos;
+
+    if (encoder->state == PB_ESTATE_ERROR)
+        return PB_ENCODER_ERROR;
+    else
+        return PB_ENCODER_DONE;
+}
+
+#endif
+
+/********************
+ * Helper functions *
+ ********************/
+
+/* This function avoids 64-bit shifts as they are quite slow on many platforms. */
+static bool checkreturn pb_encode_varint_32(pb_ostream_t *stream, uint32_t low, uint32_t high)
+{
+    size_t i = 0;
+    pb_byte_t buffer[10];
+    pb_byte_t byte = (pb_byte_t)(low & 0x7F);
+    low >>= 7;
+
+    while (i < 4 && (low != 0 || high != 0))
+    {
+        byte |= 0x80;
+        buffer[i++] = byte;
+        byte = (pb_byte_t)(low & 0x7F);
+        low >>= 7;
+    }
+
+    if (high)
+    {
+        byte = (pb_byte_t)(byte | ((high & 0x07) << 4));
+        high >>= 3;
+
+        while (high)
+        {
+            byte |= 0x80;
+            buffer[i++] = byte;
+            byte = (pb_byte_t)(high & 0x7F);
+            high >>= 7;
+        }
+    }
+
+    buffer[i++] = byte;
+
+    return pb_write(stream, buffer, i);
+}
+
+bool checkreturn pb_encode_varint(pb_ostream_t *stream, pb_uint64_t value)
+{
+    if (value <= 0x7F)
+    {
+        /* Fast path: single byte */
+        pb_byte_t byte = (pb_byte_t)value;
+        return pb_write(stream, &byte, 1);
+    }
+    else
+    {
+#ifdef PB_WITHOUT_64BIT
+        return pb_encode_varint_32(stream, value, 0);
+#else
+        return pb_encode_varint_32(stream, (uint32_t)value, (uint32_t)(value >> 32));
+#endif
+    }
+}
+
+bool checkreturn pb_encode_svarint(pb_ostream_t *stream, pb_int64_t value)
+{
+    pb_uint64_t zigzagged;
+    if (value < 0)
+        zigzagged = ~((pb_uint64_t)value << 1);
+    else
+        zigzagged = (pb_uint64_t)value << 1;
+    
+    return pb_encode_varint(stream, zigzagged);
+}
+
+bool checkreturn pb_encode_fixed32(pb_ostream_t *stream, const void *value)
+{
+    uint32_t val = *(const uint32_t*)value;
+    pb_byte_t bytes[4];
+    bytes[0] = (pb_byte_t)(val & 0xFF);
+    bytes[1] = (pb_byte_t)((val >> 8) & 0xFF);
+    bytes[2] = (pb_byte_t)((val >> 16) & 0xFF);
+    bytes[3] = (pb_byte_t)((val >> 24) & 0xFF);
+    return pb_write(stream, bytes, 4);
+}
+
+#ifndef PB_WITHOUT_64BIT
+bool checkreturn pb_encode_fixed64(pb_ostream_t *stream, const void *value)
+{
+    uint64_t val = *(const uint64_t*)value;
+    pb_byte_t bytes[8];
+    bytes[0] = (pb_byte_t)(val & 0xFF);
+    bytes[1] = (pb_byte_t)((val >> 8) & 0xFF);
+    bytes[2] = (pb_byte_t)((val >> 16) & 0xFF);
+    bytes[3] = (pb_byte_t)((val >> 24) & 0xFF);
+    bytes[4] = (pb_byte_t)((val >> 32) & 0xFF);
+    bytes[5] = (pb_byte_t)((val >> 40) & 0xFF);
+    bytes[6] = (pb_byte_t)((val >> 48) & 0xFF);
+    bytes[7] = (pb_byte_t)((val >> 56) & 0xFF);
+    return pb_write(stream, bytes, 8);
+}
+#endif
+
+bool checkreturn pb_encode_tag(pb_ostream_t *stream, pb_wire_type_t wiretype, uint32_t field_number)
+{
+    pb_uint64_t tag = ((pb_uint64_t)field_number << 3) | wiretype;
+    return pb_encode_varint(stream, tag);
+}
+
+bool pb_encode_tag_for_field ( pb_ostream_t* stream, const pb_field_iter_t* field )
+{
+    pb_wire_type_t wiretype;
+    switch (PB_LTYPE(field->type))
+    {
+        case PB_LTYPE_BOOL:
+        case PB_LTYPE_VARINT:
+        case PB_LTYPE_UVARINT:
+        case PB_LTYPE_SVARINT:
+            wiretype = PB_WT_VARINT;
+            break;
+        
+        case PB_LTYPE_FIXED32:
+            wiretype = PB_WT_32BIT;
+            break;
+        
         case PB_LTYPE_FIXED64:
             wiretype = PB_WT_64BIT;
             break;
@@ -686,14 +1540,59 @@ bool checkreturn pb_encode_string(pb_ostream_t *stream, const pb_byte_t *buffer,
     return pb_write(stream, buffer, size);
 }
 
+/* Encode the data of a bytes or string field in the message structure.
+ * Same as pb_encode_string(), except that segment streams can store a
+ * reference to the data instead of copying it. */
+static bool checkreturn encode_field_data(pb_ostream_t *stream, const pb_byte_t *buffer, size_t size)
+{
+#ifndef PB_BUFFER_ONLY
+    if (stream->callback == &segment_write && size > 0 &&
+        size >= ((pb_ostream_segments_t*)stream->state)->threshold)
+    {
+        pb_ostream_segments_t *state = (pb_ostream_segments_t*)stream->state;
+
+        if (!pb_encode_varint(stream, (pb_uint64_t)size))
+            return false;
+
+        if (stream->bytes_written + size > stream->max_size)
+            PB_RETURN_ERROR(stream, "stream full");
+
+        if (state->segment_count >= state->max_segments)
+            PB_RETURN_ERROR(stream, "too many segments");
+
+        state->segments[state->segment_count].data = buffer;
+        state->segments[state->segment_count].size = size;
+        state->segment_count++;
+        stream->bytes_written += size;
+        return true;
+    }
+#endif
+
+    return pb_encode_string(stream, buffer, size);
+}
+
+/* Encode a whole message, or only the changes from prev_struct if given. */
+static bool checkreturn encode_message(pb_ostream_t *stream, const pb_msgdesc_t *fields, const void *prev_struct, const void *src_struct)
+{
+    if (prev_struct != NULL)
+        return pb_encode_delta(stream, fields, prev_struct, src_struct);
+    else
+        return pb_encode(stream, fields, src_struct);
+}
+
 bool checkreturn pb_encode_submessage(pb_ostream_t *stream, const pb_msgdesc_t *fields, const void *src_struct)
+{
+    return encode_submessage(stream, fields, NULL, src_struct);
+}
+
+static bool checkreturn encode_submessage(pb_ostream_t *stream, const pb_msgdesc_t *fields, const void *prev_struct, const void *src_struct)
 {
     /* First calculate the message size using a non-writing substream. */
     pb_ostream_t substream = PB_OSTREAM_SIZING;
     size_t size;
     bool status;
     
-    if (!pb_encode(&substream, fields, src_struct))
+    if (!encode_message(&substream, fields, prev_struct, src_struct))
     {
 #ifndef PB_NO_ERRMSG
         stream->errmsg = substream.errmsg;
@@ -722,7 +1621,7 @@ bool checkreturn pb_encode_submessage(pb_ostream_t *stream, const pb_msgdesc_t *
     substream.errmsg = NULL;
 #endif
     
-    status = pb_encode(&substream, fields, src_struct);
+    status = encode_message(&substream, fields, prev_struct, src_struct);
     
     stream->bytes_written += substream.bytes_written;
     stream->state = substream.state;
@@ -740,7 +1639,7 @@ bool checkreturn pb_encode_submessage(pb_ostream_t *stream, const pb_msgdesc_t *
 
 static bool checkreturn pb_enc_bool(pb_ostream_t *stream, const pb_field_iter_t *field)
 {
-    uint32_t value = safe_read_bool(field->pData) ? 1 : 0;
+    uint32_t value = pb_safe_read_bool(field->pData) ? 1 : 0;
     PB_UNUSED(field);
     return pb_encode_varint(stream, value);
 }
@@ -811,63 +1710,76 @@ static bool checkreturn pb_enc_fixed(pb_ostream_t *stream, const pb_field_iter_t
     }
 }
 
-static bool checkreturn pb_enc_bytes(pb_ostream_t *stream, const pb_field_iter_t *field)
+/* Find the contents of a bytes, string or fixed length bytes field, or of
+ * a view field. Checks that static fields stay within their size. */
+static bool checkreturn get_field_data(pb_ostream_t *stream, const pb_field_iter_t *field,
+                                       const pb_byte_t **data, size_t *size)
 {
-    const pb_bytes_array_t *bytes = NULL;
+    *data = NULL;
+    *size = 0;
 
-    bytes = (const pb_bytes_array_t*)field->pData;
-    
-    if (bytes == NULL)
-    {
-        /* Treat null pointer as an empty bytes field */
-        return pb_encode_string(stream, NULL, 0);
-    }
-    
-    if (PB_ATYPE(field->type) == PB_ATYPE_STATIC &&
-        PB_BYTES_ARRAY_T_ALLOCSIZE(bytes->size) > field->data_size)
+    if (PB_ATYPE(field->type) == PB_ATYPE_VIEW)
     {
-        PB_RETURN_ERROR(stream, "bytes size exceeded");
-    }
-    
-    return pb_encode_string(stream, bytes->bytes, bytes->size);
-}
+        const pb_bytes_view_t *view = (const pb_bytes_view_t*)field->pData;
 
-static bool checkreturn pb_enc_string(pb_ostream_t *stream, const pb_field_iter_t *field)
-{
-    size_t size = 0;
-    size_t max_size = field->data_size;
-    const char *str = (const char*)field->pData;
-    
-    if (PB_ATYPE(field->type) == PB_ATYPE_POINTER)
-    {
-        max_size = (size_t)-1;
+        if (view->ptr == NULL && view->size != 0)
+            PB_RETURN_ERROR(stream, "invalid view");
+
+        *data = view->ptr;
+        *size = view->size;
     }
-    else
+    else if (PB_LTYPE(field->type) == PB_LTYPE_BYTES)
     {
-        /* pb_dec_string() assumes string fields end with a null
-         * terminator when the type isn't PB_ATYPE_POINTER, so we
-         * shouldn't allow more than max-1 bytes to be written to
-         * allow space for the null terminator.
-         */
-        if (max_size == 0)
-            PB_RETURN_ERROR(stream, "zero-length string");
+        const pb_bytes_array_t *bytes = (const pb_bytes_array_t*)field->pData;
 
-        max_size -= 1;
-    }
+        if (bytes == NULL)
+        {
+            /* Treat null pointer as an empty bytes field */
+            return true;
+        }
 
+        if (PB_ATYPE(field->type) == PB_ATYPE_STATIC &&
+            PB_BYTES_ARRAY_T_ALLOCSIZE(bytes->size) > field->data_size)
+        {
+            PB_RETURN_ERROR(stream, "bytes size exceeded");
+        }
 
-    if (str == NULL)
-    {
-        size = 0; /* Treat null pointer as an empty string */
+        *data = bytes->bytes;
+        *size = bytes->size;
     }
-    else
+    else if (PB_LTYPE(field->type) == PB_LTYPE_STRING)
     {
+        size_t max_size = field->data_size;
+        const char *str = (const char*)field->pData;
         const char *p = str;
 
+        if (PB_ATYPE(field->type) == PB_ATYPE_POINTER)
+        {
+            max_size = (size_t)-1;
+        }
+        else
+        {
+            /* pb_dec_string() assumes string fields end with a null
+             * terminator when the type isn't PB_ATYPE_POINTER, so we
+             * shouldn't allow more than max-1 bytes to be written to
+             * allow space for the null terminator.
+             */
+            if (max_size == 0)
+                PB_RETURN_ERROR(stream, "zero-length string");
+
+            max_size -= 1;
+        }
+
+        if (str == NULL)
+        {
+            /* Treat null pointer as an empty string */
+            return true;
+        }
+
         /* strnlen() is not always available, so just use a loop */
-        while (size < max_size && *p != '\0')
+        while (*size < max_size && *p != '\0')
         {
-            size++;
+            (*size)++;
             p++;
         }
 
@@ -875,20 +1787,56 @@ static bool checkreturn pb_enc_string(pb_ostream_t *stream, const pb_field_iter_
         {
             PB_RETURN_ERROR(stream, "unterminated string");
         }
+
+        *data = (const pb_byte_t*)str;
+    }
+    else
+    {
+        *data = (const pb_byte_t*)field->pData;
+        *size = field->data_size;
     }
 
-    return pb_encode_string(stream, (const pb_byte_t*)str, size);
+    return true;
+}
+
+/* Encode a bytes, fixed length bytes or view field. */
+static bool checkreturn pb_enc_bytes(pb_ostream_t *stream, const pb_field_iter_t *field)
+{
+    const pb_byte_t *data;
+    size_t size;
+
+    if (!get_field_data(stream, field, &data, &size))
+        return false;
+
+    return encode_field_data(stream, data, size);
+}
+
+/* Strings are encoded like bytes, get_field_data() finds their length. */
+static bool checkreturn pb_enc_string(pb_ostream_t *stream, const pb_field_iter_t *field)
+{
+    return pb_enc_bytes(stream, field);
 }
 
 static bool checkreturn pb_enc_submessage(pb_ostream_t *stream, const pb_field_iter_t *field)
 {
+    if (PB_ATYPE(field->type) == PB_ATYPE_VIEW)
+    {
+        const pb_lazy_t *lazy = (const pb_lazy_t*)field->pData;
+
+        if (lazy->msg == NULL)
+        {
+            /* Lazy submessage that has not been accessed, copy the original data */
+            return pb_enc_bytes(stream, field);
+        }
+
+        if (field->submsg_desc == NULL)
+            PB_RETURN_ERROR(stream, "invalid field descriptor");
+
+        return pb_encode_submessage(stream, field->submsg_desc, lazy->msg);
+    }
+
     if (field->submsg_desc == NULL)
         PB_RETURN_ERROR(stream, "invalid field descriptor");
     
     return pb_encode_submessage(stream, field->submsg_desc, field->pData);
 }
-
-static bool checkreturn pb_enc_fixed_length_bytes(pb_ostream_t *stream, const pb_field_iter_t *field)
-{
-    return pb_encode_string(stream, (const pb_byte_t*)field->pData, field->data_size);
-}
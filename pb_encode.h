@@ -46,6 +46,40 @@ struct pb_ostream_s
 #endif
 };
 
+#ifndef PB_BUFFER_ONLY
+/* State of a buffered output stream, see pb_ostream_buffered(). */
+typedef struct pb_ostream_buffer_s pb_ostream_buffer_t;
+struct pb_ostream_buffer_s
+{
+    pb_ostream_t *dest;   /* Underlying callback stream */
+    pb_byte_t *buffer;    /* Buffer given by the caller */
+    size_t size;          /* Size of the buffer */
+    size_t count;         /* Number of bytes waiting in the buffer */
+};
+
+/* One piece of the output of a segment stream, see pb_ostream_segments().
+ * Has the same members as struct iovec, for use with writev(). */
+typedef struct pb_segment_s pb_segment_t;
+struct pb_segment_s
+{
+    const pb_byte_t *data;
+    size_t size;
+};
+
+/* State of a segment output stream. */
+typedef struct pb_ostream_segments_s pb_ostream_segments_t;
+struct pb_ostream_segments_s
+{
+    pb_segment_t *segments;   /* Array of segments given by the caller */
+    size_t max_segments;      /* Size of the segments array */
+    size_t segment_count;     /* Number of segments written so far */
+    pb_byte_t *scratch;       /* Buffer for the data that is copied */
+    size_t scratch_size;      /* Size of the scratch buffer */
+    size_t scratch_used;      /* Bytes used in the scratch buffer */
+    size_t threshold;         /* Minimum size of referenced field data */
+};
+#endif
+
 /***************************
  * Main encoding functions *
  ***************************/
@@ -86,10 +120,134 @@ bool pb_encode_ex(pb_ostream_t *stream, const pb_msgdesc_t *fields, const void *
 #define pb_encode_delimited(s,f,d) pb_encode_ex(s,f,d, PB_ENCODE_DELIMITED)
 #define pb_encode_nullterminated(s,f,d) pb_encode_ex(s,f,d, PB_ENCODE_NULLTERMINATED)
 
+/* Encode one element of a repeated callback field, including its tag,
+ * inside the encode callback. The element type is taken from the field
+ * descriptor, and src must point to a variable of the matching C type with
+ * size src_size, or to the message structure for submessage fields.
+ * The generated MyMessage_field_encode_items() functions call this for
+ * fields with the callback_items option. */
+bool pb_encode_callback_item(pb_ostream_t *stream, const pb_field_iter_t *field, const void *src, size_t src_size);
+
+/* Encode a message prefixed with its message id and length, for decoding
+ * with pb_decode_by_msgid(). The message type is looked up from a msgid
+ * table, usually the one generated for a .proto file. */
+bool pb_encode_with_msgid(pb_ostream_t *stream, const pb_msgid_table_t *table, uint32_t msgid, const void *src_struct);
+
+/* Encode the messages of batch back-to-back, each prefixed with its length as
+ * with PB_ENCODE_DELIMITED. If batch->valid is not NULL, the messages that
+ * are marked not valid are left out. */
+bool pb_encode_batch(pb_ostream_t *stream, const pb_msgdesc_t *fields, const pb_batch_t *batch);
+
+/* Encode only the fields of src_struct that differ from prev_struct, so that
+ * decoding the output with pb_decode_noinit() into a copy of prev_struct
+ * gives src_struct. Submessages are compared and encoded recursively, and
+ * required fields are always included.
+ *
+ * The output relies on the protobuf rule that fields are merged into the
+ * existing values, so it can be decoded by any protobuf implementation.
+ * Changes that merging cannot express fail with the error
+ * "delta not representable": clearing an optional field or oneof, changing
+ * arrays other than by adding entries at the end, and changing a oneof or
+ * pointer submessage unless its full encoding merges correctly into the
+ * previous value. In that case, send the whole message with pb_encode()
+ * instead.
+ *
+ * Example usage:
+ *    if (!pb_encode_delta(&stream, MyMessage_fields, &previous, &current))
+ *        // ... encode current in full ...
+ *    previous = current;
+ */
+bool pb_encode_delta(pb_ostream_t *stream, const pb_msgdesc_t *fields, const void *prev_struct, const void *src_struct);
+
 /* Encode the message to get the size of the encoded data, but do not store
  * the data. */
 bool pb_get_encoded_size(size_t *size, const pb_msgdesc_t *fields, const void *src_struct);
 
+/*******************
+ * Chunked encoder *
+ *******************/
+
+#ifndef PB_BUFFER_ONLY
+/* Maximum nesting depth of submessages in pb_encoder_t, including the top
+ * level message. Deeper submessages are encoded as a whole. Must be the
+ * same in all compilation units. */
+#ifndef PB_ENCODER_MAX_DEPTH
+#define PB_ENCODER_MAX_DEPTH 8
+#endif
+
+/* Encoding state of one message level in pb_encoder_t. */
+typedef struct pb_encoder_frame_s pb_encoder_frame_t;
+struct pb_encoder_frame_s
+{
+    pb_field_iter_t iter;    /* Field that is being encoded */
+    pb_size_t index;         /* Array index of the item in the field */
+    size_t start;            /* Output position where the message starts */
+    size_t size;             /* Encoded size of the message */
+};
+
+/* State of a chunked encoder, see pb_encoder_init().
+ * The members are private to pb_encode.c. */
+typedef struct pb_encoder_s pb_encoder_t;
+struct pb_encoder_s
+{
+    pb_encoder_frame_t stack[PB_ENCODER_MAX_DEPTH];
+    uint_least8_t depth;     /* Index of the current message in stack */
+    uint_least8_t state;     /* What is written next */
+    bool full;               /* Output chunk ran out during the last write */
+    size_t offset;           /* Bytes of the current item already written */
+    size_t total;            /* Bytes written in all chunks so far */
+    size_t msgsize;          /* Size of the delimited message or current item */
+    const pb_byte_t *data;   /* Contents of the current bytes or string item */
+    pb_byte_t *chunk;        /* Current output chunk */
+    size_t chunk_size;
+    size_t chunk_pos;
+    size_t skip;             /* Bytes to skip when writing the current item again */
+
+#ifndef PB_NO_ERRMSG
+    const char *errmsg;
+#endif
+};
+
+/* Return values of pb_encoder_write(). */
+typedef enum {
+    PB_ENCODER_ERROR = 0,    /* Encoding failed, see PB_GET_ERROR(encoder) */
+    PB_ENCODER_MORE = 1,     /* The chunk is full, call again with the next one */
+    PB_ENCODER_DONE = 2      /* The whole message has been written */
+} pb_encoder_status_t;
+
+/* Start encoding a message into chunks of any size, for example the fixed
+ * size transmit buffers of a DMA controller. Each call to pb_encoder_write()
+ * fills one chunk and continues where the previous one ended, so no buffer
+ * for the whole message is needed and the caller never has to block.
+ *
+ * Submessages are encoded level by level and the contents of bytes and
+ * string fields are copied directly from the structure, keeping the
+ * position in the encoder. Other fields are encoded as a whole; if one does
+ * not fit in the rest of the chunk, it is encoded again for the next chunk,
+ * skipping the part that was already written. Field callbacks must
+ * therefore give the same output every time, as with pb_encode_submessage().
+ *
+ * The only supported flag is PB_ENCODE_DELIMITED. The source structure
+ * must not be changed until the whole message has been written.
+ *
+ * Example usage:
+ *    pb_encoder_t encoder;
+ *    pb_byte_t chunk[64];
+ *    pb_encoder_init(&encoder, MyMessage_fields, &msg, 0);
+ *
+ *    do {
+ *        status = pb_encoder_write(&encoder, chunk, sizeof(chunk), &count);
+ *        transmit(chunk, count);
+ *    } while (status == PB_ENCODER_MORE);
+ */
+bool pb_encoder_init(pb_encoder_t *encoder, const pb_msgdesc_t *fields, const void *src_struct, unsigned int flags);
+
+/* Write the next part of the message into chunk. The number of bytes
+ * written is stored in *count, which is less than size only at the end of
+ * the message or when an error occurs. */
+pb_encoder_status_t pb_encoder_write(pb_encoder_t *encoder, pb_byte_t *chunk, size_t size, size_t *count);
+#endif
+
 /**************************************
  * Functions for manipulating streams *
  **************************************/
@@ -118,6 +276,62 @@ pb_ostream_t pb_ostream_from_buffer(pb_byte_t *buf, size_t bufsize);
 #define PB_OSTREAM_SIZING {0,0,0,0}
 #endif
 
+#ifndef PB_BUFFER_ONLY
+/* Create an output stream that collects the written data into a buffer,
+ * and passes it to another stream only when the buffer gets full or when
+ * pb_ostream_flush() is called. Otherwise callback streams such as sockets
+ * get a separate call for every tag and field value. Writes larger than the
+ * buffer go directly to the destination stream.
+ *
+ * The state and buffer must remain valid while the stream is in use.
+ * The max_size of the stream is the space left in dest.
+ *
+ * Example usage:
+ *    pb_byte_t buffer[256];
+ *    pb_ostream_buffer_t state;
+ *    pb_ostream_t socket = pb_ostream_from_socket(fd);
+ *    pb_ostream_t stream = pb_ostream_buffered(&state, &socket, buffer, sizeof(buffer));
+ *    pb_encode(&stream, MyMessage_fields, &msg) && pb_ostream_flush(&stream);
+ */
+pb_ostream_t pb_ostream_buffered(pb_ostream_buffer_t *state, pb_ostream_t *dest,
+                                 pb_byte_t *buffer, size_t bufsize);
+
+/* Write out any data waiting in the buffer of a stream created with
+ * pb_ostream_buffered(). Must be called after encoding to get all of the
+ * data into the destination stream. Does nothing for other streams.
+ */
+bool pb_ostream_flush(pb_ostream_t *stream);
+#endif
+
+#ifndef PB_BUFFER_ONLY
+/* Create an output stream that produces a list of segments instead of a
+ * single buffer. The data of bytes and string fields that is at least
+ * threshold bytes long is not copied, but stored as a segment pointing to
+ * the message structure. Everything else is copied to the scratch buffer,
+ * with consecutive writes joined into the same segment.
+ *
+ * After encoding, state->segments[0 .. state->segment_count - 1] contain
+ * the encoded message in order. The message structure must not be changed
+ * or freed before the segments have been sent. Data written by field
+ * callbacks, including pb_encode_string(), is always copied.
+ *
+ * Encoding fails with "too many segments" or "scratch full" if either
+ * of the arrays runs out.
+ *
+ * Example usage:
+ *    pb_segment_t segments[16];
+ *    pb_byte_t scratch[256];
+ *    pb_ostream_segments_t state;
+ *    pb_ostream_t stream = pb_ostream_segments(&state, segments, 16, scratch, sizeof(scratch), 64);
+ *    pb_encode(&stream, MyMessage_fields, &msg);
+ *    writev(fd, (struct iovec*)segments, state.segment_count);
+ */
+pb_ostream_t pb_ostream_segments(pb_ostream_segments_t *state,
+                                 pb_segment_t *segments, size_t max_segments,
+                                 pb_byte_t *scratch, size_t scratch_size,
+                                 size_t threshold);
+#endif
+
 /* Function to write into a pb_ostream_t stream. You can use this if you need
  * to append or prepend some custom headers to the message.
  */
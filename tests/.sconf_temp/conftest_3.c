@@ -0,0 +1,3 @@
+
+#include "string.h"
+
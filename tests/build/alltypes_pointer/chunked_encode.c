@@ -0,0 +1,94 @@
+/* Encodes the alltypes message with pb_encoder_t into chunks of different
+ * sizes, and checks that the output matches pb_encode().
+ */
+
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include "unittests.h"
+#include "alltypes.pb.h"
+#include "test_helpers.h"
+
+static uint8_t input[2048];
+static uint8_t expected[2048];
+static uint8_t output[8192];
+static AllTypes msg;
+
+/* Encode the message in chunks of the given size into output */
+static bool encode_chunks(unsigned int flags, size_t chunk, size_t *size)
+{
+    pb_encoder_t encoder;
+    pb_encoder_status_t result = PB_ENCODER_MORE;
+
+    if (!pb_encoder_init(&encoder, AllTypes_fields, &msg, flags))
+        return false;
+
+    *size = 0;
+    while (result == PB_ENCODER_MORE)
+    {
+        size_t count;
+
+        if (*size + chunk > sizeof(output))
+            return false;
+
+        result = pb_encoder_write(&encoder, output + *size, chunk, &count);
+        if (result == PB_ENCODER_MORE && count != chunk)
+            return false;
+
+        *size += count;
+    }
+
+    return result == PB_ENCODER_DONE;
+}
+
+int main()
+{
+    int status = 0;
+    size_t msglen;
+    size_t expectedlen;
+
+    SET_BINARY_MODE(stdin);
+    msglen = fread(input, 1, sizeof(input), stdin);
+
+    {
+        pb_istream_t stream = pb_istream_from_buffer(input, msglen);
+        memset(&msg, 0, sizeof(msg));
+        TEST(pb_decode(&stream, AllTypes_fields, &msg));
+    }
+
+    {
+        static const size_t chunks[] = {1, 2, 3, 5, 7, 16, 100, 4096};
+        size_t i;
+
+        COMMENT("Encode in chunks of different sizes");
+        for (i = 0; i < sizeof(chunks) / sizeof(chunks[0]); i++)
+        {
+            size_t size;
+            TEST(encode_chunks(0, chunks[i], &size));
+            TEST(size == msglen && memcmp(output, input, msglen) == 0);
+        }
+    }
+
+    {
+        pb_ostream_t stream = pb_ostream_from_buffer(expected, sizeof(expected));
+        static const size_t chunks[] = {1, 2, 64, 4096};
+        size_t i;
+
+        COMMENT("Encode delimited message");
+        TEST(pb_encode_delimited(&stream, AllTypes_fields, &msg));
+        expectedlen = stream.bytes_written;
+
+        for (i = 0; i < sizeof(chunks) / sizeof(chunks[0]); i++)
+        {
+            size_t size;
+            TEST(encode_chunks(PB_ENCODE_DELIMITED, chunks[i], &size));
+            TEST(size == expectedlen && memcmp(output, expected, expectedlen) == 0);
+        }
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
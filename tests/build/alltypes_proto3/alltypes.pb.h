@@ -0,0 +1,319 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_ALLTYPES_PB_H_INCLUDED
+#define PB_ALLTYPES_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Enum definitions */
+typedef enum _HugeEnum {
+    HugeEnum_HE_Zero = 0,
+    HugeEnum_Negative = -2147483647,
+    HugeEnum_Positive = 2147483647
+} HugeEnum;
+#define _HugeEnum_MIN HugeEnum_Negative
+#define _HugeEnum_MAX HugeEnum_Positive
+#define _HugeEnum_ARRAYSIZE ((HugeEnum)(HugeEnum_Positive+1))
+
+typedef enum _MyEnum {
+    MyEnum_Zero = 0,
+    MyEnum_First = 1,
+    MyEnum_Second = 2,
+    MyEnum_Truth = 42
+} MyEnum;
+#define _MyEnum_MIN MyEnum_Zero
+#define _MyEnum_MAX MyEnum_Truth
+#define _MyEnum_ARRAYSIZE ((MyEnum)(MyEnum_Truth+1))
+
+/* Struct definitions */
+typedef struct _EmptyMessage {
+    char dummy_field;
+/* @@protoc_insertion_point(struct:EmptyMessage) */
+} EmptyMessage;
+
+
+typedef struct _Limits {
+    int32_t int32_min;
+    int32_t int32_max;
+    uint32_t uint32_min;
+    uint32_t uint32_max;
+    int64_t int64_min;
+    int64_t int64_max;
+    uint64_t uint64_min;
+    uint64_t uint64_max;
+    HugeEnum enum_min;
+    HugeEnum enum_max;
+/* @@protoc_insertion_point(struct:Limits) */
+} Limits;
+
+
+typedef struct _SubMessage {
+    char substuff1[16];
+    int32_t substuff2;
+    uint32_t substuff3;
+/* @@protoc_insertion_point(struct:SubMessage) */
+} SubMessage;
+
+
+typedef PB_BYTES_ARRAY_T(16) AllTypes_sng_bytes_t;
+typedef PB_BYTES_ARRAY_T(16) AllTypes_rep_bytes_t;
+typedef struct _AllTypes {
+    int32_t sng_int32;
+    int64_t sng_int64;
+    uint32_t sng_uint32;
+    uint64_t sng_uint64;
+    int32_t sng_sint32;
+    int64_t sng_sint64;
+    bool sng_bool;
+    uint32_t sng_fixed32;
+    int32_t sng_sfixed32;
+    float sng_float;
+    uint64_t sng_fixed64;
+    int64_t sng_sfixed64;
+    double sng_double;
+    char sng_string[16];
+    AllTypes_sng_bytes_t sng_bytes;
+    SubMessage sng_submsg;
+    MyEnum sng_enum;
+    EmptyMessage sng_emptymsg;
+    pb_byte_t sng_fbytes[4];
+    pb_size_t rep_int32_count;
+    int32_t rep_int32[5];
+    pb_size_t rep_int64_count;
+    int64_t rep_int64[5];
+    pb_size_t rep_uint32_count;
+    uint32_t rep_uint32[5];
+    pb_size_t rep_uint64_count;
+    uint64_t rep_uint64[5];
+    pb_size_t rep_sint32_count;
+    int32_t rep_sint32[5];
+    pb_size_t rep_sint64_count;
+    int64_t rep_sint64[5];
+    pb_size_t rep_bool_count;
+    bool rep_bool[5];
+    pb_size_t rep_fixed32_count;
+    uint32_t rep_fixed32[5];
+    pb_size_t rep_sfixed32_count;
+    int32_t rep_sfixed32[5];
+    pb_size_t rep_float_count;
+    float rep_float[5];
+    pb_size_t rep_fixed64_count;
+    uint64_t rep_fixed64[5];
+    pb_size_t rep_sfixed64_count;
+    int64_t rep_sfixed64[5];
+    pb_size_t rep_double_count;
+    double rep_double[5];
+    pb_size_t rep_string_count;
+    char rep_string[5][16];
+    pb_size_t rep_bytes_count;
+    AllTypes_rep_bytes_t rep_bytes[5];
+    pb_size_t rep_submsg_count;
+    SubMessage rep_submsg[5];
+    pb_size_t rep_enum_count;
+    MyEnum rep_enum[5];
+    pb_size_t rep_emptymsg_count;
+    EmptyMessage rep_emptymsg[5];
+    pb_size_t rep_fbytes_count;
+    pb_byte_t rep_fbytes[5][4];
+    pb_size_t which_oneof;
+    union {
+        SubMessage oneof_msg1;
+        EmptyMessage oneof_msg2;
+    } oneof;
+    Limits req_limits;
+    int32_t end;
+/* @@protoc_insertion_point(struct:AllTypes) */
+} AllTypes;
+
+
+/* Initializer values for message structs */
+#define SubMessage_init_default                  {"", 0, 0}
+#define EmptyMessage_init_default                {0}
+#define Limits_init_default                      {0, 0, 0, 0, 0, 0, 0, 0, _HugeEnum_MIN, _HugeEnum_MIN}
+#define AllTypes_init_default                    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, "", {0, {0}}, SubMessage_init_default, _MyEnum_MIN, EmptyMessage_init_default, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {""}, 0, {{0, {0}}}, 0, {SubMessage_init_default}, 0, {_MyEnum_MIN}, 0, {EmptyMessage_init_default}, 0, {{0}}, 0, {SubMessage_init_default}, Limits_init_default, 0}
+#define SubMessage_init_zero                     {"", 0, 0}
+#define EmptyMessage_init_zero                   {0}
+#define Limits_init_zero                         {0, 0, 0, 0, 0, 0, 0, 0, _HugeEnum_MIN, _HugeEnum_MIN}
+#define AllTypes_init_zero                       {0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, "", {0, {0}}, SubMessage_init_zero, _MyEnum_MIN, EmptyMessage_init_zero, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {0}, 0, {""}, 0, {{0, {0}}}, 0, {SubMessage_init_zero}, 0, {_MyEnum_MIN}, 0, {EmptyMessage_init_zero}, 0, {{0}}, 0, {SubMessage_init_zero}, Limits_init_zero, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Limits_int32_min_tag                     1
+#define Limits_int32_max_tag                     2
+#define Limits_uint32_min_tag                    3
+#define Limits_uint32_max_tag                    4
+#define Limits_int64_min_tag                     5
+#define Limits_int64_max_tag                     6
+#define Limits_uint64_min_tag                    7
+#define Limits_uint64_max_tag                    8
+#define Limits_enum_min_tag                      9
+#define Limits_enum_max_tag                      10
+#define SubMessage_substuff1_tag                 1
+#define SubMessage_substuff2_tag                 2
+#define SubMessage_substuff3_tag                 3
+#define AllTypes_oneof_msg1_tag                  59
+#define AllTypes_oneof_msg2_tag                  60
+#define AllTypes_sng_int32_tag                   1
+#define AllTypes_sng_int64_tag                   2
+#define AllTypes_sng_uint32_tag                  3
+#define AllTypes_sng_uint64_tag                  4
+#define AllTypes_sng_sint32_tag                  5
+#define AllTypes_sng_sint64_tag                  6
+#define AllTypes_sng_bool_tag                    7
+#define AllTypes_sng_fixed32_tag                 8
+#define AllTypes_sng_sfixed32_tag                9
+#define AllTypes_sng_float_tag                   10
+#define AllTypes_sng_fixed64_tag                 11
+#define AllTypes_sng_sfixed64_tag                12
+#define AllTypes_sng_double_tag                  13
+#define AllTypes_sng_string_tag                  14
+#define AllTypes_sng_bytes_tag                   15
+#define AllTypes_sng_submsg_tag                  16
+#define AllTypes_sng_enum_tag                    17
+#define AllTypes_sng_emptymsg_tag                18
+#define AllTypes_sng_fbytes_tag                  19
+#define AllTypes_rep_int32_tag                   21
+#define AllTypes_rep_int64_tag                   22
+#define AllTypes_rep_uint32_tag                  23
+#define AllTypes_rep_uint64_tag                  24
+#define AllTypes_rep_sint32_tag                  25
+#define AllTypes_rep_sint64_tag                  26
+#define AllTypes_rep_bool_tag                    27
+#define AllTypes_rep_fixed32_tag                 28
+#define AllTypes_rep_sfixed32_tag                29
+#define AllTypes_rep_float_tag                   30
+#define AllTypes_rep_fixed64_tag                 31
+#define AllTypes_rep_sfixed64_tag                32
+#define AllTypes_rep_double_tag                  33
+#define AllTypes_rep_string_tag                  34
+#define AllTypes_rep_bytes_tag                   35
+#define AllTypes_rep_submsg_tag                  36
+#define AllTypes_rep_enum_tag                    37
+#define AllTypes_rep_emptymsg_tag                38
+#define AllTypes_rep_fbytes_tag                  39
+#define AllTypes_req_limits_tag                  98
+#define AllTypes_end_tag                         99
+
+/* Struct field encoding specification for nanopb */
+#define SubMessage_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, STRING, substuff1, 1) \
+X(a, STATIC, SINGULAR, INT32, substuff2, 2) \
+X(a, STATIC, SINGULAR, FIXED32, substuff3, 3)
+#define SubMessage_CALLBACK NULL
+#define SubMessage_DEFAULT NULL
+#define SubMessage_DEFAULT_INSTANCE NULL
+#define SubMessage_FIELD_RECORDS NULL
+#define SubMessage_MSGFLAGS 0
+
+#define EmptyMessage_FIELDLIST(X, a) \
+
+#define EmptyMessage_CALLBACK NULL
+#define EmptyMessage_DEFAULT NULL
+#define EmptyMessage_DEFAULT_INSTANCE NULL
+#define EmptyMessage_FIELD_RECORDS NULL
+#define EmptyMessage_MSGFLAGS 0
+
+#define Limits_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, int32_min, 1) \
+X(a, STATIC, SINGULAR, INT32, int32_max, 2) \
+X(a, STATIC, SINGULAR, UINT32, uint32_min, 3) \
+X(a, STATIC, SINGULAR, UINT32, uint32_max, 4) \
+X(a, STATIC, SINGULAR, INT64, int64_min, 5) \
+X(a, STATIC, SINGULAR, INT64, int64_max, 6) \
+X(a, STATIC, SINGULAR, UINT64, uint64_min, 7) \
+X(a, STATIC, SINGULAR, UINT64, uint64_max, 8) \
+X(a, STATIC, SINGULAR, ENUM, enum_min, 9) \
+X(a, STATIC, SINGULAR, ENUM, enum_max, 10)
+#define Limits_CALLBACK NULL
+#define Limits_DEFAULT NULL
+#define Limits_DEFAULT_INSTANCE NULL
+#define Limits_FIELD_RECORDS NULL
+#define Limits_MSGFLAGS 0
+
+#define AllTypes_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, sng_int32, 1) \
+X(a, STATIC, SINGULAR, INT64, sng_int64, 2) \
+X(a, STATIC, SINGULAR, UINT32, sng_uint32, 3) \
+X(a, STATIC, SINGULAR, UINT64, sng_uint64, 4) \
+X(a, STATIC, SINGULAR, SINT32, sng_sint32, 5) \
+X(a, STATIC, SINGULAR, SINT64, sng_sint64, 6) \
+X(a, STATIC, SINGULAR, BOOL, sng_bool, 7) \
+X(a, STATIC, SINGULAR, FIXED32, sng_fixed32, 8) \
+X(a, STATIC, SINGULAR, SFIXED32, sng_sfixed32, 9) \
+X(a, STATIC, SINGULAR, FLOAT, sng_float, 10) \
+X(a, STATIC, SINGULAR, FIXED64, sng_fixed64, 11) \
+X(a, STATIC, SINGULAR, SFIXED64, sng_sfixed64, 12) \
+X(a, STATIC, SINGULAR, DOUBLE, sng_double, 13) \
+X(a, STATIC, SINGULAR, STRING, sng_string, 14) \
+X(a, STATIC, SINGULAR, BYTES, sng_bytes, 15) \
+X(a, STATIC, SINGULAR, MESSAGE, sng_submsg, 16) \
+X(a, STATIC, SINGULAR, UENUM, sng_enum, 17) \
+X(a, STATIC, SINGULAR, MESSAGE, sng_emptymsg, 18) \
+X(a, STATIC, SINGULAR, FIXED_LENGTH_BYTES, sng_fbytes, 19) \
+X(a, STATIC, REPEATED, INT32, rep_int32, 21) \
+X(a, STATIC, REPEATED, INT64, rep_int64, 22) \
+X(a, STATIC, REPEATED, UINT32, rep_uint32, 23) \
+X(a, STATIC, REPEATED, UINT64, rep_uint64, 24) \
+X(a, STATIC, REPEATED, SINT32, rep_sint32, 25) \
+X(a, STATIC, REPEATED, SINT64, rep_sint64, 26) \
+X(a, STATIC, REPEATED, BOOL, rep_bool, 27) \
+X(a, STATIC, REPEATED, FIXED32, rep_fixed32, 28) \
+X(a, STATIC, REPEATED, SFIXED32, rep_sfixed32, 29) \
+X(a, STATIC, REPEATED, FLOAT, rep_float, 30) \
+X(a, STATIC, REPEATED, FIXED64, rep_fixed64, 31) \
+X(a, STATIC, REPEATED, SFIXED64, rep_sfixed64, 32) \
+X(a, STATIC, REPEATED, DOUBLE, rep_double, 33) \
+X(a, STATIC, REPEATED, STRING, rep_string, 34) \
+X(a, STATIC, REPEATED, BYTES, rep_bytes, 35) \
+X(a, STATIC, REPEATED, MESSAGE, rep_submsg, 36) \
+X(a, STATIC, REPEATED, UENUM, rep_enum, 37) \
+X(a, STATIC, REPEATED, MESSAGE, rep_emptymsg, 38) \
+X(a, STATIC, REPEATED, FIXED_LENGTH_BYTES, rep_fbytes, 39) \
+X(a, STATIC, ONEOF, MESSAGE, (oneof,oneof_msg1,oneof.oneof_msg1), 59) \
+X(a, STATIC, ONEOF, MESSAGE, (oneof,oneof_msg2,oneof.oneof_msg2), 60) \
+X(a, STATIC, SINGULAR, MESSAGE, req_limits, 98) \
+X(a, STATIC, SINGULAR, INT32, end, 99)
+#define AllTypes_CALLBACK NULL
+#define AllTypes_DEFAULT NULL
+#define AllTypes_DEFAULT_INSTANCE NULL
+#define AllTypes_FIELD_RECORDS NULL
+#define AllTypes_MSGFLAGS 0
+#define AllTypes_sng_submsg_MSGTYPE SubMessage
+#define AllTypes_sng_emptymsg_MSGTYPE EmptyMessage
+#define AllTypes_rep_submsg_MSGTYPE SubMessage
+#define AllTypes_rep_emptymsg_MSGTYPE EmptyMessage
+#define AllTypes_oneof_oneof_msg1_MSGTYPE SubMessage
+#define AllTypes_oneof_oneof_msg2_MSGTYPE EmptyMessage
+#define AllTypes_req_limits_MSGTYPE Limits
+
+extern const pb_msgdesc_t SubMessage_msg;
+extern const pb_msgdesc_t EmptyMessage_msg;
+extern const pb_msgdesc_t Limits_msg;
+extern const pb_msgdesc_t AllTypes_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define SubMessage_fields &SubMessage_msg
+#define EmptyMessage_fields &EmptyMessage_msg
+#define Limits_fields &Limits_msg
+#define AllTypes_fields &AllTypes_msg
+
+/* Maximum encoded size of messages (where known) */
+#define SubMessage_size                          33
+#define EmptyMessage_size                        0
+#define Limits_size                              100
+#define AllTypes_size                            1330
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,90 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_ONEOF_PB_H_INCLUDED
+#define PB_ONEOF_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _SubMessage {
+    pb_size_t array_count;
+    int32_t array[8];
+/* @@protoc_insertion_point(struct:SubMessage) */
+} SubMessage;
+
+
+typedef struct _AnonymousOneOfMessage {
+    int32_t prefix;
+    pb_size_t which_values;
+    union {
+        int32_t first;
+        char second[8];
+        SubMessage third;
+    };
+    int32_t suffix;
+/* @@protoc_insertion_point(struct:AnonymousOneOfMessage) */
+} AnonymousOneOfMessage;
+
+
+/* Initializer values for message structs */
+#define SubMessage_init_default                  {0, {0}}
+#define AnonymousOneOfMessage_init_default       {0, 0, {0}, 0}
+#define SubMessage_init_zero                     {0, {0}}
+#define AnonymousOneOfMessage_init_zero          {0, 0, {0}, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define SubMessage_array_tag                     1
+#define AnonymousOneOfMessage_first_tag          5
+#define AnonymousOneOfMessage_second_tag         6
+#define AnonymousOneOfMessage_third_tag          7
+#define AnonymousOneOfMessage_prefix_tag         1
+#define AnonymousOneOfMessage_suffix_tag         99
+
+/* Struct field encoding specification for nanopb */
+#define SubMessage_FIELDLIST(X, a) \
+X(a, STATIC, REPEATED, INT32, array, 1)
+#define SubMessage_CALLBACK NULL
+#define SubMessage_DEFAULT NULL
+#define SubMessage_DEFAULT_INSTANCE NULL
+#define SubMessage_FIELD_RECORDS NULL
+#define SubMessage_MSGFLAGS 0
+
+#define AnonymousOneOfMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, prefix, 1) \
+X(a, STATIC, ONEOF, INT32, (values,first,first), 5) \
+X(a, STATIC, ONEOF, STRING, (values,second,second), 6) \
+X(a, STATIC, ONEOF, MESSAGE, (values,third,third), 7) \
+X(a, STATIC, REQUIRED, INT32, suffix, 99)
+#define AnonymousOneOfMessage_CALLBACK NULL
+#define AnonymousOneOfMessage_DEFAULT NULL
+#define AnonymousOneOfMessage_DEFAULT_INSTANCE NULL
+#define AnonymousOneOfMessage_FIELD_RECORDS NULL
+#define AnonymousOneOfMessage_MSGFLAGS 0
+#define AnonymousOneOfMessage_values_third_MSGTYPE SubMessage
+
+extern const pb_msgdesc_t SubMessage_msg;
+extern const pb_msgdesc_t AnonymousOneOfMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define SubMessage_fields &SubMessage_msg
+#define AnonymousOneOfMessage_fields &AnonymousOneOfMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+#define SubMessage_size                          88
+#define AnonymousOneOfMessage_size               113
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
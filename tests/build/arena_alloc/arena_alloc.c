@@ -0,0 +1,150 @@
+/* Decode pointer fields into a pb_arena_t and check that malloc() is not
+ * used, that the generated worst-case size is sufficient and that the
+ * arena can be reused after pb_arena_reset().
+ */
+
+#include <stdio.h>
+#include <string.h>
+#include <pb_encode.h>
+#include <pb_decode.h>
+#include <malloc_wrappers.h>
+#include "arena_alloc.pb.h"
+#include "unittests.h"
+
+#define ARENA_WORDS (ArenaMessage_arena_size / sizeof(pb_arena_align_t) + 1)
+
+static pb_arena_align_t storage[ARENA_WORDS];
+
+/* Fill all pointer fields up to their max_count and max_size. */
+static size_t encode_full_message(pb_byte_t *buffer, size_t bufsize)
+{
+    static int32_t values[8] = {1, 2, 3, 4, 5, 6, 7, 8};
+    static uint32_t packed[20];
+    static char name[] = "123456789012345";
+    static char *tags[4] = {"abcdefghi", "b", "c", "d"};
+    static PB_BYTES_ARRAY_T(32) data = {32, {0}};
+    Item items[5];
+    Item single;
+    ArenaMessage msg = ArenaMessage_init_zero;
+    pb_ostream_t stream = pb_ostream_from_buffer(buffer, bufsize);
+    int i;
+
+    for (i = 0; i < 20; i++)
+        packed[i] = (uint32_t)i * 1000;
+
+    for (i = 0; i < 5; i++)
+    {
+        items[i].name = name;
+        items[i].values_count = 8;
+        items[i].values = values;
+    }
+    single = items[0];
+
+    msg.id = 42;
+    msg.data = (pb_bytes_array_t*)&data;
+    msg.items_count = 5;
+    msg.items = items;
+    msg.tags_count = 4;
+    msg.tags = tags;
+    msg.single = &single;
+    msg.has_inline_item = true;
+    msg.inline_item = items[0];
+    msg.packed_count = 20;
+    msg.packed = packed;
+
+    if (!pb_encode(&stream, ArenaMessage_fields, &msg))
+    {
+        fprintf(stderr, "Encode failed: %s\n", PB_GET_ERROR(&stream));
+        return 0;
+    }
+
+    return stream.bytes_written;
+}
+
+int main()
+{
+    int status = 0;
+    pb_byte_t buffer[1024];
+    size_t msglen = encode_full_message(buffer, sizeof(buffer));
+    pb_arena_t arena;
+
+    TEST(msglen > 0);
+
+    {
+        ArenaMessage msg;
+        pb_istream_t stream = pb_istream_from_buffer(buffer, msglen);
+
+        COMMENT("Decode into arena of the generated worst-case size");
+        pb_arena_init(&arena, storage, ArenaMessage_arena_size);
+        TEST(pb_decode_arena(&stream, ArenaMessage_fields, &msg, &arena, 0));
+        TEST(get_alloc_count() == 0);
+        TEST(arena.used > 0 && arena.used <= ArenaMessage_arena_size);
+        TEST(msg.id == 42);
+        TEST(msg.data && msg.data->size == 32);
+        TEST(msg.items_count == 5 && msg.items[4].values_count == 8);
+        TEST(strcmp(msg.items[4].name, "123456789012345") == 0);
+        TEST(msg.items[4].values[7] == 8);
+        TEST(msg.tags_count == 4 && strcmp(msg.tags[0], "abcdefghi") == 0);
+        TEST(strcmp(msg.tags[3], "d") == 0);
+        TEST(msg.single && msg.single->values[0] == 1);
+        TEST(msg.has_inline_item && msg.inline_item.values_count == 8);
+        TEST(msg.packed_count == 20 && msg.packed[19] == 19000);
+    }
+
+    {
+        ArenaMessage msg;
+        pb_istream_t stream = pb_istream_from_buffer(buffer, msglen);
+        size_t first_use = arena.used;
+
+        COMMENT("Reuse the arena after reset");
+        pb_arena_reset(&arena);
+        TEST(arena.used == 0);
+        TEST(pb_decode_arena(&stream, ArenaMessage_fields, &msg, &arena, 0));
+        TEST(arena.used == first_use);
+        TEST(msg.items_count == 5 && msg.items[2].values[3] == 4);
+        TEST(get_alloc_count() == 0);
+    }
+
+    {
+        ArenaMessage msg;
+        pb_istream_t stream = pb_istream_from_buffer(buffer, msglen);
+
+        COMMENT("Too small arena gives an error instead of overflowing");
+        pb_arena_init(&arena, storage, 64);
+        TEST(!pb_decode_arena(&stream, ArenaMessage_fields, &msg, &arena, 0));
+        TEST(strcmp(PB_GET_ERROR(&stream), "arena full") == 0);
+        TEST(arena.used <= 64);
+        TEST(get_alloc_count() == 0);
+    }
+
+    {
+        ArenaMessage msg;
+        pb_istream_t stream = pb_istream_from_buffer(buffer, msglen);
+
+        COMMENT("Without an arena, decoding uses malloc() as before");
+        stream.arena = &arena; /* Not initialized by the caller, e.g. garbage */
+        TEST(pb_decode(&stream, ArenaMessage_fields, &msg));
+        TEST(get_alloc_count() > 0);
+        pb_release(ArenaMessage_fields, &msg);
+        TEST(get_alloc_count() == 0);
+    }
+
+    {
+        ArenaMessage msg;
+        pb_istream_t stream = pb_istream_from_buffer(buffer, msglen);
+
+        COMMENT("Pointer fields allocated elsewhere are not reallocated from the arena");
+        TEST(pb_decode(&stream, ArenaMessage_fields, &msg));
+        stream = pb_istream_from_buffer(buffer, msglen);
+        pb_arena_init(&arena, storage, sizeof(storage));
+        TEST(!pb_decode_arena(&stream, ArenaMessage_fields, &msg, &arena, PB_DECODE_NOINIT));
+        TEST(strcmp(PB_GET_ERROR(&stream), "pointer not from arena") == 0);
+        pb_release(ArenaMessage_fields, &msg);
+        TEST(get_alloc_count() == 0);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
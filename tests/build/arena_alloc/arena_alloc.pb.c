@@ -0,0 +1,21 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "arena_alloc.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(Item, Item, AUTO)
+
+
+PB_BIND(ArenaMessage, ArenaMessage, AUTO)
+
+
+PB_BIND(UnboundedMessage, UnboundedMessage, AUTO)
+
+
+
+/* @@protoc_insertion_point(eof) */
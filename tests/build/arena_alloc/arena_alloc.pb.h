@@ -0,0 +1,128 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_ARENA_ALLOC_PB_H_INCLUDED
+#define PB_ARENA_ALLOC_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Item {
+    char *name;
+    pb_size_t values_count;
+    int32_t *values;
+/* @@protoc_insertion_point(struct:Item) */
+} Item;
+
+
+typedef struct _UnboundedMessage {
+    pb_size_t names_count;
+    char **names;
+/* @@protoc_insertion_point(struct:UnboundedMessage) */
+} UnboundedMessage;
+
+
+typedef struct _ArenaMessage {
+    int32_t id;
+    pb_bytes_array_t *data;
+    pb_size_t items_count;
+    struct _Item *items;
+    pb_size_t tags_count;
+    char **tags;
+    struct _Item *single;
+    bool has_inline_item;
+    Item inline_item;
+    pb_size_t packed_count;
+    uint32_t *packed;
+/* @@protoc_insertion_point(struct:ArenaMessage) */
+} ArenaMessage;
+
+
+/* Initializer values for message structs */
+#define Item_init_default                        {NULL, 0, NULL}
+#define ArenaMessage_init_default                {0, NULL, 0, NULL, 0, NULL, NULL, false, Item_init_default, 0, NULL}
+#define UnboundedMessage_init_default            {0, NULL}
+#define Item_init_zero                           {NULL, 0, NULL}
+#define ArenaMessage_init_zero                   {0, NULL, 0, NULL, 0, NULL, NULL, false, Item_init_zero, 0, NULL}
+#define UnboundedMessage_init_zero               {0, NULL}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Item_name_tag                            1
+#define Item_values_tag                          2
+#define UnboundedMessage_names_tag               1
+#define ArenaMessage_id_tag                      1
+#define ArenaMessage_data_tag                    2
+#define ArenaMessage_items_tag                   3
+#define ArenaMessage_tags_tag                    4
+#define ArenaMessage_single_tag                  5
+#define ArenaMessage_inline_item_tag             6
+#define ArenaMessage_packed_tag                  7
+
+/* Struct field encoding specification for nanopb */
+#define Item_FIELDLIST(X, a) \
+X(a, POINTER, REQUIRED, STRING, name, 1) \
+X(a, POINTER, REPEATED, INT32, values, 2)
+#define Item_CALLBACK NULL
+#define Item_DEFAULT NULL
+#define Item_DEFAULT_INSTANCE NULL
+#define Item_FIELD_RECORDS NULL
+#define Item_MSGFLAGS 0
+
+#define ArenaMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, id, 1) \
+X(a, POINTER, OPTIONAL, BYTES, data, 2) \
+X(a, POINTER, REPEATED, MESSAGE, items, 3) \
+X(a, POINTER, REPEATED, STRING, tags, 4) \
+X(a, POINTER, OPTIONAL, MESSAGE, single, 5) \
+X(a, STATIC, OPTIONAL, MESSAGE, inline_item, 6) \
+X(a, POINTER, REPEATED, FIXED32, packed, 7)
+#define ArenaMessage_CALLBACK NULL
+#define ArenaMessage_DEFAULT NULL
+#define ArenaMessage_DEFAULT_INSTANCE NULL
+#define ArenaMessage_FIELD_RECORDS NULL
+#define ArenaMessage_MSGFLAGS 0
+#define ArenaMessage_items_MSGTYPE Item
+#define ArenaMessage_single_MSGTYPE Item
+#define ArenaMessage_inline_item_MSGTYPE Item
+
+#define UnboundedMessage_FIELDLIST(X, a) \
+X(a, POINTER, REPEATED, STRING, names, 1)
+#define UnboundedMessage_CALLBACK NULL
+#define UnboundedMessage_DEFAULT NULL
+#define UnboundedMessage_DEFAULT_INSTANCE NULL
+#define UnboundedMessage_FIELD_RECORDS NULL
+#define UnboundedMessage_MSGFLAGS 0
+
+extern const pb_msgdesc_t Item_msg;
+extern const pb_msgdesc_t ArenaMessage_msg;
+extern const pb_msgdesc_t UnboundedMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Item_fields &Item_msg
+#define ArenaMessage_fields &ArenaMessage_msg
+#define UnboundedMessage_fields &UnboundedMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+/* Item_size depends on runtime parameters */
+/* ArenaMessage_size depends on runtime parameters */
+/* UnboundedMessage_size depends on runtime parameters */
+
+/* Arena memory needed for decoding pointer fields (where known) */
+#define Item_arena_size                          (PB_ARENA_ALLOCSIZE(16) + PB_ARENA_ARRAYSIZE(8, sizeof(int32_t), 5))
+#define ArenaMessage_arena_size                  (PB_ARENA_ALLOCSIZE(PB_BYTES_ARRAY_T_ALLOCSIZE(32)) + PB_ARENA_ARRAYSIZE(5, sizeof(Item), 4) + 5 * (Item_arena_size) + PB_ARENA_ARRAYSIZE(4, sizeof(void*), 4) + 4 * (PB_ARENA_ALLOCSIZE(10)) + PB_ARENA_ALLOCSIZE(sizeof(Item)) + Item_arena_size + Item_arena_size + PB_ARENA_ARRAYSIZE(20, sizeof(uint32_t), 6))
+/* UnboundedMessage_arena_size depends on runtime parameters */
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,61 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_BATCH_DELIMITED_PB_H_INCLUDED
+#define PB_BATCH_DELIMITED_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Record {
+    uint32_t id;
+    bool has_name;
+    char name[8];
+    pb_size_t values_count;
+    int32_t values[4];
+/* @@protoc_insertion_point(struct:Record) */
+} Record;
+
+
+/* Initializer values for message structs */
+#define Record_init_default                      {0, false, "", 0, {0}}
+#define Record_init_zero                         {0, false, "", 0, {0}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Record_id_tag                            1
+#define Record_name_tag                          2
+#define Record_values_tag                        3
+
+/* Struct field encoding specification for nanopb */
+#define Record_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT32, id, 1) \
+X(a, STATIC, OPTIONAL, STRING, name, 2) \
+X(a, STATIC, REPEATED, INT32, values, 3)
+#define Record_CALLBACK NULL
+#define Record_DEFAULT NULL
+#define Record_DEFAULT_INSTANCE NULL
+#define Record_FIELD_RECORDS NULL
+#define Record_MSGFLAGS 0
+
+extern const pb_msgdesc_t Record_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Record_fields &Record_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Record_size                              59
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
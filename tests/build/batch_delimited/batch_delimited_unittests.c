@@ -0,0 +1,187 @@
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include "unittests.h"
+#include "batch_delimited.pb.h"
+
+static pb_byte_t buffer[512];
+
+static void fill_record(Record *record, uint32_t id)
+{
+    Record empty = Record_init_zero;
+    *record = empty;
+    record->id = id;
+    record->has_name = (id % 2 == 0);
+    sprintf(record->name, "rec%u", (unsigned)id);
+    record->values_count = id % 5;
+    record->values[0] = -(int32_t)id;
+    record->values[1] = 1000;
+    record->values[2] = 2;
+    record->values[3] = 3;
+}
+
+static pb_batch_t make_batch(void *messages, bool *valid, size_t capacity, size_t start, size_t count)
+{
+    pb_batch_t batch;
+    batch.messages = messages;
+    batch.valid = valid;
+    batch.capacity = capacity;
+    batch.start = start;
+    batch.count = count;
+    return batch;
+}
+
+static bool records_equal(const Record *a, const Record *b)
+{
+    return a->id == b->id &&
+           a->has_name == b->has_name &&
+           (!a->has_name || strcmp(a->name, b->name) == 0) &&
+           a->values_count == b->values_count &&
+           memcmp(a->values, b->values, a->values_count * sizeof(int32_t)) == 0;
+}
+
+int main()
+{
+    int status = 0;
+    Record records[5];
+    size_t msglen;
+    size_t i;
+
+    for (i = 0; i < 5; i++)
+        fill_record(&records[i], (uint32_t)(i + 1));
+
+    {
+        pb_batch_t batch = make_batch(records, NULL, 5, 0, 5);
+        pb_ostream_t stream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+        pb_ostream_t expected = PB_OSTREAM_SIZING;
+
+        COMMENT("Encode a batch of messages");
+        TEST(pb_encode_batch(&stream, Record_fields, &batch));
+        msglen = stream.bytes_written;
+
+        for (i = 0; i < 5; i++)
+            TEST(pb_encode_delimited(&expected, Record_fields, &records[i]));
+        TEST(expected.bytes_written == msglen);
+    }
+
+    {
+        Record decoded[8];
+        pb_batch_t batch = make_batch(decoded, NULL, 8, 0, 0);
+        pb_istream_t stream = pb_istream_from_buffer(buffer, msglen);
+
+        COMMENT("Decode all messages into an array");
+        memset(decoded, 0xAA, sizeof(decoded));
+        TEST(pb_decode_batch(&stream, Record_fields, &batch, 0));
+        TEST(batch.count == 5);
+        TEST(stream.bytes_left == 0);
+        for (i = 0; i < 5; i++)
+            TEST(records_equal(&decoded[i], &records[i]));
+    }
+
+    {
+        Record ring[3];
+        pb_batch_t batch = make_batch(ring, NULL, 3, 2, 0);
+        pb_istream_t stream = pb_istream_from_buffer(buffer, msglen);
+
+        COMMENT("Decode into a ring buffer that wraps around");
+        TEST(pb_decode_batch(&stream, Record_fields, &batch, 0));
+        TEST(batch.count == 3);
+        TEST(records_equal(&ring[2], &records[0]));
+        TEST(records_equal(&ring[0], &records[1]));
+        TEST(records_equal(&ring[1], &records[2]));
+
+        /* Consume two messages and continue */
+        batch.start = 1;
+        batch.count = 1;
+        TEST(pb_decode_batch(&stream, Record_fields, &batch, 0));
+        TEST(batch.count == 3);
+        TEST(stream.bytes_left == 0);
+        TEST(records_equal(&ring[2], &records[3]));
+        TEST(records_equal(&ring[0], &records[4]));
+
+        /* Encoding the ring gives the last three messages */
+        {
+            pb_byte_t output[128];
+            pb_ostream_t ostream = pb_ostream_from_buffer(output, sizeof(output));
+            size_t skip;
+            pb_istream_t count = pb_istream_from_buffer(buffer, msglen);
+            Record dummy;
+
+            TEST(pb_decode_delimited(&count, Record_fields, &dummy));
+            TEST(pb_decode_delimited(&count, Record_fields, &dummy));
+            skip = msglen - count.bytes_left;
+
+            TEST(pb_encode_batch(&ostream, Record_fields, &batch));
+            TEST(ostream.bytes_written == msglen - skip);
+            TEST(memcmp(output, buffer + skip, msglen - skip) == 0);
+        }
+    }
+
+    {
+        Record decoded[5];
+        bool valid[5];
+        pb_batch_t batch = make_batch(decoded, valid, 5, 0, 0);
+        pb_byte_t input[64];
+        pb_istream_t stream;
+        size_t len = 0;
+
+        COMMENT("Invalid message in the middle of the batch");
+        /* id 1, then name longer than max_size, then id 3 */
+        memcpy(input + len, "\x02\x08\x01", 3); len += 3;
+        memcpy(input + len, "\x0C\x08\x02\x12\x08toolongx", 13); len += 13;
+        memcpy(input + len, "\x02\x08\x03", 3); len += 3;
+
+        stream = pb_istream_from_buffer(input, len);
+        TEST(pb_decode_batch(&stream, Record_fields, &batch, 0));
+        TEST(batch.count == 3);
+        TEST(valid[0] && !valid[1] && valid[2]);
+        TEST(decoded[0].id == 1 && decoded[2].id == 3);
+        TEST(strcmp(PB_GET_ERROR(&stream), "string overflow") == 0);
+
+        /* Invalid messages are left out when encoding */
+        {
+            pb_ostream_t ostream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+            TEST(pb_encode_batch(&ostream, Record_fields, &batch));
+            TEST(ostream.bytes_written == 6);
+            TEST(memcmp(buffer, "\x02\x08\x01\x02\x08\x03", 6) == 0);
+        }
+
+        /* Without the valid array decoding stops at the error */
+        batch.valid = NULL;
+        batch.count = 0;
+        stream = pb_istream_from_buffer(input, len);
+        TEST(!pb_decode_batch(&stream, Record_fields, &batch, 0));
+        TEST(batch.count == 1);
+    }
+
+    {
+        Record decoded[5];
+        bool valid[5];
+        pb_batch_t batch = make_batch(decoded, valid, 5, 0, 0);
+        pb_istream_t stream = pb_istream_from_buffer((const pb_byte_t*)"\x02\x08\x01\x05\x08", 5);
+
+        COMMENT("Truncated message");
+        TEST(!pb_decode_batch(&stream, Record_fields, &batch, 0));
+        TEST(batch.count == 1);
+        TEST(strcmp(PB_GET_ERROR(&stream), "parent stream too short") == 0);
+    }
+
+    {
+        Record decoded[2];
+        pb_batch_t batch = make_batch(decoded, NULL, 2, 0, 0);
+        pb_istream_t stream = pb_istream_from_buffer((const pb_byte_t*)"\x04\x08\x07\x18\x05", 5);
+
+        COMMENT("Merge into existing messages with PB_DECODE_NOINIT");
+        fill_record(&decoded[0], 2);
+        TEST(pb_decode_batch(&stream, Record_fields, &batch, PB_DECODE_NOINIT));
+        TEST(batch.count == 1);
+        TEST(decoded[0].id == 7 && decoded[0].has_name);
+        TEST(decoded[0].values_count == 3 && decoded[0].values[2] == 5);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
@@ -0,0 +1,315 @@
+/* Decodes the alltypes message from a callback stream through
+ * pb_istream_buffered(), and checks that the result and the stream
+ * positions match decoding directly from a memory buffer. Then encodes
+ * it again through pb_ostream_buffered() and compares the output.
+ */
+
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include "unittests.h"
+#include "alltypes.pb.h"
+#include "test_helpers.h"
+
+typedef struct
+{
+    const uint8_t *buffer;
+    size_t calls;
+} counting_stream_t;
+
+static bool read_callback(pb_istream_t *stream, uint8_t *buf, size_t count)
+{
+    counting_stream_t *state = stream->state;
+    memcpy(buf, state->buffer, count);
+    state->buffer += count;
+    state->calls++;
+    return true;
+}
+
+typedef struct
+{
+    uint8_t *buffer;
+    size_t calls;
+    size_t fail_after;
+} counting_ostream_t;
+
+static bool write_callback(pb_ostream_t *stream, const uint8_t *buf, size_t count)
+{
+    counting_ostream_t *state = stream->state;
+    if (state->calls == state->fail_after)
+        PB_RETURN_ERROR(stream, "simulated");
+    memcpy(state->buffer, buf, count);
+    state->buffer += count;
+    state->calls++;
+    return true;
+}
+
+static pb_ostream_t counting_ostream(counting_ostream_t *state, uint8_t *buffer, size_t size)
+{
+    pb_ostream_t stream = {&write_callback, NULL, 0, 0};
+    state->buffer = buffer;
+    state->calls = 0;
+    state->fail_after = (size_t)-1;
+    stream.state = state;
+    stream.max_size = size;
+    return stream;
+}
+
+/* Unbounded source that signals end of input like a socket: it sets
+ * bytes_left to 0 and fails the read when there is no data left. */
+static bool eof_read_callback(pb_istream_t *stream, uint8_t *buf, size_t count)
+{
+    pb_istream_t *data = stream->state;
+    if (data->bytes_left == 0)
+    {
+        stream->bytes_left = 0;
+        return false;
+    }
+    return pb_read(data, buf, count);
+}
+
+static pb_istream_t counting_stream(counting_stream_t *state, const uint8_t *buffer, size_t size)
+{
+    pb_istream_t stream = {&read_callback, NULL, 0};
+    state->buffer = buffer;
+    state->calls = 0;
+    stream.state = state;
+    stream.bytes_left = size;
+    return stream;
+}
+
+static uint8_t input[2048];
+static uint8_t output[2048];
+static AllTypes expected;
+static AllTypes decoded;
+
+int main()
+{
+    int status = 0;
+    size_t msglen;
+
+    SET_BINARY_MODE(stdin);
+    msglen = fread(input, 1, sizeof(input), stdin);
+
+    {
+        pb_istream_t stream = pb_istream_from_buffer(input, msglen);
+
+        COMMENT("Reference decoding from memory buffer");
+        memset(&expected, 0, sizeof(expected));
+        TEST(pb_decode_noinit(&stream, AllTypes_fields, &expected));
+    }
+
+    {
+        static const size_t sizes[] = {1, 2, 3, 7, 16, 64, 256, 4096};
+        size_t i;
+
+        COMMENT("Decode with different buffer sizes");
+        for (i = 0; i < sizeof(sizes) / sizeof(sizes[0]); i++)
+        {
+            uint8_t buffer[4096];
+            counting_stream_t cs;
+            pb_istream_buffer_t state;
+            pb_istream_t source = counting_stream(&cs, input, msglen);
+            pb_istream_t stream = pb_istream_buffered(&state, &source, buffer, sizes[i]);
+
+            memset(&decoded, 0, sizeof(decoded));
+            TEST(pb_decode_noinit(&stream, AllTypes_fields, &decoded));
+            TEST(memcmp(&decoded, &expected, sizeof(decoded)) == 0);
+            TEST(stream.bytes_left == 0 && source.bytes_left == 0);
+            TEST(cs.buffer == input + msglen);
+
+            if (sizes[i] >= msglen)
+            {
+                TEST(cs.calls == 1);
+            }
+        }
+    }
+
+    {
+        counting_stream_t cs;
+        pb_istream_t stream = counting_stream(&cs, input, msglen);
+        size_t unbuffered_calls;
+
+        COMMENT("Buffering reduces the number of callback calls");
+        memset(&decoded, 0, sizeof(decoded));
+        TEST(pb_decode_noinit(&stream, AllTypes_fields, &decoded));
+        unbuffered_calls = cs.calls;
+
+        {
+            uint8_t buffer[64];
+            pb_istream_buffer_t state;
+            pb_istream_t source = counting_stream(&cs, input, msglen);
+            stream = pb_istream_buffered(&state, &source, buffer, sizeof(buffer));
+            memset(&decoded, 0, sizeof(decoded));
+            TEST(pb_decode_noinit(&stream, AllTypes_fields, &decoded));
+            TEST(cs.calls * 4 < unbuffered_calls);
+        }
+    }
+
+    {
+        uint8_t data[64];
+        uint8_t buffer[16];
+        counting_stream_t cs;
+        pb_istream_buffer_t state;
+        pb_istream_t source, stream;
+        SubMessage sub = SubMessage_init_zero;
+        pb_ostream_t ostream = pb_ostream_from_buffer(data, sizeof(data));
+        int j;
+
+        COMMENT("Read ahead data is kept for the next delimited message");
+        for (j = 0; j < 3; j++)
+        {
+            sub.substuff2 = 100 + j;
+            TEST(pb_encode_delimited(&ostream, SubMessage_fields, &sub));
+        }
+
+        source = counting_stream(&cs, data, ostream.bytes_written);
+        stream = pb_istream_buffered(&state, &source, buffer, sizeof(buffer));
+        for (j = 0; j < 3; j++)
+        {
+            SubMessage msg = SubMessage_init_zero;
+            TEST(pb_decode_delimited(&stream, SubMessage_fields, &msg));
+            TEST(msg.substuff2 == 100 + j);
+        }
+        TEST(stream.bytes_left == 0 && state.pos == state.end);
+
+        COMMENT("Truncated input");
+        source = counting_stream(&cs, data, ostream.bytes_written - 1);
+        stream = pb_istream_buffered(&state, &source, buffer, sizeof(buffer));
+        for (j = 0; j < 3; j++)
+        {
+            SubMessage msg = SubMessage_init_zero;
+            if (!pb_decode_delimited(&stream, SubMessage_fields, &msg))
+                break;
+        }
+        TEST(j == 2);
+    }
+
+    {
+        uint8_t data[64];
+        uint8_t buffer[64];
+        size_t len, i;
+        SubMessage sub = SubMessage_init_zero;
+        pb_ostream_t ostream = pb_ostream_from_buffer(data, sizeof(data));
+
+        TEST(pb_encode(&ostream, SubMessage_fields, &sub));
+        len = ostream.bytes_written;
+
+        COMMENT("End of input from an unbounded source");
+        for (i = 0; i < 2; i++)
+        {
+            SubMessage msg = SubMessage_init_zero;
+            pb_istream_buffer_t state;
+            pb_istream_t input_data = pb_istream_from_buffer(data, len);
+            pb_istream_t source = {&eof_read_callback, NULL, (size_t)-1};
+            pb_istream_t stream;
+            source.state = &input_data;
+            stream = pb_istream_buffered(&state, &source, buffer, i == 0 ? 1 : len);
+
+            TEST(pb_decode(&stream, SubMessage_fields, &msg));
+            TEST(stream.bytes_left == 0 && source.bytes_left == 0);
+        }
+
+        {
+            uint8_t tagdata[] = {0x08, 0x01};
+            pb_wire_type_t wire_type;
+            uint32_t tag;
+            uint64_t value;
+            bool eof = false;
+            pb_istream_buffer_t state;
+            pb_istream_t input_data = pb_istream_from_buffer(tagdata, sizeof(tagdata));
+            pb_istream_t source = {&eof_read_callback, NULL, (size_t)-1};
+            pb_istream_t stream;
+            source.state = &input_data;
+            stream = pb_istream_buffered(&state, &source, buffer, sizeof(tagdata));
+
+            TEST(pb_decode_tag(&stream, &wire_type, &tag, &eof) && tag == 1 && !eof);
+            TEST(pb_decode_varint(&stream, &value) && value == 1);
+            TEST(!pb_decode_tag(&stream, &wire_type, &tag, &eof) && eof);
+        }
+    }
+
+    {
+        static const size_t sizes[] = {1, 2, 3, 7, 16, 64, 256, 4096};
+        size_t i;
+
+        COMMENT("Encode with different buffer sizes");
+        for (i = 0; i < sizeof(sizes) / sizeof(sizes[0]); i++)
+        {
+            uint8_t buffer[4096];
+            counting_ostream_t cs;
+            pb_ostream_buffer_t state;
+            pb_ostream_t dest = counting_ostream(&cs, output, sizeof(output));
+            pb_ostream_t stream = pb_ostream_buffered(&state, &dest, buffer, sizes[i]);
+
+            memset(output, 0, sizeof(output));
+            TEST(pb_encode(&stream, AllTypes_fields, &expected));
+            TEST(stream.bytes_written == msglen);
+            TEST(dest.bytes_written + state.count == msglen);
+            TEST(pb_ostream_flush(&stream));
+            TEST(dest.bytes_written == msglen && state.count == 0);
+            TEST(memcmp(output, input, msglen) == 0);
+
+            if (sizes[i] >= msglen)
+            {
+                TEST(cs.calls == 1);
+            }
+        }
+    }
+
+    {
+        counting_ostream_t cs;
+        pb_ostream_t stream = counting_ostream(&cs, output, sizeof(output));
+        size_t unbuffered_calls;
+
+        COMMENT("Buffering reduces the number of callback calls");
+        TEST(pb_encode(&stream, AllTypes_fields, &expected));
+        unbuffered_calls = cs.calls;
+
+        {
+            uint8_t buffer[64];
+            pb_ostream_buffer_t state;
+            pb_ostream_t dest = counting_ostream(&cs, output, sizeof(output));
+            stream = pb_ostream_buffered(&state, &dest, buffer, sizeof(buffer));
+            TEST(pb_encode(&stream, AllTypes_fields, &expected));
+            TEST(pb_ostream_flush(&stream));
+            TEST(cs.calls * 4 < unbuffered_calls);
+        }
+    }
+
+    {
+        uint8_t buffer[64];
+        counting_ostream_t cs;
+        pb_ostream_buffer_t state;
+        pb_ostream_t dest = counting_ostream(&cs, output, msglen - 1);
+        pb_ostream_t stream = pb_ostream_buffered(&state, &dest, buffer, sizeof(buffer));
+
+        COMMENT("Destination stream full");
+        TEST(stream.max_size == msglen - 1);
+        TEST(!pb_encode(&stream, AllTypes_fields, &expected));
+        TEST(strcmp(PB_GET_ERROR(&stream), "stream full") == 0);
+
+        COMMENT("IO error when flushing");
+        dest = counting_ostream(&cs, output, sizeof(output));
+        stream = pb_ostream_buffered(&state, &dest, buffer, sizeof(buffer));
+        cs.fail_after = 0;
+        TEST(pb_encode_tag(&stream, PB_WT_VARINT, 1));
+        TEST(cs.calls == 0);
+        TEST(!pb_ostream_flush(&stream));
+        TEST(strcmp(PB_GET_ERROR(&stream), "simulated") == 0);
+    }
+
+    {
+        pb_ostream_t stream = pb_ostream_from_buffer(output, sizeof(output));
+
+        COMMENT("Flushing other streams does nothing");
+        TEST(pb_ostream_flush(&stream));
+        TEST(stream.bytes_written == 0);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
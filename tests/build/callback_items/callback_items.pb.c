@@ -0,0 +1,136 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "callback_items.pb.h"
+#include <pb_decode.h>
+#include <pb_encode.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(Point, Point, AUTO)
+
+
+PB_BIND(Stream, Stream, AUTO)
+
+
+PB_BIND(Stored, Stored, 2)
+
+
+bool Stream_values_foreach(pb_istream_t *stream, const pb_field_iter_t *field, bool (*fn)(const int32_t *item, void *ctx), void *ctx)
+{
+    int32_t item;
+    while (stream->bytes_left > 0)
+    {
+        if (!pb_decode_callback_item(stream, field, &item, sizeof(item)) || !fn(&item, ctx))
+            return false;
+    }
+    return true;
+}
+
+bool Stream_values_encode_items(pb_ostream_t *stream, const pb_field_iter_t *field, bool (*next)(int32_t *item, void *ctx), void *ctx)
+{
+    int32_t item;
+    while (next(&item, ctx))
+    {
+        if (!pb_encode_callback_item(stream, field, &item, sizeof(item)))
+            return false;
+    }
+    return true;
+}
+
+bool Stream_counters_foreach(pb_istream_t *stream, const pb_field_iter_t *field, bool (*fn)(const uint64_t *item, void *ctx), void *ctx)
+{
+    uint64_t item;
+    while (stream->bytes_left > 0)
+    {
+        if (!pb_decode_callback_item(stream, field, &item, sizeof(item)) || !fn(&item, ctx))
+            return false;
+    }
+    return true;
+}
+
+bool Stream_counters_encode_items(pb_ostream_t *stream, const pb_field_iter_t *field, bool (*next)(uint64_t *item, void *ctx), void *ctx)
+{
+    uint64_t item;
+    while (next(&item, ctx))
+    {
+        if (!pb_encode_callback_item(stream, field, &item, sizeof(item)))
+            return false;
+    }
+    return true;
+}
+
+bool Stream_samples_foreach(pb_istream_t *stream, const pb_field_iter_t *field, bool (*fn)(const double *item, void *ctx), void *ctx)
+{
+    double item;
+    while (stream->bytes_left > 0)
+    {
+        if (!pb_decode_callback_item(stream, field, &item, sizeof(item)) || !fn(&item, ctx))
+            return false;
+    }
+    return true;
+}
+
+bool Stream_samples_encode_items(pb_ostream_t *stream, const pb_field_iter_t *field, bool (*next)(double *item, void *ctx), void *ctx)
+{
+    double item;
+    while (next(&item, ctx))
+    {
+        if (!pb_encode_callback_item(stream, field, &item, sizeof(item)))
+            return false;
+    }
+    return true;
+}
+
+bool Stream_points_foreach(pb_istream_t *stream, const pb_field_iter_t *field, bool (*fn)(const Point *item, void *ctx), void *ctx)
+{
+    Point item = Point_init_zero;
+    return pb_decode_callback_item(stream, field, &item, sizeof(item)) && fn(&item, ctx);
+}
+
+bool Stream_points_encode_items(pb_ostream_t *stream, const pb_field_iter_t *field, bool (*next)(Point *item, void *ctx), void *ctx)
+{
+    Point item;
+    while (next(&item, ctx))
+    {
+        if (!pb_encode_callback_item(stream, field, &item, sizeof(item)))
+            return false;
+    }
+    return true;
+}
+
+bool Stream_colors_foreach(pb_istream_t *stream, const pb_field_iter_t *field, bool (*fn)(const Color *item, void *ctx), void *ctx)
+{
+    Color item;
+    while (stream->bytes_left > 0)
+    {
+        if (!pb_decode_callback_item(stream, field, &item, sizeof(item)) || !fn(&item, ctx))
+            return false;
+    }
+    return true;
+}
+
+bool Stream_colors_encode_items(pb_ostream_t *stream, const pb_field_iter_t *field, bool (*next)(Color *item, void *ctx), void *ctx)
+{
+    Color item;
+    while (next(&item, ctx))
+    {
+        if (!pb_encode_callback_item(stream, field, &item, sizeof(item)))
+            return false;
+    }
+    return true;
+}
+
+
+
+/* On some platforms (such as AVR), double is really float.
+ * Using double on these platforms is not directly supported
+ * by nanopb, but see example_avr_double.
+ * To get rid of this error, remove any double fields from your .proto.
+ */
+PB_STATIC_ASSERT(sizeof(double) == 8, DOUBLE_MUST_BE_8_BYTES)
+
+/* @@protoc_insertion_point(eof) */
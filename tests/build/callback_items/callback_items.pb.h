@@ -0,0 +1,157 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_CALLBACK_ITEMS_PB_H_INCLUDED
+#define PB_CALLBACK_ITEMS_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Enum definitions */
+typedef enum _Color {
+    Color_RED = 1,
+    Color_GREEN = 2
+} Color;
+#define _Color_MIN Color_RED
+#define _Color_MAX Color_GREEN
+#define _Color_ARRAYSIZE ((Color)(Color_GREEN+1))
+
+/* Struct definitions */
+typedef struct _Point {
+    int32_t x;
+    int32_t y;
+/* @@protoc_insertion_point(struct:Point) */
+} Point;
+
+
+typedef struct _Stream {
+    pb_callback_t values;
+    pb_callback_t counters;
+    pb_callback_t samples;
+    pb_callback_t points;
+    pb_callback_t colors;
+    pb_callback_t names;
+    uint32_t id;
+/* @@protoc_insertion_point(struct:Stream) */
+} Stream;
+
+
+typedef struct _Stored {
+    pb_size_t values_count;
+    int32_t values[8];
+    pb_size_t counters_count;
+    uint64_t counters[8];
+    pb_size_t samples_count;
+    double samples[8];
+    pb_size_t points_count;
+    Point points[8];
+    pb_size_t colors_count;
+    Color colors[8];
+    uint32_t id;
+/* @@protoc_insertion_point(struct:Stored) */
+} Stored;
+
+
+/* Initializer values for message structs */
+#define Point_init_default                       {0, 0}
+#define Stream_init_default                      {{{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}, 0}
+#define Stored_init_default                      {0, {0}, 0, {0}, 0, {0}, 0, {Point_init_default}, 0, {_Color_MIN}, 0}
+#define Point_init_zero                          {0, 0}
+#define Stream_init_zero                         {{{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}, 0}
+#define Stored_init_zero                         {0, {0}, 0, {0}, 0, {0}, 0, {Point_init_zero}, 0, {_Color_MIN}, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Point_x_tag                              1
+#define Point_y_tag                              2
+#define Stream_values_tag                        1
+#define Stream_counters_tag                      2
+#define Stream_samples_tag                       3
+#define Stream_points_tag                        4
+#define Stream_colors_tag                        5
+#define Stream_names_tag                         6
+#define Stream_id_tag                            7
+#define Stored_values_tag                        1
+#define Stored_counters_tag                      2
+#define Stored_samples_tag                       3
+#define Stored_points_tag                        4
+#define Stored_colors_tag                        5
+#define Stored_id_tag                            7
+
+/* Struct field encoding specification for nanopb */
+#define Point_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, x, 1) \
+X(a, STATIC, REQUIRED, INT32, y, 2)
+#define Point_CALLBACK NULL
+#define Point_DEFAULT NULL
+#define Point_DEFAULT_INSTANCE NULL
+#define Point_FIELD_RECORDS NULL
+#define Point_MSGFLAGS 0
+
+#define Stream_FIELDLIST(X, a) \
+X(a, CALLBACK, REPEATED, SINT32, values, 1) \
+X(a, CALLBACK, REPEATED, UINT64, counters, 2) \
+X(a, CALLBACK, REPEATED, DOUBLE, samples, 3) \
+X(a, CALLBACK, REPEATED, MESSAGE, points, 4) \
+X(a, CALLBACK, REPEATED, UENUM, colors, 5) \
+X(a, CALLBACK, REPEATED, STRING, names, 6) \
+X(a, STATIC, REQUIRED, UINT32, id, 7)
+#define Stream_CALLBACK pb_default_field_callback
+#define Stream_DEFAULT NULL
+#define Stream_DEFAULT_INSTANCE NULL
+#define Stream_FIELD_RECORDS NULL
+#define Stream_MSGFLAGS 0
+#define Stream_points_MSGTYPE Point
+
+#define Stored_FIELDLIST(X, a) \
+X(a, STATIC, REPEATED, SINT32, values, 1) \
+X(a, STATIC, REPEATED, UINT64, counters, 2) \
+X(a, STATIC, REPEATED, DOUBLE, samples, 3) \
+X(a, STATIC, REPEATED, MESSAGE, points, 4) \
+X(a, STATIC, REPEATED, UENUM, colors, 5) \
+X(a, STATIC, REQUIRED, UINT32, id, 7)
+#define Stored_CALLBACK NULL
+#define Stored_DEFAULT NULL
+#define Stored_DEFAULT_INSTANCE NULL
+#define Stored_FIELD_RECORDS NULL
+#define Stored_MSGFLAGS 0
+#define Stored_points_MSGTYPE Point
+
+extern const pb_msgdesc_t Point_msg;
+extern const pb_msgdesc_t Stream_msg;
+extern const pb_msgdesc_t Stored_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Point_fields &Point_msg
+#define Stream_fields &Stream_msg
+#define Stored_fields &Stored_msg
+
+/* Element-by-element access to repeated callback fields */
+bool Stream_values_foreach(pb_istream_t *stream, const pb_field_iter_t *field, bool (*fn)(const int32_t *item, void *ctx), void *ctx);
+bool Stream_values_encode_items(pb_ostream_t *stream, const pb_field_iter_t *field, bool (*next)(int32_t *item, void *ctx), void *ctx);
+bool Stream_counters_foreach(pb_istream_t *stream, const pb_field_iter_t *field, bool (*fn)(const uint64_t *item, void *ctx), void *ctx);
+bool Stream_counters_encode_items(pb_ostream_t *stream, const pb_field_iter_t *field, bool (*next)(uint64_t *item, void *ctx), void *ctx);
+bool Stream_samples_foreach(pb_istream_t *stream, const pb_field_iter_t *field, bool (*fn)(const double *item, void *ctx), void *ctx);
+bool Stream_samples_encode_items(pb_ostream_t *stream, const pb_field_iter_t *field, bool (*next)(double *item, void *ctx), void *ctx);
+bool Stream_points_foreach(pb_istream_t *stream, const pb_field_iter_t *field, bool (*fn)(const Point *item, void *ctx), void *ctx);
+bool Stream_points_encode_items(pb_ostream_t *stream, const pb_field_iter_t *field, bool (*next)(Point *item, void *ctx), void *ctx);
+bool Stream_colors_foreach(pb_istream_t *stream, const pb_field_iter_t *field, bool (*fn)(const Color *item, void *ctx), void *ctx);
+bool Stream_colors_encode_items(pb_ostream_t *stream, const pb_field_iter_t *field, bool (*next)(Color *item, void *ctx), void *ctx);
+
+/* Maximum encoded size of messages (where known) */
+#define Point_size                               22
+/* Stream_size depends on runtime parameters */
+#define Stored_size                              422
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
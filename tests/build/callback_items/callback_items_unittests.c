@@ -0,0 +1,298 @@
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include "unittests.h"
+#include "callback_items.pb.h"
+
+static pb_byte_t buffer[4096];
+
+/* Element handlers that append to the arrays of a Stored message */
+static bool store_value(const int32_t *item, void *ctx)
+{
+    Stored *dest = (Stored*)ctx;
+    if (dest->values_count >= 8) return false;
+    dest->values[dest->values_count++] = *item;
+    return true;
+}
+
+static bool store_counter(const uint64_t *item, void *ctx)
+{
+    Stored *dest = (Stored*)ctx;
+    if (dest->counters_count >= 8) return false;
+    dest->counters[dest->counters_count++] = *item;
+    return true;
+}
+
+static bool store_sample(const double *item, void *ctx)
+{
+    Stored *dest = (Stored*)ctx;
+    if (dest->samples_count >= 8) return false;
+    dest->samples[dest->samples_count++] = *item;
+    return true;
+}
+
+static bool store_point(const Point *item, void *ctx)
+{
+    Stored *dest = (Stored*)ctx;
+    if (dest->points_count >= 8) return false;
+    dest->points[dest->points_count++] = *item;
+    return true;
+}
+
+static bool store_color(const Color *item, void *ctx)
+{
+    Stored *dest = (Stored*)ctx;
+    if (dest->colors_count >= 8) return false;
+    dest->colors[dest->colors_count++] = *item;
+    return true;
+}
+
+static bool decode_stream(pb_istream_t *stream, const pb_field_t *field, void **arg)
+{
+    switch (field->tag)
+    {
+        case Stream_values_tag: return Stream_values_foreach(stream, field, store_value, *arg);
+        case Stream_counters_tag: return Stream_counters_foreach(stream, field, store_counter, *arg);
+        case Stream_samples_tag: return Stream_samples_foreach(stream, field, store_sample, *arg);
+        case Stream_points_tag: return Stream_points_foreach(stream, field, store_point, *arg);
+        case Stream_colors_tag: return Stream_colors_foreach(stream, field, store_color, *arg);
+        default: return false;
+    }
+}
+
+/* Iterators that return the elements of a Stored message */
+typedef struct {
+    const Stored *src;
+    pb_size_t index;
+} source_t;
+
+static bool next_value(int32_t *item, void *ctx)
+{
+    source_t *s = (source_t*)ctx;
+    if (s->index >= s->src->values_count) return false;
+    *item = s->src->values[s->index++];
+    return true;
+}
+
+static bool next_counter(uint64_t *item, void *ctx)
+{
+    source_t *s = (source_t*)ctx;
+    if (s->index >= s->src->counters_count) return false;
+    *item = s->src->counters[s->index++];
+    return true;
+}
+
+static bool next_sample(double *item, void *ctx)
+{
+    source_t *s = (source_t*)ctx;
+    if (s->index >= s->src->samples_count) return false;
+    *item = s->src->samples[s->index++];
+    return true;
+}
+
+static bool next_point(Point *item, void *ctx)
+{
+    source_t *s = (source_t*)ctx;
+    if (s->index >= s->src->points_count) return false;
+    *item = s->src->points[s->index++];
+    return true;
+}
+
+static bool next_color(Color *item, void *ctx)
+{
+    source_t *s = (source_t*)ctx;
+    if (s->index >= s->src->colors_count) return false;
+    *item = s->src->colors[s->index++];
+    return true;
+}
+
+static bool encode_stream(pb_ostream_t *stream, const pb_field_t *field, void * const *arg)
+{
+    source_t source;
+    source.src = (const Stored*)*arg;
+    source.index = 0;
+
+    switch (field->tag)
+    {
+        case Stream_values_tag: return Stream_values_encode_items(stream, field, next_value, &source);
+        case Stream_counters_tag: return Stream_counters_encode_items(stream, field, next_counter, &source);
+        case Stream_samples_tag: return Stream_samples_encode_items(stream, field, next_sample, &source);
+        case Stream_points_tag: return Stream_points_encode_items(stream, field, next_point, &source);
+        case Stream_colors_tag: return Stream_colors_encode_items(stream, field, next_color, &source);
+        default: return false;
+    }
+}
+
+/* Counts up to limit when encoding, and sums the values when decoding */
+typedef struct {
+    int32_t next;
+    int32_t limit;
+} count_t;
+
+static bool next_count(int32_t *item, void *ctx)
+{
+    count_t *c = (count_t*)ctx;
+    if (c->next >= c->limit) return false;
+    *item = c->next++;
+    return true;
+}
+
+static bool add_value(const int32_t *item, void *ctx)
+{
+    count_t *c = (count_t*)ctx;
+    c->limit += *item;
+    return true;
+}
+
+static bool encode_range(pb_ostream_t *stream, const pb_field_t *field, void * const *arg)
+{
+    return Stream_values_encode_items(stream, field, next_count, *arg);
+}
+
+static bool decode_sum(pb_istream_t *stream, const pb_field_t *field, void **arg)
+{
+    return Stream_values_foreach(stream, field, add_value, *arg);
+}
+
+static void set_callbacks(Stream *msg, Stored *arg)
+{
+    msg->values.funcs.decode = decode_stream;
+    msg->values.arg = arg;
+    msg->counters.funcs.decode = decode_stream;
+    msg->counters.arg = arg;
+    msg->samples.funcs.decode = decode_stream;
+    msg->samples.arg = arg;
+    msg->points.funcs.decode = decode_stream;
+    msg->points.arg = arg;
+    msg->colors.funcs.decode = decode_stream;
+    msg->colors.arg = arg;
+}
+
+static void set_encoders(Stream *msg, Stored *arg)
+{
+    msg->values.funcs.encode = encode_stream;
+    msg->values.arg = arg;
+    msg->counters.funcs.encode = encode_stream;
+    msg->counters.arg = arg;
+    msg->samples.funcs.encode = encode_stream;
+    msg->samples.arg = arg;
+    msg->points.funcs.encode = encode_stream;
+    msg->points.arg = arg;
+    msg->colors.funcs.encode = encode_stream;
+    msg->colors.arg = arg;
+}
+
+static bool stored_equal(const Stored *a, const Stored *b)
+{
+    return a->values_count == b->values_count &&
+           memcmp(a->values, b->values, a->values_count * sizeof(a->values[0])) == 0 &&
+           a->counters_count == b->counters_count &&
+           memcmp(a->counters, b->counters, a->counters_count * sizeof(a->counters[0])) == 0 &&
+           a->samples_count == b->samples_count &&
+           memcmp(a->samples, b->samples, a->samples_count * sizeof(a->samples[0])) == 0 &&
+           a->points_count == b->points_count &&
+           memcmp(a->points, b->points, a->points_count * sizeof(a->points[0])) == 0 &&
+           a->colors_count == b->colors_count &&
+           memcmp(a->colors, b->colors, a->colors_count * sizeof(a->colors[0])) == 0;
+}
+
+int main()
+{
+    int status = 0;
+    Stored source = Stored_init_zero;
+
+    source.values_count = 4;
+    source.values[0] = 0;
+    source.values[1] = -1;
+    source.values[2] = 2000000;
+    source.values[3] = -2147483647 - 1;
+    source.counters_count = 2;
+    source.counters[0] = 1;
+    source.counters[1] = (uint64_t)-1;
+    source.samples_count = 3;
+    source.samples[0] = 0.5;
+    source.samples[1] = -1e100;
+    source.samples[2] = 3.0;
+    source.points_count = 3;
+    source.points[0].x = 1;
+    source.points[0].y = 2;
+    source.points[2].x = -3;
+    source.points[2].y = 4;
+    source.colors_count = 2;
+    source.colors[0] = Color_GREEN;
+    source.colors[1] = Color_RED;
+    source.id = 99;
+
+    {
+        pb_ostream_t ostream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+        Stored collected = Stored_init_zero;
+        Stream msg = Stream_init_zero;
+        pb_istream_t istream;
+
+        COMMENT("Decode packed and unpacked fields element by element");
+        TEST(pb_encode(&ostream, Stored_fields, &source));
+        set_callbacks(&msg, &collected);
+        istream = pb_istream_from_buffer(buffer, ostream.bytes_written);
+        TEST(pb_decode(&istream, Stream_fields, &msg));
+        TEST(msg.id == 99);
+        TEST(stored_equal(&collected, &source));
+    }
+
+    {
+        pb_ostream_t ostream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+        Stored decoded = Stored_init_zero;
+        Stream msg = Stream_init_zero;
+        pb_istream_t istream;
+
+        COMMENT("Encode elements from iterators");
+        set_encoders(&msg, &source);
+        msg.id = 99;
+        TEST(pb_encode(&ostream, Stream_fields, &msg));
+
+        istream = pb_istream_from_buffer(buffer, ostream.bytes_written);
+        TEST(pb_decode(&istream, Stored_fields, &decoded));
+        TEST(decoded.id == 99);
+        TEST(stored_equal(&decoded, &source));
+    }
+
+    {
+        pb_ostream_t ostream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+        Stored collected = Stored_init_zero;
+        Stream msg = Stream_init_zero;
+        pb_istream_t istream;
+
+        COMMENT("Handler can stop decoding");
+        TEST(pb_encode(&ostream, Stored_fields, &source));
+        set_callbacks(&msg, &collected);
+        collected.values_count = 7;
+        istream = pb_istream_from_buffer(buffer, ostream.bytes_written);
+        TEST(!pb_decode(&istream, Stream_fields, &msg));
+        TEST(collected.values_count == 8);
+    }
+
+    {
+        pb_ostream_t ostream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+        Stream msg = Stream_init_zero;
+        count_t counter = {0, 0};
+        pb_istream_t istream;
+
+        COMMENT("Many elements with constant memory use");
+        msg.values.funcs.encode = encode_range;
+        msg.values.arg = &counter;
+        counter.limit = 1000;
+        TEST(pb_encode(&ostream, Stream_fields, &msg));
+
+        msg.values.funcs.decode = decode_sum;
+        msg.values.arg = &counter;
+        counter.limit = 0;
+        istream = pb_istream_from_buffer(buffer, ostream.bytes_written);
+        TEST(pb_decode(&istream, Stream_fields, &msg));
+        TEST(counter.limit == 1000 * 999 / 2);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
@@ -0,0 +1,27 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "chunked_encode.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(Empty, Empty, AUTO)
+
+
+PB_BIND(Inner, Inner, AUTO)
+
+
+PB_BIND(Middle, Middle, AUTO)
+
+
+PB_BIND(Outer, Outer, 2)
+
+
+PB_BIND(Large, Large, 2)
+
+
+
+/* @@protoc_insertion_point(eof) */
@@ -0,0 +1,196 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_CHUNKED_ENCODE_PB_H_INCLUDED
+#define PB_CHUNKED_ENCODE_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Empty {
+    char dummy_field;
+/* @@protoc_insertion_point(struct:Empty) */
+} Empty;
+
+
+typedef struct _Inner {
+    int32_t value;
+    bool has_text;
+    char text[16];
+    pb_size_t packed_count;
+    int32_t packed[8];
+/* @@protoc_insertion_point(struct:Inner) */
+} Inner;
+
+
+typedef PB_BYTES_ARRAY_T(1500) Large_data_t;
+typedef struct _Large {
+    bool has_data;
+    Large_data_t data;
+    bool has_text;
+    char text[1500];
+    pb_size_t names_count;
+    char names[4][8];
+    bool has_id;
+    pb_byte_t id[4];
+    struct _Middle *ptr;
+    pb_size_t ptrs_count;
+    char **ptrs;
+/* @@protoc_insertion_point(struct:Large) */
+} Large;
+
+
+typedef struct _Middle {
+    pb_size_t inners_count;
+    Inner inners[3];
+    bool has_empty;
+    Empty empty;
+    pb_callback_t blob;
+/* @@protoc_insertion_point(struct:Middle) */
+} Middle;
+
+
+typedef struct _Outer {
+    bool has_middle;
+    Middle middle;
+    pb_size_t middles_count;
+    Middle middles[2];
+    bool has_id;
+    uint32_t id;
+    pb_size_t which_choice;
+    union {
+        Inner inner;
+        uint32_t number;
+    } choice;
+/* @@protoc_insertion_point(struct:Outer) */
+} Outer;
+
+
+/* Initializer values for message structs */
+#define Empty_init_default                       {0}
+#define Inner_init_default                       {0, false, "", 0, {0}}
+#define Middle_init_default                      {0, {Inner_init_default}, false, Empty_init_default, {{NULL}, NULL}}
+#define Outer_init_default                       {false, Middle_init_default, 0, {Middle_init_default}, false, 0, 0, {Inner_init_default}}
+#define Large_init_default                       {false, {0, {0}}, false, "", 0, {""}, false, {0}, NULL, 0, NULL}
+#define Empty_init_zero                          {0}
+#define Inner_init_zero                          {0, false, "", 0, {0}}
+#define Middle_init_zero                         {0, {Inner_init_zero}, false, Empty_init_zero, {{NULL}, NULL}}
+#define Outer_init_zero                          {false, Middle_init_zero, 0, {Middle_init_zero}, false, 0, 0, {Inner_init_zero}}
+#define Large_init_zero                          {false, {0, {0}}, false, "", 0, {""}, false, {0}, NULL, 0, NULL}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Inner_value_tag                          1
+#define Inner_text_tag                           2
+#define Inner_packed_tag                         3
+#define Large_data_tag                           1
+#define Large_text_tag                           2
+#define Large_names_tag                          3
+#define Large_id_tag                             4
+#define Large_ptr_tag                            5
+#define Large_ptrs_tag                           6
+#define Middle_inners_tag                        1
+#define Middle_empty_tag                         2
+#define Middle_blob_tag                          3
+#define Outer_inner_tag                          4
+#define Outer_number_tag                         5
+#define Outer_middle_tag                         1
+#define Outer_middles_tag                        2
+#define Outer_id_tag                             3
+
+/* Struct field encoding specification for nanopb */
+#define Empty_FIELDLIST(X, a) \
+
+#define Empty_CALLBACK NULL
+#define Empty_DEFAULT NULL
+#define Empty_DEFAULT_INSTANCE NULL
+#define Empty_FIELD_RECORDS NULL
+#define Empty_MSGFLAGS 0
+
+#define Inner_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, value, 1) \
+X(a, STATIC, OPTIONAL, STRING, text, 2) \
+X(a, STATIC, REPEATED, SINT32, packed, 3)
+#define Inner_CALLBACK NULL
+#define Inner_DEFAULT NULL
+#define Inner_DEFAULT_INSTANCE NULL
+#define Inner_FIELD_RECORDS NULL
+#define Inner_MSGFLAGS 0
+
+#define Middle_FIELDLIST(X, a) \
+X(a, STATIC, REPEATED, MESSAGE, inners, 1) \
+X(a, STATIC, OPTIONAL, MESSAGE, empty, 2) \
+X(a, CALLBACK, OPTIONAL, BYTES, blob, 3)
+#define Middle_CALLBACK pb_default_field_callback
+#define Middle_DEFAULT NULL
+#define Middle_DEFAULT_INSTANCE NULL
+#define Middle_FIELD_RECORDS NULL
+#define Middle_MSGFLAGS 0
+#define Middle_inners_MSGTYPE Inner
+#define Middle_empty_MSGTYPE Empty
+
+#define Outer_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, MESSAGE, middle, 1) \
+X(a, STATIC, REPEATED, MESSAGE, middles, 2) \
+X(a, STATIC, OPTIONAL, UINT32, id, 3) \
+X(a, STATIC, ONEOF, MESSAGE, (choice,inner,choice.inner), 4) \
+X(a, STATIC, ONEOF, FIXED32, (choice,number,choice.number), 5)
+#define Outer_CALLBACK NULL
+#define Outer_DEFAULT NULL
+#define Outer_DEFAULT_INSTANCE NULL
+#define Outer_FIELD_RECORDS NULL
+#define Outer_MSGFLAGS 0
+#define Outer_middle_MSGTYPE Middle
+#define Outer_middles_MSGTYPE Middle
+#define Outer_choice_inner_MSGTYPE Inner
+
+#define Large_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, BYTES, data, 1) \
+X(a, STATIC, OPTIONAL, STRING, text, 2) \
+X(a, STATIC, REPEATED, STRING, names, 3) \
+X(a, STATIC, OPTIONAL, FIXED_LENGTH_BYTES, id, 4) \
+X(a, POINTER, OPTIONAL, MESSAGE, ptr, 5) \
+X(a, POINTER, REPEATED, STRING, ptrs, 6)
+#define Large_CALLBACK NULL
+#define Large_DEFAULT NULL
+#define Large_DEFAULT_INSTANCE NULL
+#define Large_FIELD_RECORDS NULL
+#define Large_MSGFLAGS 0
+#define Large_ptr_MSGTYPE Middle
+
+extern const pb_msgdesc_t Empty_msg;
+extern const pb_msgdesc_t Inner_msg;
+extern const pb_msgdesc_t Middle_msg;
+extern const pb_msgdesc_t Outer_msg;
+extern const pb_msgdesc_t Large_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Empty_fields &Empty_msg
+#define Inner_fields &Inner_msg
+#define Middle_fields &Middle_msg
+#define Outer_fields &Outer_msg
+#define Large_fields &Large_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Empty_size                               0
+#define Inner_size                               76
+/* Middle_size depends on runtime parameters */
+/* Outer_size depends on runtime parameters */
+/* Large_size depends on runtime parameters */
+
+/* Arena memory needed for decoding pointer fields (where known) */
+/* Large_arena_size depends on runtime parameters */
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
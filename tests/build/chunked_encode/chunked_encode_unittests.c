@@ -0,0 +1,260 @@
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include "unittests.h"
+#include "chunked_encode.pb.h"
+
+static pb_byte_t expected[4096];
+static pb_byte_t output[4096];
+
+static bool encode_blob(pb_ostream_t *stream, const pb_field_t *field, void * const *arg)
+{
+    const char *text = (const char*)*arg;
+    return pb_encode_tag_for_field(stream, field) &&
+           pb_encode_string(stream, (const pb_byte_t*)text, strlen(text));
+}
+
+/* Counts the calls while giving the same output every time */
+static bool encode_counted(pb_ostream_t *stream, const pb_field_t *field, void * const *arg)
+{
+    int *calls = (int*)*arg;
+    (*calls)++;
+    return pb_encode_tag_for_field(stream, field) &&
+           pb_encode_string(stream, (const pb_byte_t*)"x", 1);
+}
+
+/* Gives a longer output each time it is called */
+static bool encode_growing(pb_ostream_t *stream, const pb_field_t *field, void * const *arg)
+{
+    int *calls = (int*)*arg;
+    (*calls)++;
+    return pb_encode_tag_for_field(stream, field) &&
+           pb_encode_string(stream, (const pb_byte_t*)"abcdefgh", (size_t)*calls);
+}
+
+/* Encode in chunks of the given size, returning the final status */
+static pb_encoder_status_t encode_chunks(pb_encoder_t *encoder, size_t chunk, size_t *size)
+{
+    pb_encoder_status_t result = PB_ENCODER_MORE;
+
+    *size = 0;
+    while (result == PB_ENCODER_MORE && *size + chunk <= sizeof(output))
+    {
+        size_t count;
+        result = pb_encoder_write(encoder, output + *size, chunk, &count);
+        *size += count;
+    }
+
+    return result;
+}
+
+static void fill_inner(Inner *inner, int32_t value, const char *text)
+{
+    inner->value = value;
+    inner->has_text = (text != NULL);
+    if (text)
+        strcpy(inner->text, text);
+    inner->packed_count = 3;
+    inner->packed[0] = value;
+    inner->packed[1] = -value;
+    inner->packed[2] = 100000;
+}
+
+int main()
+{
+    int status = 0;
+    size_t expectedlen;
+    Outer msg = Outer_init_zero;
+
+    msg.has_middle = true;
+    msg.middle.inners_count = 2;
+    fill_inner(&msg.middle.inners[0], 1, NULL);
+    fill_inner(&msg.middle.inners[1], -5000, "second");
+    msg.middle.has_empty = true;
+    msg.middle.blob.funcs.encode = encode_blob;
+    msg.middle.blob.arg = "callback data in a submessage";
+    msg.middles_count = 2;
+    msg.middles[0].inners_count = 3;
+    fill_inner(&msg.middles[0].inners[0], 7, "a");
+    fill_inner(&msg.middles[0].inners[1], 8, "");
+    fill_inner(&msg.middles[0].inners[2], 9, "0123456789abcde");
+    msg.has_id = true;
+    msg.id = 300;
+    msg.which_choice = Outer_inner_tag;
+    fill_inner(&msg.choice.inner, 42, "oneof");
+
+    {
+        pb_ostream_t stream = pb_ostream_from_buffer(expected, sizeof(expected));
+        TEST(pb_encode(&stream, Outer_fields, &msg));
+        expectedlen = stream.bytes_written;
+    }
+
+    {
+        size_t chunk;
+        bool ok = true;
+
+        COMMENT("Nested submessages in chunks of every size");
+        for (chunk = 1; chunk <= expectedlen + 1 && ok; chunk++)
+        {
+            pb_encoder_t encoder;
+            size_t size;
+
+            ok = pb_encoder_init(&encoder, Outer_fields, &msg, 0) &&
+                 encode_chunks(&encoder, chunk, &size) == PB_ENCODER_DONE &&
+                 size == expectedlen &&
+                 memcmp(output, expected, expectedlen) == 0;
+        }
+        TEST(ok);
+    }
+
+    {
+        pb_encoder_t encoder;
+        size_t count;
+
+        COMMENT("Chunk filled exactly by the last field");
+        TEST(pb_encoder_init(&encoder, Outer_fields, &msg, 0));
+        TEST(pb_encoder_write(&encoder, output, expectedlen, &count) == PB_ENCODER_DONE);
+        TEST(count == expectedlen);
+        TEST(pb_encoder_write(&encoder, output, 16, &count) == PB_ENCODER_DONE);
+        TEST(count == 0);
+    }
+
+    {
+        Empty empty = Empty_init_zero;
+        Outer none = Outer_init_zero;
+        pb_encoder_t encoder;
+        size_t count;
+
+        COMMENT("Empty messages");
+        TEST(pb_encoder_init(&encoder, Empty_fields, &empty, 0));
+        TEST(pb_encoder_write(&encoder, output, 16, &count) == PB_ENCODER_DONE);
+        TEST(count == 0);
+
+        TEST(pb_encoder_init(&encoder, Empty_fields, &empty, PB_ENCODE_DELIMITED));
+        TEST(pb_encoder_write(&encoder, output, 16, &count) == PB_ENCODER_DONE);
+        TEST(count == 1 && output[0] == 0);
+
+        TEST(pb_encoder_init(&encoder, Outer_fields, &none, PB_ENCODE_DELIMITED));
+        TEST(pb_encoder_write(&encoder, output, 16, &count) == PB_ENCODER_DONE);
+        TEST(count == 1 && output[0] == 0);
+    }
+
+    {
+        pb_ostream_t stream = pb_ostream_from_buffer(expected, sizeof(expected));
+        pb_encoder_t encoder;
+        size_t size;
+
+        COMMENT("Delimited message in small chunks");
+        TEST(pb_encode_delimited(&stream, Outer_fields, &msg));
+        TEST(pb_encoder_init(&encoder, Outer_fields, &msg, PB_ENCODE_DELIMITED));
+        TEST(encode_chunks(&encoder, 3, &size) == PB_ENCODER_DONE);
+        TEST(size == stream.bytes_written);
+        TEST(memcmp(output, expected, size) == 0);
+
+        /* The decoder accepts the result */
+        {
+            Outer decoded = Outer_init_zero;
+            pb_istream_t istream = pb_istream_from_buffer(output, size);
+            TEST(pb_decode_delimited(&istream, Outer_fields, &decoded));
+            TEST(decoded.middles[0].inners[2].value == 9);
+            TEST(decoded.choice.inner.packed[2] == 100000);
+        }
+    }
+
+    {
+        static Large large;
+        Middle middle = Middle_init_zero;
+        char *ptrs[3] = {"pointer", NULL, "strings"};
+        static const size_t chunks[] = {1, 2, 7, 64, 1000};
+        size_t i;
+        bool ok = true;
+        int calls = 0;
+
+        COMMENT("Bytes, strings and pointer submessages spanning many chunks");
+        large.has_data = true;
+        large.data.size = 1500;
+        for (i = 0; i < large.data.size; i++)
+            large.data.bytes[i] = (pb_byte_t)i;
+        large.has_text = true;
+        memset(large.text, 'a', 1499);
+        large.names_count = 3;
+        strcpy(large.names[0], "first");
+        strcpy(large.names[2], "1234567");
+        large.has_id = true;
+        memcpy(large.id, "\x01\x00\x02\x00", 4);
+        middle.inners_count = 2;
+        fill_inner(&middle.inners[0], 1, "first inner");
+        fill_inner(&middle.inners[1], 2, "second inner");
+        middle.blob.funcs.encode = encode_counted;
+        middle.blob.arg = &calls;
+        large.ptr = &middle;
+        large.ptrs_count = 3;
+        large.ptrs = ptrs;
+
+        {
+            pb_ostream_t stream = pb_ostream_from_buffer(expected, sizeof(expected));
+            TEST(pb_encode(&stream, Large_fields, &large));
+            expectedlen = stream.bytes_written;
+        }
+
+        for (i = 0; i < sizeof(chunks) / sizeof(chunks[0]) && ok; i++)
+        {
+            pb_encoder_t encoder;
+            size_t size;
+
+            ok = pb_encoder_init(&encoder, Large_fields, &large, 0) &&
+                 encode_chunks(&encoder, chunks[i], &size) == PB_ENCODER_DONE &&
+                 size == expectedlen &&
+                 memcmp(output, expected, expectedlen) == 0;
+        }
+        TEST(ok);
+
+        /* The pointer submessage is entered instead of being encoded
+         * again for every chunk, so the callback runs only a few times. */
+        {
+            pb_encoder_t encoder;
+            size_t size;
+
+            calls = 0;
+            TEST(pb_encoder_init(&encoder, Large_fields, &large, 0));
+            TEST(encode_chunks(&encoder, 1, &size) == PB_ENCODER_DONE);
+            TEST(calls <= 8);
+        }
+    }
+
+    {
+        Outer bad = Outer_init_zero;
+        pb_encoder_t encoder;
+        size_t size;
+
+        COMMENT("Too large array count");
+        bad.middles_count = 3;
+        TEST(pb_encoder_init(&encoder, Outer_fields, &bad, 0));
+        TEST(encode_chunks(&encoder, 4, &size) == PB_ENCODER_ERROR);
+        TEST(strcmp(PB_GET_ERROR(&encoder), "array max size exceeded") == 0);
+    }
+
+    {
+        Outer bad = Outer_init_zero;
+        pb_encoder_t encoder;
+        size_t size;
+        int calls = 0;
+
+        COMMENT("Submessage that changes size during encoding");
+        bad.has_middle = true;
+        bad.middle.blob.funcs.encode = encode_growing;
+        bad.middle.blob.arg = &calls;
+        TEST(pb_encoder_init(&encoder, Outer_fields, &bad, 0));
+        TEST(encode_chunks(&encoder, 64, &size) == PB_ENCODER_ERROR);
+        TEST(strcmp(PB_GET_ERROR(&encoder), "submsg size changed") == 0);
+
+        /* Later calls keep reporting the error */
+        TEST(pb_encoder_write(&encoder, output, 64, &size) == PB_ENCODER_ERROR);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
@@ -0,0 +1,95 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_MESSAGE_PB_H_INCLUDED
+#define PB_MESSAGE_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _MyEmptyMessage {
+    char dummy_field;
+/* @@protoc_insertion_point(struct:MyEmptyMessage) */
+} MyEmptyMessage;
+
+
+typedef struct _MyNonEmptyMessage {
+    bool has_field;
+    uint32_t field;
+/* @@protoc_insertion_point(struct:MyNonEmptyMessage) */
+} MyNonEmptyMessage;
+
+
+/* Initializer values for message structs */
+#define MyEmptyMessage_init_default              {0}
+#define MyNonEmptyMessage_init_default           {false, 0}
+#define MyEmptyMessage_init_zero                 {0}
+#define MyNonEmptyMessage_init_zero              {false, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define MyNonEmptyMessage_field_tag              1
+
+/* Struct field encoding specification for nanopb */
+#define MyEmptyMessage_FIELDLIST(X, a) \
+
+#define MyEmptyMessage_CALLBACK NULL
+#define MyEmptyMessage_DEFAULT NULL
+#define MyEmptyMessage_DEFAULT_INSTANCE NULL
+#define MyEmptyMessage_FIELD_RECORDS NULL
+#define MyEmptyMessage_MSGFLAGS 0
+
+#define MyNonEmptyMessage_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, UINT32, field, 1)
+#define MyNonEmptyMessage_CALLBACK NULL
+#define MyNonEmptyMessage_DEFAULT NULL
+#define MyNonEmptyMessage_DEFAULT_INSTANCE NULL
+#define MyNonEmptyMessage_FIELD_RECORDS NULL
+#define MyNonEmptyMessage_MSGFLAGS 0
+
+extern const pb_msgdesc_t MyEmptyMessage_msg;
+extern const pb_msgdesc_t MyNonEmptyMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define MyEmptyMessage_fields &MyEmptyMessage_msg
+#define MyNonEmptyMessage_fields &MyNonEmptyMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+#define MyEmptyMessage_size                      0
+#define MyNonEmptyMessage_size                   6
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+
+#ifdef __cplusplus
+/* Message descriptors for nanopb */
+namespace nanopb {
+template <>
+struct MessageDescriptor<MyEmptyMessage> {
+    static PB_INLINE_CONSTEXPR const pb_size_t fields_array_length = 0;
+    static inline const pb_msgdesc_t* fields() {
+        return &MyEmptyMessage_msg;
+    }
+};
+template <>
+struct MessageDescriptor<MyNonEmptyMessage> {
+    static PB_INLINE_CONSTEXPR const pb_size_t fields_array_length = 1;
+    static inline const pb_msgdesc_t* fields() {
+        return &MyNonEmptyMessage_msg;
+    }
+};
+}  // namespace nanopb
+
+#endif  /* __cplusplus */
+
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,515 @@
+/* pb_common.c: Common support functions for pb_encode.c and pb_decode.c.
+ *
+ * 2014 Petteri Aimonen <jpa@kapsi.fi>
+ */
+
+#include "pb_common.h"
+
+/* Unpack the field information from the variable width field_info words */
+static void unpack_field_info(pb_field_iter_t *iter, uint32_t *data_offset, int8_t *size_offset)
+{
+    uint32_t word0;
+    uint8_t format;
+
+    word0 = iter->descriptor->field_info[iter->field_info_index];
+    format = word0 & 3;
+    iter->tag = (pb_size_t)((word0 >> 2) & 0x3F);
+    iter->type = (pb_type_t)((word0 >> 8) & 0xFF);
+
+    if (format == 0)
+    {
+        /* 1-word format */
+        iter->array_size = 1;
+        *size_offset = (int8_t)((word0 >> 24) & 0x0F);
+        *data_offset = (word0 >> 16) & 0xFF;
+        iter->data_size = (pb_size_t)((word0 >> 28) & 0x0F);
+    }
+    else if (format == 1)
+    {
+        /* 2-word format */
+        uint32_t word1 = iter->descriptor->field_info[iter->field_info_index + 1];
+
+        iter->array_size = (pb_size_t)((word0 >> 16) & 0x0FFF);
+        iter->tag = (pb_size_t)(iter->tag | ((word1 >> 28) << 6));
+        *size_offset = (int8_t)((word0 >> 28) & 0x0F);
+        *data_offset = word1 & 0xFFFF;
+        iter->data_size = (pb_size_t)((word1 >> 16) & 0x0FFF);
+    }
+    else if (format == 2)
+    {
+        /* 4-word format */
+        uint32_t word1 = iter->descriptor->field_info[iter->field_info_index + 1];
+        uint32_t word2 = iter->descriptor->field_info[iter->field_info_index + 2];
+        uint32_t word3 = iter->descriptor->field_info[iter->field_info_index + 3];
+
+        iter->array_size = (pb_size_t)(word0 >> 16);
+        iter->tag = (pb_size_t)(iter->tag | ((word1 >> 8) << 6));
+        *size_offset = (int8_t)(word1 & 0xFF);
+        *data_offset = word2;
+        iter->data_size = (pb_size_t)word3;
+    }
+    else
+    {
+        /* 8-word format */
+        uint32_t word1 = iter->descriptor->field_info[iter->field_info_index + 1];
+        uint32_t word2 = iter->descriptor->field_info[iter->field_info_index + 2];
+        uint32_t word3 = iter->descriptor->field_info[iter->field_info_index + 3];
+        uint32_t word4 = iter->descriptor->field_info[iter->field_info_index + 4];
+
+        iter->array_size = (pb_size_t)word4;
+        iter->tag = (pb_size_t)(iter->tag | ((word1 >> 8) << 6));
+        *size_offset = (int8_t)(word1 & 0xFF);
+        *data_offset = word2;
+        iter->data_size = (pb_size_t)word3;
+    }
+}
+
+static bool load_descriptor_values(pb_field_iter_t *iter)
+{
+    uint32_t data_offset;
+    int8_t size_offset;
+
+    if (iter->index >= iter->descriptor->field_count)
+        return false;
+
+    if (iter->descriptor->field_records != NULL)
+    {
+        /* Expanded descriptor, values can be copied directly */
+        const pb_field_record_t *record = &iter->descriptor->field_records[iter->index];
+        iter->tag = record->tag;
+        iter->type = record->type;
+        iter->array_size = record->array_size;
+        iter->data_size = record->data_size;
+        iter->submessage_index = record->submsg_index;
+        iter->required_field_index = record->required_index;
+        size_offset = (int8_t)record->size_offset;
+        data_offset = record->data_offset;
+    }
+    else
+    {
+        unpack_field_info(iter, &data_offset, &size_offset);
+    }
+
+    iter->pField = (char*)iter->message + data_offset;
+
+    if (size_offset)
+    {
+        iter->pSize = (char*)iter->pField - size_offset;
+    }
+    else if (PB_HTYPE(iter->type) == PB_HTYPE_OPTIONAL &&
+             (iter->descriptor->flags & PB_MSGFLAG_HAS_BITS) &&
+             (PB_ATYPE(iter->type) == PB_ATYPE_STATIC ||
+              PB_ATYPE(iter->type) == PB_ATYPE_VIEW))
+    {
+        /* Presence bit in the has_bits array at start of message */
+        iter->pSize = (uint32_t*)iter->message + (iter->index >> 5);
+    }
+    else if (PB_HTYPE(iter->type) == PB_HTYPE_REPEATED &&
+             (PB_ATYPE(iter->type) == PB_ATYPE_STATIC ||
+              PB_ATYPE(iter->type) == PB_ATYPE_POINTER ||
+              PB_ATYPE(iter->type) == PB_ATYPE_VIEW))
+    {
+        /* Fixed count array */
+        iter->pSize = &iter->array_size;
+    }
+    else
+    {
+        iter->pSize = NULL;
+    }
+
+    if (PB_ATYPE(iter->type) == PB_ATYPE_POINTER && iter->pField != NULL)
+    {
+        iter->pData = *(void**)iter->pField;
+    }
+    else
+    {
+        iter->pData = iter->pField;
+    }
+
+    if (PB_LTYPE(iter->type) == PB_LTYPE_SUBMESSAGE)
+    {
+        iter->submsg_desc = iter->descriptor->submsg_info[iter->submessage_index];
+    }
+    else
+    {
+        iter->submsg_desc = NULL;
+    }
+
+    return true;
+}
+
+static void advance_iterator(pb_field_iter_t *iter)
+{
+    iter->index++;
+
+    if (iter->index >= iter->descriptor->field_count)
+    {
+        /* Restart */
+        iter->index = 0;
+        iter->field_info_index = 0;
+        iter->submessage_index = 0;
+        iter->required_field_index = 0;
+    }
+    else if (iter->descriptor->field_records != NULL)
+    {
+        /* Indexes are loaded from the field record */
+    }
+    else
+    {
+        /* Increment indexes based on previous field type.
+         * All field info formats have the following fields:
+         * - lowest 2 bits tell the amount of words in the descriptor (2^n words)
+         * - bits 2..7 give the lowest bits of tag number.
+         * - bits 8..15 give the field type.
+         */
+        uint32_t prev_descriptor = iter->descriptor->field_info[iter->field_info_index];
+        pb_type_t prev_type = (prev_descriptor >> 8) & 0xFF;
+        pb_size_t descriptor_len = (pb_size_t)(1 << (prev_descriptor & 3));
+
+        iter->field_info_index = (pb_size_t)(iter->field_info_index + descriptor_len);
+
+        if (PB_HTYPE(prev_type) == PB_HTYPE_REQUIRED)
+        {
+            iter->required_field_index++;
+        }
+
+        if (PB_LTYPE(prev_type) == PB_LTYPE_SUBMESSAGE)
+        {
+            iter->submessage_index++;
+        }
+    }
+}
+
+bool pb_field_iter_begin(pb_field_iter_t *iter, const pb_msgdesc_t *desc, void *message)
+{
+    memset(iter, 0, sizeof(*iter));
+
+    iter->descriptor = desc;
+    iter->message = message;
+
+    return load_descriptor_values(iter);
+}
+
+bool pb_field_iter_begin_extension(pb_field_iter_t *iter, pb_extension_t *extension)
+{
+    const pb_msgdesc_t *msg = (const pb_msgdesc_t*)extension->type->arg;
+    bool status;
+
+    if (PB_ATYPE(msg->field_info[0] >> 8) == PB_ATYPE_POINTER)
+    {
+        /* For pointer extensions, the pointer is stored directly
+         * in the extension structure. This avoids having an extra
+         * indirection. */
+        status = pb_field_iter_begin(iter, msg, &extension->dest);
+    }
+    else
+    {
+        status = pb_field_iter_begin(iter, msg, extension->dest);
+    }
+
+    iter->pSize = &extension->found;
+    return status;
+}
+
+bool pb_field_iter_next(pb_field_iter_t *iter)
+{
+    advance_iterator(iter);
+    (void)load_descriptor_values(iter);
+    return iter->index != 0;
+}
+
+bool pb_field_iter_find(pb_field_iter_t *iter, uint32_t tag)
+{
+    if (iter->tag == tag)
+    {
+        return true; /* Nothing to do, correct field already. */
+    }
+    else
+    {
+        pb_size_t start = iter->index;
+        uint32_t fieldtag;
+
+        do
+        {
+            /* Advance iterator but don't load values yet */
+            advance_iterator(iter);
+
+            /* Do fast check for tag number match */
+            if (iter->descriptor->field_records != NULL)
+                fieldtag = iter->descriptor->field_records[iter->index].tag;
+            else
+                fieldtag = (iter->descriptor->field_info[iter->field_info_index] >> 2) & 0x3F;
+
+            if ((fieldtag & 0x3F) == (tag & 0x3F))
+            {
+                /* Good candidate, check further */
+                (void)load_descriptor_values(iter);
+
+                if (iter->tag == tag &&
+                    PB_LTYPE(iter->type) != PB_LTYPE_EXTENSION)
+                {
+                    /* Found it */
+                    return true;
+                }
+            }
+        } while (iter->index != start);
+
+        /* Searched all the way back to start, and found nothing. */
+        (void)load_descriptor_values(iter);
+        return false;
+    }
+}
+
+/* Read a bool value without causing undefined behavior even if the value
+ * is invalid. See issue #434 and
+ * https://stackoverflow.com/questions/27661768/weird-results-for-conditional
+ */
+bool pb_safe_read_bool(const void *pSize)
+{
+    const char *p = (const char *)pSize;
+    size_t i;
+    for (i = 0; i < sizeof(bool); i++)
+    {
+        if (p[i] != 0)
+            return true;
+    }
+    return false;
+}
+
+bool pb_field_is_present(const pb_field_iter_t *field)
+{
+    if (field->descriptor->flags & PB_MSGFLAG_HAS_BITS)
+    {
+        return PB_HAS_BIT((const uint32_t*)field->message, field->index) != 0;
+    }
+    else
+    {
+        return pb_safe_read_bool(field->pSize);
+    }
+}
+
+void pb_field_set_present(const pb_field_iter_t *field, bool present)
+{
+    if (field->descriptor->flags & PB_MSGFLAG_HAS_BITS)
+    {
+        if (present)
+            PB_SET_HAS_BIT((uint32_t*)field->message, field->index);
+        else
+            PB_CLEAR_HAS_BIT((uint32_t*)field->message, field->index);
+    }
+    else
+    {
+        *(bool*)field->pSize = present;
+    }
+}
+
+bool pb_default_field_callback(pb_istream_t *istream, pb_ostream_t *ostream, const pb_field_t *field)
+{
+    if (field->data_size == sizeof(pb_callback_t))
+    {
+        pb_callback_t *pCallback = (pb_callback_t*)field->pData;
+
+        if (pCallback != NULL)
+        {
+            if (istream != NULL && pCallback->funcs.decode != NULL)
+            {
+#ifdef PB_OLD_CALLBACK_STYLE
+                return pCallback->funcs.decode(istream, field, pCallback->arg);
+#else
+                return pCallback->funcs.decode(istream, field, &pCallback->arg);
+#endif
+            }
+
+            if (ostream != NULL && pCallback->funcs.encode != NULL)
+            {
+#ifdef PB_OLD_CALLBACK_STYLE
+                return pCallback->funcs.encode(ostream, field, pCallback->arg);
+#else
+                return pCallback->funcs.encode(ostream, field, &pCallback->arg);
+#endif
+            }
+        }
+    }
+
+    return true; /* Success, but didn't do anything */
+
+}
+
+const pb_msgid_entry_t *pb_msgid_find(const pb_msgid_table_t *table, uint32_t msgid)
+{
+    const pb_msgid_entry_t *entries = table->entries;
+    pb_size_t low = 0;
+    pb_size_t high = table->count;
+
+    if (high == 0)
+        return NULL;
+
+    /* Consecutive ids can be indexed directly */
+    if (msgid >= entries[0].msgid && msgid - entries[0].msgid < table->count)
+    {
+        const pb_msgid_entry_t *entry = &entries[msgid - entries[0].msgid];
+        if (entry->msgid == msgid)
+            return entry;
+    }
+
+    while (low < high)
+    {
+        pb_size_t mid = (pb_size_t)(low + (high - low) / 2);
+
+        if (entries[mid].msgid < msgid)
+            low = (pb_size_t)(mid + 1);
+        else
+            high = mid;
+    }
+
+    if (low < table->count && entries[low].msgid == msgid)
+        return &entries[low];
+
+    return NULL;
+}
+
+/* Compare one value of a field, i.e. one entry of an array. For pointer-type
+ * strings and bytes, a and b are the pointers stored in the structure. */
+static bool value_equal(const pb_field_iter_t *field, const void *a, const void *b)
+{
+    if (a == b)
+        return true;
+
+    if (a == NULL || b == NULL)
+        return false; /* Pointer field that is only allocated in one message */
+
+    if (PB_ATYPE(field->type) == PB_ATYPE_VIEW)
+    {
+        const pb_bytes_view_t *view_a = (const pb_bytes_view_t*)a;
+        const pb_bytes_view_t *view_b = (const pb_bytes_view_t*)b;
+
+        if (PB_LTYPE(field->type) == PB_LTYPE_SUBMESSAGE &&
+            (((const pb_lazy_t*)a)->msg != NULL || ((const pb_lazy_t*)b)->msg != NULL))
+        {
+            /* Lazy submessage that has been accessed, and may have been modified */
+            return false;
+        }
+
+        return view_a->size == view_b->size &&
+               (view_a->size == 0 || memcmp(view_a->ptr, view_b->ptr, view_a->size) == 0);
+    }
+
+    switch (PB_LTYPE(field->type))
+    {
+        case PB_LTYPE_BYTES:
+        {
+            const pb_bytes_array_t *bytes_a = (const pb_bytes_array_t*)a;
+            const pb_bytes_array_t *bytes_b = (const pb_bytes_array_t*)b;
+            return bytes_a->size == bytes_b->size &&
+                   memcmp(bytes_a->bytes, bytes_b->bytes, bytes_a->size) == 0;
+        }
+
+        case PB_LTYPE_STRING:
+            if (PB_ATYPE(field->type) == PB_ATYPE_POINTER)
+                return strcmp((const char*)a, (const char*)b) == 0;
+            else
+                return strncmp((const char*)a, (const char*)b, field->data_size) == 0;
+
+        case PB_LTYPE_SUBMESSAGE:
+            return field->submsg_desc != NULL && pb_message_equal(field->submsg_desc, a, b);
+
+        default:
+            /* Integer, float and fixed length bytes values.
+             * The data_size does not include any padding. */
+            return memcmp(a, b, field->data_size) == 0;
+    }
+}
+
+bool pb_field_equal(const pb_field_iter_t *a, const pb_field_iter_t *b)
+{
+    pb_type_t type = a->type;
+
+    if (PB_LTYPE(type) == PB_LTYPE_EXTENSION)
+    {
+        /* Extensions can only be compared when there are none */
+        return *(pb_extension_t* const*)a->pData == NULL &&
+               *(pb_extension_t* const*)b->pData == NULL;
+    }
+    else if (PB_ATYPE(type) == PB_ATYPE_CALLBACK)
+    {
+        /* The data of callback fields is not available */
+        return false;
+    }
+    else if (PB_HTYPE(type) == PB_HTYPE_REPEATED)
+    {
+        pb_size_t count = *(const pb_size_t*)a->pSize;
+        pb_size_t i;
+
+        if (count != *(const pb_size_t*)b->pSize)
+            return false;
+
+        for (i = 0; i < count; i++)
+        {
+            const void *item_a = (const char*)a->pData + (size_t)a->data_size * i;
+            const void *item_b = (const char*)b->pData + (size_t)b->data_size * i;
+
+            if (PB_ATYPE(type) == PB_ATYPE_POINTER &&
+                (PB_LTYPE(type) == PB_LTYPE_STRING || PB_LTYPE(type) == PB_LTYPE_BYTES))
+            {
+                /* Array of pointers to the values */
+                item_a = *(const void* const*)item_a;
+                item_b = *(const void* const*)item_b;
+            }
+
+            if (!value_equal(a, item_a, item_b))
+                return false;
+        }
+
+        return true;
+    }
+    else if (PB_HTYPE(type) == PB_HTYPE_ONEOF)
+    {
+        bool present = (*(const pb_size_t*)a->pSize == a->tag);
+
+        if (present != (*(const pb_size_t*)b->pSize == b->tag))
+            return false;
+
+        if (!present)
+            return true;
+    }
+    else if (PB_HTYPE(type) == PB_HTYPE_OPTIONAL && a->pSize != NULL)
+    {
+        bool present = pb_field_is_present(a);
+
+        if (present != pb_field_is_present(b))
+            return false;
+
+        if (!present)
+            return true;
+    }
+
+    return value_equal(a, a->pData, b->pData);
+}
+
+bool pb_message_equal(const pb_msgdesc_t *fields, const void *a, const void *b)
+{
+    pb_field_iter_t iter_a;
+    pb_field_iter_t iter_b;
+
+    /* The iterators take non-const pointers, but are only used for reading */
+    union {
+        void *p1;
+        const void *p2;
+    } msg_a, msg_b;
+    msg_a.p2 = a;
+    msg_b.p2 = b;
+
+    if (!pb_field_iter_begin(&iter_a, fields, msg_a.p1) ||
+        !pb_field_iter_begin(&iter_b, fields, msg_b.p1))
+    {
+        return true; /* Empty message type */
+    }
+
+    do
+    {
+        if (!pb_field_equal(&iter_a, &iter_b))
+            return false;
+    } while (pb_field_iter_next(&iter_a) && pb_field_iter_next(&iter_b));
+
+    return true;
+}
@@ -0,0 +1,34 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "dedup_descriptors.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+const dedup_Vec3 dedup_Vec3_default_instance = dedup_Vec3_init_default;
+PB_BIND_EXT(dedup_Vec3, dedup_Vec3, AUTO)
+
+
+PB_BIND_ALIAS(dedup_Position, dedup_Position, dedup_Vec3)
+
+
+const dedup_Velocity dedup_Velocity_default_instance = dedup_Velocity_init_default;
+PB_BIND_EXT(dedup_Velocity, dedup_Velocity, AUTO)
+
+
+const dedup_Stamped dedup_Stamped_default_instance = dedup_Stamped_init_default;
+PB_BIND_EXT(dedup_Stamped, dedup_Stamped, AUTO)
+
+
+PB_BIND_ALIAS(dedup_StampedCopy, dedup_StampedCopy, dedup_Stamped)
+
+
+const dedup_StampedPosition dedup_StampedPosition_default_instance = dedup_StampedPosition_init_default;
+PB_BIND_EXT(dedup_StampedPosition, dedup_StampedPosition, AUTO)
+
+
+
+/* @@protoc_insertion_point(eof) */
@@ -0,0 +1,190 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_DEDUP_DEDUP_DESCRIPTORS_PB_H_INCLUDED
+#define PB_DEDUP_DEDUP_DESCRIPTORS_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _dedup_Position {
+    float x;
+    float y;
+    float z;
+/* @@protoc_insertion_point(struct:dedup_Position) */
+} dedup_Position;
+
+
+typedef struct _dedup_Vec3 {
+    float x;
+    float y;
+    float z;
+/* @@protoc_insertion_point(struct:dedup_Vec3) */
+} dedup_Vec3;
+
+
+typedef struct _dedup_Velocity {
+    float x;
+    float y;
+    float z;
+/* @@protoc_insertion_point(struct:dedup_Velocity) */
+} dedup_Velocity;
+
+
+typedef struct _dedup_Stamped {
+    uint64_t time;
+    bool has_value;
+    dedup_Vec3 value;
+/* @@protoc_insertion_point(struct:dedup_Stamped) */
+} dedup_Stamped;
+
+
+typedef struct _dedup_StampedCopy {
+    uint64_t time;
+    bool has_value;
+    dedup_Vec3 value;
+/* @@protoc_insertion_point(struct:dedup_StampedCopy) */
+} dedup_StampedCopy;
+
+
+typedef struct _dedup_StampedPosition {
+    uint64_t time;
+    bool has_value;
+    dedup_Position value;
+/* @@protoc_insertion_point(struct:dedup_StampedPosition) */
+} dedup_StampedPosition;
+
+
+/* Initializer values for message structs */
+#define dedup_Vec3_init_default                  {0, 0, 1}
+#define dedup_Position_init_default              {0, 0, 1}
+#define dedup_Velocity_init_default              {0, 0, 0}
+#define dedup_Stamped_init_default               {0, false, dedup_Vec3_init_default}
+#define dedup_StampedCopy_init_default           {0, false, dedup_Vec3_init_default}
+#define dedup_StampedPosition_init_default       {0, false, dedup_Position_init_default}
+#define dedup_Vec3_init_zero                     {0, 0, 0}
+#define dedup_Position_init_zero                 {0, 0, 0}
+#define dedup_Velocity_init_zero                 {0, 0, 0}
+#define dedup_Stamped_init_zero                  {0, false, dedup_Vec3_init_zero}
+#define dedup_StampedCopy_init_zero              {0, false, dedup_Vec3_init_zero}
+#define dedup_StampedPosition_init_zero          {0, false, dedup_Position_init_zero}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define dedup_Position_x_tag                     1
+#define dedup_Position_y_tag                     2
+#define dedup_Position_z_tag                     3
+#define dedup_Vec3_x_tag                         1
+#define dedup_Vec3_y_tag                         2
+#define dedup_Vec3_z_tag                         3
+#define dedup_Velocity_x_tag                     1
+#define dedup_Velocity_y_tag                     2
+#define dedup_Velocity_z_tag                     3
+#define dedup_Stamped_time_tag                   1
+#define dedup_Stamped_value_tag                  2
+#define dedup_StampedCopy_time_tag               1
+#define dedup_StampedCopy_value_tag              2
+#define dedup_StampedPosition_time_tag           1
+#define dedup_StampedPosition_value_tag          2
+
+/* Struct field encoding specification for nanopb */
+#define dedup_Vec3_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, FLOAT, x, 1) \
+X(a, STATIC, REQUIRED, FLOAT, y, 2) \
+X(a, STATIC, REQUIRED, FLOAT, z, 3)
+#define dedup_Vec3_CALLBACK NULL
+#define dedup_Vec3_DEFAULT (const uint8_t*)"\x1d\x00\x00\x80\x3f\x00"
+#define dedup_Vec3_DEFAULT_INSTANCE &dedup_Vec3_default_instance
+#define dedup_Vec3_FIELD_RECORDS NULL
+#define dedup_Vec3_MSGFLAGS 0
+
+#define dedup_Position_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, FLOAT, x, 1) \
+X(a, STATIC, REQUIRED, FLOAT, y, 2) \
+X(a, STATIC, REQUIRED, FLOAT, z, 3)
+#define dedup_Position_CALLBACK NULL
+#define dedup_Position_DEFAULT dedup_Vec3_DEFAULT
+#define dedup_Position_DEFAULT_INSTANCE dedup_Vec3_DEFAULT_INSTANCE
+#define dedup_Position_FIELD_RECORDS NULL
+#define dedup_Position_MSGFLAGS 0
+
+#define dedup_Velocity_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, FLOAT, x, 1) \
+X(a, STATIC, REQUIRED, FLOAT, y, 2) \
+X(a, STATIC, REQUIRED, FLOAT, z, 3)
+#define dedup_Velocity_CALLBACK NULL
+#define dedup_Velocity_DEFAULT NULL
+#define dedup_Velocity_DEFAULT_INSTANCE &dedup_Velocity_default_instance
+#define dedup_Velocity_FIELD_RECORDS NULL
+#define dedup_Velocity_MSGFLAGS 0
+
+#define dedup_Stamped_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT64, time, 1) \
+X(a, STATIC, OPTIONAL, MESSAGE, value, 2)
+#define dedup_Stamped_CALLBACK NULL
+#define dedup_Stamped_DEFAULT NULL
+#define dedup_Stamped_DEFAULT_INSTANCE &dedup_Stamped_default_instance
+#define dedup_Stamped_FIELD_RECORDS NULL
+#define dedup_Stamped_MSGFLAGS 0
+#define dedup_Stamped_value_MSGTYPE dedup_Vec3
+
+#define dedup_StampedCopy_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT64, time, 1) \
+X(a, STATIC, OPTIONAL, MESSAGE, value, 2)
+#define dedup_StampedCopy_CALLBACK NULL
+#define dedup_StampedCopy_DEFAULT dedup_Stamped_DEFAULT
+#define dedup_StampedCopy_DEFAULT_INSTANCE dedup_Stamped_DEFAULT_INSTANCE
+#define dedup_StampedCopy_FIELD_RECORDS NULL
+#define dedup_StampedCopy_MSGFLAGS 0
+#define dedup_StampedCopy_value_MSGTYPE dedup_Vec3
+
+#define dedup_StampedPosition_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT64, time, 1) \
+X(a, STATIC, OPTIONAL, MESSAGE, value, 2)
+#define dedup_StampedPosition_CALLBACK NULL
+#define dedup_StampedPosition_DEFAULT NULL
+#define dedup_StampedPosition_DEFAULT_INSTANCE &dedup_StampedPosition_default_instance
+#define dedup_StampedPosition_FIELD_RECORDS NULL
+#define dedup_StampedPosition_MSGFLAGS 0
+#define dedup_StampedPosition_value_MSGTYPE dedup_Position
+
+extern const pb_msgdesc_t dedup_Vec3_msg;
+extern const pb_msgdesc_t dedup_Position_msg;
+extern const pb_msgdesc_t dedup_Velocity_msg;
+extern const pb_msgdesc_t dedup_Stamped_msg;
+extern const pb_msgdesc_t dedup_StampedCopy_msg;
+extern const pb_msgdesc_t dedup_StampedPosition_msg;
+extern const dedup_Vec3 dedup_Vec3_default_instance;
+extern const dedup_Velocity dedup_Velocity_default_instance;
+extern const dedup_Stamped dedup_Stamped_default_instance;
+extern const dedup_StampedPosition dedup_StampedPosition_default_instance;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define dedup_Vec3_fields &dedup_Vec3_msg
+#define dedup_Position_fields &dedup_Position_msg
+#define dedup_Velocity_fields &dedup_Velocity_msg
+#define dedup_Stamped_fields &dedup_Stamped_msg
+#define dedup_StampedCopy_fields &dedup_StampedCopy_msg
+#define dedup_StampedPosition_fields &dedup_StampedPosition_msg
+
+/* Maximum encoded size of messages (where known) */
+#define dedup_Vec3_size                          15
+#define dedup_Position_size                      15
+#define dedup_Velocity_size                      15
+#define dedup_Stamped_size                       28
+#define dedup_StampedCopy_size                   28
+#define dedup_StampedPosition_size               28
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,37 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "default_instance.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+const Settings Settings_default_instance = Settings_init_default;
+PB_BIND_EXT(Settings, Settings, AUTO)
+
+
+const Config Config_default_instance = Config_init_default;
+PB_BIND_EXT(Config, Config, AUTO)
+
+
+PB_BIND(WithCallback, WithCallback, AUTO)
+
+
+PB_BIND(ContainsCallback, ContainsCallback, AUTO)
+
+
+PB_BIND(NoInstance, NoInstance, AUTO)
+
+
+
+
+/* On some platforms (such as AVR), double is really float.
+ * Using double on these platforms is not directly supported
+ * by nanopb, but see example_avr_double.
+ * To get rid of this error, remove any double fields from your .proto.
+ */
+PB_STATIC_ASSERT(sizeof(double) == 8, DOUBLE_MUST_BE_8_BYTES)
+
+/* @@protoc_insertion_point(eof) */
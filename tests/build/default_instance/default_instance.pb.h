@@ -0,0 +1,178 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_DEFAULT_INSTANCE_PB_H_INCLUDED
+#define PB_DEFAULT_INSTANCE_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Enum definitions */
+typedef enum _Mode {
+    Mode_MODE_FIRST = 1,
+    Mode_MODE_SECOND = 2
+} Mode;
+#define _Mode_MIN Mode_MODE_FIRST
+#define _Mode_MAX Mode_MODE_SECOND
+#define _Mode_ARRAYSIZE ((Mode)(Mode_MODE_SECOND+1))
+
+/* Struct definitions */
+typedef struct _NoInstance {
+    bool has_rate;
+    int32_t rate;
+/* @@protoc_insertion_point(struct:NoInstance) */
+} NoInstance;
+
+
+typedef struct _Settings {
+    bool has_rate;
+    int32_t rate;
+    bool has_name;
+    char name[16];
+    bool has_mode;
+    Mode mode;
+    pb_size_t values_count;
+    uint32_t values[4];
+/* @@protoc_insertion_point(struct:Settings) */
+} Settings;
+
+
+typedef struct _WithCallback {
+    bool has_rate;
+    int32_t rate;
+    pb_callback_t name;
+/* @@protoc_insertion_point(struct:WithCallback) */
+} WithCallback;
+
+
+typedef struct _Config {
+    Settings settings;
+    bool has_gain;
+    double gain;
+    pb_size_t which_choice;
+    union {
+        int32_t number;
+        Settings other;
+    } choice;
+/* @@protoc_insertion_point(struct:Config) */
+} Config;
+
+
+typedef struct _ContainsCallback {
+    WithCallback inner;
+/* @@protoc_insertion_point(struct:ContainsCallback) */
+} ContainsCallback;
+
+
+/* Initializer values for message structs */
+#define Settings_init_default                    {false, 100, false, "sensor", false, Mode_MODE_SECOND, 0, {0}}
+#define Config_init_default                      {Settings_init_default, false, 1.5, 0, {7}}
+#define WithCallback_init_default                {false, 100, {{NULL}, NULL}}
+#define ContainsCallback_init_default            {WithCallback_init_default}
+#define NoInstance_init_default                  {false, 100}
+#define Settings_init_zero                       {false, 0, false, "", false, _Mode_MIN, 0, {0}}
+#define Config_init_zero                         {Settings_init_zero, false, 0, 0, {0}}
+#define WithCallback_init_zero                   {false, 0, {{NULL}, NULL}}
+#define ContainsCallback_init_zero               {WithCallback_init_zero}
+#define NoInstance_init_zero                     {false, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define NoInstance_rate_tag                      1
+#define Settings_rate_tag                        1
+#define Settings_name_tag                        2
+#define Settings_mode_tag                        3
+#define Settings_values_tag                      4
+#define WithCallback_rate_tag                    1
+#define WithCallback_name_tag                    2
+#define Config_number_tag                        3
+#define Config_other_tag                         4
+#define Config_settings_tag                      1
+#define Config_gain_tag                          2
+#define ContainsCallback_inner_tag               1
+
+/* Struct field encoding specification for nanopb */
+#define Settings_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, INT32, rate, 1) \
+X(a, STATIC, OPTIONAL, STRING, name, 2) \
+X(a, STATIC, OPTIONAL, UENUM, mode, 3) \
+X(a, STATIC, REPEATED, FIXED32, values, 4)
+#define Settings_CALLBACK NULL
+#define Settings_DEFAULT (const uint8_t*)"\x08\x64\x12\x06\x73\x65\x6e\x73\x6f\x72\x18\x02\x00"
+#define Settings_DEFAULT_INSTANCE &Settings_default_instance
+#define Settings_FIELD_RECORDS NULL
+#define Settings_MSGFLAGS 0
+
+#define Config_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, settings, 1) \
+X(a, STATIC, OPTIONAL, DOUBLE, gain, 2) \
+X(a, STATIC, ONEOF, INT32, (choice,number,choice.number), 3) \
+X(a, STATIC, ONEOF, MESSAGE, (choice,other,choice.other), 4)
+#define Config_CALLBACK NULL
+#define Config_DEFAULT (const uint8_t*)"\x11\x00\x00\x00\x00\x00\x00\xf8\x3f\x00"
+#define Config_DEFAULT_INSTANCE &Config_default_instance
+#define Config_FIELD_RECORDS NULL
+#define Config_MSGFLAGS 0
+#define Config_settings_MSGTYPE Settings
+#define Config_choice_other_MSGTYPE Settings
+
+#define WithCallback_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, INT32, rate, 1) \
+X(a, CALLBACK, OPTIONAL, STRING, name, 2)
+#define WithCallback_CALLBACK pb_default_field_callback
+#define WithCallback_DEFAULT (const uint8_t*)"\x08\x64\x00"
+#define WithCallback_DEFAULT_INSTANCE NULL
+#define WithCallback_FIELD_RECORDS NULL
+#define WithCallback_MSGFLAGS 0
+
+#define ContainsCallback_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, inner, 1)
+#define ContainsCallback_CALLBACK NULL
+#define ContainsCallback_DEFAULT NULL
+#define ContainsCallback_DEFAULT_INSTANCE NULL
+#define ContainsCallback_FIELD_RECORDS NULL
+#define ContainsCallback_MSGFLAGS 0
+#define ContainsCallback_inner_MSGTYPE WithCallback
+
+#define NoInstance_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, INT32, rate, 1)
+#define NoInstance_CALLBACK NULL
+#define NoInstance_DEFAULT (const uint8_t*)"\x08\x64\x00"
+#define NoInstance_DEFAULT_INSTANCE NULL
+#define NoInstance_FIELD_RECORDS NULL
+#define NoInstance_MSGFLAGS 0
+
+extern const pb_msgdesc_t Settings_msg;
+extern const pb_msgdesc_t Config_msg;
+extern const pb_msgdesc_t WithCallback_msg;
+extern const pb_msgdesc_t ContainsCallback_msg;
+extern const pb_msgdesc_t NoInstance_msg;
+extern const Settings Settings_default_instance;
+extern const Config Config_default_instance;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Settings_fields &Settings_msg
+#define Config_fields &Config_msg
+#define WithCallback_fields &WithCallback_msg
+#define ContainsCallback_fields &ContainsCallback_msg
+#define NoInstance_fields &NoInstance_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Settings_size                            50
+#define Config_size                              113
+/* WithCallback_size depends on runtime parameters */
+/* ContainsCallback_size depends on runtime parameters */
+#define NoInstance_size                          11
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
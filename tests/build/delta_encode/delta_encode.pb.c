@@ -0,0 +1,21 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "delta_encode.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(Sensor, Sensor, AUTO)
+
+
+PB_BIND(Status, Status, 2)
+
+
+PB_BIND(Uncompared, Uncompared, AUTO)
+
+
+
+/* @@protoc_insertion_point(eof) */
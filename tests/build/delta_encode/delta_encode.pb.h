@@ -0,0 +1,143 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_DELTA_ENCODE_PB_H_INCLUDED
+#define PB_DELTA_ENCODE_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Sensor {
+    uint32_t id;
+    bool has_value;
+    float value;
+    bool has_unit;
+    char unit[8];
+/* @@protoc_insertion_point(struct:Sensor) */
+} Sensor;
+
+
+typedef struct _Uncompared {
+    bool has_value;
+    uint32_t value;
+/* @@protoc_insertion_point(struct:Uncompared) */
+} Uncompared;
+
+
+typedef PB_BYTES_ARRAY_T(16) Status_blob_t;
+typedef struct _Status {
+    uint32_t seq;
+    bool has_temperature;
+    int32_t temperature;
+    bool has_mode;
+    char mode[16];
+    pb_size_t sensors_count;
+    Sensor sensors[8];
+    bool has_main;
+    Sensor main;
+    pb_size_t history_count;
+    int32_t history[16];
+    pb_size_t which_state;
+    union {
+        uint32_t code;
+        Sensor fault;
+    } state;
+    bool has_blob;
+    Status_blob_t blob;
+/* @@protoc_insertion_point(struct:Status) */
+} Status;
+
+
+/* Initializer values for message structs */
+#define Sensor_init_default                      {0, false, 0, false, ""}
+#define Status_init_default                      {0, false, 0, false, "", 0, {Sensor_init_default}, false, Sensor_init_default, 0, {0}, 0, {0}, false, {0, {0}}}
+#define Uncompared_init_default                  {false, 0}
+#define Sensor_init_zero                         {0, false, 0, false, ""}
+#define Status_init_zero                         {0, false, 0, false, "", 0, {Sensor_init_zero}, false, Sensor_init_zero, 0, {0}, 0, {0}, false, {0, {0}}}
+#define Uncompared_init_zero                     {false, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Sensor_id_tag                            1
+#define Sensor_value_tag                         2
+#define Sensor_unit_tag                          3
+#define Uncompared_value_tag                     1
+#define Status_code_tag                          7
+#define Status_fault_tag                         8
+#define Status_seq_tag                           1
+#define Status_temperature_tag                   2
+#define Status_mode_tag                          3
+#define Status_sensors_tag                       4
+#define Status_main_tag                          5
+#define Status_history_tag                       6
+#define Status_blob_tag                          9
+
+/* Struct field encoding specification for nanopb */
+#define Sensor_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT32, id, 1) \
+X(a, STATIC, OPTIONAL, FLOAT, value, 2) \
+X(a, STATIC, OPTIONAL, STRING, unit, 3)
+#define Sensor_CALLBACK NULL
+#define Sensor_DEFAULT NULL
+#define Sensor_DEFAULT_INSTANCE NULL
+#define Sensor_FIELD_RECORDS NULL
+#define Sensor_MSGFLAGS 0
+
+#define Status_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT32, seq, 1) \
+X(a, STATIC, OPTIONAL, INT32, temperature, 2) \
+X(a, STATIC, OPTIONAL, STRING, mode, 3) \
+X(a, STATIC, REPEATED, MESSAGE, sensors, 4) \
+X(a, STATIC, OPTIONAL, MESSAGE, main, 5) \
+X(a, STATIC, REPEATED, INT32, history, 6) \
+X(a, STATIC, ONEOF, UINT32, (state,code,state.code), 7) \
+X(a, STATIC, ONEOF, MESSAGE, (state,fault,state.fault), 8) \
+X(a, STATIC, OPTIONAL, BYTES, blob, 9)
+#define Status_CALLBACK NULL
+#define Status_DEFAULT NULL
+#define Status_DEFAULT_INSTANCE NULL
+#define Status_FIELD_RECORDS NULL
+#define Status_MSGFLAGS 0
+#define Status_sensors_MSGTYPE Sensor
+#define Status_main_MSGTYPE Sensor
+#define Status_state_fault_MSGTYPE Sensor
+
+#define Uncompared_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, UINT32, value, 1)
+#define Uncompared_CALLBACK NULL
+#define Uncompared_DEFAULT NULL
+#define Uncompared_DEFAULT_INSTANCE NULL
+#define Uncompared_FIELD_RECORDS NULL
+#define Uncompared_MSGFLAGS 0
+
+extern const pb_msgdesc_t Sensor_msg;
+extern const pb_msgdesc_t Status_msg;
+extern const pb_msgdesc_t Uncompared_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Sensor_fields &Sensor_msg
+#define Status_fields &Status_msg
+#define Uncompared_fields &Uncompared_msg
+
+/* Comparison of message structures, used with pb_encode_delta() */
+#define Sensor_equal(a, b)                       pb_message_equal(Sensor_fields, (a), (b))
+#define Status_equal(a, b)                       pb_message_equal(Status_fields, (a), (b))
+
+/* Maximum encoded size of messages (where known) */
+#define Sensor_size                              20
+#define Status_size                              448
+#define Uncompared_size                          6
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
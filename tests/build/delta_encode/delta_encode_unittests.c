@@ -0,0 +1,184 @@
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include "unittests.h"
+#include "delta_encode.pb.h"
+
+static void make_status(Status *msg)
+{
+    memset(msg, 0, sizeof(*msg));
+    msg->seq = 1;
+    msg->has_temperature = true;
+    msg->temperature = 25;
+    msg->has_mode = true;
+    strcpy(msg->mode, "normal");
+    msg->sensors_count = 2;
+    msg->sensors[0].id = 10;
+    msg->sensors[0].has_value = true;
+    msg->sensors[0].value = 1.5f;
+    msg->sensors[1].id = 11;
+    msg->sensors[1].has_unit = true;
+    strcpy(msg->sensors[1].unit, "mV");
+    msg->has_main = true;
+    msg->main.id = 1;
+    msg->main.has_value = true;
+    msg->main.value = 3.25f;
+    msg->main.has_unit = true;
+    strcpy(msg->main.unit, "degC");
+    msg->history_count = 3;
+    msg->history[0] = 20;
+    msg->history[1] = 21;
+    msg->history[2] = 23;
+    msg->which_state = Status_code_tag;
+    msg->state.code = 5;
+    msg->has_blob = true;
+    msg->blob.size = 4;
+    memcpy(msg->blob.bytes, "\x01\x02\x03\x04", 4);
+}
+
+/* Decode a delta on top of a copy of the previous message */
+static bool apply_delta(const Status *prev, const pb_byte_t *data, size_t size, Status *result)
+{
+    pb_istream_t stream = pb_istream_from_buffer(data, size);
+    *result = *prev;
+    return pb_decode_noinit(&stream, Status_fields, result) && stream.bytes_left == 0;
+}
+
+int main()
+{
+    int status = 0;
+    pb_byte_t buffer[512];
+    size_t full_size;
+    Status prev;
+    Status cur;
+    Status result;
+
+    make_status(&prev);
+    TEST(pb_get_encoded_size(&full_size, Status_fields, &prev));
+
+    {
+        COMMENT("Comparison of message structures");
+        make_status(&cur);
+        TEST(Status_equal(&prev, &cur));
+        cur.sensors[1].unit[1] = 'A';
+        TEST(!Status_equal(&prev, &cur));
+        make_status(&cur);
+        cur.has_temperature = false;
+        TEST(!Status_equal(&prev, &cur));
+        make_status(&cur);
+        cur.history[5] = 99; /* Past the end of the array */
+        cur.mode[10] = 'x';  /* Past the terminating null */
+        TEST(Status_equal(&prev, &cur));
+    }
+
+    {
+        pb_ostream_t stream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+
+        COMMENT("Unchanged message encodes only required fields");
+        make_status(&cur);
+        cur.seq = 2;
+        TEST(pb_encode_delta(&stream, Status_fields, &prev, &cur));
+        TEST(stream.bytes_written == 2);
+        TEST(apply_delta(&prev, buffer, stream.bytes_written, &result));
+        TEST(Status_equal(&result, &cur));
+    }
+
+    {
+        pb_ostream_t stream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+
+        COMMENT("Changed fields are merged into the previous message");
+        make_status(&cur);
+        cur.seq = 2;
+        cur.temperature = 26;
+        strcpy(cur.mode, "eco");
+        cur.main.value = 3.5f;
+        cur.sensors_count = 3;
+        cur.sensors[2].id = 12;
+        cur.history_count = 4;
+        cur.history[3] = 24;
+        cur.which_state = Status_fault_tag;
+        cur.state.fault.id = 7;
+        TEST(pb_encode_delta(&stream, Status_fields, &prev, &cur));
+        TEST(stream.bytes_written < full_size);
+        TEST(apply_delta(&prev, buffer, stream.bytes_written, &result));
+        TEST(Status_equal(&result, &cur));
+        TEST(result.main.has_unit && strcmp(result.main.unit, "degC") == 0);
+    }
+
+    {
+        pb_ostream_t stream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+
+        COMMENT("Optional field added");
+        prev.has_temperature = false;
+        make_status(&cur);
+        TEST(pb_encode_delta(&stream, Status_fields, &prev, &cur));
+        TEST(apply_delta(&prev, buffer, stream.bytes_written, &result));
+        TEST(Status_equal(&result, &cur));
+        make_status(&prev);
+    }
+
+    {
+        pb_ostream_t stream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+
+        COMMENT("Removed optional field cannot be encoded");
+        make_status(&cur);
+        cur.has_main = false;
+        TEST(!pb_encode_delta(&stream, Status_fields, &prev, &cur));
+        TEST(strcmp(PB_GET_ERROR(&stream), "delta not representable") == 0);
+    }
+
+    {
+        pb_ostream_t stream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+
+        COMMENT("Cleared oneof cannot be encoded");
+        make_status(&cur);
+        cur.which_state = 0;
+        TEST(!pb_encode_delta(&stream, Status_fields, &prev, &cur));
+        TEST(strcmp(PB_GET_ERROR(&stream), "delta not representable") == 0);
+    }
+
+    {
+        pb_ostream_t stream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+
+        COMMENT("Changed array entry cannot be encoded");
+        make_status(&cur);
+        cur.sensors[0].value = 2.0f;
+        TEST(!pb_encode_delta(&stream, Status_fields, &prev, &cur));
+        TEST(strcmp(PB_GET_ERROR(&stream), "delta not representable") == 0);
+
+        stream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+        make_status(&cur);
+        cur.history_count = 2;
+        TEST(!pb_encode_delta(&stream, Status_fields, &prev, &cur));
+        TEST(strcmp(PB_GET_ERROR(&stream), "delta not representable") == 0);
+    }
+
+    {
+        pb_ostream_t stream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+
+        COMMENT("Changed oneof submessage is merged into the previous value");
+        prev.which_state = Status_fault_tag;
+        prev.state.fault.id = 7;
+        prev.state.fault.has_unit = true;
+        strcpy(prev.state.fault.unit, "degC");
+        cur = prev;
+        cur.state.fault.has_value = true;
+        cur.state.fault.value = 3;
+        TEST(pb_encode_delta(&stream, Status_fields, &prev, &cur));
+        TEST(apply_delta(&prev, buffer, stream.bytes_written, &result));
+        TEST(Status_equal(&result, &cur));
+
+        COMMENT("Field cleared in oneof submessage cannot be encoded");
+        stream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+        cur.state.fault.has_unit = false;
+        TEST(!pb_encode_delta(&stream, Status_fields, &prev, &cur));
+        TEST(strcmp(PB_GET_ERROR(&stream), "delta not representable") == 0);
+        make_status(&prev);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
@@ -0,0 +1,44 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_ENUM_PB_H_INCLUDED
+#define PB_ENUM_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Enum definitions */
+typedef enum _MyEnum {
+    MyEnum_VALUE1 = 1,
+    MyEnum_VALUE2 = 2,
+    MyEnum_VALUE15 = 15
+} MyEnum;
+#define _MyEnum_MIN MyEnum_VALUE1
+#define _MyEnum_MAX MyEnum_VALUE15
+#define _MyEnum_ARRAYSIZE ((MyEnum)(MyEnum_VALUE15+1))
+const char *MyEnum_name(MyEnum v);
+
+
+typedef enum _MyShortNameEnum {
+    MSNE_VALUE256 = 256
+} MyShortNameEnum;
+#define _MyShortNameEnum_MIN MSNE_VALUE256
+#define _MyShortNameEnum_MAX MSNE_VALUE256
+#define _MyShortNameEnum_ARRAYSIZE ((MyShortNameEnum)(MSNE_VALUE256+1))
+#define MyShortNameEnum_MSNE_VALUE256 MSNE_VALUE256
+const char *MyShortNameEnum_name(MyShortNameEnum v);
+
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,117 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "alltypes.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+const pb_field_record_t SubMessage_field_records[] =
+{
+    PB_FIELD_RECORD(SubMessage, STATIC, REQUIRED, STRING, substuff1, 1, 0, 0),
+    PB_FIELD_RECORD(SubMessage, STATIC, REQUIRED, INT32, substuff2, 2, 0, 1),
+    PB_FIELD_RECORD(SubMessage, STATIC, OPTIONAL, FIXED32, substuff3, 3, 0, 2),
+};
+PB_BIND_EXT(SubMessage, SubMessage, AUTO)
+
+
+PB_BIND(EmptyMessage, EmptyMessage, AUTO)
+
+
+const pb_field_record_t Limits_field_records[] =
+{
+    PB_FIELD_RECORD(Limits, STATIC, REQUIRED, INT32, int32_min, 1, 0, 0),
+    PB_FIELD_RECORD(Limits, STATIC, REQUIRED, INT32, int32_max, 2, 0, 1),
+    PB_FIELD_RECORD(Limits, STATIC, REQUIRED, UINT32, uint32_min, 3, 0, 2),
+    PB_FIELD_RECORD(Limits, STATIC, REQUIRED, UINT32, uint32_max, 4, 0, 3),
+    PB_FIELD_RECORD(Limits, STATIC, REQUIRED, INT64, int64_min, 5, 0, 4),
+    PB_FIELD_RECORD(Limits, STATIC, REQUIRED, INT64, int64_max, 6, 0, 5),
+    PB_FIELD_RECORD(Limits, STATIC, REQUIRED, UINT64, uint64_min, 7, 0, 6),
+    PB_FIELD_RECORD(Limits, STATIC, REQUIRED, UINT64, uint64_max, 8, 0, 7),
+    PB_FIELD_RECORD(Limits, STATIC, REQUIRED, ENUM, enum_min, 9, 0, 8),
+    PB_FIELD_RECORD(Limits, STATIC, REQUIRED, ENUM, enum_max, 10, 0, 9),
+};
+PB_BIND_EXT(Limits, Limits, AUTO)
+
+
+const pb_field_record_t AllTypes_field_records[] =
+{
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, INT32, req_int32, 1, 0, 0),
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, INT64, req_int64, 2, 0, 1),
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, UINT32, req_uint32, 3, 0, 2),
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, UINT64, req_uint64, 4, 0, 3),
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, SINT32, req_sint32, 5, 0, 4),
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, SINT64, req_sint64, 6, 0, 5),
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, BOOL, req_bool, 7, 0, 6),
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, FIXED32, req_fixed32, 8, 0, 7),
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, SFIXED32, req_sfixed32, 9, 0, 8),
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, FLOAT, req_float, 10, 0, 9),
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, FIXED64, req_fixed64, 11, 0, 10),
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, SFIXED64, req_sfixed64, 12, 0, 11),
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, DOUBLE, req_double, 13, 0, 12),
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, STRING, req_string, 14, 0, 13),
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, BYTES, req_bytes, 15, 0, 14),
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, MESSAGE, req_submsg, 16, 0, 15),
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, UENUM, req_enum, 17, 1, 16),
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, MESSAGE, req_emptymsg, 18, 1, 17),
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, FIXED_LENGTH_BYTES, req_fbytes, 19, 2, 18),
+    PB_FIELD_RECORD(AllTypes, STATIC, REPEATED, INT32, rep_int32, 21, 2, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, REPEATED, INT64, rep_int64, 22, 2, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, REPEATED, UINT32, rep_uint32, 23, 2, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, REPEATED, UINT64, rep_uint64, 24, 2, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, REPEATED, SINT32, rep_sint32, 25, 2, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, REPEATED, SINT64, rep_sint64, 26, 2, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, REPEATED, BOOL, rep_bool, 27, 2, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, REPEATED, FIXED32, rep_fixed32, 28, 2, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, REPEATED, SFIXED32, rep_sfixed32, 29, 2, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, REPEATED, FLOAT, rep_float, 30, 2, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, REPEATED, FIXED64, rep_fixed64, 31, 2, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, REPEATED, SFIXED64, rep_sfixed64, 32, 2, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, REPEATED, DOUBLE, rep_double, 33, 2, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, REPEATED, STRING, rep_string, 34, 2, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, REPEATED, BYTES, rep_bytes, 35, 2, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, REPEATED, MESSAGE, rep_submsg, 36, 2, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, REPEATED, UENUM, rep_enum, 37, 3, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, REPEATED, MESSAGE, rep_emptymsg, 38, 3, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, REPEATED, FIXED_LENGTH_BYTES, rep_fbytes, 39, 4, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, OPTIONAL, INT32, opt_int32, 41, 4, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, OPTIONAL, INT64, opt_int64, 42, 4, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, OPTIONAL, UINT32, opt_uint32, 43, 4, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, OPTIONAL, UINT64, opt_uint64, 44, 4, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, OPTIONAL, SINT32, opt_sint32, 45, 4, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, OPTIONAL, SINT64, opt_sint64, 46, 4, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, OPTIONAL, BOOL, opt_bool, 47, 4, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, OPTIONAL, FIXED32, opt_fixed32, 48, 4, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, OPTIONAL, SFIXED32, opt_sfixed32, 49, 4, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, OPTIONAL, FLOAT, opt_float, 50, 4, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, OPTIONAL, FIXED64, opt_fixed64, 51, 4, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, OPTIONAL, SFIXED64, opt_sfixed64, 52, 4, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, OPTIONAL, DOUBLE, opt_double, 53, 4, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, OPTIONAL, STRING, opt_string, 54, 4, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, OPTIONAL, BYTES, opt_bytes, 55, 4, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, OPTIONAL, MESSAGE, opt_submsg, 56, 4, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, OPTIONAL, UENUM, opt_enum, 57, 5, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, OPTIONAL, MESSAGE, opt_emptymsg, 58, 5, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, OPTIONAL, FIXED_LENGTH_BYTES, opt_fbytes, 59, 6, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, ONEOF, MESSAGE, (oneof,oneof_msg1,oneof.oneof_msg1), 60, 6, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, ONEOF, MESSAGE, (oneof,oneof_msg2,oneof.oneof_msg2), 61, 7, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, MESSAGE, req_limits, 98, 8, 19),
+    PB_FIELD_RECORD(AllTypes, STATIC, REQUIRED, INT32, end, 99, 9, 20),
+    PB_FIELD_RECORD(AllTypes, CALLBACK, OPTIONAL, EXTENSION, extensions, 200, 9, 21),
+};
+PB_BIND_EXT(AllTypes, AllTypes, 2)
+
+
+
+
+
+/* On some platforms (such as AVR), double is really float.
+ * Using double on these platforms is not directly supported
+ * by nanopb, but see example_avr_double.
+ * To get rid of this error, remove any double fields from your .proto.
+ */
+PB_STATIC_ASSERT(sizeof(double) == 8, DOUBLE_MUST_BE_8_BYTES)
+
+/* @@protoc_insertion_point(eof) */
@@ -0,0 +1,57 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "extensions.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(ExtensionMessage, ExtensionMessage, AUTO)
+
+
+/* Definition for extension field AllTypes_extensionfield1 */
+typedef struct _AllTypes_extensionfield1_extmsg {
+    int32_t AllTypes_extensionfield1;
+/* @@protoc_insertion_point(struct:AllTypes_extensionfield1_extmsg) */
+} AllTypes_extensionfield1_extmsg;
+#define AllTypes_extensionfield1_extmsg_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, AllTypes_extensionfield1, 255)
+#define AllTypes_extensionfield1_extmsg_CALLBACK NULL
+#define AllTypes_extensionfield1_extmsg_DEFAULT NULL
+#define AllTypes_extensionfield1_extmsg_DEFAULT_INSTANCE NULL
+#define AllTypes_extensionfield1_extmsg_FIELD_RECORDS NULL
+#define AllTypes_extensionfield1_extmsg_MSGFLAGS 0
+pb_byte_t AllTypes_extensionfield1_extmsg_default[] = {0x00};
+PB_BIND(AllTypes_extensionfield1_extmsg, AllTypes_extensionfield1_extmsg, 2)
+const pb_extension_type_t AllTypes_extensionfield1 = {
+    NULL,
+    NULL,
+    &AllTypes_extensionfield1_extmsg_msg
+};
+
+/* Definition for extension field ExtensionMessage_AllTypes_extensionfield2 */
+typedef struct _ExtensionMessage_AllTypes_extensionfield2_extmsg {
+    ExtensionMessage AllTypes_extensionfield2;
+/* @@protoc_insertion_point(struct:ExtensionMessage_AllTypes_extensionfield2_extmsg) */
+} ExtensionMessage_AllTypes_extensionfield2_extmsg;
+#define ExtensionMessage_AllTypes_extensionfield2_extmsg_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, AllTypes_extensionfield2, 254)
+#define ExtensionMessage_AllTypes_extensionfield2_extmsg_CALLBACK NULL
+#define ExtensionMessage_AllTypes_extensionfield2_extmsg_DEFAULT NULL
+#define ExtensionMessage_AllTypes_extensionfield2_extmsg_DEFAULT_INSTANCE NULL
+#define ExtensionMessage_AllTypes_extensionfield2_extmsg_FIELD_RECORDS NULL
+#define ExtensionMessage_AllTypes_extensionfield2_extmsg_MSGFLAGS 0
+#define ExtensionMessage_AllTypes_extensionfield2_extmsg_AllTypes_extensionfield2_MSGTYPE ExtensionMessage
+pb_byte_t ExtensionMessage_AllTypes_extensionfield2_extmsg_default[] = {0x00};
+PB_BIND(ExtensionMessage_AllTypes_extensionfield2_extmsg, ExtensionMessage_AllTypes_extensionfield2_extmsg, 2)
+const pb_extension_type_t ExtensionMessage_AllTypes_extensionfield2 = {
+    NULL,
+    NULL,
+    &ExtensionMessage_AllTypes_extensionfield2_extmsg_msg
+};
+
+
+
+/* @@protoc_insertion_point(eof) */
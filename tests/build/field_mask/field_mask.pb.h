@@ -0,0 +1,143 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_FIELD_MASK_PB_H_INCLUDED
+#define PB_FIELD_MASK_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Point {
+    int32_t x;
+    int32_t y;
+    bool has_label;
+    char label[32];
+/* @@protoc_insertion_point(struct:Point) */
+} Point;
+
+
+typedef struct _Unmasked {
+    bool has_value;
+    uint32_t value;
+/* @@protoc_insertion_point(struct:Unmasked) */
+} Unmasked;
+
+
+typedef struct _Shape {
+    uint32_t id;
+    bool has_name;
+    char name[64];
+    pb_size_t points_count;
+    Point points[8];
+    bool has_center;
+    Point center;
+    pb_size_t which_kind;
+    union {
+        Point anchor;
+        uint32_t radius;
+    } kind;
+    pb_size_t values_count;
+    int32_t values[16];
+/* @@protoc_insertion_point(struct:Shape) */
+} Shape;
+
+
+/* Initializer values for message structs */
+#define Point_init_default                       {0, 0, false, ""}
+#define Shape_init_default                       {0, false, "", 0, {Point_init_default}, false, Point_init_default, 0, {Point_init_default}, 0, {0}}
+#define Unmasked_init_default                    {false, 0}
+#define Point_init_zero                          {0, 0, false, ""}
+#define Shape_init_zero                          {0, false, "", 0, {Point_init_zero}, false, Point_init_zero, 0, {Point_init_zero}, 0, {0}}
+#define Unmasked_init_zero                       {false, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Point_x_tag                              1
+#define Point_y_tag                              2
+#define Point_label_tag                          3
+#define Unmasked_value_tag                       1
+#define Shape_anchor_tag                         5
+#define Shape_radius_tag                         6
+#define Shape_id_tag                             1
+#define Shape_name_tag                           2
+#define Shape_points_tag                         3
+#define Shape_center_tag                         4
+#define Shape_values_tag                         7
+
+/* Field indexes for pb_decode_masked() */
+#define Point_x_index                            0
+#define Point_y_index                            1
+#define Point_label_index                        2
+#define Point_MASK_WORDS                         1
+#define Shape_id_index                           0
+#define Shape_name_index                         1
+#define Shape_points_index                       2
+#define Shape_center_index                       3
+#define Shape_anchor_index                       4
+#define Shape_radius_index                       5
+#define Shape_values_index                       6
+#define Shape_MASK_WORDS                         1
+
+/* Struct field encoding specification for nanopb */
+#define Point_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, x, 1) \
+X(a, STATIC, REQUIRED, INT32, y, 2) \
+X(a, STATIC, OPTIONAL, STRING, label, 3)
+#define Point_CALLBACK NULL
+#define Point_DEFAULT NULL
+#define Point_DEFAULT_INSTANCE NULL
+#define Point_FIELD_RECORDS NULL
+#define Point_MSGFLAGS 0
+
+#define Shape_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT32, id, 1) \
+X(a, STATIC, OPTIONAL, STRING, name, 2) \
+X(a, STATIC, REPEATED, MESSAGE, points, 3) \
+X(a, STATIC, OPTIONAL, MESSAGE, center, 4) \
+X(a, STATIC, ONEOF, MESSAGE, (kind,anchor,kind.anchor), 5) \
+X(a, STATIC, ONEOF, UINT32, (kind,radius,kind.radius), 6) \
+X(a, STATIC, REPEATED, INT32, values, 7)
+#define Shape_CALLBACK NULL
+#define Shape_DEFAULT NULL
+#define Shape_DEFAULT_INSTANCE NULL
+#define Shape_FIELD_RECORDS NULL
+#define Shape_MSGFLAGS 0
+#define Shape_points_MSGTYPE Point
+#define Shape_center_MSGTYPE Point
+#define Shape_kind_anchor_MSGTYPE Point
+
+#define Unmasked_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, UINT32, value, 1)
+#define Unmasked_CALLBACK NULL
+#define Unmasked_DEFAULT NULL
+#define Unmasked_DEFAULT_INSTANCE NULL
+#define Unmasked_FIELD_RECORDS NULL
+#define Unmasked_MSGFLAGS 0
+
+extern const pb_msgdesc_t Point_msg;
+extern const pb_msgdesc_t Shape_msg;
+extern const pb_msgdesc_t Unmasked_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Point_fields &Point_msg
+#define Shape_fields &Shape_msg
+#define Unmasked_fields &Unmasked_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Point_size                               55
+#define Shape_size                               817
+#define Unmasked_size                            6
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,382 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_ALLTYPES_POINTER_ALLTYPES_POINTER_PB_H_INCLUDED
+#define PB_ALLTYPES_POINTER_ALLTYPES_POINTER_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Enum definitions */
+typedef enum _alltypes_pointer_HugeEnum {
+    alltypes_pointer_HugeEnum_Negative = -2147483647,
+    alltypes_pointer_HugeEnum_Positive = 2147483647
+} alltypes_pointer_HugeEnum;
+#define _alltypes_pointer_HugeEnum_MIN alltypes_pointer_HugeEnum_Negative
+#define _alltypes_pointer_HugeEnum_MAX alltypes_pointer_HugeEnum_Positive
+#define _alltypes_pointer_HugeEnum_ARRAYSIZE ((alltypes_pointer_HugeEnum)(alltypes_pointer_HugeEnum_Positive+1))
+
+typedef enum _alltypes_pointer_MyEnum {
+    alltypes_pointer_MyEnum_Zero = 0,
+    alltypes_pointer_MyEnum_First = 1,
+    alltypes_pointer_MyEnum_Second = 2,
+    alltypes_pointer_MyEnum_Truth = 42
+} alltypes_pointer_MyEnum;
+#define _alltypes_pointer_MyEnum_MIN alltypes_pointer_MyEnum_Zero
+#define _alltypes_pointer_MyEnum_MAX alltypes_pointer_MyEnum_Truth
+#define _alltypes_pointer_MyEnum_ARRAYSIZE ((alltypes_pointer_MyEnum)(alltypes_pointer_MyEnum_Truth+1))
+
+/* Struct definitions */
+typedef struct _alltypes_pointer_AllTypes {
+    int32_t *req_int32;
+    int64_t *req_int64;
+    uint32_t *req_uint32;
+    uint64_t *req_uint64;
+    int32_t *req_sint32;
+    int64_t *req_sint64;
+    bool *req_bool;
+    uint32_t *req_fixed32;
+    int32_t *req_sfixed32;
+    float *req_float;
+    uint64_t *req_fixed64;
+    int64_t *req_sfixed64;
+    double *req_double;
+    char *req_string;
+    pb_bytes_array_t *req_bytes;
+    struct _alltypes_pointer_SubMessage *req_submsg;
+    alltypes_pointer_MyEnum *req_enum;
+    struct _alltypes_pointer_EmptyMessage *req_emptymsg;
+    pb_byte_t (*req_fbytes)[4];
+    pb_size_t rep_int32_count;
+    int32_t *rep_int32;
+    pb_size_t rep_int64_count;
+    int64_t *rep_int64;
+    pb_size_t rep_uint32_count;
+    uint32_t *rep_uint32;
+    pb_size_t rep_uint64_count;
+    uint64_t *rep_uint64;
+    pb_size_t rep_sint32_count;
+    int32_t *rep_sint32;
+    pb_size_t rep_sint64_count;
+    int64_t *rep_sint64;
+    pb_size_t rep_bool_count;
+    bool *rep_bool;
+    pb_size_t rep_fixed32_count;
+    uint32_t *rep_fixed32;
+    pb_size_t rep_sfixed32_count;
+    int32_t *rep_sfixed32;
+    pb_size_t rep_float_count;
+    float *rep_float;
+    pb_size_t rep_fixed64_count;
+    uint64_t *rep_fixed64;
+    pb_size_t rep_sfixed64_count;
+    int64_t *rep_sfixed64;
+    pb_size_t rep_double_count;
+    double *rep_double;
+    pb_size_t rep_string_count;
+    char **rep_string;
+    pb_size_t rep_bytes_count;
+    pb_bytes_array_t **rep_bytes;
+    pb_size_t rep_submsg_count;
+    struct _alltypes_pointer_SubMessage *rep_submsg;
+    pb_size_t rep_enum_count;
+    alltypes_pointer_MyEnum *rep_enum;
+    pb_size_t rep_emptymsg_count;
+    struct _alltypes_pointer_EmptyMessage *rep_emptymsg;
+    pb_size_t rep_fbytes_count;
+    pb_byte_t (*rep_fbytes)[4];
+    int32_t *opt_int32;
+    int64_t *opt_int64;
+    uint32_t *opt_uint32;
+    uint64_t *opt_uint64;
+    int32_t *opt_sint32;
+    int64_t *opt_sint64;
+    bool *opt_bool;
+    uint32_t *opt_fixed32;
+    int32_t *opt_sfixed32;
+    float *opt_float;
+    uint64_t *opt_fixed64;
+    int64_t *opt_sfixed64;
+    double *opt_double;
+    char *opt_string;
+    pb_bytes_array_t *opt_bytes;
+    struct _alltypes_pointer_SubMessage *opt_submsg;
+    alltypes_pointer_MyEnum *opt_enum;
+    struct _alltypes_pointer_EmptyMessage *opt_emptymsg;
+    pb_byte_t (*opt_fbytes)[4];
+    pb_size_t which_oneof;
+    union {
+        struct _alltypes_pointer_SubMessage *oneof_msg1;
+        struct _alltypes_pointer_EmptyMessage *oneof_msg2;
+    } oneof;
+    struct _alltypes_pointer_Limits *req_limits;
+    int32_t *end;
+    pb_extension_t *extensions;
+/* @@protoc_insertion_point(struct:alltypes_pointer_AllTypes) */
+} alltypes_pointer_AllTypes;
+
+
+typedef struct _alltypes_pointer_EmptyMessage {
+    char dummy_field;
+/* @@protoc_insertion_point(struct:alltypes_pointer_EmptyMessage) */
+} alltypes_pointer_EmptyMessage;
+
+
+typedef struct _alltypes_pointer_Limits {
+    int32_t *int32_min;
+    int32_t *int32_max;
+    uint32_t *uint32_min;
+    uint32_t *uint32_max;
+    int64_t *int64_min;
+    int64_t *int64_max;
+    uint64_t *uint64_min;
+    uint64_t *uint64_max;
+    alltypes_pointer_HugeEnum *enum_min;
+    alltypes_pointer_HugeEnum *enum_max;
+/* @@protoc_insertion_point(struct:alltypes_pointer_Limits) */
+} alltypes_pointer_Limits;
+
+
+typedef struct _alltypes_pointer_SubMessage {
+    char *substuff1;
+    int32_t *substuff2;
+    uint32_t *substuff3;
+/* @@protoc_insertion_point(struct:alltypes_pointer_SubMessage) */
+} alltypes_pointer_SubMessage;
+
+
+/* Initializer values for message structs */
+#define alltypes_pointer_SubMessage_init_default {NULL, NULL, NULL}
+#define alltypes_pointer_EmptyMessage_init_default {0}
+#define alltypes_pointer_Limits_init_default     {NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL}
+#define alltypes_pointer_AllTypes_init_default   {NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0, {NULL}, NULL, NULL, NULL}
+#define alltypes_pointer_SubMessage_init_zero    {NULL, NULL, NULL}
+#define alltypes_pointer_EmptyMessage_init_zero  {0}
+#define alltypes_pointer_Limits_init_zero        {NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL}
+#define alltypes_pointer_AllTypes_init_zero      {NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0, {NULL}, NULL, NULL, NULL}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define alltypes_pointer_AllTypes_oneof_msg1_tag 60
+#define alltypes_pointer_AllTypes_oneof_msg2_tag 61
+#define alltypes_pointer_AllTypes_req_int32_tag  1
+#define alltypes_pointer_AllTypes_req_int64_tag  2
+#define alltypes_pointer_AllTypes_req_uint32_tag 3
+#define alltypes_pointer_AllTypes_req_uint64_tag 4
+#define alltypes_pointer_AllTypes_req_sint32_tag 5
+#define alltypes_pointer_AllTypes_req_sint64_tag 6
+#define alltypes_pointer_AllTypes_req_bool_tag   7
+#define alltypes_pointer_AllTypes_req_fixed32_tag 8
+#define alltypes_pointer_AllTypes_req_sfixed32_tag 9
+#define alltypes_pointer_AllTypes_req_float_tag  10
+#define alltypes_pointer_AllTypes_req_fixed64_tag 11
+#define alltypes_pointer_AllTypes_req_sfixed64_tag 12
+#define alltypes_pointer_AllTypes_req_double_tag 13
+#define alltypes_pointer_AllTypes_req_string_tag 14
+#define alltypes_pointer_AllTypes_req_bytes_tag  15
+#define alltypes_pointer_AllTypes_req_submsg_tag 16
+#define alltypes_pointer_AllTypes_req_enum_tag   17
+#define alltypes_pointer_AllTypes_req_emptymsg_tag 18
+#define alltypes_pointer_AllTypes_req_fbytes_tag 19
+#define alltypes_pointer_AllTypes_rep_int32_tag  21
+#define alltypes_pointer_AllTypes_rep_int64_tag  22
+#define alltypes_pointer_AllTypes_rep_uint32_tag 23
+#define alltypes_pointer_AllTypes_rep_uint64_tag 24
+#define alltypes_pointer_AllTypes_rep_sint32_tag 25
+#define alltypes_pointer_AllTypes_rep_sint64_tag 26
+#define alltypes_pointer_AllTypes_rep_bool_tag   27
+#define alltypes_pointer_AllTypes_rep_fixed32_tag 28
+#define alltypes_pointer_AllTypes_rep_sfixed32_tag 29
+#define alltypes_pointer_AllTypes_rep_float_tag  30
+#define alltypes_pointer_AllTypes_rep_fixed64_tag 31
+#define alltypes_pointer_AllTypes_rep_sfixed64_tag 32
+#define alltypes_pointer_AllTypes_rep_double_tag 33
+#define alltypes_pointer_AllTypes_rep_string_tag 34
+#define alltypes_pointer_AllTypes_rep_bytes_tag  35
+#define alltypes_pointer_AllTypes_rep_submsg_tag 36
+#define alltypes_pointer_AllTypes_rep_enum_tag   37
+#define alltypes_pointer_AllTypes_rep_emptymsg_tag 38
+#define alltypes_pointer_AllTypes_rep_fbytes_tag 39
+#define alltypes_pointer_AllTypes_opt_int32_tag  41
+#define alltypes_pointer_AllTypes_opt_int64_tag  42
+#define alltypes_pointer_AllTypes_opt_uint32_tag 43
+#define alltypes_pointer_AllTypes_opt_uint64_tag 44
+#define alltypes_pointer_AllTypes_opt_sint32_tag 45
+#define alltypes_pointer_AllTypes_opt_sint64_tag 46
+#define alltypes_pointer_AllTypes_opt_bool_tag   47
+#define alltypes_pointer_AllTypes_opt_fixed32_tag 48
+#define alltypes_pointer_AllTypes_opt_sfixed32_tag 49
+#define alltypes_pointer_AllTypes_opt_float_tag  50
+#define alltypes_pointer_AllTypes_opt_fixed64_tag 51
+#define alltypes_pointer_AllTypes_opt_sfixed64_tag 52
+#define alltypes_pointer_AllTypes_opt_double_tag 53
+#define alltypes_pointer_AllTypes_opt_string_tag 54
+#define alltypes_pointer_AllTypes_opt_bytes_tag  55
+#define alltypes_pointer_AllTypes_opt_submsg_tag 56
+#define alltypes_pointer_AllTypes_opt_enum_tag   57
+#define alltypes_pointer_AllTypes_opt_emptymsg_tag 58
+#define alltypes_pointer_AllTypes_opt_fbytes_tag 59
+#define alltypes_pointer_AllTypes_req_limits_tag 98
+#define alltypes_pointer_AllTypes_end_tag        99
+#define alltypes_pointer_Limits_int32_min_tag    1
+#define alltypes_pointer_Limits_int32_max_tag    2
+#define alltypes_pointer_Limits_uint32_min_tag   3
+#define alltypes_pointer_Limits_uint32_max_tag   4
+#define alltypes_pointer_Limits_int64_min_tag    5
+#define alltypes_pointer_Limits_int64_max_tag    6
+#define alltypes_pointer_Limits_uint64_min_tag   7
+#define alltypes_pointer_Limits_uint64_max_tag   8
+#define alltypes_pointer_Limits_enum_min_tag     9
+#define alltypes_pointer_Limits_enum_max_tag     10
+#define alltypes_pointer_SubMessage_substuff1_tag 1
+#define alltypes_pointer_SubMessage_substuff2_tag 2
+#define alltypes_pointer_SubMessage_substuff3_tag 3
+
+/* Struct field encoding specification for nanopb */
+#define alltypes_pointer_SubMessage_FIELDLIST(X, a) \
+X(a, POINTER, REQUIRED, STRING, substuff1, 1) \
+X(a, POINTER, REQUIRED, INT32, substuff2, 2) \
+X(a, POINTER, OPTIONAL, FIXED32, substuff3, 3)
+#define alltypes_pointer_SubMessage_CALLBACK NULL
+#define alltypes_pointer_SubMessage_DEFAULT NULL
+#define alltypes_pointer_SubMessage_DEFAULT_INSTANCE NULL
+#define alltypes_pointer_SubMessage_FIELD_RECORDS NULL
+#define alltypes_pointer_SubMessage_MSGFLAGS 0
+
+#define alltypes_pointer_EmptyMessage_FIELDLIST(X, a) \
+
+#define alltypes_pointer_EmptyMessage_CALLBACK NULL
+#define alltypes_pointer_EmptyMessage_DEFAULT NULL
+#define alltypes_pointer_EmptyMessage_DEFAULT_INSTANCE NULL
+#define alltypes_pointer_EmptyMessage_FIELD_RECORDS NULL
+#define alltypes_pointer_EmptyMessage_MSGFLAGS 0
+
+#define alltypes_pointer_Limits_FIELDLIST(X, a) \
+X(a, POINTER, REQUIRED, INT32, int32_min, 1) \
+X(a, POINTER, REQUIRED, INT32, int32_max, 2) \
+X(a, POINTER, REQUIRED, UINT32, uint32_min, 3) \
+X(a, POINTER, REQUIRED, UINT32, uint32_max, 4) \
+X(a, POINTER, REQUIRED, INT64, int64_min, 5) \
+X(a, POINTER, REQUIRED, INT64, int64_max, 6) \
+X(a, POINTER, REQUIRED, UINT64, uint64_min, 7) \
+X(a, POINTER, REQUIRED, UINT64, uint64_max, 8) \
+X(a, POINTER, REQUIRED, ENUM, enum_min, 9) \
+X(a, POINTER, REQUIRED, ENUM, enum_max, 10)
+#define alltypes_pointer_Limits_CALLBACK NULL
+#define alltypes_pointer_Limits_DEFAULT NULL
+#define alltypes_pointer_Limits_DEFAULT_INSTANCE NULL
+#define alltypes_pointer_Limits_FIELD_RECORDS NULL
+#define alltypes_pointer_Limits_MSGFLAGS 0
+
+#define alltypes_pointer_AllTypes_FIELDLIST(X, a) \
+X(a, POINTER, REQUIRED, INT32, req_int32, 1) \
+X(a, POINTER, REQUIRED, INT64, req_int64, 2) \
+X(a, POINTER, REQUIRED, UINT32, req_uint32, 3) \
+X(a, POINTER, REQUIRED, UINT64, req_uint64, 4) \
+X(a, POINTER, REQUIRED, SINT32, req_sint32, 5) \
+X(a, POINTER, REQUIRED, SINT64, req_sint64, 6) \
+X(a, POINTER, REQUIRED, BOOL, req_bool, 7) \
+X(a, POINTER, REQUIRED, FIXED32, req_fixed32, 8) \
+X(a, POINTER, REQUIRED, SFIXED32, req_sfixed32, 9) \
+X(a, POINTER, REQUIRED, FLOAT, req_float, 10) \
+X(a, POINTER, REQUIRED, FIXED64, req_fixed64, 11) \
+X(a, POINTER, REQUIRED, SFIXED64, req_sfixed64, 12) \
+X(a, POINTER, REQUIRED, DOUBLE, req_double, 13) \
+X(a, POINTER, REQUIRED, STRING, req_string, 14) \
+X(a, POINTER, REQUIRED, BYTES, req_bytes, 15) \
+X(a, POINTER, REQUIRED, MESSAGE, req_submsg, 16) \
+X(a, POINTER, REQUIRED, UENUM, req_enum, 17) \
+X(a, POINTER, REQUIRED, MESSAGE, req_emptymsg, 18) \
+X(a, POINTER, REQUIRED, FIXED_LENGTH_BYTES, req_fbytes, 19) \
+X(a, POINTER, REPEATED, INT32, rep_int32, 21) \
+X(a, POINTER, REPEATED, INT64, rep_int64, 22) \
+X(a, POINTER, REPEATED, UINT32, rep_uint32, 23) \
+X(a, POINTER, REPEATED, UINT64, rep_uint64, 24) \
+X(a, POINTER, REPEATED, SINT32, rep_sint32, 25) \
+X(a, POINTER, REPEATED, SINT64, rep_sint64, 26) \
+X(a, POINTER, REPEATED, BOOL, rep_bool, 27) \
+X(a, POINTER, REPEATED, FIXED32, rep_fixed32, 28) \
+X(a, POINTER, REPEATED, SFIXED32, rep_sfixed32, 29) \
+X(a, POINTER, REPEATED, FLOAT, rep_float, 30) \
+X(a, POINTER, REPEATED, FIXED64, rep_fixed64, 31) \
+X(a, POINTER, REPEATED, SFIXED64, rep_sfixed64, 32) \
+X(a, POINTER, REPEATED, DOUBLE, rep_double, 33) \
+X(a, POINTER, REPEATED, STRING, rep_string, 34) \
+X(a, POINTER, REPEATED, BYTES, rep_bytes, 35) \
+X(a, POINTER, REPEATED, MESSAGE, rep_submsg, 36) \
+X(a, POINTER, REPEATED, UENUM, rep_enum, 37) \
+X(a, POINTER, REPEATED, MESSAGE, rep_emptymsg, 38) \
+X(a, POINTER, REPEATED, FIXED_LENGTH_BYTES, rep_fbytes, 39) \
+X(a, POINTER, OPTIONAL, INT32, opt_int32, 41) \
+X(a, POINTER, OPTIONAL, INT64, opt_int64, 42) \
+X(a, POINTER, OPTIONAL, UINT32, opt_uint32, 43) \
+X(a, POINTER, OPTIONAL, UINT64, opt_uint64, 44) \
+X(a, POINTER, OPTIONAL, SINT32, opt_sint32, 45) \
+X(a, POINTER, OPTIONAL, SINT64, opt_sint64, 46) \
+X(a, POINTER, OPTIONAL, BOOL, opt_bool, 47) \
+X(a, POINTER, OPTIONAL, FIXED32, opt_fixed32, 48) \
+X(a, POINTER, OPTIONAL, SFIXED32, opt_sfixed32, 49) \
+X(a, POINTER, OPTIONAL, FLOAT, opt_float, 50) \
+X(a, POINTER, OPTIONAL, FIXED64, opt_fixed64, 51) \
+X(a, POINTER, OPTIONAL, SFIXED64, opt_sfixed64, 52) \
+X(a, POINTER, OPTIONAL, DOUBLE, opt_double, 53) \
+X(a, POINTER, OPTIONAL, STRING, opt_string, 54) \
+X(a, POINTER, OPTIONAL, BYTES, opt_bytes, 55) \
+X(a, POINTER, OPTIONAL, MESSAGE, opt_submsg, 56) \
+X(a, POINTER, OPTIONAL, UENUM, opt_enum, 57) \
+X(a, POINTER, OPTIONAL, MESSAGE, opt_emptymsg, 58) \
+X(a, POINTER, OPTIONAL, FIXED_LENGTH_BYTES, opt_fbytes, 59) \
+X(a, POINTER, ONEOF, MESSAGE, (oneof,oneof_msg1,oneof.oneof_msg1), 60) \
+X(a, POINTER, ONEOF, MESSAGE, (oneof,oneof_msg2,oneof.oneof_msg2), 61) \
+X(a, POINTER, REQUIRED, MESSAGE, req_limits, 98) \
+X(a, POINTER, REQUIRED, INT32, end, 99) \
+X(a, CALLBACK, OPTIONAL, EXTENSION, extensions, 200)
+#define alltypes_pointer_AllTypes_CALLBACK pb_default_field_callback
+#define alltypes_pointer_AllTypes_DEFAULT NULL
+#define alltypes_pointer_AllTypes_DEFAULT_INSTANCE NULL
+#define alltypes_pointer_AllTypes_FIELD_RECORDS NULL
+#define alltypes_pointer_AllTypes_MSGFLAGS 0
+#define alltypes_pointer_AllTypes_req_submsg_MSGTYPE alltypes_pointer_SubMessage
+#define alltypes_pointer_AllTypes_req_emptymsg_MSGTYPE alltypes_pointer_EmptyMessage
+#define alltypes_pointer_AllTypes_rep_submsg_MSGTYPE alltypes_pointer_SubMessage
+#define alltypes_pointer_AllTypes_rep_emptymsg_MSGTYPE alltypes_pointer_EmptyMessage
+#define alltypes_pointer_AllTypes_opt_submsg_MSGTYPE alltypes_pointer_SubMessage
+#define alltypes_pointer_AllTypes_opt_emptymsg_MSGTYPE alltypes_pointer_EmptyMessage
+#define alltypes_pointer_AllTypes_oneof_oneof_msg1_MSGTYPE alltypes_pointer_SubMessage
+#define alltypes_pointer_AllTypes_oneof_oneof_msg2_MSGTYPE alltypes_pointer_EmptyMessage
+#define alltypes_pointer_AllTypes_req_limits_MSGTYPE alltypes_pointer_Limits
+
+extern const pb_msgdesc_t alltypes_pointer_SubMessage_msg;
+extern const pb_msgdesc_t alltypes_pointer_EmptyMessage_msg;
+extern const pb_msgdesc_t alltypes_pointer_Limits_msg;
+extern const pb_msgdesc_t alltypes_pointer_AllTypes_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define alltypes_pointer_SubMessage_fields &alltypes_pointer_SubMessage_msg
+#define alltypes_pointer_EmptyMessage_fields &alltypes_pointer_EmptyMessage_msg
+#define alltypes_pointer_Limits_fields &alltypes_pointer_Limits_msg
+#define alltypes_pointer_AllTypes_fields &alltypes_pointer_AllTypes_msg
+
+/* Maximum encoded size of messages (where known) */
+/* alltypes_pointer_SubMessage_size depends on runtime parameters */
+#define alltypes_pointer_EmptyMessage_size       0
+/* alltypes_pointer_Limits_size depends on runtime parameters */
+/* alltypes_pointer_AllTypes_size depends on runtime parameters */
+
+/* Arena memory needed for decoding pointer fields (where known) */
+/* alltypes_pointer_SubMessage_arena_size depends on runtime parameters */
+#define alltypes_pointer_Limits_arena_size       (PB_ARENA_ALLOCSIZE(sizeof(int32_t)) + PB_ARENA_ALLOCSIZE(sizeof(int32_t)) + PB_ARENA_ALLOCSIZE(sizeof(uint32_t)) + PB_ARENA_ALLOCSIZE(sizeof(uint32_t)) + PB_ARENA_ALLOCSIZE(sizeof(int64_t)) + PB_ARENA_ALLOCSIZE(sizeof(int64_t)) + PB_ARENA_ALLOCSIZE(sizeof(uint64_t)) + PB_ARENA_ALLOCSIZE(sizeof(uint64_t)) + PB_ARENA_ALLOCSIZE(sizeof(alltypes_pointer_HugeEnum)) + PB_ARENA_ALLOCSIZE(sizeof(alltypes_pointer_HugeEnum)))
+/* alltypes_pointer_AllTypes_arena_size depends on runtime parameters */
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
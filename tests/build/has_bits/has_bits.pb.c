@@ -0,0 +1,21 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "has_bits.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(Inner, Inner, AUTO)
+
+
+PB_BIND(Flags, Flags, AUTO)
+
+
+PB_BIND_EXT(FlagsBits, FlagsBits, AUTO)
+
+
+
+/* @@protoc_insertion_point(eof) */
@@ -0,0 +1,205 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_HAS_BITS_PB_H_INCLUDED
+#define PB_HAS_BITS_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Inner {
+    bool has_value;
+    int32_t value;
+/* @@protoc_insertion_point(struct:Inner) */
+} Inner;
+
+
+typedef struct _Flags {
+    bool has_f1;
+    bool f1;
+    bool has_f2;
+    bool f2;
+    bool has_f3;
+    bool f3;
+    bool has_f4;
+    bool f4;
+    bool has_num;
+    uint32_t num;
+    int32_t req;
+    pb_size_t arr_count;
+    int32_t arr[3];
+    bool has_str;
+    char str[8];
+    bool has_inner;
+    Inner inner;
+    pb_size_t which_choice;
+    union {
+        int32_t c1;
+        bool c2;
+    } choice;
+    bool has_f12;
+    bool f12;
+/* @@protoc_insertion_point(struct:Flags) */
+} Flags;
+
+
+typedef struct _FlagsBits {
+    uint32_t has_bits[1];
+    bool f1;
+    bool f2;
+    bool f3;
+    bool f4;
+    uint32_t num;
+    int32_t req;
+    pb_size_t arr_count;
+    int32_t arr[3];
+    char str[8];
+    Inner inner;
+    pb_size_t which_choice;
+    union {
+        int32_t c1;
+        bool c2;
+    } choice;
+    bool f12;
+/* @@protoc_insertion_point(struct:FlagsBits) */
+} FlagsBits;
+
+
+/* Initializer values for message structs */
+#define Inner_init_default                       {false, 0}
+#define Flags_init_default                       {false, 0, false, 0, false, 0, false, 0, false, 7u, 0, 0, {0}, false, "x", false, Inner_init_default, 0, {0}, false, 0}
+#define FlagsBits_init_default                   {{0}, 0, 0, 0, 0, 7u, 0, 0, {0}, "x", Inner_init_default, 0, {0}, 0}
+#define Inner_init_zero                          {false, 0}
+#define Flags_init_zero                          {false, 0, false, 0, false, 0, false, 0, false, 0, 0, 0, {0}, false, "", false, Inner_init_zero, 0, {0}, false, 0}
+#define FlagsBits_init_zero                      {{0}, 0, 0, 0, 0, 0, 0, 0, {0}, "", Inner_init_zero, 0, {0}, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Inner_value_tag                          1
+#define Flags_c1_tag                             10
+#define Flags_c2_tag                             11
+#define Flags_f1_tag                             1
+#define Flags_f2_tag                             2
+#define Flags_f3_tag                             3
+#define Flags_f4_tag                             4
+#define Flags_num_tag                            5
+#define Flags_req_tag                            6
+#define Flags_arr_tag                            7
+#define Flags_str_tag                            8
+#define Flags_inner_tag                          9
+#define Flags_f12_tag                            12
+#define FlagsBits_c1_tag                         10
+#define FlagsBits_c2_tag                         11
+#define FlagsBits_f1_tag                         1
+#define FlagsBits_f2_tag                         2
+#define FlagsBits_f3_tag                         3
+#define FlagsBits_f4_tag                         4
+#define FlagsBits_num_tag                        5
+#define FlagsBits_req_tag                        6
+#define FlagsBits_arr_tag                        7
+#define FlagsBits_str_tag                        8
+#define FlagsBits_inner_tag                      9
+#define FlagsBits_f12_tag                        12
+
+/* Struct field encoding specification for nanopb */
+#define Inner_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, INT32, value, 1)
+#define Inner_CALLBACK NULL
+#define Inner_DEFAULT NULL
+#define Inner_DEFAULT_INSTANCE NULL
+#define Inner_FIELD_RECORDS NULL
+#define Inner_MSGFLAGS 0
+
+#define Flags_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, BOOL, f1, 1) \
+X(a, STATIC, OPTIONAL, BOOL, f2, 2) \
+X(a, STATIC, OPTIONAL, BOOL, f3, 3) \
+X(a, STATIC, OPTIONAL, BOOL, f4, 4) \
+X(a, STATIC, OPTIONAL, UINT32, num, 5) \
+X(a, STATIC, REQUIRED, INT32, req, 6) \
+X(a, STATIC, REPEATED, INT32, arr, 7) \
+X(a, STATIC, OPTIONAL, STRING, str, 8) \
+X(a, STATIC, OPTIONAL, MESSAGE, inner, 9) \
+X(a, STATIC, ONEOF, INT32, (choice,c1,choice.c1), 10) \
+X(a, STATIC, ONEOF, BOOL, (choice,c2,choice.c2), 11) \
+X(a, STATIC, OPTIONAL, BOOL, f12, 12)
+#define Flags_CALLBACK NULL
+#define Flags_DEFAULT (const uint8_t*)"\x28\x07\x42\x01\x78\x00"
+#define Flags_DEFAULT_INSTANCE NULL
+#define Flags_FIELD_RECORDS NULL
+#define Flags_MSGFLAGS 0
+#define Flags_inner_MSGTYPE Inner
+
+#define FlagsBits_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, BOOL, f1, 1) \
+X(a, STATIC, SINGULAR, BOOL, f2, 2) \
+X(a, STATIC, SINGULAR, BOOL, f3, 3) \
+X(a, STATIC, SINGULAR, BOOL, f4, 4) \
+X(a, STATIC, SINGULAR, UINT32, num, 5) \
+X(a, STATIC, REQUIRED, INT32, req, 6) \
+X(a, STATIC, REPEATED, INT32, arr, 7) \
+X(a, STATIC, SINGULAR, STRING, str, 8) \
+X(a, STATIC, SINGULAR, MESSAGE, inner, 9) \
+X(a, STATIC, ONEOF, INT32, (choice,c1,choice.c1), 10) \
+X(a, STATIC, ONEOF, BOOL, (choice,c2,choice.c2), 11) \
+X(a, STATIC, SINGULAR, BOOL, f12, 12)
+#define FlagsBits_CALLBACK NULL
+#define FlagsBits_DEFAULT (const uint8_t*)"\x28\x07\x42\x01\x78\x00"
+#define FlagsBits_DEFAULT_INSTANCE NULL
+#define FlagsBits_FIELD_RECORDS NULL
+#define FlagsBits_MSGFLAGS PB_MSGFLAG_HAS_BITS
+#define FlagsBits_inner_MSGTYPE Inner
+
+extern const pb_msgdesc_t Inner_msg;
+extern const pb_msgdesc_t Flags_msg;
+extern const pb_msgdesc_t FlagsBits_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Inner_fields &Inner_msg
+#define Flags_fields &Flags_msg
+#define FlagsBits_fields &FlagsBits_msg
+
+/* Accessors for presence of optional fields in has_bits */
+#define FlagsBits_has_f1(msg)                    PB_HAS_BIT((msg)->has_bits, 0)
+#define FlagsBits_set_has_f1(msg)                PB_SET_HAS_BIT((msg)->has_bits, 0)
+#define FlagsBits_clear_has_f1(msg)              PB_CLEAR_HAS_BIT((msg)->has_bits, 0)
+#define FlagsBits_has_f2(msg)                    PB_HAS_BIT((msg)->has_bits, 1)
+#define FlagsBits_set_has_f2(msg)                PB_SET_HAS_BIT((msg)->has_bits, 1)
+#define FlagsBits_clear_has_f2(msg)              PB_CLEAR_HAS_BIT((msg)->has_bits, 1)
+#define FlagsBits_has_f3(msg)                    PB_HAS_BIT((msg)->has_bits, 2)
+#define FlagsBits_set_has_f3(msg)                PB_SET_HAS_BIT((msg)->has_bits, 2)
+#define FlagsBits_clear_has_f3(msg)              PB_CLEAR_HAS_BIT((msg)->has_bits, 2)
+#define FlagsBits_has_f4(msg)                    PB_HAS_BIT((msg)->has_bits, 3)
+#define FlagsBits_set_has_f4(msg)                PB_SET_HAS_BIT((msg)->has_bits, 3)
+#define FlagsBits_clear_has_f4(msg)              PB_CLEAR_HAS_BIT((msg)->has_bits, 3)
+#define FlagsBits_has_num(msg)                   PB_HAS_BIT((msg)->has_bits, 4)
+#define FlagsBits_set_has_num(msg)               PB_SET_HAS_BIT((msg)->has_bits, 4)
+#define FlagsBits_clear_has_num(msg)             PB_CLEAR_HAS_BIT((msg)->has_bits, 4)
+#define FlagsBits_has_str(msg)                   PB_HAS_BIT((msg)->has_bits, 7)
+#define FlagsBits_set_has_str(msg)               PB_SET_HAS_BIT((msg)->has_bits, 7)
+#define FlagsBits_clear_has_str(msg)             PB_CLEAR_HAS_BIT((msg)->has_bits, 7)
+#define FlagsBits_has_inner(msg)                 PB_HAS_BIT((msg)->has_bits, 8)
+#define FlagsBits_set_has_inner(msg)             PB_SET_HAS_BIT((msg)->has_bits, 8)
+#define FlagsBits_clear_has_inner(msg)           PB_CLEAR_HAS_BIT((msg)->has_bits, 8)
+#define FlagsBits_has_f12(msg)                   PB_HAS_BIT((msg)->has_bits, 11)
+#define FlagsBits_set_has_f12(msg)               PB_SET_HAS_BIT((msg)->has_bits, 11)
+#define FlagsBits_clear_has_f12(msg)             PB_CLEAR_HAS_BIT((msg)->has_bits, 11)
+
+/* Maximum encoded size of messages (where known) */
+#define Inner_size                               11
+#define Flags_size                               93
+#define FlagsBits_size                           93
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
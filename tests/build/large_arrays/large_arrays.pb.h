@@ -0,0 +1,145 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_LARGE_ARRAYS_PB_H_INCLUDED
+#define PB_LARGE_ARRAYS_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Enum definitions */
+typedef enum _Level {
+    Level_LOW = 1,
+    Level_HIGH = 2
+} Level;
+#define _Level_MIN Level_LOW
+#define _Level_MAX Level_HIGH
+#define _Level_ARRAYSIZE ((Level)(Level_HIGH+1))
+
+typedef enum _Mode {
+    Mode_OFF = 0,
+    Mode_ON = 1
+} Mode;
+#define _Mode_MIN Mode_OFF
+#define _Mode_MAX Mode_ON
+#define _Mode_ARRAYSIZE ((Mode)(Mode_ON+1))
+
+/* Struct definitions */
+typedef struct _Entry {
+    int32_t id;
+    bool has_weight;
+    int32_t weight;
+/* @@protoc_insertion_point(struct:Entry) */
+} Entry;
+
+
+typedef struct _Point {
+    int32_t x;
+    bool has_mode;
+    Mode mode;
+/* @@protoc_insertion_point(struct:Point) */
+} Point;
+
+
+typedef struct _LargeArrays {
+    pb_size_t values_count;
+    int32_t values[5000];
+    pb_size_t entries_count;
+    Entry entries[1000];
+    pb_size_t names_count;
+    char names[500][8];
+    double fixed[2000];
+    Level levels[3];
+    Entry slots[3];
+    Mode modes[1000];
+    Point points[1000];
+/* @@protoc_insertion_point(struct:LargeArrays) */
+} LargeArrays;
+
+
+/* Initializer values for message structs */
+#define Point_init_default                       {0, false, _Mode_MIN}
+#define Entry_init_default                       {0, false, 5}
+#define LargeArrays_init_default                 {0, {0}, 0, {Entry_init_default}, 0, {""}, {0}, {_Level_MIN, _Level_MIN, _Level_MIN}, {Entry_init_default, Entry_init_default, Entry_init_default}, {_Mode_MIN}, {Point_init_default}}
+#define Point_init_zero                          {0, false, _Mode_MIN}
+#define Entry_init_zero                          {0, false, 0}
+#define LargeArrays_init_zero                    {0, {0}, 0, {Entry_init_zero}, 0, {""}, {0}, {_Level_MIN, _Level_MIN, _Level_MIN}, {Entry_init_zero}, {_Mode_MIN}, {Point_init_zero}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Entry_id_tag                             1
+#define Entry_weight_tag                         2
+#define Point_x_tag                              1
+#define Point_mode_tag                           2
+#define LargeArrays_values_tag                   1
+#define LargeArrays_entries_tag                  2
+#define LargeArrays_names_tag                    3
+#define LargeArrays_fixed_tag                    4
+#define LargeArrays_levels_tag                   5
+#define LargeArrays_slots_tag                    6
+#define LargeArrays_modes_tag                    7
+#define LargeArrays_points_tag                   8
+
+/* Struct field encoding specification for nanopb */
+#define Point_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, x, 1) \
+X(a, STATIC, OPTIONAL, UENUM, mode, 2)
+#define Point_CALLBACK NULL
+#define Point_DEFAULT NULL
+#define Point_DEFAULT_INSTANCE NULL
+#define Point_FIELD_RECORDS NULL
+#define Point_MSGFLAGS 0
+
+#define Entry_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, id, 1) \
+X(a, STATIC, OPTIONAL, INT32, weight, 2)
+#define Entry_CALLBACK NULL
+#define Entry_DEFAULT (const uint8_t*)"\x10\x05\x00"
+#define Entry_DEFAULT_INSTANCE NULL
+#define Entry_FIELD_RECORDS NULL
+#define Entry_MSGFLAGS 0
+
+#define LargeArrays_FIELDLIST(X, a) \
+X(a, STATIC, REPEATED, INT32, values, 1) \
+X(a, STATIC, REPEATED, MESSAGE, entries, 2) \
+X(a, STATIC, REPEATED, STRING, names, 3) \
+X(a, STATIC, FIXARRAY, DOUBLE, fixed, 4) \
+X(a, STATIC, FIXARRAY, UENUM, levels, 5) \
+X(a, STATIC, FIXARRAY, MESSAGE, slots, 6) \
+X(a, STATIC, FIXARRAY, UENUM, modes, 7) \
+X(a, STATIC, FIXARRAY, MESSAGE, points, 8)
+#define LargeArrays_CALLBACK NULL
+#define LargeArrays_DEFAULT NULL
+#define LargeArrays_DEFAULT_INSTANCE NULL
+#define LargeArrays_FIELD_RECORDS NULL
+#define LargeArrays_MSGFLAGS 0
+#define LargeArrays_entries_MSGTYPE Entry
+#define LargeArrays_slots_MSGTYPE Entry
+#define LargeArrays_points_MSGTYPE Point
+
+extern const pb_msgdesc_t Point_msg;
+extern const pb_msgdesc_t Entry_msg;
+extern const pb_msgdesc_t LargeArrays_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Point_fields &Point_msg
+#define Entry_fields &Entry_msg
+#define LargeArrays_fields &LargeArrays_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Point_size                               13
+#define Entry_size                               22
+#define LargeArrays_size                         118578
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
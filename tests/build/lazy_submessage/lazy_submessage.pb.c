@@ -0,0 +1,24 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "lazy_submessage.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(Inner, Inner, AUTO)
+
+
+PB_BIND(Outer, Outer, AUTO)
+
+
+PB_BIND(InnerExtended, InnerExtended, AUTO)
+
+
+PB_BIND(OuterStatic, OuterStatic, AUTO)
+
+
+
+/* @@protoc_insertion_point(eof) */
@@ -0,0 +1,167 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_LAZY_SUBMESSAGE_PB_H_INCLUDED
+#define PB_LAZY_SUBMESSAGE_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Inner {
+    int32_t value;
+    bool has_s;
+    char s[16];
+/* @@protoc_insertion_point(struct:Inner) */
+} Inner;
+
+
+typedef struct _InnerExtended {
+    int32_t value;
+    bool has_s;
+    char s[16];
+    bool has_extra;
+    int32_t extra;
+/* @@protoc_insertion_point(struct:InnerExtended) */
+} InnerExtended;
+
+
+typedef struct _Outer {
+    int32_t id;
+    bool has_lazy_inner;
+    pb_lazy_t lazy_inner;
+    Inner eager;
+    pb_size_t which_choice;
+    union {
+        pb_lazy_t lazy_choice;
+        int32_t number;
+    } choice;
+/* @@protoc_insertion_point(struct:Outer) */
+} Outer;
+
+
+typedef struct _OuterStatic {
+    int32_t id;
+    bool has_lazy_inner;
+    InnerExtended lazy_inner;
+    InnerExtended eager;
+    pb_size_t which_choice;
+    union {
+        InnerExtended lazy_choice;
+        int32_t number;
+    } choice;
+/* @@protoc_insertion_point(struct:OuterStatic) */
+} OuterStatic;
+
+
+/* Initializer values for message structs */
+#define Inner_init_default                       {0, false, ""}
+#define Outer_init_default                       {0, false, {{NULL, 0}, NULL}, Inner_init_default, 0, {{{NULL, 0}, NULL}}}
+#define InnerExtended_init_default               {0, false, "", false, 0}
+#define OuterStatic_init_default                 {0, false, InnerExtended_init_default, InnerExtended_init_default, 0, {InnerExtended_init_default}}
+#define Inner_init_zero                          {0, false, ""}
+#define Outer_init_zero                          {0, false, {{NULL, 0}, NULL}, Inner_init_zero, 0, {{{NULL, 0}, NULL}}}
+#define InnerExtended_init_zero                  {0, false, "", false, 0}
+#define OuterStatic_init_zero                    {0, false, InnerExtended_init_zero, InnerExtended_init_zero, 0, {InnerExtended_init_zero}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Inner_value_tag                          1
+#define Inner_s_tag                              2
+#define InnerExtended_value_tag                  1
+#define InnerExtended_s_tag                      2
+#define InnerExtended_extra_tag                  3
+#define Outer_lazy_choice_tag                    4
+#define Outer_number_tag                         5
+#define Outer_id_tag                             1
+#define Outer_lazy_inner_tag                     2
+#define Outer_eager_tag                          3
+#define OuterStatic_lazy_choice_tag              4
+#define OuterStatic_number_tag                   5
+#define OuterStatic_id_tag                       1
+#define OuterStatic_lazy_inner_tag               2
+#define OuterStatic_eager_tag                    3
+
+/* Struct field encoding specification for nanopb */
+#define Inner_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, value, 1) \
+X(a, STATIC, OPTIONAL, STRING, s, 2)
+#define Inner_CALLBACK NULL
+#define Inner_DEFAULT NULL
+#define Inner_DEFAULT_INSTANCE NULL
+#define Inner_FIELD_RECORDS NULL
+#define Inner_MSGFLAGS 0
+
+#define Outer_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, id, 1) \
+X(a, VIEW, OPTIONAL, MESSAGE, lazy_inner, 2) \
+X(a, STATIC, REQUIRED, MESSAGE, eager, 3) \
+X(a, VIEW, ONEOF, MESSAGE, (choice,lazy_choice,choice.lazy_choice), 4) \
+X(a, STATIC, ONEOF, INT32, (choice,number,choice.number), 5)
+#define Outer_CALLBACK NULL
+#define Outer_DEFAULT NULL
+#define Outer_DEFAULT_INSTANCE NULL
+#define Outer_FIELD_RECORDS NULL
+#define Outer_MSGFLAGS 0
+#define Outer_lazy_inner_MSGTYPE Inner
+#define Outer_eager_MSGTYPE Inner
+#define Outer_choice_lazy_choice_MSGTYPE Inner
+
+#define InnerExtended_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, value, 1) \
+X(a, STATIC, OPTIONAL, STRING, s, 2) \
+X(a, STATIC, OPTIONAL, INT32, extra, 3)
+#define InnerExtended_CALLBACK NULL
+#define InnerExtended_DEFAULT NULL
+#define InnerExtended_DEFAULT_INSTANCE NULL
+#define InnerExtended_FIELD_RECORDS NULL
+#define InnerExtended_MSGFLAGS 0
+
+#define OuterStatic_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, id, 1) \
+X(a, STATIC, OPTIONAL, MESSAGE, lazy_inner, 2) \
+X(a, STATIC, REQUIRED, MESSAGE, eager, 3) \
+X(a, STATIC, ONEOF, MESSAGE, (choice,lazy_choice,choice.lazy_choice), 4) \
+X(a, STATIC, ONEOF, INT32, (choice,number,choice.number), 5)
+#define OuterStatic_CALLBACK NULL
+#define OuterStatic_DEFAULT NULL
+#define OuterStatic_DEFAULT_INSTANCE NULL
+#define OuterStatic_FIELD_RECORDS NULL
+#define OuterStatic_MSGFLAGS 0
+#define OuterStatic_lazy_inner_MSGTYPE InnerExtended
+#define OuterStatic_eager_MSGTYPE InnerExtended
+#define OuterStatic_choice_lazy_choice_MSGTYPE InnerExtended
+
+extern const pb_msgdesc_t Inner_msg;
+extern const pb_msgdesc_t Outer_msg;
+extern const pb_msgdesc_t InnerExtended_msg;
+extern const pb_msgdesc_t OuterStatic_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Inner_fields &Inner_msg
+#define Outer_fields &Outer_msg
+#define InnerExtended_fields &InnerExtended_msg
+#define OuterStatic_fields &OuterStatic_msg
+
+/* Accessors for lazily decoded submessages */
+#define Outer_lazy_choice_get(msg, dest)         ((Inner*)pb_decode_lazy(&(msg)->choice.lazy_choice, &Inner_msg, (dest)))
+#define Outer_lazy_inner_get(msg, dest)          ((Inner*)pb_decode_lazy(&(msg)->lazy_inner, &Inner_msg, (dest)))
+
+/* Maximum encoded size of messages (where known) */
+#define Inner_size                               28
+/* Outer_size depends on runtime parameters */
+#define InnerExtended_size                       39
+#define OuterStatic_size                         134
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,66 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "mem_release.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(SubMessage, SubMessage, AUTO)
+
+
+PB_BIND(TestMessage, TestMessage, 2)
+
+
+PB_BIND(OneofMessage, OneofMessage, AUTO)
+
+
+PB_BIND(RepeatedMessage, RepeatedMessage, AUTO)
+
+
+/* Definition for extension field dynamic_ext */
+typedef struct _dynamic_ext_extmsg {
+    struct _SubMessage *dynamic_ext;
+/* @@protoc_insertion_point(struct:dynamic_ext_extmsg) */
+} dynamic_ext_extmsg;
+#define dynamic_ext_extmsg_FIELDLIST(X, a) \
+X(a, POINTER, REQUIRED, MESSAGE, dynamic_ext, 100)
+#define dynamic_ext_extmsg_CALLBACK NULL
+#define dynamic_ext_extmsg_DEFAULT NULL
+#define dynamic_ext_extmsg_DEFAULT_INSTANCE NULL
+#define dynamic_ext_extmsg_FIELD_RECORDS NULL
+#define dynamic_ext_extmsg_MSGFLAGS 0
+#define dynamic_ext_extmsg_dynamic_ext_MSGTYPE SubMessage
+pb_byte_t dynamic_ext_extmsg_default[] = {0x00};
+PB_BIND(dynamic_ext_extmsg, dynamic_ext_extmsg, 2)
+const pb_extension_type_t dynamic_ext = {
+    NULL,
+    NULL,
+    &dynamic_ext_extmsg_msg
+};
+
+/* Definition for extension field static_ext */
+typedef struct _static_ext_extmsg {
+    SubMessage static_ext;
+/* @@protoc_insertion_point(struct:static_ext_extmsg) */
+} static_ext_extmsg;
+#define static_ext_extmsg_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, static_ext, 101)
+#define static_ext_extmsg_CALLBACK NULL
+#define static_ext_extmsg_DEFAULT NULL
+#define static_ext_extmsg_DEFAULT_INSTANCE NULL
+#define static_ext_extmsg_FIELD_RECORDS NULL
+#define static_ext_extmsg_MSGFLAGS 0
+#define static_ext_extmsg_static_ext_MSGTYPE SubMessage
+pb_byte_t static_ext_extmsg_default[] = {0x00};
+PB_BIND(static_ext_extmsg, static_ext_extmsg, 2)
+const pb_extension_type_t static_ext = {
+    NULL,
+    NULL,
+    &static_ext_extmsg_msg
+};
+
+
+/* @@protoc_insertion_point(eof) */
@@ -0,0 +1,60 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_MESSAGES2_PB_H_INCLUDED
+#define PB_MESSAGES2_PB_H_INCLUDED
+#include <pb.h>
+
+#include "messages1.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef PB_BYTES_ARRAY_T(128) xmit_data_t;
+typedef struct _xmit {
+    MessageHeader header;
+    xmit_data_t data;
+/* @@protoc_insertion_point(struct:xmit) */
+} xmit;
+
+
+/* Initializer values for message structs */
+#define xmit_init_default                        {MessageHeader_init_default, {0, {0}}}
+#define xmit_init_zero                           {MessageHeader_init_zero, {0, {0}}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define xmit_header_tag                          1
+#define xmit_data_tag                            2
+
+/* Struct field encoding specification for nanopb */
+#define xmit_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, header, 1) \
+X(a, STATIC, REQUIRED, BYTES, data, 2)
+#define xmit_CALLBACK NULL
+#define xmit_DEFAULT NULL
+#define xmit_DEFAULT_INSTANCE NULL
+#define xmit_FIELD_RECORDS NULL
+#define xmit_MSGFLAGS 0
+#define xmit_header_MSGTYPE MessageHeader
+
+extern const pb_msgdesc_t xmit_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define xmit_fields &xmit_msg
+
+/* Maximum encoded size of messages (where known) */
+#define xmit_size                                175
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
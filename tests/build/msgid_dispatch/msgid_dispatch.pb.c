@@ -0,0 +1,34 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "msgid_dispatch.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(Pong, Pong, AUTO)
+
+
+PB_BIND(Ping, Ping, AUTO)
+
+
+PB_BIND(Status, Status, AUTO)
+
+
+PB_BIND(Reset, Reset, AUTO)
+
+
+PB_BIND(Unlisted, Unlisted, AUTO)
+
+
+static const pb_msgid_entry_t MSGID_DISPATCH_msgid_entries[4] = {
+    {1, &Ping_msg, Ping_size},
+    {2, &Pong_msg, Pong_size},
+    {3, &Reset_msg, Reset_size},
+    {300, &Status_msg, Status_size},
+};
+const pb_msgid_table_t MSGID_DISPATCH_msgid_table = {MSGID_DISPATCH_msgid_entries, 4};
+
+/* @@protoc_insertion_point(eof) */
@@ -0,0 +1,172 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_MSGID_DISPATCH_PB_H_INCLUDED
+#define PB_MSGID_DISPATCH_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Reset {
+    char dummy_field;
+/* @@protoc_insertion_point(struct:Reset) */
+} Reset;
+
+
+typedef PB_BYTES_ARRAY_T(32) Ping_payload_t;
+typedef struct _Ping {
+    uint32_t seq;
+    bool has_payload;
+    Ping_payload_t payload;
+/* @@protoc_insertion_point(struct:Ping) */
+} Ping;
+
+
+typedef struct _Pong {
+    uint32_t seq;
+/* @@protoc_insertion_point(struct:Pong) */
+} Pong;
+
+
+typedef struct _Status {
+    int32_t temperature;
+    bool has_text;
+    char text[16];
+/* @@protoc_insertion_point(struct:Status) */
+} Status;
+
+
+typedef struct _Unlisted {
+    uint32_t value;
+/* @@protoc_insertion_point(struct:Unlisted) */
+} Unlisted;
+
+
+/* Initializer values for message structs */
+#define Pong_init_default                        {0}
+#define Ping_init_default                        {0, false, {0, {0}}}
+#define Status_init_default                      {0, false, ""}
+#define Reset_init_default                       {0}
+#define Unlisted_init_default                    {0}
+#define Pong_init_zero                           {0}
+#define Ping_init_zero                           {0, false, {0, {0}}}
+#define Status_init_zero                         {0, false, ""}
+#define Reset_init_zero                          {0}
+#define Unlisted_init_zero                       {0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Ping_seq_tag                             1
+#define Ping_payload_tag                         2
+#define Pong_seq_tag                             1
+#define Status_temperature_tag                   1
+#define Status_text_tag                          2
+#define Unlisted_value_tag                       1
+
+/* Struct field encoding specification for nanopb */
+#define Pong_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT32, seq, 1)
+#define Pong_CALLBACK NULL
+#define Pong_DEFAULT NULL
+#define Pong_DEFAULT_INSTANCE NULL
+#define Pong_FIELD_RECORDS NULL
+#define Pong_MSGFLAGS 0
+
+#define Ping_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT32, seq, 1) \
+X(a, STATIC, OPTIONAL, BYTES, payload, 2)
+#define Ping_CALLBACK NULL
+#define Ping_DEFAULT NULL
+#define Ping_DEFAULT_INSTANCE NULL
+#define Ping_FIELD_RECORDS NULL
+#define Ping_MSGFLAGS 0
+
+#define Status_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, temperature, 1) \
+X(a, STATIC, OPTIONAL, STRING, text, 2)
+#define Status_CALLBACK NULL
+#define Status_DEFAULT NULL
+#define Status_DEFAULT_INSTANCE NULL
+#define Status_FIELD_RECORDS NULL
+#define Status_MSGFLAGS 0
+
+#define Reset_FIELDLIST(X, a) \
+
+#define Reset_CALLBACK NULL
+#define Reset_DEFAULT NULL
+#define Reset_DEFAULT_INSTANCE NULL
+#define Reset_FIELD_RECORDS NULL
+#define Reset_MSGFLAGS 0
+
+#define Unlisted_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT32, value, 1)
+#define Unlisted_CALLBACK NULL
+#define Unlisted_DEFAULT NULL
+#define Unlisted_DEFAULT_INSTANCE NULL
+#define Unlisted_FIELD_RECORDS NULL
+#define Unlisted_MSGFLAGS 0
+
+extern const pb_msgdesc_t Pong_msg;
+extern const pb_msgdesc_t Ping_msg;
+extern const pb_msgdesc_t Status_msg;
+extern const pb_msgdesc_t Reset_msg;
+extern const pb_msgdesc_t Unlisted_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Pong_fields &Pong_msg
+#define Ping_fields &Ping_msg
+#define Status_fields &Status_msg
+#define Reset_fields &Reset_msg
+#define Unlisted_fields &Unlisted_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Pong_size                                6
+#define Ping_size                                40
+#define Status_size                              28
+#define Reset_size                               0
+#define Unlisted_size                            6
+
+/* Message IDs (where set with "msgid" option) */
+#ifdef PB_MSGID
+#define PB_MSG_2 Pong
+#define PB_MSG_1 Ping
+#define PB_MSG_300 Status
+#define PB_MSG_3 Reset
+
+#define MSGID_DISPATCH_MESSAGES \
+	PB_MSG(2,6,Pong) \
+	PB_MSG(1,40,Ping) \
+	PB_MSG(300,28,Status) \
+	PB_MSG(3,0,Reset) \
+
+#define Pong_msgid 2
+#define Ping_msgid 1
+#define Status_msgid 300
+#define Reset_msgid 3
+
+#endif
+
+/* Dispatch by message ID, see pb_decode_by_msgid() */
+typedef union {
+    Ping msg_Ping;
+    Pong msg_Pong;
+    Reset msg_Reset;
+    Status msg_Status;
+} MSGID_DISPATCH_msgid_union;
+
+extern const pb_msgid_table_t MSGID_DISPATCH_msgid_table;
+#define MSGID_DISPATCH_msgid_size                42
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,117 @@
+/* Enables the Msg_msgid defines */
+#define PB_MSGID
+
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include <pb_common.h>
+#include "unittests.h"
+#include "msgid_dispatch.pb.h"
+
+int main()
+{
+    int status = 0;
+    pb_byte_t buffer[3 * MSGID_DISPATCH_msgid_size];
+    size_t msglen;
+
+    {
+        const pb_msgid_table_t *table = &MSGID_DISPATCH_msgid_table;
+
+        COMMENT("Lookup from the generated table");
+        TEST(table->count == 4);
+        TEST(pb_msgid_find(table, Ping_msgid)->fields == Ping_fields);
+        TEST(pb_msgid_find(table, Pong_msgid)->fields == Pong_fields);
+        TEST(pb_msgid_find(table, Reset_msgid)->fields == Reset_fields);
+        TEST(pb_msgid_find(table, Status_msgid)->fields == Status_fields);
+        TEST(pb_msgid_find(table, Status_msgid)->size == Status_size);
+        TEST(pb_msgid_find(table, 0) == NULL);
+        TEST(pb_msgid_find(table, 4) == NULL);
+        TEST(pb_msgid_find(table, 299) == NULL);
+        TEST(pb_msgid_find(table, 301) == NULL);
+    }
+
+    {
+        pb_msgid_entry_t entries[5] = {{10, NULL, 0}, {11, NULL, 0}, {13, NULL, 0},
+                                       {1000, NULL, 0}, {70000, NULL, 0}};
+        pb_msgid_table_t table;
+        uint32_t i;
+        bool ok = true;
+
+        COMMENT("Lookup with gaps between the ids");
+        table.entries = entries;
+        table.count = 5;
+        for (i = 0; i < 5; i++)
+            ok = ok && pb_msgid_find(&table, entries[i].msgid) == &entries[i];
+        for (i = 0; i < 10; i++)
+            ok = ok && pb_msgid_find(&table, i) == NULL;
+        TEST(ok);
+        TEST(pb_msgid_find(&table, 12) == NULL);
+        TEST(pb_msgid_find(&table, 14) == NULL);
+        TEST(pb_msgid_find(&table, 70001) == NULL);
+
+        table.count = 0;
+        TEST(pb_msgid_find(&table, 10) == NULL);
+    }
+
+    {
+        pb_ostream_t stream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+        Ping ping = Ping_init_zero;
+        Status st = Status_init_zero;
+        Unlisted unlisted = Unlisted_init_zero;
+
+        COMMENT("Encode messages with their ids");
+        ping.seq = 5;
+        ping.has_payload = true;
+        ping.payload.size = 32;
+        memset(ping.payload.bytes, 0x55, 32);
+        st.temperature = -40;
+        st.has_text = true;
+        strcpy(st.text, "012345678901234");
+
+        TEST(pb_encode_with_msgid(&stream, &MSGID_DISPATCH_msgid_table, Ping_msgid, &ping));
+        TEST(stream.bytes_written <= MSGID_DISPATCH_msgid_size);
+        TEST(pb_encode_with_msgid(&stream, &MSGID_DISPATCH_msgid_table, Status_msgid, &st));
+        TEST(!pb_encode_with_msgid(&stream, &MSGID_DISPATCH_msgid_table, 7, &unlisted));
+        TEST(strcmp(PB_GET_ERROR(&stream), "unknown msgid") == 0);
+        msglen = stream.bytes_written;
+        TEST(buffer[0] == Ping_msgid);
+    }
+
+    {
+        pb_istream_t stream = pb_istream_from_buffer(buffer, msglen);
+        MSGID_DISPATCH_msgid_union rx;
+        uint32_t msgid;
+
+        COMMENT("Decode into the union");
+        TEST(sizeof(rx) >= sizeof(Status) && sizeof(rx) >= sizeof(Ping));
+        TEST(pb_decode_by_msgid(&stream, &MSGID_DISPATCH_msgid_table, &rx, &msgid));
+        TEST(msgid == Ping_msgid);
+        TEST(rx.msg_Ping.seq == 5 && rx.msg_Ping.payload.size == 32);
+        TEST(pb_decode_by_msgid(&stream, &MSGID_DISPATCH_msgid_table, &rx, &msgid));
+        TEST(msgid == Status_msgid);
+        TEST(rx.msg_Status.temperature == -40);
+        TEST(strcmp(rx.msg_Status.text, "012345678901234") == 0);
+        TEST(stream.bytes_left == 0);
+    }
+
+    {
+        /* Unknown id 7, then Pong with seq 9 */
+        const pb_byte_t input[] = {7, 2, 0x08, 0x01, 2, 2, 0x08, 0x09};
+        pb_istream_t stream = pb_istream_from_buffer(input, sizeof(input));
+        MSGID_DISPATCH_msgid_union rx;
+        uint32_t msgid;
+
+        COMMENT("Unknown message is skipped");
+        TEST(!pb_decode_by_msgid(&stream, &MSGID_DISPATCH_msgid_table, &rx, &msgid));
+        TEST(msgid == 7);
+        TEST(strcmp(PB_GET_ERROR(&stream), "unknown msgid") == 0);
+        TEST(pb_decode_by_msgid(&stream, &MSGID_DISPATCH_msgid_table, &rx, &msgid));
+        TEST(msgid == Pong_msgid && rx.msg_Pong.seq == 9);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
@@ -0,0 +1,107 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_MULTIFILE2_PB_H_INCLUDED
+#define PB_MULTIFILE2_PB_H_INCLUDED
+#include <pb.h>
+
+#include "multifile1.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Callback2Message {
+    TestMessage tstmsg;
+    SubMessage submsg;
+/* @@protoc_insertion_point(struct:Callback2Message) */
+} Callback2Message;
+
+
+typedef struct _Enums {
+    SignedEnum senum;
+    UnsignedEnum uenum;
+/* @@protoc_insertion_point(struct:Enums) */
+} Enums;
+
+
+typedef struct _OneofMessage {
+    pb_size_t which_msgs;
+    union {
+        StaticMessage tstmsg;
+    } msgs;
+/* @@protoc_insertion_point(struct:OneofMessage) */
+} OneofMessage;
+
+
+/* Initializer values for message structs */
+#define Callback2Message_init_default            {TestMessage_init_default, SubMessage_init_default}
+#define OneofMessage_init_default                {0, {StaticMessage_init_default}}
+#define Enums_init_default                       {_SignedEnum_MIN, _UnsignedEnum_MIN}
+#define Callback2Message_init_zero               {TestMessage_init_zero, SubMessage_init_zero}
+#define OneofMessage_init_zero                   {0, {StaticMessage_init_zero}}
+#define Enums_init_zero                          {_SignedEnum_MIN, _UnsignedEnum_MIN}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Callback2Message_tstmsg_tag              1
+#define Callback2Message_submsg_tag              2
+#define Enums_senum_tag                          1
+#define Enums_uenum_tag                          2
+#define OneofMessage_tstmsg_tag                  1
+
+/* Struct field encoding specification for nanopb */
+#define Callback2Message_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, tstmsg, 1) \
+X(a, STATIC, REQUIRED, MESSAGE, submsg, 2)
+#define Callback2Message_CALLBACK NULL
+#define Callback2Message_DEFAULT NULL
+#define Callback2Message_DEFAULT_INSTANCE NULL
+#define Callback2Message_FIELD_RECORDS NULL
+#define Callback2Message_MSGFLAGS 0
+#define Callback2Message_tstmsg_MSGTYPE TestMessage
+#define Callback2Message_submsg_MSGTYPE SubMessage
+
+#define OneofMessage_FIELDLIST(X, a) \
+X(a, STATIC, ONEOF, MESSAGE, (msgs,tstmsg,msgs.tstmsg), 1)
+#define OneofMessage_CALLBACK NULL
+#define OneofMessage_DEFAULT NULL
+#define OneofMessage_DEFAULT_INSTANCE NULL
+#define OneofMessage_FIELD_RECORDS NULL
+#define OneofMessage_MSGFLAGS 0
+#define OneofMessage_msgs_tstmsg_MSGTYPE StaticMessage
+
+#define Enums_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, ENUM, senum, 1) \
+X(a, STATIC, REQUIRED, UENUM, uenum, 2)
+#define Enums_CALLBACK NULL
+#define Enums_DEFAULT NULL
+#define Enums_DEFAULT_INSTANCE NULL
+#define Enums_FIELD_RECORDS NULL
+#define Enums_MSGFLAGS 0
+
+extern const pb_msgdesc_t Callback2Message_msg;
+extern const pb_msgdesc_t OneofMessage_msg;
+extern const pb_msgdesc_t Enums_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Callback2Message_fields &Callback2Message_msg
+#define OneofMessage_fields &OneofMessage_msg
+#define Enums_fields &Enums_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Callback2Message_size                    (12 + TestMessage_size + SubMessage_size)
+#define OneofMessage_size                        27
+#define Enums_size                               14
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
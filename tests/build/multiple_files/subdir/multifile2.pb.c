@@ -0,0 +1,27 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "subdir/multifile2.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(subdir_Callback2Message, subdir_Callback2Message, 2)
+
+
+PB_BIND(subdir_SmallMessage, subdir_SmallMessage, AUTO)
+
+
+PB_BIND(subdir_OneofMessage, subdir_OneofMessage, AUTO)
+
+
+PB_BIND(subdir_Enums, subdir_Enums, AUTO)
+
+
+PB_BIND(subdir_SubdirMessage, subdir_SubdirMessage, AUTO)
+
+
+
+/* @@protoc_insertion_point(eof) */
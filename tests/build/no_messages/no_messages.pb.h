@@ -0,0 +1,30 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_NO_MESSAGES_PB_H_INCLUDED
+#define PB_NO_MESSAGES_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Enum definitions */
+typedef enum _Test {
+    Test_First = 1
+} Test;
+#define _Test_MIN Test_First
+#define _Test_MAX Test_First
+#define _Test_ARRAYSIZE ((Test)(Test_First+1))
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
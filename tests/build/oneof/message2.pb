@@ -0,0 +1 @@
+{2abcd
\ No newline at end of file
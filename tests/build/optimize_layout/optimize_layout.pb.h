@@ -0,0 +1,283 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_OPTIMIZE_LAYOUT_PB_H_INCLUDED
+#define PB_OPTIMIZE_LAYOUT_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Inner {
+    int32_t value;
+    bool has_flag;
+    bool flag;
+/* @@protoc_insertion_point(struct:Inner) */
+} Inner;
+
+
+typedef PB_BYTES_ARRAY_T(5) Optionals_key_t;
+typedef struct _Optionals {
+    bool has_timestamp;
+    int64_t timestamp;
+    bool has_count;
+    int32_t count;
+    bool has_enabled;
+    bool enabled;
+    bool has_level;
+    double level;
+    pb_size_t samples_count;
+    int32_t samples[3];
+    bool has_port;
+    uint16_t port;
+    pb_size_t flags_count;
+    bool flags[2];
+    bool has_code;
+    char code[3];
+    bool has_key;
+    Optionals_key_t key;
+/* @@protoc_insertion_point(struct:Optionals) */
+} Optionals;
+
+
+typedef PB_BYTES_ARRAY_T(5) OptionalsOptimized_key_t;
+typedef struct _OptionalsOptimized {
+    pb_size_t samples_count;
+    int32_t samples[3];
+    bool has_enabled;
+    bool enabled;
+    bool has_code;
+    char code[3];
+    bool has_timestamp;
+    int64_t timestamp;
+    pb_size_t flags_count;
+    bool flags[2];
+    bool has_level;
+    double level;
+    bool has_port;
+    uint16_t port;
+    bool has_count;
+    int32_t count;
+    bool has_key;
+    OptionalsOptimized_key_t key;
+/* @@protoc_insertion_point(struct:OptionalsOptimized) */
+} OptionalsOptimized;
+
+
+typedef struct _Telemetry {
+    bool valid;
+    double timestamp;
+    bool has_sequence;
+    uint8_t sequence;
+    bool has_voltage;
+    double voltage;
+    bool charging;
+    pb_size_t cells_count;
+    float cells[3];
+    bool has_label;
+    char label[5];
+    int64_t energy;
+    bool has_inner;
+    Inner inner;
+    pb_size_t which_source;
+    union {
+        bool external;
+        double current;
+    } source;
+/* @@protoc_insertion_point(struct:Telemetry) */
+} Telemetry;
+
+
+typedef struct _TelemetryOptimized {
+    double timestamp;
+    int64_t energy;
+    pb_size_t cells_count;
+    float cells[3];
+    bool valid;
+    bool has_sequence;
+    uint8_t sequence;
+    bool charging;
+    pb_size_t which_source;
+    union {
+        bool external;
+        double current;
+    } source;
+    bool has_label;
+    char label[5];
+    bool has_voltage;
+    double voltage;
+    bool has_inner;
+    Inner inner;
+/* @@protoc_insertion_point(struct:TelemetryOptimized) */
+} TelemetryOptimized;
+
+
+/* Initializer values for message structs */
+#define Inner_init_default                       {0, false, 0}
+#define Telemetry_init_default                   {0, 0, false, 0, false, 12.5, 0, 0, {0}, false, "bat", 0, false, Inner_init_default, 0, {0}}
+#define TelemetryOptimized_init_default          {0, 0, 0, {0}, 0, false, 0, 0, 0, {0}, false, "bat", false, 12.5, false, Inner_init_default}
+#define Optionals_init_default                   {false, 0, false, 0, false, 0, false, 0, 0, {0}, false, 0, 0, {0}, false, "", false, {0, {0}}}
+#define OptionalsOptimized_init_default          {0, {0}, false, 0, false, "", false, 0, 0, {0}, false, 0, false, 0, false, 0, false, {0, {0}}}
+#define Inner_init_zero                          {0, false, 0}
+#define Telemetry_init_zero                      {0, 0, false, 0, false, 0, 0, 0, {0}, false, "", 0, false, Inner_init_zero, 0, {0}}
+#define TelemetryOptimized_init_zero             {0, 0, 0, {0}, 0, false, 0, 0, 0, {0}, false, "", false, 0, false, Inner_init_zero}
+#define Optionals_init_zero                      {false, 0, false, 0, false, 0, false, 0, 0, {0}, false, 0, 0, {0}, false, "", false, {0, {0}}}
+#define OptionalsOptimized_init_zero             {0, {0}, false, 0, false, "", false, 0, 0, {0}, false, 0, false, 0, false, 0, false, {0, {0}}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Inner_value_tag                          1
+#define Inner_flag_tag                           2
+#define Optionals_timestamp_tag                  1
+#define Optionals_count_tag                      2
+#define Optionals_enabled_tag                    3
+#define Optionals_level_tag                      4
+#define Optionals_samples_tag                    5
+#define Optionals_port_tag                       6
+#define Optionals_flags_tag                      7
+#define Optionals_code_tag                       8
+#define Optionals_key_tag                        9
+#define OptionalsOptimized_timestamp_tag         1
+#define OptionalsOptimized_count_tag             2
+#define OptionalsOptimized_enabled_tag           3
+#define OptionalsOptimized_level_tag             4
+#define OptionalsOptimized_samples_tag           5
+#define OptionalsOptimized_port_tag              6
+#define OptionalsOptimized_flags_tag             7
+#define OptionalsOptimized_code_tag              8
+#define OptionalsOptimized_key_tag               9
+#define Telemetry_external_tag                   10
+#define Telemetry_current_tag                    11
+#define Telemetry_valid_tag                      1
+#define Telemetry_timestamp_tag                  2
+#define Telemetry_sequence_tag                   3
+#define Telemetry_voltage_tag                    4
+#define Telemetry_charging_tag                   5
+#define Telemetry_cells_tag                      6
+#define Telemetry_label_tag                      7
+#define Telemetry_energy_tag                     8
+#define Telemetry_inner_tag                      9
+#define TelemetryOptimized_external_tag          10
+#define TelemetryOptimized_current_tag           11
+#define TelemetryOptimized_valid_tag             1
+#define TelemetryOptimized_timestamp_tag         2
+#define TelemetryOptimized_sequence_tag          3
+#define TelemetryOptimized_voltage_tag           4
+#define TelemetryOptimized_charging_tag          5
+#define TelemetryOptimized_cells_tag             6
+#define TelemetryOptimized_label_tag             7
+#define TelemetryOptimized_energy_tag            8
+#define TelemetryOptimized_inner_tag             9
+
+/* Struct field encoding specification for nanopb */
+#define Inner_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, value, 1) \
+X(a, STATIC, OPTIONAL, BOOL, flag, 2)
+#define Inner_CALLBACK NULL
+#define Inner_DEFAULT NULL
+#define Inner_DEFAULT_INSTANCE NULL
+#define Inner_FIELD_RECORDS NULL
+#define Inner_MSGFLAGS 0
+
+#define Telemetry_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, BOOL, valid, 1) \
+X(a, STATIC, REQUIRED, DOUBLE, timestamp, 2) \
+X(a, STATIC, OPTIONAL, UINT32, sequence, 3) \
+X(a, STATIC, OPTIONAL, DOUBLE, voltage, 4) \
+X(a, STATIC, REQUIRED, BOOL, charging, 5) \
+X(a, STATIC, REPEATED, FLOAT, cells, 6) \
+X(a, STATIC, OPTIONAL, STRING, label, 7) \
+X(a, STATIC, REQUIRED, INT64, energy, 8) \
+X(a, STATIC, OPTIONAL, MESSAGE, inner, 9) \
+X(a, STATIC, ONEOF, BOOL, (source,external,source.external), 10) \
+X(a, STATIC, ONEOF, DOUBLE, (source,current,source.current), 11)
+#define Telemetry_CALLBACK NULL
+#define Telemetry_DEFAULT (const uint8_t*)"\x21\x00\x00\x00\x00\x00\x00\x29\x40\x3a\x03\x62\x61\x74\x00"
+#define Telemetry_DEFAULT_INSTANCE NULL
+#define Telemetry_FIELD_RECORDS NULL
+#define Telemetry_MSGFLAGS 0
+#define Telemetry_inner_MSGTYPE Inner
+
+#define TelemetryOptimized_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, BOOL, valid, 1) \
+X(a, STATIC, REQUIRED, DOUBLE, timestamp, 2) \
+X(a, STATIC, OPTIONAL, UINT32, sequence, 3) \
+X(a, STATIC, OPTIONAL, DOUBLE, voltage, 4) \
+X(a, STATIC, REQUIRED, BOOL, charging, 5) \
+X(a, STATIC, REPEATED, FLOAT, cells, 6) \
+X(a, STATIC, OPTIONAL, STRING, label, 7) \
+X(a, STATIC, REQUIRED, INT64, energy, 8) \
+X(a, STATIC, OPTIONAL, MESSAGE, inner, 9) \
+X(a, STATIC, ONEOF, BOOL, (source,external,source.external), 10) \
+X(a, STATIC, ONEOF, DOUBLE, (source,current,source.current), 11)
+#define TelemetryOptimized_CALLBACK NULL
+#define TelemetryOptimized_DEFAULT (const uint8_t*)"\x21\x00\x00\x00\x00\x00\x00\x29\x40\x3a\x03\x62\x61\x74\x00"
+#define TelemetryOptimized_DEFAULT_INSTANCE NULL
+#define TelemetryOptimized_FIELD_RECORDS NULL
+#define TelemetryOptimized_MSGFLAGS 0
+#define TelemetryOptimized_inner_MSGTYPE Inner
+
+#define Optionals_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, INT64, timestamp, 1) \
+X(a, STATIC, OPTIONAL, INT32, count, 2) \
+X(a, STATIC, OPTIONAL, BOOL, enabled, 3) \
+X(a, STATIC, OPTIONAL, DOUBLE, level, 4) \
+X(a, STATIC, REPEATED, INT32, samples, 5) \
+X(a, STATIC, OPTIONAL, UINT32, port, 6) \
+X(a, STATIC, REPEATED, BOOL, flags, 7) \
+X(a, STATIC, OPTIONAL, STRING, code, 8) \
+X(a, STATIC, OPTIONAL, BYTES, key, 9)
+#define Optionals_CALLBACK NULL
+#define Optionals_DEFAULT NULL
+#define Optionals_DEFAULT_INSTANCE NULL
+#define Optionals_FIELD_RECORDS NULL
+#define Optionals_MSGFLAGS 0
+
+#define OptionalsOptimized_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, INT64, timestamp, 1) \
+X(a, STATIC, OPTIONAL, INT32, count, 2) \
+X(a, STATIC, OPTIONAL, BOOL, enabled, 3) \
+X(a, STATIC, OPTIONAL, DOUBLE, level, 4) \
+X(a, STATIC, REPEATED, INT32, samples, 5) \
+X(a, STATIC, OPTIONAL, UINT32, port, 6) \
+X(a, STATIC, REPEATED, BOOL, flags, 7) \
+X(a, STATIC, OPTIONAL, STRING, code, 8) \
+X(a, STATIC, OPTIONAL, BYTES, key, 9)
+#define OptionalsOptimized_CALLBACK NULL
+#define OptionalsOptimized_DEFAULT NULL
+#define OptionalsOptimized_DEFAULT_INSTANCE NULL
+#define OptionalsOptimized_FIELD_RECORDS NULL
+#define OptionalsOptimized_MSGFLAGS 0
+
+extern const pb_msgdesc_t Inner_msg;
+extern const pb_msgdesc_t Telemetry_msg;
+extern const pb_msgdesc_t TelemetryOptimized_msg;
+extern const pb_msgdesc_t Optionals_msg;
+extern const pb_msgdesc_t OptionalsOptimized_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Inner_fields &Inner_msg
+#define Telemetry_fields &Telemetry_msg
+#define TelemetryOptimized_fields &TelemetryOptimized_msg
+#define Optionals_fields &Optionals_msg
+#define OptionalsOptimized_fields &OptionalsOptimized_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Inner_size                               13
+#define Telemetry_size                           81
+#define TelemetryOptimized_size                  81
+#define Optionals_size                           85
+#define OptionalsOptimized_size                  85
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,307 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_OPTIONS_PB_H_INCLUDED
+#define PB_OPTIONS_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Enum definitions */
+typedef enum _Enum1 {
+    EnumValue1 = 1,
+    EnumValue2 = 2
+} Enum1;
+#define _Enum1_MIN EnumValue1
+#define _Enum1_MAX EnumValue2
+#define _Enum1_ARRAYSIZE ((Enum1)(EnumValue2+1))
+#define Enum1_EnumValue1 EnumValue1
+#define Enum1_EnumValue2 EnumValue2
+
+typedef enum _Message5_Enum2 {
+    Message5_EnumValue1 = 1
+} Message5_Enum2;
+#define _Message5_Enum2_MIN Message5_EnumValue1
+#define _Message5_Enum2_MAX Message5_EnumValue1
+#define _Message5_Enum2_ARRAYSIZE ((Message5_Enum2)(Message5_EnumValue1+1))
+#define Message5_Enum2_EnumValue1 Message5_EnumValue1
+
+/* Struct definitions */
+typedef struct _Message4 {
+    pb_callback_t int32_callback;
+/* @@protoc_insertion_point(struct:Message4) */
+} Message4;
+
+
+typedef struct _EnumTest {
+    Enum1 field;
+/* @@protoc_insertion_point(struct:EnumTest) */
+} EnumTest;
+
+
+typedef struct _Message1 {
+    char filesize[20];
+/* @@protoc_insertion_point(struct:Message1) */
+} Message1;
+
+
+typedef struct _Message2 {
+    char msgsize[30];
+/* @@protoc_insertion_point(struct:Message2) */
+} Message2;
+
+
+typedef struct _Message3 {
+    char fieldsize[40];
+    char fieldlen[41];
+/* @@protoc_insertion_point(struct:Message3) */
+} Message3;
+
+
+typedef struct _Message5 {
+    Message5_Enum2 field;
+/* @@protoc_insertion_point(struct:Message5) */
+} Message5;
+
+
+typedef struct _Message6 {
+    int32_t field1;
+/* @@protoc_insertion_point(struct:Message6) */
+} Message6;
+
+
+typedef struct _OneofMessage {
+    pb_size_t which_foo;
+    union {
+        int32_t bar;
+    } foo;
+/* @@protoc_insertion_point(struct:OneofMessage) */
+} OneofMessage;
+
+
+typedef struct _Proto3Field {
+    int32_t proto3field;
+/* @@protoc_insertion_point(struct:Proto3Field) */
+} Proto3Field;
+
+
+typedef struct _WideMessage {
+    int32_t foo;
+/* @@protoc_insertion_point(struct:WideMessage) */
+} WideMessage;
+
+
+PB_PACKED_STRUCT_START
+typedef struct _my_packed_struct {
+    bool has_myfield;
+    int32_t myfield;
+/* @@protoc_insertion_point(struct:my_packed_struct) */
+} pb_packed my_packed_struct;
+PB_PACKED_STRUCT_END
+
+
+/* Initializer values for message structs */
+#define Message1_init_default                    {""}
+#define Message2_init_default                    {""}
+#define Message3_init_default                    {"", ""}
+#define Message4_init_default                    {{{NULL}, NULL}}
+#define EnumTest_init_default                    {EnumValue2}
+#define Message5_init_default                    {Message5_EnumValue1}
+#define my_packed_struct_init_default            {false, 0}
+#define Message6_init_default                    {0}
+#define OneofMessage_init_default                {0, {0}}
+#define Proto3Field_init_default                 {0}
+#define WideMessage_init_default                 {0}
+#define Message1_init_zero                       {""}
+#define Message2_init_zero                       {""}
+#define Message3_init_zero                       {"", ""}
+#define Message4_init_zero                       {{{NULL}, NULL}}
+#define EnumTest_init_zero                       {_Enum1_MIN}
+#define Message5_init_zero                       {_Message5_Enum2_MIN}
+#define my_packed_struct_init_zero               {false, 0}
+#define Message6_init_zero                       {0}
+#define OneofMessage_init_zero                   {0, {0}}
+#define Proto3Field_init_zero                    {0}
+#define WideMessage_init_zero                    {0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Message4_int32_callback_tag              1
+#define EnumTest_field_tag                       1
+#define Message1_filesize_tag                    1
+#define Message2_msgsize_tag                     1
+#define Message3_fieldsize_tag                   1
+#define Message3_fieldlen_tag                    2
+#define Message5_field_tag                       1
+#define Message6_field1_tag                      1
+#define OneofMessage_bar_tag                     1
+#define Proto3Field_proto3field_tag              1
+#define WideMessage_foo_tag                      1
+#define my_packed_struct_myfield_tag             1
+
+/* Struct field encoding specification for nanopb */
+#define Message1_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, STRING, filesize, 1)
+#define Message1_CALLBACK NULL
+#define Message1_DEFAULT NULL
+#define Message1_DEFAULT_INSTANCE NULL
+#define Message1_FIELD_RECORDS NULL
+#define Message1_MSGFLAGS 0
+
+#define Message2_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, STRING, msgsize, 1)
+#define Message2_CALLBACK NULL
+#define Message2_DEFAULT NULL
+#define Message2_DEFAULT_INSTANCE NULL
+#define Message2_FIELD_RECORDS NULL
+#define Message2_MSGFLAGS 0
+
+#define Message3_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, STRING, fieldsize, 1) \
+X(a, STATIC, REQUIRED, STRING, fieldlen, 2)
+#define Message3_CALLBACK NULL
+#define Message3_DEFAULT NULL
+#define Message3_DEFAULT_INSTANCE NULL
+#define Message3_FIELD_RECORDS NULL
+#define Message3_MSGFLAGS 0
+
+#define Message4_FIELDLIST(X, a) \
+X(a, CALLBACK, REQUIRED, INT32, int32_callback, 1)
+#define Message4_CALLBACK pb_default_field_callback
+#define Message4_DEFAULT NULL
+#define Message4_DEFAULT_INSTANCE NULL
+#define Message4_FIELD_RECORDS NULL
+#define Message4_MSGFLAGS 0
+
+#define EnumTest_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UENUM, field, 1)
+#define EnumTest_CALLBACK NULL
+#define EnumTest_DEFAULT (const uint8_t*)"\x08\x02\x00"
+#define EnumTest_DEFAULT_INSTANCE NULL
+#define EnumTest_FIELD_RECORDS NULL
+#define EnumTest_MSGFLAGS 0
+
+#define Message5_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UENUM, field, 1)
+#define Message5_CALLBACK NULL
+#define Message5_DEFAULT (const uint8_t*)"\x08\x01\x00"
+#define Message5_DEFAULT_INSTANCE NULL
+#define Message5_FIELD_RECORDS NULL
+#define Message5_MSGFLAGS 0
+
+#define my_packed_struct_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, INT32, myfield, 1)
+#define my_packed_struct_CALLBACK NULL
+#define my_packed_struct_DEFAULT NULL
+#define my_packed_struct_DEFAULT_INSTANCE NULL
+#define my_packed_struct_FIELD_RECORDS NULL
+#define my_packed_struct_MSGFLAGS 0
+
+#define Message6_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, field1, 1)
+#define Message6_CALLBACK NULL
+#define Message6_DEFAULT NULL
+#define Message6_DEFAULT_INSTANCE NULL
+#define Message6_FIELD_RECORDS NULL
+#define Message6_MSGFLAGS 0
+
+#define OneofMessage_FIELDLIST(X, a) \
+X(a, STATIC, ONEOF, INT32, (foo,bar,foo.bar), 1)
+#define OneofMessage_CALLBACK NULL
+#define OneofMessage_DEFAULT NULL
+#define OneofMessage_DEFAULT_INSTANCE NULL
+#define OneofMessage_FIELD_RECORDS NULL
+#define OneofMessage_MSGFLAGS 0
+
+#define Proto3Field_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, proto3field, 1)
+#define Proto3Field_CALLBACK NULL
+#define Proto3Field_DEFAULT NULL
+#define Proto3Field_DEFAULT_INSTANCE NULL
+#define Proto3Field_FIELD_RECORDS NULL
+#define Proto3Field_MSGFLAGS 0
+
+#define WideMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, foo, 1)
+#define WideMessage_CALLBACK NULL
+#define WideMessage_DEFAULT NULL
+#define WideMessage_DEFAULT_INSTANCE NULL
+#define WideMessage_FIELD_RECORDS NULL
+#define WideMessage_MSGFLAGS 0
+
+extern const pb_msgdesc_t Message1_msg;
+extern const pb_msgdesc_t Message2_msg;
+extern const pb_msgdesc_t Message3_msg;
+extern const pb_msgdesc_t Message4_msg;
+extern const pb_msgdesc_t EnumTest_msg;
+extern const pb_msgdesc_t Message5_msg;
+extern const pb_msgdesc_t my_packed_struct_msg;
+extern const pb_msgdesc_t Message6_msg;
+extern const pb_msgdesc_t OneofMessage_msg;
+extern const pb_msgdesc_t Proto3Field_msg;
+extern const pb_msgdesc_t WideMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Message1_fields &Message1_msg
+#define Message2_fields &Message2_msg
+#define Message3_fields &Message3_msg
+#define Message4_fields &Message4_msg
+#define EnumTest_fields &EnumTest_msg
+#define Message5_fields &Message5_msg
+#define my_packed_struct_fields &my_packed_struct_msg
+#define Message6_fields &Message6_msg
+#define OneofMessage_fields &OneofMessage_msg
+#define Proto3Field_fields &Proto3Field_msg
+#define WideMessage_fields &WideMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Message1_size                            21
+#define Message2_size                            31
+#define Message3_size                            83
+/* Message4_size depends on runtime parameters */
+#define EnumTest_size                            2
+#define Message5_size                            2
+#define my_packed_struct_size                    11
+#define Message6_size                            11
+#define OneofMessage_size                        11
+#define Proto3Field_size                         11
+#define WideMessage_size                         11
+
+/* Message IDs (where set with "msgid" option) */
+#ifdef PB_MSGID
+#define PB_MSG_103 Message3
+#define PB_MSG_104 Message4
+#define PB_MSG_105 Message5
+
+#define OPTIONS_MESSAGES \
+	PB_MSG(103,83,Message3) \
+	PB_MSG(104,-1,Message4) \
+	PB_MSG(105,2,Message5) \
+
+#define Message3_msgid 103
+#define Message4_msgid 104
+#define Message5_msgid 105
+
+#endif
+
+/* Dispatch by message ID, see pb_decode_by_msgid() */
+typedef union {
+    Message3 msg_Message3;
+    Message4 msg_Message4;
+    Message5 msg_Message5;
+} OPTIONS_msgid_union;
+
+extern const pb_msgid_table_t OPTIONS_msgid_table;
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,60 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_PROTO3_OPTIONS_PB_H_INCLUDED
+#define PB_PROTO3_OPTIONS_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Message1 {
+    int32_t proto3_default;
+    bool has_proto3_off;
+    int32_t proto3_off;
+    int32_t proto3_on;
+/* @@protoc_insertion_point(struct:Message1) */
+} Message1;
+
+
+/* Initializer values for message structs */
+#define Message1_init_default                    {0, false, 0, 0}
+#define Message1_init_zero                       {0, false, 0, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Message1_proto3_default_tag              1
+#define Message1_proto3_off_tag                  2
+#define Message1_proto3_on_tag                   3
+
+/* Struct field encoding specification for nanopb */
+#define Message1_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, proto3_default, 1) \
+X(a, STATIC, OPTIONAL, INT32, proto3_off, 2) \
+X(a, STATIC, SINGULAR, INT32, proto3_on, 3)
+#define Message1_CALLBACK NULL
+#define Message1_DEFAULT NULL
+#define Message1_DEFAULT_INSTANCE NULL
+#define Message1_FIELD_RECORDS NULL
+#define Message1_MSGFLAGS 0
+
+extern const pb_msgdesc_t Message1_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Message1_fields &Message1_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Message1_size                            33
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,70 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_PACKED_FIXED_ARRAYS_PB_H_INCLUDED
+#define PB_PACKED_FIXED_ARRAYS_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _SensorFrame {
+    pb_size_t samples_count;
+    float samples[512];
+    pb_size_t values_count;
+    double values[16];
+    pb_size_t ids_count;
+    uint32_t ids[8];
+    pb_size_t offsets_count;
+    int64_t offsets[8];
+    bool has_seq;
+    int32_t seq;
+/* @@protoc_insertion_point(struct:SensorFrame) */
+} SensorFrame;
+
+
+/* Initializer values for message structs */
+#define SensorFrame_init_default                 {0, {0}, 0, {0}, 0, {0}, 0, {0}, false, 0}
+#define SensorFrame_init_zero                    {0, {0}, 0, {0}, 0, {0}, 0, {0}, false, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define SensorFrame_samples_tag                  1
+#define SensorFrame_values_tag                   2
+#define SensorFrame_ids_tag                      3
+#define SensorFrame_offsets_tag                  4
+#define SensorFrame_seq_tag                      5
+
+/* Struct field encoding specification for nanopb */
+#define SensorFrame_FIELDLIST(X, a) \
+X(a, STATIC, REPEATED, FLOAT, samples, 1) \
+X(a, STATIC, REPEATED, DOUBLE, values, 2) \
+X(a, STATIC, REPEATED, FIXED32, ids, 3) \
+X(a, STATIC, REPEATED, SFIXED64, offsets, 4) \
+X(a, STATIC, OPTIONAL, INT32, seq, 5)
+#define SensorFrame_CALLBACK NULL
+#define SensorFrame_DEFAULT NULL
+#define SensorFrame_DEFAULT_INSTANCE NULL
+#define SensorFrame_FIELD_RECORDS NULL
+#define SensorFrame_MSGFLAGS 0
+
+extern const pb_msgdesc_t SensorFrame_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define SensorFrame_fields &SensorFrame_msg
+
+/* Maximum encoded size of messages (where known) */
+#define SensorFrame_size                         2827
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,137 @@
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include "unittests.h"
+#include "packed_fixed_arrays.pb.h"
+
+static SensorFrame frame;
+static SensorFrame decoded;
+static pb_byte_t buffer[SensorFrame_size];
+
+static void fill_frame(SensorFrame *msg)
+{
+    int i;
+    memset(msg, 0, sizeof(*msg));
+
+    msg->samples_count = 512;
+    for (i = 0; i < 512; i++)
+        msg->samples[i] = (float)i * 0.25f - 10.0f;
+
+    msg->values_count = 16;
+    for (i = 0; i < 16; i++)
+        msg->values[i] = (double)i * 1e100;
+
+    msg->ids_count = 8;
+    for (i = 0; i < 8; i++)
+        msg->ids[i] = 0x01020304u * (uint32_t)i;
+
+    msg->offsets_count = 8;
+    for (i = 0; i < 8; i++)
+        msg->offsets[i] = -(int64_t)i * 0x100000001LL;
+
+    msg->has_seq = true;
+    msg->seq = 5;
+}
+
+int main()
+{
+    int status = 0;
+    size_t msglen;
+
+    {
+        pb_ostream_t stream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+
+        COMMENT("Encode full arrays");
+        fill_frame(&frame);
+        TEST(pb_encode(&stream, SensorFrame_fields, &frame));
+        msglen = stream.bytes_written;
+
+        /* Tag 1, length 2048 as varint, then -10.0f in little endian */
+        TEST(buffer[0] == 0x0A && buffer[1] == 0x80 && buffer[2] == 0x10);
+        TEST(buffer[3] == 0x00 && buffer[4] == 0x00 && buffer[5] == 0x20 && buffer[6] == 0xC1);
+    }
+
+    {
+        pb_istream_t stream = pb_istream_from_buffer(buffer, msglen);
+
+        COMMENT("Decode full arrays");
+        TEST(pb_decode(&stream, SensorFrame_fields, &decoded));
+        TEST(decoded.samples_count == 512);
+        TEST(memcmp(decoded.samples, frame.samples, sizeof(frame.samples)) == 0);
+        TEST(decoded.values_count == 16);
+        TEST(memcmp(decoded.values, frame.values, sizeof(frame.values)) == 0);
+        TEST(decoded.ids_count == 8 && decoded.ids[7] == 0x01020304u * 7);
+        TEST(decoded.offsets_count == 8 && decoded.offsets[3] == -3 * 0x100000001LL);
+        TEST(decoded.has_seq && decoded.seq == 5);
+    }
+
+    {
+        pb_byte_t chunks[64];
+        pb_ostream_t ostream = pb_ostream_from_buffer(chunks, sizeof(chunks));
+        pb_istream_t istream;
+
+        COMMENT("Multiple packed chunks are appended");
+        memset(&frame, 0, sizeof(frame));
+        frame.ids_count = 3;
+        frame.ids[0] = 1; frame.ids[1] = 2; frame.ids[2] = 3;
+        TEST(pb_encode(&ostream, SensorFrame_fields, &frame));
+        frame.ids[0] = 4; frame.ids[1] = 5; frame.ids[2] = 6;
+        TEST(pb_encode(&ostream, SensorFrame_fields, &frame));
+
+        istream = pb_istream_from_buffer(chunks, ostream.bytes_written);
+        TEST(pb_decode(&istream, SensorFrame_fields, &decoded));
+        TEST(decoded.ids_count == 6);
+        TEST(decoded.ids[0] == 1 && decoded.ids[3] == 4 && decoded.ids[5] == 6);
+
+        COMMENT("Array overflow over multiple chunks");
+        istream = pb_istream_from_buffer(chunks, ostream.bytes_written);
+        TEST(!pb_decode_noinit(&istream, SensorFrame_fields, &decoded));
+        TEST(strcmp(PB_GET_ERROR(&istream), "array overflow") == 0);
+        TEST(decoded.ids_count == 8);
+    }
+
+    {
+        /* 9 values for ids[8] */
+        pb_byte_t data[2 + 36] = {0x1A, 36};
+        pb_istream_t stream = pb_istream_from_buffer(data, sizeof(data));
+
+        COMMENT("Too many values in a packed array");
+        TEST(!pb_decode(&stream, SensorFrame_fields, &decoded));
+        TEST(strcmp(PB_GET_ERROR(&stream), "array overflow") == 0);
+    }
+
+    {
+        /* Length is not a multiple of value size */
+        pb_byte_t data[2 + 6] = {0x1A, 6, 1, 0, 0, 0, 2, 0};
+        pb_istream_t stream = pb_istream_from_buffer(data, sizeof(data));
+
+        COMMENT("Partial value at end of packed array");
+        TEST(!pb_decode(&stream, SensorFrame_fields, &decoded));
+    }
+
+    {
+        /* Length is larger than the rest of the message */
+        pb_byte_t data[2 + 4] = {0x1A, 8, 1, 0, 0, 0};
+        pb_istream_t stream = pb_istream_from_buffer(data, sizeof(data));
+
+        COMMENT("Truncated packed array");
+        TEST(!pb_decode(&stream, SensorFrame_fields, &decoded));
+    }
+
+    {
+        pb_byte_t data[] = {0x1D, 1, 0, 0, 0, 0x1A, 8, 2, 0, 0, 0, 3, 0, 0, 0,
+                            0x1D, 4, 0, 0, 0};
+        pb_istream_t stream = pb_istream_from_buffer(data, sizeof(data));
+
+        COMMENT("Mixed packed and unpacked values");
+        TEST(pb_decode(&stream, SensorFrame_fields, &decoded));
+        TEST(decoded.ids_count == 4);
+        TEST(decoded.ids[0] == 1 && decoded.ids[1] == 2 && decoded.ids[2] == 3 && decoded.ids[3] == 4);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
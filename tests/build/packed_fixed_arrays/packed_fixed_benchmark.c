@@ -0,0 +1,73 @@
+/* Benchmark for encoding and decoding of a message with large packed
+ * float arrays. Prints the time per message, which can be compared
+ * between builds to catch performance regressions. Fails only if the
+ * decoded data does not match.
+ */
+
+#include <stdio.h>
+#include <string.h>
+#include <time.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include "packed_fixed_arrays.pb.h"
+
+#define ITERATIONS 5000
+
+static SensorFrame frame;
+static SensorFrame decoded;
+static pb_byte_t buffer[SensorFrame_size];
+
+static double elapsed_us(clock_t start)
+{
+    return (double)(clock() - start) * 1e6 / CLOCKS_PER_SEC / ITERATIONS;
+}
+
+int main()
+{
+    int i;
+    size_t msglen = 0;
+    clock_t start;
+
+    frame.samples_count = 512;
+    for (i = 0; i < 512; i++)
+        frame.samples[i] = (float)i / 3.0f;
+
+    frame.values_count = 16;
+    for (i = 0; i < 16; i++)
+        frame.values[i] = (double)i / 7.0;
+
+    start = clock();
+    for (i = 0; i < ITERATIONS; i++)
+    {
+        pb_ostream_t stream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+        if (!pb_encode(&stream, SensorFrame_fields, &frame))
+        {
+            printf("Encoding failed: %s\n", PB_GET_ERROR(&stream));
+            return 1;
+        }
+        msglen = stream.bytes_written;
+    }
+    printf("Encode: %.2f us per %d byte message\n", elapsed_us(start), (int)msglen);
+
+    start = clock();
+    for (i = 0; i < ITERATIONS; i++)
+    {
+        pb_istream_t stream = pb_istream_from_buffer(buffer, msglen);
+        if (!pb_decode(&stream, SensorFrame_fields, &decoded))
+        {
+            printf("Decoding failed: %s\n", PB_GET_ERROR(&stream));
+            return 1;
+        }
+    }
+    printf("Decode: %.2f us per %d byte message\n", elapsed_us(start), (int)msglen);
+
+    if (decoded.samples_count != 512 || decoded.values_count != 16 ||
+        memcmp(decoded.samples, frame.samples, sizeof(frame.samples)) != 0 ||
+        memcmp(decoded.values, frame.values, sizeof(frame.values)) != 0)
+    {
+        printf("Decoded data does not match\n");
+        return 1;
+    }
+
+    return 0;
+}
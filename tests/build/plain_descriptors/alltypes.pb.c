@@ -0,0 +1,272 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "alltypes.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+const uint32_t plain_SubMessage_field_info[] =
+{
+    PB_FIELDINFO_2(1, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_STRING, offsetof(plain_SubMessage, substuff1), pb_membersize(plain_SubMessage, substuff1), 0, 1)
+    PB_FIELDINFO_1(2, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_INT32, offsetof(plain_SubMessage, substuff2), pb_membersize(plain_SubMessage, substuff2), 0, 1)
+    PB_FIELDINFO_1(3, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_FIXED32, offsetof(plain_SubMessage, substuff3), pb_membersize(plain_SubMessage, substuff3), pb_delta(plain_SubMessage, substuff3, has_substuff3), 1)
+    0
+};
+const pb_msgdesc_t* plain_SubMessage_submsg_info[] =
+{
+    NULL
+};
+const pb_msgdesc_t plain_SubMessage_msg =
+{
+    3,
+    2,
+    plain_SubMessage_field_info,
+    plain_SubMessage_submsg_info,
+    plain_SubMessage_DEFAULT,
+    plain_SubMessage_CALLBACK,
+    plain_SubMessage_DEFAULT_INSTANCE,
+    sizeof(plain_SubMessage),
+    plain_SubMessage_FIELD_RECORDS,
+    plain_SubMessage_MSGFLAGS,
+};
+PB_FIELDINFO_ASSERT_2(1, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_STRING, offsetof(plain_SubMessage, substuff1), pb_membersize(plain_SubMessage, substuff1), 0, 1)
+PB_FIELDINFO_ASSERT_1(2, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_INT32, offsetof(plain_SubMessage, substuff2), pb_membersize(plain_SubMessage, substuff2), 0, 1)
+PB_FIELDINFO_ASSERT_1(3, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_FIXED32, offsetof(plain_SubMessage, substuff3), pb_membersize(plain_SubMessage, substuff3), pb_delta(plain_SubMessage, substuff3, has_substuff3), 1)
+
+
+const uint32_t plain_EmptyMessage_field_info[] =
+{
+    0
+};
+const pb_msgdesc_t* plain_EmptyMessage_submsg_info[] =
+{
+    NULL
+};
+const pb_msgdesc_t plain_EmptyMessage_msg =
+{
+    0,
+    0,
+    plain_EmptyMessage_field_info,
+    plain_EmptyMessage_submsg_info,
+    plain_EmptyMessage_DEFAULT,
+    plain_EmptyMessage_CALLBACK,
+    plain_EmptyMessage_DEFAULT_INSTANCE,
+    sizeof(plain_EmptyMessage),
+    plain_EmptyMessage_FIELD_RECORDS,
+    plain_EmptyMessage_MSGFLAGS,
+};
+
+
+const uint32_t plain_Limits_field_info[] =
+{
+    PB_FIELDINFO_1(1, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_INT32, offsetof(plain_Limits, int32_min), pb_membersize(plain_Limits, int32_min), 0, 1)
+    PB_FIELDINFO_1(2, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_INT32, offsetof(plain_Limits, int32_max), pb_membersize(plain_Limits, int32_max), 0, 1)
+    PB_FIELDINFO_1(3, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_UINT32, offsetof(plain_Limits, uint32_min), pb_membersize(plain_Limits, uint32_min), 0, 1)
+    PB_FIELDINFO_1(4, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_UINT32, offsetof(plain_Limits, uint32_max), pb_membersize(plain_Limits, uint32_max), 0, 1)
+    PB_FIELDINFO_1(5, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_INT64, offsetof(plain_Limits, int64_min), pb_membersize(plain_Limits, int64_min), 0, 1)
+    PB_FIELDINFO_1(6, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_INT64, offsetof(plain_Limits, int64_max), pb_membersize(plain_Limits, int64_max), 0, 1)
+    PB_FIELDINFO_1(7, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_UINT64, offsetof(plain_Limits, uint64_min), pb_membersize(plain_Limits, uint64_min), 0, 1)
+    PB_FIELDINFO_1(8, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_UINT64, offsetof(plain_Limits, uint64_max), pb_membersize(plain_Limits, uint64_max), 0, 1)
+    PB_FIELDINFO_1(9, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_ENUM, offsetof(plain_Limits, enum_min), pb_membersize(plain_Limits, enum_min), 0, 1)
+    PB_FIELDINFO_1(10, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_ENUM, offsetof(plain_Limits, enum_max), pb_membersize(plain_Limits, enum_max), 0, 1)
+    0
+};
+const pb_msgdesc_t* plain_Limits_submsg_info[] =
+{
+    NULL
+};
+const pb_msgdesc_t plain_Limits_msg =
+{
+    10,
+    10,
+    plain_Limits_field_info,
+    plain_Limits_submsg_info,
+    plain_Limits_DEFAULT,
+    plain_Limits_CALLBACK,
+    plain_Limits_DEFAULT_INSTANCE,
+    sizeof(plain_Limits),
+    plain_Limits_FIELD_RECORDS,
+    plain_Limits_MSGFLAGS,
+};
+PB_FIELDINFO_ASSERT_1(1, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_INT32, offsetof(plain_Limits, int32_min), pb_membersize(plain_Limits, int32_min), 0, 1)
+PB_FIELDINFO_ASSERT_1(2, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_INT32, offsetof(plain_Limits, int32_max), pb_membersize(plain_Limits, int32_max), 0, 1)
+PB_FIELDINFO_ASSERT_1(3, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_UINT32, offsetof(plain_Limits, uint32_min), pb_membersize(plain_Limits, uint32_min), 0, 1)
+PB_FIELDINFO_ASSERT_1(4, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_UINT32, offsetof(plain_Limits, uint32_max), pb_membersize(plain_Limits, uint32_max), 0, 1)
+PB_FIELDINFO_ASSERT_1(5, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_INT64, offsetof(plain_Limits, int64_min), pb_membersize(plain_Limits, int64_min), 0, 1)
+PB_FIELDINFO_ASSERT_1(6, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_INT64, offsetof(plain_Limits, int64_max), pb_membersize(plain_Limits, int64_max), 0, 1)
+PB_FIELDINFO_ASSERT_1(7, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_UINT64, offsetof(plain_Limits, uint64_min), pb_membersize(plain_Limits, uint64_min), 0, 1)
+PB_FIELDINFO_ASSERT_1(8, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_UINT64, offsetof(plain_Limits, uint64_max), pb_membersize(plain_Limits, uint64_max), 0, 1)
+PB_FIELDINFO_ASSERT_1(9, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_ENUM, offsetof(plain_Limits, enum_min), pb_membersize(plain_Limits, enum_min), 0, 1)
+PB_FIELDINFO_ASSERT_1(10, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_ENUM, offsetof(plain_Limits, enum_max), pb_membersize(plain_Limits, enum_max), 0, 1)
+
+
+const uint32_t plain_AllTypes_field_info[] =
+{
+    PB_FIELDINFO_2(1, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_INT32, offsetof(plain_AllTypes, req_int32), pb_membersize(plain_AllTypes, req_int32), 0, 1)
+    PB_FIELDINFO_2(2, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_INT64, offsetof(plain_AllTypes, req_int64), pb_membersize(plain_AllTypes, req_int64), 0, 1)
+    PB_FIELDINFO_2(3, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_UINT32, offsetof(plain_AllTypes, req_uint32), pb_membersize(plain_AllTypes, req_uint32), 0, 1)
+    PB_FIELDINFO_2(4, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_UINT64, offsetof(plain_AllTypes, req_uint64), pb_membersize(plain_AllTypes, req_uint64), 0, 1)
+    PB_FIELDINFO_2(5, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_SINT32, offsetof(plain_AllTypes, req_sint32), pb_membersize(plain_AllTypes, req_sint32), 0, 1)
+    PB_FIELDINFO_2(6, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_SINT64, offsetof(plain_AllTypes, req_sint64), pb_membersize(plain_AllTypes, req_sint64), 0, 1)
+    PB_FIELDINFO_2(7, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_BOOL, offsetof(plain_AllTypes, req_bool), pb_membersize(plain_AllTypes, req_bool), 0, 1)
+    PB_FIELDINFO_2(8, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_FIXED32, offsetof(plain_AllTypes, req_fixed32), pb_membersize(plain_AllTypes, req_fixed32), 0, 1)
+    PB_FIELDINFO_2(9, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_SFIXED32, offsetof(plain_AllTypes, req_sfixed32), pb_membersize(plain_AllTypes, req_sfixed32), 0, 1)
+    PB_FIELDINFO_2(10, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_FLOAT, offsetof(plain_AllTypes, req_float), pb_membersize(plain_AllTypes, req_float), 0, 1)
+    PB_FIELDINFO_2(11, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_FIXED64, offsetof(plain_AllTypes, req_fixed64), pb_membersize(plain_AllTypes, req_fixed64), 0, 1)
+    PB_FIELDINFO_2(12, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_SFIXED64, offsetof(plain_AllTypes, req_sfixed64), pb_membersize(plain_AllTypes, req_sfixed64), 0, 1)
+    PB_FIELDINFO_2(13, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_DOUBLE, offsetof(plain_AllTypes, req_double), pb_membersize(plain_AllTypes, req_double), 0, 1)
+    PB_FIELDINFO_2(14, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_STRING, offsetof(plain_AllTypes, req_string), pb_membersize(plain_AllTypes, req_string), 0, 1)
+    PB_FIELDINFO_2(15, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_BYTES, offsetof(plain_AllTypes, req_bytes), pb_membersize(plain_AllTypes, req_bytes), 0, 1)
+    PB_FIELDINFO_2(16, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_MESSAGE, offsetof(plain_AllTypes, req_submsg), pb_membersize(plain_AllTypes, req_submsg), 0, 1)
+    PB_FIELDINFO_2(17, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_UENUM, offsetof(plain_AllTypes, req_enum), pb_membersize(plain_AllTypes, req_enum), 0, 1)
+    PB_FIELDINFO_2(18, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_MESSAGE, offsetof(plain_AllTypes, req_emptymsg), pb_membersize(plain_AllTypes, req_emptymsg), 0, 1)
+    PB_FIELDINFO_2(19, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_FIXED_LENGTH_BYTES, offsetof(plain_AllTypes, req_fbytes), pb_membersize(plain_AllTypes, req_fbytes), 0, 1)
+    PB_FIELDINFO_2(21, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_INT32, offsetof(plain_AllTypes, rep_int32), pb_membersize(plain_AllTypes, rep_int32[0]), pb_delta(plain_AllTypes, rep_int32, rep_int32_count), pb_arraysize(plain_AllTypes, rep_int32))
+    PB_FIELDINFO_2(22, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_INT64, offsetof(plain_AllTypes, rep_int64), pb_membersize(plain_AllTypes, rep_int64[0]), pb_delta(plain_AllTypes, rep_int64, rep_int64_count), pb_arraysize(plain_AllTypes, rep_int64))
+    PB_FIELDINFO_2(23, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_UINT32, offsetof(plain_AllTypes, rep_uint32), pb_membersize(plain_AllTypes, rep_uint32[0]), pb_delta(plain_AllTypes, rep_uint32, rep_uint32_count), pb_arraysize(plain_AllTypes, rep_uint32))
+    PB_FIELDINFO_2(24, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_UINT64, offsetof(plain_AllTypes, rep_uint64), pb_membersize(plain_AllTypes, rep_uint64[0]), pb_delta(plain_AllTypes, rep_uint64, rep_uint64_count), pb_arraysize(plain_AllTypes, rep_uint64))
+    PB_FIELDINFO_2(25, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_SINT32, offsetof(plain_AllTypes, rep_sint32), pb_membersize(plain_AllTypes, rep_sint32[0]), pb_delta(plain_AllTypes, rep_sint32, rep_sint32_count), pb_arraysize(plain_AllTypes, rep_sint32))
+    PB_FIELDINFO_2(26, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_SINT64, offsetof(plain_AllTypes, rep_sint64), pb_membersize(plain_AllTypes, rep_sint64[0]), pb_delta(plain_AllTypes, rep_sint64, rep_sint64_count), pb_arraysize(plain_AllTypes, rep_sint64))
+    PB_FIELDINFO_2(27, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_BOOL, offsetof(plain_AllTypes, rep_bool), pb_membersize(plain_AllTypes, rep_bool[0]), pb_delta(plain_AllTypes, rep_bool, rep_bool_count), pb_arraysize(plain_AllTypes, rep_bool))
+    PB_FIELDINFO_2(28, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_FIXED32, offsetof(plain_AllTypes, rep_fixed32), pb_membersize(plain_AllTypes, rep_fixed32[0]), pb_delta(plain_AllTypes, rep_fixed32, rep_fixed32_count), pb_arraysize(plain_AllTypes, rep_fixed32))
+    PB_FIELDINFO_2(29, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_SFIXED32, offsetof(plain_AllTypes, rep_sfixed32), pb_membersize(plain_AllTypes, rep_sfixed32[0]), pb_delta(plain_AllTypes, rep_sfixed32, rep_sfixed32_count), pb_arraysize(plain_AllTypes, rep_sfixed32))
+    PB_FIELDINFO_2(30, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_FLOAT, offsetof(plain_AllTypes, rep_float), pb_membersize(plain_AllTypes, rep_float[0]), pb_delta(plain_AllTypes, rep_float, rep_float_count), pb_arraysize(plain_AllTypes, rep_float))
+    PB_FIELDINFO_2(31, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_FIXED64, offsetof(plain_AllTypes, rep_fixed64), pb_membersize(plain_AllTypes, rep_fixed64[0]), pb_delta(plain_AllTypes, rep_fixed64, rep_fixed64_count), pb_arraysize(plain_AllTypes, rep_fixed64))
+    PB_FIELDINFO_2(32, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_SFIXED64, offsetof(plain_AllTypes, rep_sfixed64), pb_membersize(plain_AllTypes, rep_sfixed64[0]), pb_delta(plain_AllTypes, rep_sfixed64, rep_sfixed64_count), pb_arraysize(plain_AllTypes, rep_sfixed64))
+    PB_FIELDINFO_2(33, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_DOUBLE, offsetof(plain_AllTypes, rep_double), pb_membersize(plain_AllTypes, rep_double[0]), pb_delta(plain_AllTypes, rep_double, rep_double_count), pb_arraysize(plain_AllTypes, rep_double))
+    PB_FIELDINFO_2(34, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_STRING, offsetof(plain_AllTypes, rep_string), pb_membersize(plain_AllTypes, rep_string[0]), pb_delta(plain_AllTypes, rep_string, rep_string_count), pb_arraysize(plain_AllTypes, rep_string))
+    PB_FIELDINFO_2(35, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_BYTES, offsetof(plain_AllTypes, rep_bytes), pb_membersize(plain_AllTypes, rep_bytes[0]), pb_delta(plain_AllTypes, rep_bytes, rep_bytes_count), pb_arraysize(plain_AllTypes, rep_bytes))
+    PB_FIELDINFO_2(36, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_MESSAGE, offsetof(plain_AllTypes, rep_submsg), pb_membersize(plain_AllTypes, rep_submsg[0]), pb_delta(plain_AllTypes, rep_submsg, rep_submsg_count), pb_arraysize(plain_AllTypes, rep_submsg))
+    PB_FIELDINFO_2(37, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_UENUM, offsetof(plain_AllTypes, rep_enum), pb_membersize(plain_AllTypes, rep_enum[0]), pb_delta(plain_AllTypes, rep_enum, rep_enum_count), pb_arraysize(plain_AllTypes, rep_enum))
+    PB_FIELDINFO_2(38, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_MESSAGE, offsetof(plain_AllTypes, rep_emptymsg), pb_membersize(plain_AllTypes, rep_emptymsg[0]), pb_delta(plain_AllTypes, rep_emptymsg, rep_emptymsg_count), pb_arraysize(plain_AllTypes, rep_emptymsg))
+    PB_FIELDINFO_2(39, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_FIXED_LENGTH_BYTES, offsetof(plain_AllTypes, rep_fbytes), pb_membersize(plain_AllTypes, rep_fbytes[0]), pb_delta(plain_AllTypes, rep_fbytes, rep_fbytes_count), pb_arraysize(plain_AllTypes, rep_fbytes))
+    PB_FIELDINFO_2(41, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_INT32, offsetof(plain_AllTypes, opt_int32), pb_membersize(plain_AllTypes, opt_int32), pb_delta(plain_AllTypes, opt_int32, has_opt_int32), 1)
+    PB_FIELDINFO_2(42, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_INT64, offsetof(plain_AllTypes, opt_int64), pb_membersize(plain_AllTypes, opt_int64), pb_delta(plain_AllTypes, opt_int64, has_opt_int64), 1)
+    PB_FIELDINFO_2(43, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_UINT32, offsetof(plain_AllTypes, opt_uint32), pb_membersize(plain_AllTypes, opt_uint32), pb_delta(plain_AllTypes, opt_uint32, has_opt_uint32), 1)
+    PB_FIELDINFO_2(44, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_UINT64, offsetof(plain_AllTypes, opt_uint64), pb_membersize(plain_AllTypes, opt_uint64), pb_delta(plain_AllTypes, opt_uint64, has_opt_uint64), 1)
+    PB_FIELDINFO_2(45, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_SINT32, offsetof(plain_AllTypes, opt_sint32), pb_membersize(plain_AllTypes, opt_sint32), pb_delta(plain_AllTypes, opt_sint32, has_opt_sint32), 1)
+    PB_FIELDINFO_2(46, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_SINT64, offsetof(plain_AllTypes, opt_sint64), pb_membersize(plain_AllTypes, opt_sint64), pb_delta(plain_AllTypes, opt_sint64, has_opt_sint64), 1)
+    PB_FIELDINFO_2(47, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_BOOL, offsetof(plain_AllTypes, opt_bool), pb_membersize(plain_AllTypes, opt_bool), pb_delta(plain_AllTypes, opt_bool, has_opt_bool), 1)
+    PB_FIELDINFO_2(48, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_FIXED32, offsetof(plain_AllTypes, opt_fixed32), pb_membersize(plain_AllTypes, opt_fixed32), pb_delta(plain_AllTypes, opt_fixed32, has_opt_fixed32), 1)
+    PB_FIELDINFO_2(49, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_SFIXED32, offsetof(plain_AllTypes, opt_sfixed32), pb_membersize(plain_AllTypes, opt_sfixed32), pb_delta(plain_AllTypes, opt_sfixed32, has_opt_sfixed32), 1)
+    PB_FIELDINFO_2(50, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_FLOAT, offsetof(plain_AllTypes, opt_float), pb_membersize(plain_AllTypes, opt_float), pb_delta(plain_AllTypes, opt_float, has_opt_float), 1)
+    PB_FIELDINFO_2(51, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_FIXED64, offsetof(plain_AllTypes, opt_fixed64), pb_membersize(plain_AllTypes, opt_fixed64), pb_delta(plain_AllTypes, opt_fixed64, has_opt_fixed64), 1)
+    PB_FIELDINFO_2(52, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_SFIXED64, offsetof(plain_AllTypes, opt_sfixed64), pb_membersize(plain_AllTypes, opt_sfixed64), pb_delta(plain_AllTypes, opt_sfixed64, has_opt_sfixed64), 1)
+    PB_FIELDINFO_2(53, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_DOUBLE, offsetof(plain_AllTypes, opt_double), pb_membersize(plain_AllTypes, opt_double), pb_delta(plain_AllTypes, opt_double, has_opt_double), 1)
+    PB_FIELDINFO_2(54, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_STRING, offsetof(plain_AllTypes, opt_string), pb_membersize(plain_AllTypes, opt_string), pb_delta(plain_AllTypes, opt_string, has_opt_string), 1)
+    PB_FIELDINFO_2(55, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_BYTES, offsetof(plain_AllTypes, opt_bytes), pb_membersize(plain_AllTypes, opt_bytes), pb_delta(plain_AllTypes, opt_bytes, has_opt_bytes), 1)
+    PB_FIELDINFO_2(56, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_MESSAGE, offsetof(plain_AllTypes, opt_submsg), pb_membersize(plain_AllTypes, opt_submsg), pb_delta(plain_AllTypes, opt_submsg, has_opt_submsg), 1)
+    PB_FIELDINFO_2(57, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_UENUM, offsetof(plain_AllTypes, opt_enum), pb_membersize(plain_AllTypes, opt_enum), pb_delta(plain_AllTypes, opt_enum, has_opt_enum), 1)
+    PB_FIELDINFO_2(58, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_MESSAGE, offsetof(plain_AllTypes, opt_emptymsg), pb_membersize(plain_AllTypes, opt_emptymsg), pb_delta(plain_AllTypes, opt_emptymsg, has_opt_emptymsg), 1)
+    PB_FIELDINFO_2(59, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_FIXED_LENGTH_BYTES, offsetof(plain_AllTypes, opt_fbytes), pb_membersize(plain_AllTypes, opt_fbytes), pb_delta(plain_AllTypes, opt_fbytes, has_opt_fbytes), 1)
+    PB_FIELDINFO_2(60, PB_ATYPE_STATIC | PB_HTYPE_ONEOF | PB_LTYPE_MAP_MESSAGE, offsetof(plain_AllTypes, oneof.oneof_msg1), pb_membersize(plain_AllTypes, oneof.oneof_msg1), pb_delta(plain_AllTypes, oneof.oneof_msg1, which_oneof), 1)
+    PB_FIELDINFO_2(61, PB_ATYPE_STATIC | PB_HTYPE_ONEOF | PB_LTYPE_MAP_MESSAGE, offsetof(plain_AllTypes, oneof.oneof_msg2), pb_membersize(plain_AllTypes, oneof.oneof_msg2), pb_delta(plain_AllTypes, oneof.oneof_msg2, which_oneof), 1)
+    PB_FIELDINFO_2(98, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_MESSAGE, offsetof(plain_AllTypes, req_limits), pb_membersize(plain_AllTypes, req_limits), 0, 1)
+    PB_FIELDINFO_2(99, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_INT32, offsetof(plain_AllTypes, end), pb_membersize(plain_AllTypes, end), 0, 1)
+    PB_FIELDINFO_2(200, PB_ATYPE_CALLBACK | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_EXTENSION, offsetof(plain_AllTypes, extensions), pb_membersize(plain_AllTypes, extensions), 0, 1)
+    0
+};
+const pb_msgdesc_t* plain_AllTypes_submsg_info[] =
+{
+    &plain_SubMessage_msg,
+    &plain_EmptyMessage_msg,
+    &plain_SubMessage_msg,
+    &plain_EmptyMessage_msg,
+    &plain_SubMessage_msg,
+    &plain_EmptyMessage_msg,
+    &plain_SubMessage_msg,
+    &plain_EmptyMessage_msg,
+    &plain_Limits_msg,
+    NULL
+};
+const pb_msgdesc_t plain_AllTypes_msg =
+{
+    62,
+    21,
+    plain_AllTypes_field_info,
+    plain_AllTypes_submsg_info,
+    plain_AllTypes_DEFAULT,
+    plain_AllTypes_CALLBACK,
+    plain_AllTypes_DEFAULT_INSTANCE,
+    sizeof(plain_AllTypes),
+    plain_AllTypes_FIELD_RECORDS,
+    plain_AllTypes_MSGFLAGS,
+};
+PB_FIELDINFO_ASSERT_2(1, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_INT32, offsetof(plain_AllTypes, req_int32), pb_membersize(plain_AllTypes, req_int32), 0, 1)
+PB_FIELDINFO_ASSERT_2(2, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_INT64, offsetof(plain_AllTypes, req_int64), pb_membersize(plain_AllTypes, req_int64), 0, 1)
+PB_FIELDINFO_ASSERT_2(3, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_UINT32, offsetof(plain_AllTypes, req_uint32), pb_membersize(plain_AllTypes, req_uint32), 0, 1)
+PB_FIELDINFO_ASSERT_2(4, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_UINT64, offsetof(plain_AllTypes, req_uint64), pb_membersize(plain_AllTypes, req_uint64), 0, 1)
+PB_FIELDINFO_ASSERT_2(5, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_SINT32, offsetof(plain_AllTypes, req_sint32), pb_membersize(plain_AllTypes, req_sint32), 0, 1)
+PB_FIELDINFO_ASSERT_2(6, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_SINT64, offsetof(plain_AllTypes, req_sint64), pb_membersize(plain_AllTypes, req_sint64), 0, 1)
+PB_FIELDINFO_ASSERT_2(7, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_BOOL, offsetof(plain_AllTypes, req_bool), pb_membersize(plain_AllTypes, req_bool), 0, 1)
+PB_FIELDINFO_ASSERT_2(8, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_FIXED32, offsetof(plain_AllTypes, req_fixed32), pb_membersize(plain_AllTypes, req_fixed32), 0, 1)
+PB_FIELDINFO_ASSERT_2(9, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_SFIXED32, offsetof(plain_AllTypes, req_sfixed32), pb_membersize(plain_AllTypes, req_sfixed32), 0, 1)
+PB_FIELDINFO_ASSERT_2(10, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_FLOAT, offsetof(plain_AllTypes, req_float), pb_membersize(plain_AllTypes, req_float), 0, 1)
+PB_FIELDINFO_ASSERT_2(11, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_FIXED64, offsetof(plain_AllTypes, req_fixed64), pb_membersize(plain_AllTypes, req_fixed64), 0, 1)
+PB_FIELDINFO_ASSERT_2(12, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_SFIXED64, offsetof(plain_AllTypes, req_sfixed64), pb_membersize(plain_AllTypes, req_sfixed64), 0, 1)
+PB_FIELDINFO_ASSERT_2(13, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_DOUBLE, offsetof(plain_AllTypes, req_double), pb_membersize(plain_AllTypes, req_double), 0, 1)
+PB_FIELDINFO_ASSERT_2(14, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_STRING, offsetof(plain_AllTypes, req_string), pb_membersize(plain_AllTypes, req_string), 0, 1)
+PB_FIELDINFO_ASSERT_2(15, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_BYTES, offsetof(plain_AllTypes, req_bytes), pb_membersize(plain_AllTypes, req_bytes), 0, 1)
+PB_FIELDINFO_ASSERT_2(16, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_MESSAGE, offsetof(plain_AllTypes, req_submsg), pb_membersize(plain_AllTypes, req_submsg), 0, 1)
+PB_FIELDINFO_ASSERT_2(17, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_UENUM, offsetof(plain_AllTypes, req_enum), pb_membersize(plain_AllTypes, req_enum), 0, 1)
+PB_FIELDINFO_ASSERT_2(18, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_MESSAGE, offsetof(plain_AllTypes, req_emptymsg), pb_membersize(plain_AllTypes, req_emptymsg), 0, 1)
+PB_FIELDINFO_ASSERT_2(19, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_FIXED_LENGTH_BYTES, offsetof(plain_AllTypes, req_fbytes), pb_membersize(plain_AllTypes, req_fbytes), 0, 1)
+PB_FIELDINFO_ASSERT_2(21, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_INT32, offsetof(plain_AllTypes, rep_int32), pb_membersize(plain_AllTypes, rep_int32[0]), pb_delta(plain_AllTypes, rep_int32, rep_int32_count), pb_arraysize(plain_AllTypes, rep_int32))
+PB_FIELDINFO_ASSERT_2(22, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_INT64, offsetof(plain_AllTypes, rep_int64), pb_membersize(plain_AllTypes, rep_int64[0]), pb_delta(plain_AllTypes, rep_int64, rep_int64_count), pb_arraysize(plain_AllTypes, rep_int64))
+PB_FIELDINFO_ASSERT_2(23, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_UINT32, offsetof(plain_AllTypes, rep_uint32), pb_membersize(plain_AllTypes, rep_uint32[0]), pb_delta(plain_AllTypes, rep_uint32, rep_uint32_count), pb_arraysize(plain_AllTypes, rep_uint32))
+PB_FIELDINFO_ASSERT_2(24, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_UINT64, offsetof(plain_AllTypes, rep_uint64), pb_membersize(plain_AllTypes, rep_uint64[0]), pb_delta(plain_AllTypes, rep_uint64, rep_uint64_count), pb_arraysize(plain_AllTypes, rep_uint64))
+PB_FIELDINFO_ASSERT_2(25, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_SINT32, offsetof(plain_AllTypes, rep_sint32), pb_membersize(plain_AllTypes, rep_sint32[0]), pb_delta(plain_AllTypes, rep_sint32, rep_sint32_count), pb_arraysize(plain_AllTypes, rep_sint32))
+PB_FIELDINFO_ASSERT_2(26, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_SINT64, offsetof(plain_AllTypes, rep_sint64), pb_membersize(plain_AllTypes, rep_sint64[0]), pb_delta(plain_AllTypes, rep_sint64, rep_sint64_count), pb_arraysize(plain_AllTypes, rep_sint64))
+PB_FIELDINFO_ASSERT_2(27, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_BOOL, offsetof(plain_AllTypes, rep_bool), pb_membersize(plain_AllTypes, rep_bool[0]), pb_delta(plain_AllTypes, rep_bool, rep_bool_count), pb_arraysize(plain_AllTypes, rep_bool))
+PB_FIELDINFO_ASSERT_2(28, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_FIXED32, offsetof(plain_AllTypes, rep_fixed32), pb_membersize(plain_AllTypes, rep_fixed32[0]), pb_delta(plain_AllTypes, rep_fixed32, rep_fixed32_count), pb_arraysize(plain_AllTypes, rep_fixed32))
+PB_FIELDINFO_ASSERT_2(29, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_SFIXED32, offsetof(plain_AllTypes, rep_sfixed32), pb_membersize(plain_AllTypes, rep_sfixed32[0]), pb_delta(plain_AllTypes, rep_sfixed32, rep_sfixed32_count), pb_arraysize(plain_AllTypes, rep_sfixed32))
+PB_FIELDINFO_ASSERT_2(30, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_FLOAT, offsetof(plain_AllTypes, rep_float), pb_membersize(plain_AllTypes, rep_float[0]), pb_delta(plain_AllTypes, rep_float, rep_float_count), pb_arraysize(plain_AllTypes, rep_float))
+PB_FIELDINFO_ASSERT_2(31, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_FIXED64, offsetof(plain_AllTypes, rep_fixed64), pb_membersize(plain_AllTypes, rep_fixed64[0]), pb_delta(plain_AllTypes, rep_fixed64, rep_fixed64_count), pb_arraysize(plain_AllTypes, rep_fixed64))
+PB_FIELDINFO_ASSERT_2(32, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_SFIXED64, offsetof(plain_AllTypes, rep_sfixed64), pb_membersize(plain_AllTypes, rep_sfixed64[0]), pb_delta(plain_AllTypes, rep_sfixed64, rep_sfixed64_count), pb_arraysize(plain_AllTypes, rep_sfixed64))
+PB_FIELDINFO_ASSERT_2(33, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_DOUBLE, offsetof(plain_AllTypes, rep_double), pb_membersize(plain_AllTypes, rep_double[0]), pb_delta(plain_AllTypes, rep_double, rep_double_count), pb_arraysize(plain_AllTypes, rep_double))
+PB_FIELDINFO_ASSERT_2(34, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_STRING, offsetof(plain_AllTypes, rep_string), pb_membersize(plain_AllTypes, rep_string[0]), pb_delta(plain_AllTypes, rep_string, rep_string_count), pb_arraysize(plain_AllTypes, rep_string))
+PB_FIELDINFO_ASSERT_2(35, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_BYTES, offsetof(plain_AllTypes, rep_bytes), pb_membersize(plain_AllTypes, rep_bytes[0]), pb_delta(plain_AllTypes, rep_bytes, rep_bytes_count), pb_arraysize(plain_AllTypes, rep_bytes))
+PB_FIELDINFO_ASSERT_2(36, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_MESSAGE, offsetof(plain_AllTypes, rep_submsg), pb_membersize(plain_AllTypes, rep_submsg[0]), pb_delta(plain_AllTypes, rep_submsg, rep_submsg_count), pb_arraysize(plain_AllTypes, rep_submsg))
+PB_FIELDINFO_ASSERT_2(37, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_UENUM, offsetof(plain_AllTypes, rep_enum), pb_membersize(plain_AllTypes, rep_enum[0]), pb_delta(plain_AllTypes, rep_enum, rep_enum_count), pb_arraysize(plain_AllTypes, rep_enum))
+PB_FIELDINFO_ASSERT_2(38, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_MESSAGE, offsetof(plain_AllTypes, rep_emptymsg), pb_membersize(plain_AllTypes, rep_emptymsg[0]), pb_delta(plain_AllTypes, rep_emptymsg, rep_emptymsg_count), pb_arraysize(plain_AllTypes, rep_emptymsg))
+PB_FIELDINFO_ASSERT_2(39, PB_ATYPE_STATIC | PB_HTYPE_REPEATED | PB_LTYPE_MAP_FIXED_LENGTH_BYTES, offsetof(plain_AllTypes, rep_fbytes), pb_membersize(plain_AllTypes, rep_fbytes[0]), pb_delta(plain_AllTypes, rep_fbytes, rep_fbytes_count), pb_arraysize(plain_AllTypes, rep_fbytes))
+PB_FIELDINFO_ASSERT_2(41, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_INT32, offsetof(plain_AllTypes, opt_int32), pb_membersize(plain_AllTypes, opt_int32), pb_delta(plain_AllTypes, opt_int32, has_opt_int32), 1)
+PB_FIELDINFO_ASSERT_2(42, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_INT64, offsetof(plain_AllTypes, opt_int64), pb_membersize(plain_AllTypes, opt_int64), pb_delta(plain_AllTypes, opt_int64, has_opt_int64), 1)
+PB_FIELDINFO_ASSERT_2(43, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_UINT32, offsetof(plain_AllTypes, opt_uint32), pb_membersize(plain_AllTypes, opt_uint32), pb_delta(plain_AllTypes, opt_uint32, has_opt_uint32), 1)
+PB_FIELDINFO_ASSERT_2(44, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_UINT64, offsetof(plain_AllTypes, opt_uint64), pb_membersize(plain_AllTypes, opt_uint64), pb_delta(plain_AllTypes, opt_uint64, has_opt_uint64), 1)
+PB_FIELDINFO_ASSERT_2(45, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_SINT32, offsetof(plain_AllTypes, opt_sint32), pb_membersize(plain_AllTypes, opt_sint32), pb_delta(plain_AllTypes, opt_sint32, has_opt_sint32), 1)
+PB_FIELDINFO_ASSERT_2(46, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_SINT64, offsetof(plain_AllTypes, opt_sint64), pb_membersize(plain_AllTypes, opt_sint64), pb_delta(plain_AllTypes, opt_sint64, has_opt_sint64), 1)
+PB_FIELDINFO_ASSERT_2(47, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_BOOL, offsetof(plain_AllTypes, opt_bool), pb_membersize(plain_AllTypes, opt_bool), pb_delta(plain_AllTypes, opt_bool, has_opt_bool), 1)
+PB_FIELDINFO_ASSERT_2(48, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_FIXED32, offsetof(plain_AllTypes, opt_fixed32), pb_membersize(plain_AllTypes, opt_fixed32), pb_delta(plain_AllTypes, opt_fixed32, has_opt_fixed32), 1)
+PB_FIELDINFO_ASSERT_2(49, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_SFIXED32, offsetof(plain_AllTypes, opt_sfixed32), pb_membersize(plain_AllTypes, opt_sfixed32), pb_delta(plain_AllTypes, opt_sfixed32, has_opt_sfixed32), 1)
+PB_FIELDINFO_ASSERT_2(50, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_FLOAT, offsetof(plain_AllTypes, opt_float), pb_membersize(plain_AllTypes, opt_float), pb_delta(plain_AllTypes, opt_float, has_opt_float), 1)
+PB_FIELDINFO_ASSERT_2(51, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_FIXED64, offsetof(plain_AllTypes, opt_fixed64), pb_membersize(plain_AllTypes, opt_fixed64), pb_delta(plain_AllTypes, opt_fixed64, has_opt_fixed64), 1)
+PB_FIELDINFO_ASSERT_2(52, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_SFIXED64, offsetof(plain_AllTypes, opt_sfixed64), pb_membersize(plain_AllTypes, opt_sfixed64), pb_delta(plain_AllTypes, opt_sfixed64, has_opt_sfixed64), 1)
+PB_FIELDINFO_ASSERT_2(53, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_DOUBLE, offsetof(plain_AllTypes, opt_double), pb_membersize(plain_AllTypes, opt_double), pb_delta(plain_AllTypes, opt_double, has_opt_double), 1)
+PB_FIELDINFO_ASSERT_2(54, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_STRING, offsetof(plain_AllTypes, opt_string), pb_membersize(plain_AllTypes, opt_string), pb_delta(plain_AllTypes, opt_string, has_opt_string), 1)
+PB_FIELDINFO_ASSERT_2(55, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_BYTES, offsetof(plain_AllTypes, opt_bytes), pb_membersize(plain_AllTypes, opt_bytes), pb_delta(plain_AllTypes, opt_bytes, has_opt_bytes), 1)
+PB_FIELDINFO_ASSERT_2(56, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_MESSAGE, offsetof(plain_AllTypes, opt_submsg), pb_membersize(plain_AllTypes, opt_submsg), pb_delta(plain_AllTypes, opt_submsg, has_opt_submsg), 1)
+PB_FIELDINFO_ASSERT_2(57, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_UENUM, offsetof(plain_AllTypes, opt_enum), pb_membersize(plain_AllTypes, opt_enum), pb_delta(plain_AllTypes, opt_enum, has_opt_enum), 1)
+PB_FIELDINFO_ASSERT_2(58, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_MESSAGE, offsetof(plain_AllTypes, opt_emptymsg), pb_membersize(plain_AllTypes, opt_emptymsg), pb_delta(plain_AllTypes, opt_emptymsg, has_opt_emptymsg), 1)
+PB_FIELDINFO_ASSERT_2(59, PB_ATYPE_STATIC | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_FIXED_LENGTH_BYTES, offsetof(plain_AllTypes, opt_fbytes), pb_membersize(plain_AllTypes, opt_fbytes), pb_delta(plain_AllTypes, opt_fbytes, has_opt_fbytes), 1)
+PB_FIELDINFO_ASSERT_2(60, PB_ATYPE_STATIC | PB_HTYPE_ONEOF | PB_LTYPE_MAP_MESSAGE, offsetof(plain_AllTypes, oneof.oneof_msg1), pb_membersize(plain_AllTypes, oneof.oneof_msg1), pb_delta(plain_AllTypes, oneof.oneof_msg1, which_oneof), 1)
+PB_FIELDINFO_ASSERT_2(61, PB_ATYPE_STATIC | PB_HTYPE_ONEOF | PB_LTYPE_MAP_MESSAGE, offsetof(plain_AllTypes, oneof.oneof_msg2), pb_membersize(plain_AllTypes, oneof.oneof_msg2), pb_delta(plain_AllTypes, oneof.oneof_msg2, which_oneof), 1)
+PB_FIELDINFO_ASSERT_2(98, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_MESSAGE, offsetof(plain_AllTypes, req_limits), pb_membersize(plain_AllTypes, req_limits), 0, 1)
+PB_FIELDINFO_ASSERT_2(99, PB_ATYPE_STATIC | PB_HTYPE_REQUIRED | PB_LTYPE_MAP_INT32, offsetof(plain_AllTypes, end), pb_membersize(plain_AllTypes, end), 0, 1)
+PB_FIELDINFO_ASSERT_2(200, PB_ATYPE_CALLBACK | PB_HTYPE_OPTIONAL | PB_LTYPE_MAP_EXTENSION, offsetof(plain_AllTypes, extensions), pb_membersize(plain_AllTypes, extensions), 0, 1)
+
+
+
+
+
+/* On some platforms (such as AVR), double is really float.
+ * Using double on these platforms is not directly supported
+ * by nanopb, but see example_avr_double.
+ * To get rid of this error, remove any double fields from your .proto.
+ */
+PB_STATIC_ASSERT(sizeof(double) == 8, DOUBLE_MUST_BE_8_BYTES)
+
+/* @@protoc_insertion_point(eof) */
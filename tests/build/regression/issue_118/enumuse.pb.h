@@ -0,0 +1,55 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_ENUMUSE_PB_H_INCLUDED
+#define PB_ENUMUSE_PB_H_INCLUDED
+#include <pb.h>
+
+#include "enumdef.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _MyMessage {
+    MyEnum myenum;
+/* @@protoc_insertion_point(struct:MyMessage) */
+} MyMessage;
+
+
+/* Initializer values for message structs */
+#define MyMessage_init_default                   {FOOBAR}
+#define MyMessage_init_zero                      {_MyEnum_MIN}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define MyMessage_myenum_tag                     1
+
+/* Struct field encoding specification for nanopb */
+#define MyMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UENUM, myenum, 1)
+#define MyMessage_CALLBACK NULL
+#define MyMessage_DEFAULT (const uint8_t*)"\x08\x01\x00"
+#define MyMessage_DEFAULT_INSTANCE NULL
+#define MyMessage_FIELD_RECORDS NULL
+#define MyMessage_MSGFLAGS 0
+
+extern const pb_msgdesc_t MyMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define MyMessage_fields &MyMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+#define MyMessage_size                           2
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,77 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_EXTENSIONBUG_PB_H_INCLUDED
+#define PB_EXTENSIONBUG_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Message1 {
+    char dummy_field;
+/* @@protoc_insertion_point(struct:Message1) */
+} Message1;
+
+
+typedef struct _Message2 {
+    bool has_field2;
+    uint32_t field2;
+/* @@protoc_insertion_point(struct:Message2) */
+} Message2;
+
+
+/* Extensions */
+extern const pb_extension_type_t Message2_extras; /* field type: Message2 extras; */
+
+/* Initializer values for message structs */
+#define Message1_init_default                    {0}
+#define Message2_init_default                    {false, 0}
+#define Message1_init_zero                       {0}
+#define Message2_init_zero                       {false, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Message2_field2_tag                      2
+#define Message2_extras_tag                      30
+
+/* Struct field encoding specification for nanopb */
+#define Message1_FIELDLIST(X, a) \
+
+#define Message1_CALLBACK NULL
+#define Message1_DEFAULT NULL
+#define Message1_DEFAULT_INSTANCE NULL
+#define Message1_FIELD_RECORDS NULL
+#define Message1_MSGFLAGS 0
+
+#define Message2_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, UINT32, field2, 2)
+#define Message2_CALLBACK NULL
+#define Message2_DEFAULT NULL
+#define Message2_DEFAULT_INSTANCE NULL
+#define Message2_FIELD_RECORDS NULL
+#define Message2_MSGFLAGS 0
+
+extern const pb_msgdesc_t Message1_msg;
+extern const pb_msgdesc_t Message2_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Message1_fields &Message1_msg
+#define Message2_fields &Message2_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Message1_size                            0
+#define Message2_size                            6
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,33 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "testproto.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(SubMessage, SubMessage, AUTO)
+
+
+PB_BIND(OneOfMessage, OneOfMessage, 2)
+
+
+PB_BIND(topMessage, topMessage, AUTO)
+
+
+PB_BIND(MyMessage1, MyMessage1, AUTO)
+
+
+PB_BIND(MyMessage2, MyMessage2, AUTO)
+
+
+PB_BIND(MyMessage3, MyMessage3, AUTO)
+
+
+PB_BIND(MyMessage4, MyMessage4, AUTO)
+
+
+
+/* @@protoc_insertion_point(eof) */
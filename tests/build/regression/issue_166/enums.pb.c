@@ -0,0 +1,20 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "enums.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(SignedMsg, SignedMsg, AUTO)
+
+
+PB_BIND(UnsignedMsg, UnsignedMsg, AUTO)
+
+
+
+
+
+/* @@protoc_insertion_point(eof) */
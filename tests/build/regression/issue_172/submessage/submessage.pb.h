@@ -0,0 +1,54 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_SUBMESSAGE_SUBMESSAGE_PB_H_INCLUDED
+#define PB_SUBMESSAGE_SUBMESSAGE_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef PB_BYTES_ARRAY_T(16) submessage_data_t;
+typedef struct _submessage {
+    submessage_data_t data;
+/* @@protoc_insertion_point(struct:submessage) */
+} submessage;
+
+
+/* Initializer values for message structs */
+#define submessage_init_default                  {{0, {0}}}
+#define submessage_init_zero                     {{0, {0}}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define submessage_data_tag                      1
+
+/* Struct field encoding specification for nanopb */
+#define submessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, BYTES, data, 1)
+#define submessage_CALLBACK NULL
+#define submessage_DEFAULT NULL
+#define submessage_DEFAULT_INSTANCE NULL
+#define submessage_FIELD_RECORDS NULL
+#define submessage_MSGFLAGS 0
+
+extern const pb_msgdesc_t submessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define submessage_fields &submessage_msg
+
+/* Maximum encoded size of messages (where known) */
+#define submessage_size                          18
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
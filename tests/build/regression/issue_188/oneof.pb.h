@@ -0,0 +1,104 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_ONEOF_PB_H_INCLUDED
+#define PB_ONEOF_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Enum definitions */
+typedef enum _EnumTwo {
+    EnumTwo_SOME_ENUM_1 = 1,
+    EnumTwo_SOME_ENUM_2 = 5,
+    EnumTwo_SOME_ENUM_3 = 6,
+    EnumTwo_SOME_ENUM_4 = 9,
+    EnumTwo_SOME_ENUM_5 = 10,
+    EnumTwo_SOME_ENUM_6 = 12,
+    EnumTwo_SOME_ENUM_7 = 39,
+    EnumTwo_SOME_ENUM_8 = 401
+} EnumTwo;
+#define _EnumTwo_MIN EnumTwo_SOME_ENUM_1
+#define _EnumTwo_MAX EnumTwo_SOME_ENUM_8
+#define _EnumTwo_ARRAYSIZE ((EnumTwo)(EnumTwo_SOME_ENUM_8+1))
+
+/* Struct definitions */
+typedef struct _MessageOne {
+    uint32_t one;
+    uint32_t two;
+    uint32_t three;
+    int32_t four;
+/* @@protoc_insertion_point(struct:MessageOne) */
+} MessageOne;
+
+
+typedef struct _OneofMessage {
+    pb_size_t which_payload;
+    union {
+        MessageOne message;
+        EnumTwo enum;
+    } payload;
+/* @@protoc_insertion_point(struct:OneofMessage) */
+} OneofMessage;
+
+
+/* Initializer values for message structs */
+#define MessageOne_init_default                  {0, 0, 0, 0}
+#define OneofMessage_init_default                {0, {MessageOne_init_default}}
+#define MessageOne_init_zero                     {0, 0, 0, 0}
+#define OneofMessage_init_zero                   {0, {MessageOne_init_zero}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define MessageOne_one_tag                       1
+#define MessageOne_two_tag                       2
+#define MessageOne_three_tag                     3
+#define MessageOne_four_tag                      4
+#define OneofMessage_message_tag                 1
+#define OneofMessage_enum_tag                    2
+
+/* Struct field encoding specification for nanopb */
+#define MessageOne_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT32, one, 1) \
+X(a, STATIC, REQUIRED, UINT32, two, 2) \
+X(a, STATIC, REQUIRED, UINT32, three, 3) \
+X(a, STATIC, REQUIRED, INT32, four, 4)
+#define MessageOne_CALLBACK NULL
+#define MessageOne_DEFAULT NULL
+#define MessageOne_DEFAULT_INSTANCE NULL
+#define MessageOne_FIELD_RECORDS NULL
+#define MessageOne_MSGFLAGS 0
+
+#define OneofMessage_FIELDLIST(X, a) \
+X(a, STATIC, ONEOF, MESSAGE, (payload,message,payload.message), 1) \
+X(a, STATIC, ONEOF, ENUM, (payload,enum,payload.enum), 2)
+#define OneofMessage_CALLBACK NULL
+#define OneofMessage_DEFAULT NULL
+#define OneofMessage_DEFAULT_INSTANCE NULL
+#define OneofMessage_FIELD_RECORDS NULL
+#define OneofMessage_MSGFLAGS 0
+#define OneofMessage_payload_message_MSGTYPE MessageOne
+
+extern const pb_msgdesc_t MessageOne_msg;
+extern const pb_msgdesc_t OneofMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define MessageOne_fields &MessageOne_msg
+#define OneofMessage_fields &OneofMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+#define MessageOne_size                          29
+#define OneofMessage_size                        31
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
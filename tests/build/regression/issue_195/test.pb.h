@@ -0,0 +1,80 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_TEST_PB_H_INCLUDED
+#define PB_TEST_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _TestMessage {
+    uint32_t id;
+    pb_callback_t payload;
+/* @@protoc_insertion_point(struct:TestMessage) */
+} TestMessage;
+
+
+typedef struct _EncapsulatedMessage {
+    uint32_t id;
+    TestMessage test;
+/* @@protoc_insertion_point(struct:EncapsulatedMessage) */
+} EncapsulatedMessage;
+
+
+/* Initializer values for message structs */
+#define TestMessage_init_default                 {0, {{NULL}, NULL}}
+#define EncapsulatedMessage_init_default         {0, TestMessage_init_default}
+#define TestMessage_init_zero                    {0, {{NULL}, NULL}}
+#define EncapsulatedMessage_init_zero            {0, TestMessage_init_zero}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define TestMessage_id_tag                       1
+#define TestMessage_payload_tag                  2
+#define EncapsulatedMessage_id_tag               1
+#define EncapsulatedMessage_test_tag             2
+
+/* Struct field encoding specification for nanopb */
+#define TestMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT32, id, 1) \
+X(a, CALLBACK, REQUIRED, BYTES, payload, 2)
+#define TestMessage_CALLBACK pb_default_field_callback
+#define TestMessage_DEFAULT NULL
+#define TestMessage_DEFAULT_INSTANCE NULL
+#define TestMessage_FIELD_RECORDS NULL
+#define TestMessage_MSGFLAGS 0
+
+#define EncapsulatedMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT32, id, 1) \
+X(a, STATIC, REQUIRED, MESSAGE, test, 2)
+#define EncapsulatedMessage_CALLBACK NULL
+#define EncapsulatedMessage_DEFAULT NULL
+#define EncapsulatedMessage_DEFAULT_INSTANCE NULL
+#define EncapsulatedMessage_FIELD_RECORDS NULL
+#define EncapsulatedMessage_MSGFLAGS 0
+#define EncapsulatedMessage_test_MSGTYPE TestMessage
+
+extern const pb_msgdesc_t TestMessage_msg;
+extern const pb_msgdesc_t EncapsulatedMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define TestMessage_fields &TestMessage_msg
+#define EncapsulatedMessage_fields &EncapsulatedMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+/* TestMessage_size depends on runtime parameters */
+/* EncapsulatedMessage_size depends on runtime parameters */
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,62 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_MULTIPLE_ONEOF_PB_H_INCLUDED
+#define PB_MULTIPLE_ONEOF_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _MainMessage {
+    pb_size_t which_oneof1;
+    union {
+        uint32_t oneof1_uint32;
+    } oneof1;
+    pb_size_t which_oneof2;
+    union {
+        uint32_t oneof2_uint32;
+    } oneof2;
+/* @@protoc_insertion_point(struct:MainMessage) */
+} MainMessage;
+
+
+/* Initializer values for message structs */
+#define MainMessage_init_default                 {0, {0}, 0, {0}}
+#define MainMessage_init_zero                    {0, {0}, 0, {0}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define MainMessage_oneof1_uint32_tag            1
+#define MainMessage_oneof2_uint32_tag            2
+
+/* Struct field encoding specification for nanopb */
+#define MainMessage_FIELDLIST(X, a) \
+X(a, STATIC, ONEOF, UINT32, (oneof1,oneof1_uint32,oneof1.oneof1_uint32), 1) \
+X(a, STATIC, ONEOF, UINT32, (oneof2,oneof2_uint32,oneof2.oneof2_uint32), 2)
+#define MainMessage_CALLBACK NULL
+#define MainMessage_DEFAULT NULL
+#define MainMessage_DEFAULT_INSTANCE NULL
+#define MainMessage_FIELD_RECORDS NULL
+#define MainMessage_MSGFLAGS 0
+
+extern const pb_msgdesc_t MainMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define MainMessage_fields &MainMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+#define MainMessage_size                         12
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,38 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "zero_value.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(Extendable, Extendable, AUTO)
+
+
+PB_BIND(PointerMessage, PointerMessage, AUTO)
+
+
+/* Definition for extension field opt_int32 */
+typedef struct _opt_int32_extmsg {
+    int32_t opt_int32;
+/* @@protoc_insertion_point(struct:opt_int32_extmsg) */
+} opt_int32_extmsg;
+#define opt_int32_extmsg_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, opt_int32, 11)
+#define opt_int32_extmsg_CALLBACK NULL
+#define opt_int32_extmsg_DEFAULT NULL
+#define opt_int32_extmsg_DEFAULT_INSTANCE NULL
+#define opt_int32_extmsg_FIELD_RECORDS NULL
+#define opt_int32_extmsg_MSGFLAGS 0
+pb_byte_t opt_int32_extmsg_default[] = {0x00};
+PB_BIND(opt_int32_extmsg, opt_int32_extmsg, AUTO)
+const pb_extension_type_t opt_int32 = {
+    NULL,
+    NULL,
+    &opt_int32_extmsg_msg
+};
+
+
+/* @@protoc_insertion_point(eof) */
@@ -0,0 +1,114 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "bigvalue.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(enterprise_BigData, enterprise_BigData, AUTO)
+
+
+PB_BIND(enterprise_BigEvent, enterprise_BigEvent, AUTO)
+
+
+PB_BIND(enterprise_BigValue1, enterprise_BigValue1, AUTO)
+
+
+PB_BIND(enterprise_BigValue2, enterprise_BigValue2, AUTO)
+
+
+PB_BIND(enterprise_BigValue3, enterprise_BigValue3, AUTO)
+
+
+PB_BIND(enterprise_BigValue4, enterprise_BigValue4, AUTO)
+
+
+PB_BIND(enterprise_BigValue5, enterprise_BigValue5, AUTO)
+
+
+PB_BIND(enterprise_BigValue6, enterprise_BigValue6, AUTO)
+
+
+PB_BIND(enterprise_BigValue7, enterprise_BigValue7, AUTO)
+
+
+PB_BIND(enterprise_BigValue8, enterprise_BigValue8, AUTO)
+
+
+PB_BIND(enterprise_BigValue9, enterprise_BigValue9, AUTO)
+
+
+PB_BIND(enterprise_BigValue10, enterprise_BigValue10, AUTO)
+
+
+PB_BIND(enterprise_BigValue11, enterprise_BigValue11, AUTO)
+
+
+PB_BIND(enterprise_BigValue12, enterprise_BigValue12, AUTO)
+
+
+PB_BIND(enterprise_BigValue13, enterprise_BigValue13, AUTO)
+
+
+PB_BIND(enterprise_BigValue14, enterprise_BigValue14, AUTO)
+
+
+PB_BIND(enterprise_BigValue15, enterprise_BigValue15, AUTO)
+
+
+PB_BIND(enterprise_BigValue16, enterprise_BigValue16, AUTO)
+
+
+PB_BIND(enterprise_BigValue17, enterprise_BigValue17, AUTO)
+
+
+PB_BIND(enterprise_BigValue18, enterprise_BigValue18, AUTO)
+
+
+PB_BIND(enterprise_BigValue19, enterprise_BigValue19, AUTO)
+
+
+PB_BIND(enterprise_BigValue20, enterprise_BigValue20, AUTO)
+
+
+PB_BIND(enterprise_BigValue21, enterprise_BigValue21, AUTO)
+
+
+PB_BIND(enterprise_BigValue22, enterprise_BigValue22, AUTO)
+
+
+PB_BIND(enterprise_BigValue23, enterprise_BigValue23, AUTO)
+
+
+PB_BIND(enterprise_BigValue24, enterprise_BigValue24, AUTO)
+
+
+PB_BIND(enterprise_BigValue25, enterprise_BigValue25, AUTO)
+
+
+PB_BIND(enterprise_BigValue26, enterprise_BigValue26, AUTO)
+
+
+PB_BIND(enterprise_BigValue27, enterprise_BigValue27, AUTO)
+
+
+PB_BIND(enterprise_BigValue28, enterprise_BigValue28, AUTO)
+
+
+PB_BIND(enterprise_BigValue29, enterprise_BigValue29, AUTO)
+
+
+PB_BIND(enterprise_BigValue30, enterprise_BigValue30, AUTO)
+
+
+PB_BIND(enterprise_BigValue31, enterprise_BigValue31, AUTO)
+
+
+PB_BIND(enterprise_BigValue32, enterprise_BigValue32, AUTO)
+
+
+
+/* @@protoc_insertion_point(eof) */
@@ -0,0 +1,938 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_ENTERPRISE_BIGVALUE_PB_H_INCLUDED
+#define PB_ENTERPRISE_BIGVALUE_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _enterprise_BigData {
+    pb_callback_t events;
+/* @@protoc_insertion_point(struct:enterprise_BigData) */
+} enterprise_BigData;
+
+
+typedef struct _enterprise_BigValue1 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue1) */
+} enterprise_BigValue1;
+
+
+typedef struct _enterprise_BigValue10 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue10) */
+} enterprise_BigValue10;
+
+
+typedef struct _enterprise_BigValue11 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue11) */
+} enterprise_BigValue11;
+
+
+typedef struct _enterprise_BigValue12 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue12) */
+} enterprise_BigValue12;
+
+
+typedef struct _enterprise_BigValue13 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue13) */
+} enterprise_BigValue13;
+
+
+typedef struct _enterprise_BigValue14 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue14) */
+} enterprise_BigValue14;
+
+
+typedef struct _enterprise_BigValue15 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue15) */
+} enterprise_BigValue15;
+
+
+typedef struct _enterprise_BigValue16 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue16) */
+} enterprise_BigValue16;
+
+
+typedef struct _enterprise_BigValue17 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue17) */
+} enterprise_BigValue17;
+
+
+typedef struct _enterprise_BigValue18 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue18) */
+} enterprise_BigValue18;
+
+
+typedef struct _enterprise_BigValue19 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue19) */
+} enterprise_BigValue19;
+
+
+typedef struct _enterprise_BigValue2 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue2) */
+} enterprise_BigValue2;
+
+
+typedef struct _enterprise_BigValue20 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue20) */
+} enterprise_BigValue20;
+
+
+typedef struct _enterprise_BigValue21 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue21) */
+} enterprise_BigValue21;
+
+
+typedef struct _enterprise_BigValue22 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue22) */
+} enterprise_BigValue22;
+
+
+typedef struct _enterprise_BigValue23 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue23) */
+} enterprise_BigValue23;
+
+
+typedef struct _enterprise_BigValue24 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue24) */
+} enterprise_BigValue24;
+
+
+typedef struct _enterprise_BigValue25 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue25) */
+} enterprise_BigValue25;
+
+
+typedef struct _enterprise_BigValue26 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue26) */
+} enterprise_BigValue26;
+
+
+typedef struct _enterprise_BigValue27 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue27) */
+} enterprise_BigValue27;
+
+
+typedef struct _enterprise_BigValue28 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue28) */
+} enterprise_BigValue28;
+
+
+typedef struct _enterprise_BigValue29 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue29) */
+} enterprise_BigValue29;
+
+
+typedef struct _enterprise_BigValue3 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue3) */
+} enterprise_BigValue3;
+
+
+typedef struct _enterprise_BigValue30 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue30) */
+} enterprise_BigValue30;
+
+
+typedef struct _enterprise_BigValue31 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue31) */
+} enterprise_BigValue31;
+
+
+typedef struct _enterprise_BigValue32 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue32) */
+} enterprise_BigValue32;
+
+
+typedef struct _enterprise_BigValue4 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue4) */
+} enterprise_BigValue4;
+
+
+typedef struct _enterprise_BigValue5 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue5) */
+} enterprise_BigValue5;
+
+
+typedef struct _enterprise_BigValue6 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue6) */
+} enterprise_BigValue6;
+
+
+typedef struct _enterprise_BigValue7 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue7) */
+} enterprise_BigValue7;
+
+
+typedef struct _enterprise_BigValue8 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue8) */
+} enterprise_BigValue8;
+
+
+typedef struct _enterprise_BigValue9 {
+    int32_t key;
+    pb_callback_t value;
+/* @@protoc_insertion_point(struct:enterprise_BigValue9) */
+} enterprise_BigValue9;
+
+
+typedef struct _enterprise_BigEvent {
+    pb_size_t which_event;
+    union {
+        enterprise_BigValue1 data1;
+        enterprise_BigValue2 data2;
+        enterprise_BigValue3 data3;
+        enterprise_BigValue4 data4;
+        enterprise_BigValue5 data5;
+        enterprise_BigValue6 data6;
+        enterprise_BigValue7 data7;
+        enterprise_BigValue8 data8;
+        enterprise_BigValue9 data9;
+        enterprise_BigValue10 data10;
+        enterprise_BigValue11 data11;
+        enterprise_BigValue12 data12;
+        enterprise_BigValue13 data13;
+        enterprise_BigValue14 data14;
+        enterprise_BigValue15 data15;
+        enterprise_BigValue16 data16;
+        enterprise_BigValue17 data17;
+        enterprise_BigValue18 data18;
+        enterprise_BigValue19 data19;
+        enterprise_BigValue20 data20;
+        enterprise_BigValue21 data21;
+        enterprise_BigValue22 data22;
+        enterprise_BigValue23 data23;
+        enterprise_BigValue24 data24;
+        enterprise_BigValue25 data25;
+        enterprise_BigValue26 data26;
+        enterprise_BigValue27 data27;
+        enterprise_BigValue28 data28;
+        enterprise_BigValue29 data29;
+        enterprise_BigValue30 data30;
+        enterprise_BigValue31 data31;
+        enterprise_BigValue32 data32;
+    } event;
+/* @@protoc_insertion_point(struct:enterprise_BigEvent) */
+} enterprise_BigEvent;
+
+
+/* Initializer values for message structs */
+#define enterprise_BigData_init_default          {{{NULL}, NULL}}
+#define enterprise_BigEvent_init_default         {0, {enterprise_BigValue1_init_default}}
+#define enterprise_BigValue1_init_default        {0, {{NULL}, NULL}}
+#define enterprise_BigValue2_init_default        {0, {{NULL}, NULL}}
+#define enterprise_BigValue3_init_default        {0, {{NULL}, NULL}}
+#define enterprise_BigValue4_init_default        {0, {{NULL}, NULL}}
+#define enterprise_BigValue5_init_default        {0, {{NULL}, NULL}}
+#define enterprise_BigValue6_init_default        {0, {{NULL}, NULL}}
+#define enterprise_BigValue7_init_default        {0, {{NULL}, NULL}}
+#define enterprise_BigValue8_init_default        {0, {{NULL}, NULL}}
+#define enterprise_BigValue9_init_default        {0, {{NULL}, NULL}}
+#define enterprise_BigValue10_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue11_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue12_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue13_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue14_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue15_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue16_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue17_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue18_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue19_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue20_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue21_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue22_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue23_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue24_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue25_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue26_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue27_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue28_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue29_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue30_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue31_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigValue32_init_default       {0, {{NULL}, NULL}}
+#define enterprise_BigData_init_zero             {{{NULL}, NULL}}
+#define enterprise_BigEvent_init_zero            {0, {enterprise_BigValue1_init_zero}}
+#define enterprise_BigValue1_init_zero           {0, {{NULL}, NULL}}
+#define enterprise_BigValue2_init_zero           {0, {{NULL}, NULL}}
+#define enterprise_BigValue3_init_zero           {0, {{NULL}, NULL}}
+#define enterprise_BigValue4_init_zero           {0, {{NULL}, NULL}}
+#define enterprise_BigValue5_init_zero           {0, {{NULL}, NULL}}
+#define enterprise_BigValue6_init_zero           {0, {{NULL}, NULL}}
+#define enterprise_BigValue7_init_zero           {0, {{NULL}, NULL}}
+#define enterprise_BigValue8_init_zero           {0, {{NULL}, NULL}}
+#define enterprise_BigValue9_init_zero           {0, {{NULL}, NULL}}
+#define enterprise_BigValue10_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue11_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue12_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue13_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue14_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue15_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue16_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue17_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue18_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue19_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue20_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue21_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue22_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue23_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue24_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue25_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue26_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue27_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue28_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue29_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue30_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue31_init_zero          {0, {{NULL}, NULL}}
+#define enterprise_BigValue32_init_zero          {0, {{NULL}, NULL}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define enterprise_BigData_events_tag            1
+#define enterprise_BigValue1_key_tag             1
+#define enterprise_BigValue1_value_tag           2
+#define enterprise_BigValue10_key_tag            1
+#define enterprise_BigValue10_value_tag          2
+#define enterprise_BigValue11_key_tag            1
+#define enterprise_BigValue11_value_tag          2
+#define enterprise_BigValue12_key_tag            1
+#define enterprise_BigValue12_value_tag          2
+#define enterprise_BigValue13_key_tag            1
+#define enterprise_BigValue13_value_tag          2
+#define enterprise_BigValue14_key_tag            1
+#define enterprise_BigValue14_value_tag          2
+#define enterprise_BigValue15_key_tag            1
+#define enterprise_BigValue15_value_tag          2
+#define enterprise_BigValue16_key_tag            1
+#define enterprise_BigValue16_value_tag          2
+#define enterprise_BigValue17_key_tag            1
+#define enterprise_BigValue17_value_tag          2
+#define enterprise_BigValue18_key_tag            1
+#define enterprise_BigValue18_value_tag          2
+#define enterprise_BigValue19_key_tag            1
+#define enterprise_BigValue19_value_tag          2
+#define enterprise_BigValue2_key_tag             1
+#define enterprise_BigValue2_value_tag           2
+#define enterprise_BigValue20_key_tag            1
+#define enterprise_BigValue20_value_tag          2
+#define enterprise_BigValue21_key_tag            1
+#define enterprise_BigValue21_value_tag          2
+#define enterprise_BigValue22_key_tag            1
+#define enterprise_BigValue22_value_tag          2
+#define enterprise_BigValue23_key_tag            1
+#define enterprise_BigValue23_value_tag          2
+#define enterprise_BigValue24_key_tag            1
+#define enterprise_BigValue24_value_tag          2
+#define enterprise_BigValue25_key_tag            1
+#define enterprise_BigValue25_value_tag          2
+#define enterprise_BigValue26_key_tag            1
+#define enterprise_BigValue26_value_tag          2
+#define enterprise_BigValue27_key_tag            1
+#define enterprise_BigValue27_value_tag          2
+#define enterprise_BigValue28_key_tag            1
+#define enterprise_BigValue28_value_tag          2
+#define enterprise_BigValue29_key_tag            1
+#define enterprise_BigValue29_value_tag          2
+#define enterprise_BigValue3_key_tag             1
+#define enterprise_BigValue3_value_tag           2
+#define enterprise_BigValue30_key_tag            1
+#define enterprise_BigValue30_value_tag          2
+#define enterprise_BigValue31_key_tag            1
+#define enterprise_BigValue31_value_tag          2
+#define enterprise_BigValue32_key_tag            1
+#define enterprise_BigValue32_value_tag          2
+#define enterprise_BigValue4_key_tag             1
+#define enterprise_BigValue4_value_tag           2
+#define enterprise_BigValue5_key_tag             1
+#define enterprise_BigValue5_value_tag           2
+#define enterprise_BigValue6_key_tag             1
+#define enterprise_BigValue6_value_tag           2
+#define enterprise_BigValue7_key_tag             1
+#define enterprise_BigValue7_value_tag           2
+#define enterprise_BigValue8_key_tag             1
+#define enterprise_BigValue8_value_tag           2
+#define enterprise_BigValue9_key_tag             1
+#define enterprise_BigValue9_value_tag           2
+#define enterprise_BigEvent_data1_tag            1
+#define enterprise_BigEvent_data2_tag            2
+#define enterprise_BigEvent_data3_tag            3
+#define enterprise_BigEvent_data4_tag            4
+#define enterprise_BigEvent_data5_tag            5
+#define enterprise_BigEvent_data6_tag            6
+#define enterprise_BigEvent_data7_tag            7
+#define enterprise_BigEvent_data8_tag            8
+#define enterprise_BigEvent_data9_tag            9
+#define enterprise_BigEvent_data10_tag           10
+#define enterprise_BigEvent_data11_tag           11
+#define enterprise_BigEvent_data12_tag           12
+#define enterprise_BigEvent_data13_tag           13
+#define enterprise_BigEvent_data14_tag           14
+#define enterprise_BigEvent_data15_tag           15
+#define enterprise_BigEvent_data16_tag           16
+#define enterprise_BigEvent_data17_tag           17
+#define enterprise_BigEvent_data18_tag           18
+#define enterprise_BigEvent_data19_tag           19
+#define enterprise_BigEvent_data20_tag           20
+#define enterprise_BigEvent_data21_tag           21
+#define enterprise_BigEvent_data22_tag           22
+#define enterprise_BigEvent_data23_tag           23
+#define enterprise_BigEvent_data24_tag           24
+#define enterprise_BigEvent_data25_tag           25
+#define enterprise_BigEvent_data26_tag           26
+#define enterprise_BigEvent_data27_tag           27
+#define enterprise_BigEvent_data28_tag           28
+#define enterprise_BigEvent_data29_tag           29
+#define enterprise_BigEvent_data30_tag           30
+#define enterprise_BigEvent_data31_tag           31
+#define enterprise_BigEvent_data32_tag           32
+
+/* Struct field encoding specification for nanopb */
+#define enterprise_BigData_FIELDLIST(X, a) \
+X(a, CALLBACK, REPEATED, MESSAGE, events, 1)
+#define enterprise_BigData_CALLBACK pb_default_field_callback
+#define enterprise_BigData_DEFAULT NULL
+#define enterprise_BigData_DEFAULT_INSTANCE NULL
+#define enterprise_BigData_FIELD_RECORDS NULL
+#define enterprise_BigData_MSGFLAGS 0
+#define enterprise_BigData_events_MSGTYPE enterprise_BigEvent
+
+#define enterprise_BigEvent_FIELDLIST(X, a) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data1,event.data1), 1) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data2,event.data2), 2) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data3,event.data3), 3) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data4,event.data4), 4) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data5,event.data5), 5) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data6,event.data6), 6) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data7,event.data7), 7) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data8,event.data8), 8) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data9,event.data9), 9) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data10,event.data10), 10) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data11,event.data11), 11) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data12,event.data12), 12) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data13,event.data13), 13) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data14,event.data14), 14) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data15,event.data15), 15) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data16,event.data16), 16) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data17,event.data17), 17) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data18,event.data18), 18) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data19,event.data19), 19) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data20,event.data20), 20) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data21,event.data21), 21) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data22,event.data22), 22) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data23,event.data23), 23) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data24,event.data24), 24) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data25,event.data25), 25) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data26,event.data26), 26) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data27,event.data27), 27) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data28,event.data28), 28) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data29,event.data29), 29) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data30,event.data30), 30) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data31,event.data31), 31) \
+X(a, STATIC, ONEOF, MESSAGE, (event,data32,event.data32), 32)
+#define enterprise_BigEvent_CALLBACK NULL
+#define enterprise_BigEvent_DEFAULT NULL
+#define enterprise_BigEvent_DEFAULT_INSTANCE NULL
+#define enterprise_BigEvent_FIELD_RECORDS NULL
+#define enterprise_BigEvent_MSGFLAGS 0
+#define enterprise_BigEvent_event_data1_MSGTYPE enterprise_BigValue1
+#define enterprise_BigEvent_event_data2_MSGTYPE enterprise_BigValue2
+#define enterprise_BigEvent_event_data3_MSGTYPE enterprise_BigValue3
+#define enterprise_BigEvent_event_data4_MSGTYPE enterprise_BigValue4
+#define enterprise_BigEvent_event_data5_MSGTYPE enterprise_BigValue5
+#define enterprise_BigEvent_event_data6_MSGTYPE enterprise_BigValue6
+#define enterprise_BigEvent_event_data7_MSGTYPE enterprise_BigValue7
+#define enterprise_BigEvent_event_data8_MSGTYPE enterprise_BigValue8
+#define enterprise_BigEvent_event_data9_MSGTYPE enterprise_BigValue9
+#define enterprise_BigEvent_event_data10_MSGTYPE enterprise_BigValue10
+#define enterprise_BigEvent_event_data11_MSGTYPE enterprise_BigValue11
+#define enterprise_BigEvent_event_data12_MSGTYPE enterprise_BigValue12
+#define enterprise_BigEvent_event_data13_MSGTYPE enterprise_BigValue13
+#define enterprise_BigEvent_event_data14_MSGTYPE enterprise_BigValue14
+#define enterprise_BigEvent_event_data15_MSGTYPE enterprise_BigValue15
+#define enterprise_BigEvent_event_data16_MSGTYPE enterprise_BigValue16
+#define enterprise_BigEvent_event_data17_MSGTYPE enterprise_BigValue17
+#define enterprise_BigEvent_event_data18_MSGTYPE enterprise_BigValue18
+#define enterprise_BigEvent_event_data19_MSGTYPE enterprise_BigValue19
+#define enterprise_BigEvent_event_data20_MSGTYPE enterprise_BigValue20
+#define enterprise_BigEvent_event_data21_MSGTYPE enterprise_BigValue21
+#define enterprise_BigEvent_event_data22_MSGTYPE enterprise_BigValue22
+#define enterprise_BigEvent_event_data23_MSGTYPE enterprise_BigValue23
+#define enterprise_BigEvent_event_data24_MSGTYPE enterprise_BigValue24
+#define enterprise_BigEvent_event_data25_MSGTYPE enterprise_BigValue25
+#define enterprise_BigEvent_event_data26_MSGTYPE enterprise_BigValue26
+#define enterprise_BigEvent_event_data27_MSGTYPE enterprise_BigValue27
+#define enterprise_BigEvent_event_data28_MSGTYPE enterprise_BigValue28
+#define enterprise_BigEvent_event_data29_MSGTYPE enterprise_BigValue29
+#define enterprise_BigEvent_event_data30_MSGTYPE enterprise_BigValue30
+#define enterprise_BigEvent_event_data31_MSGTYPE enterprise_BigValue31
+#define enterprise_BigEvent_event_data32_MSGTYPE enterprise_BigValue32
+
+#define enterprise_BigValue1_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue1_CALLBACK pb_default_field_callback
+#define enterprise_BigValue1_DEFAULT NULL
+#define enterprise_BigValue1_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue1_FIELD_RECORDS NULL
+#define enterprise_BigValue1_MSGFLAGS 0
+
+#define enterprise_BigValue2_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue2_CALLBACK pb_default_field_callback
+#define enterprise_BigValue2_DEFAULT NULL
+#define enterprise_BigValue2_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue2_FIELD_RECORDS NULL
+#define enterprise_BigValue2_MSGFLAGS 0
+
+#define enterprise_BigValue3_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue3_CALLBACK pb_default_field_callback
+#define enterprise_BigValue3_DEFAULT NULL
+#define enterprise_BigValue3_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue3_FIELD_RECORDS NULL
+#define enterprise_BigValue3_MSGFLAGS 0
+
+#define enterprise_BigValue4_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue4_CALLBACK pb_default_field_callback
+#define enterprise_BigValue4_DEFAULT NULL
+#define enterprise_BigValue4_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue4_FIELD_RECORDS NULL
+#define enterprise_BigValue4_MSGFLAGS 0
+
+#define enterprise_BigValue5_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue5_CALLBACK pb_default_field_callback
+#define enterprise_BigValue5_DEFAULT NULL
+#define enterprise_BigValue5_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue5_FIELD_RECORDS NULL
+#define enterprise_BigValue5_MSGFLAGS 0
+
+#define enterprise_BigValue6_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue6_CALLBACK pb_default_field_callback
+#define enterprise_BigValue6_DEFAULT NULL
+#define enterprise_BigValue6_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue6_FIELD_RECORDS NULL
+#define enterprise_BigValue6_MSGFLAGS 0
+
+#define enterprise_BigValue7_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue7_CALLBACK pb_default_field_callback
+#define enterprise_BigValue7_DEFAULT NULL
+#define enterprise_BigValue7_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue7_FIELD_RECORDS NULL
+#define enterprise_BigValue7_MSGFLAGS 0
+
+#define enterprise_BigValue8_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue8_CALLBACK pb_default_field_callback
+#define enterprise_BigValue8_DEFAULT NULL
+#define enterprise_BigValue8_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue8_FIELD_RECORDS NULL
+#define enterprise_BigValue8_MSGFLAGS 0
+
+#define enterprise_BigValue9_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue9_CALLBACK pb_default_field_callback
+#define enterprise_BigValue9_DEFAULT NULL
+#define enterprise_BigValue9_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue9_FIELD_RECORDS NULL
+#define enterprise_BigValue9_MSGFLAGS 0
+
+#define enterprise_BigValue10_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue10_CALLBACK pb_default_field_callback
+#define enterprise_BigValue10_DEFAULT NULL
+#define enterprise_BigValue10_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue10_FIELD_RECORDS NULL
+#define enterprise_BigValue10_MSGFLAGS 0
+
+#define enterprise_BigValue11_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue11_CALLBACK pb_default_field_callback
+#define enterprise_BigValue11_DEFAULT NULL
+#define enterprise_BigValue11_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue11_FIELD_RECORDS NULL
+#define enterprise_BigValue11_MSGFLAGS 0
+
+#define enterprise_BigValue12_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue12_CALLBACK pb_default_field_callback
+#define enterprise_BigValue12_DEFAULT NULL
+#define enterprise_BigValue12_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue12_FIELD_RECORDS NULL
+#define enterprise_BigValue12_MSGFLAGS 0
+
+#define enterprise_BigValue13_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue13_CALLBACK pb_default_field_callback
+#define enterprise_BigValue13_DEFAULT NULL
+#define enterprise_BigValue13_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue13_FIELD_RECORDS NULL
+#define enterprise_BigValue13_MSGFLAGS 0
+
+#define enterprise_BigValue14_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue14_CALLBACK pb_default_field_callback
+#define enterprise_BigValue14_DEFAULT NULL
+#define enterprise_BigValue14_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue14_FIELD_RECORDS NULL
+#define enterprise_BigValue14_MSGFLAGS 0
+
+#define enterprise_BigValue15_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue15_CALLBACK pb_default_field_callback
+#define enterprise_BigValue15_DEFAULT NULL
+#define enterprise_BigValue15_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue15_FIELD_RECORDS NULL
+#define enterprise_BigValue15_MSGFLAGS 0
+
+#define enterprise_BigValue16_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue16_CALLBACK pb_default_field_callback
+#define enterprise_BigValue16_DEFAULT NULL
+#define enterprise_BigValue16_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue16_FIELD_RECORDS NULL
+#define enterprise_BigValue16_MSGFLAGS 0
+
+#define enterprise_BigValue17_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue17_CALLBACK pb_default_field_callback
+#define enterprise_BigValue17_DEFAULT NULL
+#define enterprise_BigValue17_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue17_FIELD_RECORDS NULL
+#define enterprise_BigValue17_MSGFLAGS 0
+
+#define enterprise_BigValue18_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue18_CALLBACK pb_default_field_callback
+#define enterprise_BigValue18_DEFAULT NULL
+#define enterprise_BigValue18_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue18_FIELD_RECORDS NULL
+#define enterprise_BigValue18_MSGFLAGS 0
+
+#define enterprise_BigValue19_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue19_CALLBACK pb_default_field_callback
+#define enterprise_BigValue19_DEFAULT NULL
+#define enterprise_BigValue19_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue19_FIELD_RECORDS NULL
+#define enterprise_BigValue19_MSGFLAGS 0
+
+#define enterprise_BigValue20_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue20_CALLBACK pb_default_field_callback
+#define enterprise_BigValue20_DEFAULT NULL
+#define enterprise_BigValue20_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue20_FIELD_RECORDS NULL
+#define enterprise_BigValue20_MSGFLAGS 0
+
+#define enterprise_BigValue21_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue21_CALLBACK pb_default_field_callback
+#define enterprise_BigValue21_DEFAULT NULL
+#define enterprise_BigValue21_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue21_FIELD_RECORDS NULL
+#define enterprise_BigValue21_MSGFLAGS 0
+
+#define enterprise_BigValue22_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue22_CALLBACK pb_default_field_callback
+#define enterprise_BigValue22_DEFAULT NULL
+#define enterprise_BigValue22_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue22_FIELD_RECORDS NULL
+#define enterprise_BigValue22_MSGFLAGS 0
+
+#define enterprise_BigValue23_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue23_CALLBACK pb_default_field_callback
+#define enterprise_BigValue23_DEFAULT NULL
+#define enterprise_BigValue23_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue23_FIELD_RECORDS NULL
+#define enterprise_BigValue23_MSGFLAGS 0
+
+#define enterprise_BigValue24_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue24_CALLBACK pb_default_field_callback
+#define enterprise_BigValue24_DEFAULT NULL
+#define enterprise_BigValue24_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue24_FIELD_RECORDS NULL
+#define enterprise_BigValue24_MSGFLAGS 0
+
+#define enterprise_BigValue25_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue25_CALLBACK pb_default_field_callback
+#define enterprise_BigValue25_DEFAULT NULL
+#define enterprise_BigValue25_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue25_FIELD_RECORDS NULL
+#define enterprise_BigValue25_MSGFLAGS 0
+
+#define enterprise_BigValue26_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue26_CALLBACK pb_default_field_callback
+#define enterprise_BigValue26_DEFAULT NULL
+#define enterprise_BigValue26_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue26_FIELD_RECORDS NULL
+#define enterprise_BigValue26_MSGFLAGS 0
+
+#define enterprise_BigValue27_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue27_CALLBACK pb_default_field_callback
+#define enterprise_BigValue27_DEFAULT NULL
+#define enterprise_BigValue27_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue27_FIELD_RECORDS NULL
+#define enterprise_BigValue27_MSGFLAGS 0
+
+#define enterprise_BigValue28_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue28_CALLBACK pb_default_field_callback
+#define enterprise_BigValue28_DEFAULT NULL
+#define enterprise_BigValue28_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue28_FIELD_RECORDS NULL
+#define enterprise_BigValue28_MSGFLAGS 0
+
+#define enterprise_BigValue29_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue29_CALLBACK pb_default_field_callback
+#define enterprise_BigValue29_DEFAULT NULL
+#define enterprise_BigValue29_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue29_FIELD_RECORDS NULL
+#define enterprise_BigValue29_MSGFLAGS 0
+
+#define enterprise_BigValue30_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue30_CALLBACK pb_default_field_callback
+#define enterprise_BigValue30_DEFAULT NULL
+#define enterprise_BigValue30_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue30_FIELD_RECORDS NULL
+#define enterprise_BigValue30_MSGFLAGS 0
+
+#define enterprise_BigValue31_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue31_CALLBACK pb_default_field_callback
+#define enterprise_BigValue31_DEFAULT NULL
+#define enterprise_BigValue31_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue31_FIELD_RECORDS NULL
+#define enterprise_BigValue31_MSGFLAGS 0
+
+#define enterprise_BigValue32_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, key, 1) \
+X(a, CALLBACK, SINGULAR, BYTES, value, 2)
+#define enterprise_BigValue32_CALLBACK pb_default_field_callback
+#define enterprise_BigValue32_DEFAULT NULL
+#define enterprise_BigValue32_DEFAULT_INSTANCE NULL
+#define enterprise_BigValue32_FIELD_RECORDS NULL
+#define enterprise_BigValue32_MSGFLAGS 0
+
+extern const pb_msgdesc_t enterprise_BigData_msg;
+extern const pb_msgdesc_t enterprise_BigEvent_msg;
+extern const pb_msgdesc_t enterprise_BigValue1_msg;
+extern const pb_msgdesc_t enterprise_BigValue2_msg;
+extern const pb_msgdesc_t enterprise_BigValue3_msg;
+extern const pb_msgdesc_t enterprise_BigValue4_msg;
+extern const pb_msgdesc_t enterprise_BigValue5_msg;
+extern const pb_msgdesc_t enterprise_BigValue6_msg;
+extern const pb_msgdesc_t enterprise_BigValue7_msg;
+extern const pb_msgdesc_t enterprise_BigValue8_msg;
+extern const pb_msgdesc_t enterprise_BigValue9_msg;
+extern const pb_msgdesc_t enterprise_BigValue10_msg;
+extern const pb_msgdesc_t enterprise_BigValue11_msg;
+extern const pb_msgdesc_t enterprise_BigValue12_msg;
+extern const pb_msgdesc_t enterprise_BigValue13_msg;
+extern const pb_msgdesc_t enterprise_BigValue14_msg;
+extern const pb_msgdesc_t enterprise_BigValue15_msg;
+extern const pb_msgdesc_t enterprise_BigValue16_msg;
+extern const pb_msgdesc_t enterprise_BigValue17_msg;
+extern const pb_msgdesc_t enterprise_BigValue18_msg;
+extern const pb_msgdesc_t enterprise_BigValue19_msg;
+extern const pb_msgdesc_t enterprise_BigValue20_msg;
+extern const pb_msgdesc_t enterprise_BigValue21_msg;
+extern const pb_msgdesc_t enterprise_BigValue22_msg;
+extern const pb_msgdesc_t enterprise_BigValue23_msg;
+extern const pb_msgdesc_t enterprise_BigValue24_msg;
+extern const pb_msgdesc_t enterprise_BigValue25_msg;
+extern const pb_msgdesc_t enterprise_BigValue26_msg;
+extern const pb_msgdesc_t enterprise_BigValue27_msg;
+extern const pb_msgdesc_t enterprise_BigValue28_msg;
+extern const pb_msgdesc_t enterprise_BigValue29_msg;
+extern const pb_msgdesc_t enterprise_BigValue30_msg;
+extern const pb_msgdesc_t enterprise_BigValue31_msg;
+extern const pb_msgdesc_t enterprise_BigValue32_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define enterprise_BigData_fields &enterprise_BigData_msg
+#define enterprise_BigEvent_fields &enterprise_BigEvent_msg
+#define enterprise_BigValue1_fields &enterprise_BigValue1_msg
+#define enterprise_BigValue2_fields &enterprise_BigValue2_msg
+#define enterprise_BigValue3_fields &enterprise_BigValue3_msg
+#define enterprise_BigValue4_fields &enterprise_BigValue4_msg
+#define enterprise_BigValue5_fields &enterprise_BigValue5_msg
+#define enterprise_BigValue6_fields &enterprise_BigValue6_msg
+#define enterprise_BigValue7_fields &enterprise_BigValue7_msg
+#define enterprise_BigValue8_fields &enterprise_BigValue8_msg
+#define enterprise_BigValue9_fields &enterprise_BigValue9_msg
+#define enterprise_BigValue10_fields &enterprise_BigValue10_msg
+#define enterprise_BigValue11_fields &enterprise_BigValue11_msg
+#define enterprise_BigValue12_fields &enterprise_BigValue12_msg
+#define enterprise_BigValue13_fields &enterprise_BigValue13_msg
+#define enterprise_BigValue14_fields &enterprise_BigValue14_msg
+#define enterprise_BigValue15_fields &enterprise_BigValue15_msg
+#define enterprise_BigValue16_fields &enterprise_BigValue16_msg
+#define enterprise_BigValue17_fields &enterprise_BigValue17_msg
+#define enterprise_BigValue18_fields &enterprise_BigValue18_msg
+#define enterprise_BigValue19_fields &enterprise_BigValue19_msg
+#define enterprise_BigValue20_fields &enterprise_BigValue20_msg
+#define enterprise_BigValue21_fields &enterprise_BigValue21_msg
+#define enterprise_BigValue22_fields &enterprise_BigValue22_msg
+#define enterprise_BigValue23_fields &enterprise_BigValue23_msg
+#define enterprise_BigValue24_fields &enterprise_BigValue24_msg
+#define enterprise_BigValue25_fields &enterprise_BigValue25_msg
+#define enterprise_BigValue26_fields &enterprise_BigValue26_msg
+#define enterprise_BigValue27_fields &enterprise_BigValue27_msg
+#define enterprise_BigValue28_fields &enterprise_BigValue28_msg
+#define enterprise_BigValue29_fields &enterprise_BigValue29_msg
+#define enterprise_BigValue30_fields &enterprise_BigValue30_msg
+#define enterprise_BigValue31_fields &enterprise_BigValue31_msg
+#define enterprise_BigValue32_fields &enterprise_BigValue32_msg
+
+/* Maximum encoded size of messages (where known) */
+/* enterprise_BigData_size depends on runtime parameters */
+/* enterprise_BigEvent_size depends on runtime parameters */
+/* enterprise_BigValue1_size depends on runtime parameters */
+/* enterprise_BigValue2_size depends on runtime parameters */
+/* enterprise_BigValue3_size depends on runtime parameters */
+/* enterprise_BigValue4_size depends on runtime parameters */
+/* enterprise_BigValue5_size depends on runtime parameters */
+/* enterprise_BigValue6_size depends on runtime parameters */
+/* enterprise_BigValue7_size depends on runtime parameters */
+/* enterprise_BigValue8_size depends on runtime parameters */
+/* enterprise_BigValue9_size depends on runtime parameters */
+/* enterprise_BigValue10_size depends on runtime parameters */
+/* enterprise_BigValue11_size depends on runtime parameters */
+/* enterprise_BigValue12_size depends on runtime parameters */
+/* enterprise_BigValue13_size depends on runtime parameters */
+/* enterprise_BigValue14_size depends on runtime parameters */
+/* enterprise_BigValue15_size depends on runtime parameters */
+/* enterprise_BigValue16_size depends on runtime parameters */
+/* enterprise_BigValue17_size depends on runtime parameters */
+/* enterprise_BigValue18_size depends on runtime parameters */
+/* enterprise_BigValue19_size depends on runtime parameters */
+/* enterprise_BigValue20_size depends on runtime parameters */
+/* enterprise_BigValue21_size depends on runtime parameters */
+/* enterprise_BigValue22_size depends on runtime parameters */
+/* enterprise_BigValue23_size depends on runtime parameters */
+/* enterprise_BigValue24_size depends on runtime parameters */
+/* enterprise_BigValue25_size depends on runtime parameters */
+/* enterprise_BigValue26_size depends on runtime parameters */
+/* enterprise_BigValue27_size depends on runtime parameters */
+/* enterprise_BigValue28_size depends on runtime parameters */
+/* enterprise_BigValue29_size depends on runtime parameters */
+/* enterprise_BigValue30_size depends on runtime parameters */
+/* enterprise_BigValue31_size depends on runtime parameters */
+/* enterprise_BigValue32_size depends on runtime parameters */
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
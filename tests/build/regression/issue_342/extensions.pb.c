@@ -0,0 +1,35 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "extensions.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(BaseMessage, BaseMessage, 2)
+
+
+/* Definition for extension field string_extension */
+typedef struct _string_extension_extmsg {
+    pb_callback_t string_extension;
+/* @@protoc_insertion_point(struct:string_extension_extmsg) */
+} string_extension_extmsg;
+#define string_extension_extmsg_FIELDLIST(X, a) \
+X(a, CALLBACK, REQUIRED, STRING, string_extension, 100)
+#define string_extension_extmsg_CALLBACK pb_default_field_callback
+#define string_extension_extmsg_DEFAULT NULL
+#define string_extension_extmsg_DEFAULT_INSTANCE NULL
+#define string_extension_extmsg_FIELD_RECORDS NULL
+#define string_extension_extmsg_MSGFLAGS 0
+pb_byte_t string_extension_extmsg_default[] = {0x00};
+PB_BIND(string_extension_extmsg, string_extension_extmsg, 2)
+const pb_extension_type_t string_extension = {
+    NULL,
+    NULL,
+    &string_extension_extmsg_msg
+};
+
+
+/* @@protoc_insertion_point(eof) */
@@ -0,0 +1,56 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_EXTENSIONS_PB_H_INCLUDED
+#define PB_EXTENSIONS_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _BaseMessage {
+    pb_extension_t *extensions;
+/* @@protoc_insertion_point(struct:BaseMessage) */
+} BaseMessage;
+
+
+/* Extensions */
+extern const pb_extension_type_t string_extension; /* field type: pb_callback_t string_extension; */
+
+/* Initializer values for message structs */
+#define BaseMessage_init_default                 {NULL}
+#define BaseMessage_init_zero                    {NULL}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define string_extension_tag                     100
+
+/* Struct field encoding specification for nanopb */
+#define BaseMessage_FIELDLIST(X, a) \
+X(a, CALLBACK, OPTIONAL, EXTENSION, extensions, 100)
+#define BaseMessage_CALLBACK pb_default_field_callback
+#define BaseMessage_DEFAULT NULL
+#define BaseMessage_DEFAULT_INSTANCE NULL
+#define BaseMessage_FIELD_RECORDS NULL
+#define BaseMessage_MSGFLAGS 0
+
+extern const pb_msgdesc_t BaseMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define BaseMessage_fields &BaseMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+#define BaseMessage_size                         0
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,61 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_ONEOFMSG_PB_H_INCLUDED
+#define PB_ONEOFMSG_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef PB_BYTES_ARRAY_T(252) BodyMessage_device_data_crypted_t;
+typedef PB_BYTES_ARRAY_T(252) BodyMessage_device_config_crypted_t;
+typedef struct _BodyMessage {
+    pb_size_t which_body_type;
+    union {
+        BodyMessage_device_data_crypted_t device_data_crypted;
+        BodyMessage_device_config_crypted_t device_config_crypted;
+    } body_type;
+/* @@protoc_insertion_point(struct:BodyMessage) */
+} BodyMessage;
+
+
+/* Initializer values for message structs */
+#define BodyMessage_init_default                 {0, {{0, {0}}}}
+#define BodyMessage_init_zero                    {0, {{0, {0}}}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define BodyMessage_device_data_crypted_tag      1
+#define BodyMessage_device_config_crypted_tag    2
+
+/* Struct field encoding specification for nanopb */
+#define BodyMessage_FIELDLIST(X, a) \
+X(a, STATIC, ONEOF, BYTES, (body_type,device_data_crypted,body_type.device_data_crypted), 1) \
+X(a, STATIC, ONEOF, BYTES, (body_type,device_config_crypted,body_type.device_config_crypted), 2)
+#define BodyMessage_CALLBACK NULL
+#define BodyMessage_DEFAULT NULL
+#define BodyMessage_DEFAULT_INSTANCE NULL
+#define BodyMessage_FIELD_RECORDS NULL
+#define BodyMessage_MSGFLAGS 0
+
+extern const pb_msgdesc_t BodyMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define BodyMessage_fields &BodyMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+#define BodyMessage_size                         255
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
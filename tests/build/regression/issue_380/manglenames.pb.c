@@ -0,0 +1,24 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "manglenames.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(A, A, AUTO)
+
+
+PB_BIND(A_B, A_B, AUTO)
+
+
+PB_BIND(AP, AP, AUTO)
+
+
+PB_BIND(AP_B, AP_B, AUTO)
+
+
+
+/* @@protoc_insertion_point(eof) */
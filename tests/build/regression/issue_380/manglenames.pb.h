@@ -0,0 +1,119 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_A_MANGLENAMES_PB_H_INCLUDED
+#define PB_A_MANGLENAMES_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _AP_B {
+    bool has_val;
+    uint32_t val;
+/* @@protoc_insertion_point(struct:AP_B) */
+} AP_B;
+
+
+typedef struct _A_B {
+    bool has_val;
+    uint32_t val;
+/* @@protoc_insertion_point(struct:A_B) */
+} A_B;
+
+
+typedef struct _A {
+    bool has_b;
+    A_B b;
+/* @@protoc_insertion_point(struct:A) */
+} A;
+
+
+typedef struct _AP {
+    bool has_m;
+    AP_B m;
+/* @@protoc_insertion_point(struct:AP) */
+} AP;
+
+
+/* Initializer values for message structs */
+#define A_init_default                           {false, A_B_init_default}
+#define A_B_init_default                         {false, 0}
+#define AP_init_default                          {false, AP_B_init_default}
+#define AP_B_init_default                        {false, 0}
+#define A_init_zero                              {false, A_B_init_zero}
+#define A_B_init_zero                            {false, 0}
+#define AP_init_zero                             {false, AP_B_init_zero}
+#define AP_B_init_zero                           {false, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define AP_B_val_tag                             1
+#define A_B_val_tag                              1
+#define A_b_tag                                  1
+#define AP_m_tag                                 1
+
+/* Struct field encoding specification for nanopb */
+#define A_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, MESSAGE, b, 1)
+#define A_CALLBACK NULL
+#define A_DEFAULT NULL
+#define A_DEFAULT_INSTANCE NULL
+#define A_FIELD_RECORDS NULL
+#define A_MSGFLAGS 0
+#define A_b_MSGTYPE A_B
+
+#define A_B_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, UINT32, val, 1)
+#define A_B_CALLBACK NULL
+#define A_B_DEFAULT NULL
+#define A_B_DEFAULT_INSTANCE NULL
+#define A_B_FIELD_RECORDS NULL
+#define A_B_MSGFLAGS 0
+
+#define AP_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, MESSAGE, m, 1)
+#define AP_CALLBACK NULL
+#define AP_DEFAULT NULL
+#define AP_DEFAULT_INSTANCE NULL
+#define AP_FIELD_RECORDS NULL
+#define AP_MSGFLAGS 0
+#define AP_m_MSGTYPE AP_B
+
+#define AP_B_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, UINT32, val, 1)
+#define AP_B_CALLBACK NULL
+#define AP_B_DEFAULT NULL
+#define AP_B_DEFAULT_INSTANCE NULL
+#define AP_B_FIELD_RECORDS NULL
+#define AP_B_MSGFLAGS 0
+
+extern const pb_msgdesc_t A_msg;
+extern const pb_msgdesc_t A_B_msg;
+extern const pb_msgdesc_t AP_msg;
+extern const pb_msgdesc_t AP_B_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define A_fields &A_msg
+#define A_B_fields &A_B_msg
+#define AP_fields &AP_msg
+#define AP_B_fields &AP_B_msg
+
+/* Maximum encoded size of messages (where known) */
+#define A_size                                   8
+#define A_B_size                                 6
+#define AP_size                                  8
+#define AP_B_size                                6
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
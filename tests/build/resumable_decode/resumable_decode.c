@@ -0,0 +1,98 @@
+/* Decodes the alltypes message with pb_decoder_t, feeding the input in
+ * pieces of different sizes, and checks that the result matches
+ * pb_decode().
+ */
+
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include "unittests.h"
+#include "alltypes.pb.h"
+#include "test_helpers.h"
+
+static uint8_t input[2048];
+static AllTypes expected;
+static AllTypes decoded;
+
+/* Feed the input in pieces of the given size */
+static bool feed_pieces(pb_decoder_t *decoder, const uint8_t *data, size_t size, size_t piece)
+{
+    while (size > 0)
+    {
+        size_t count = (size < piece) ? size : piece;
+        size_t used;
+
+        if (pb_decoder_feed(decoder, data, count, &used) != PB_DECODER_NEED_MORE || used != count)
+            return false;
+
+        data += count;
+        size -= count;
+    }
+
+    return true;
+}
+
+int main()
+{
+    int status = 0;
+    size_t msglen;
+
+    SET_BINARY_MODE(stdin);
+    msglen = fread(input, 1, sizeof(input), stdin);
+
+    {
+        pb_istream_t stream = pb_istream_from_buffer(input, msglen);
+
+        COMMENT("Reference decoding with pb_decode()");
+        memset(&expected, 0, sizeof(expected));
+        TEST(pb_decode(&stream, AllTypes_fields, &expected));
+    }
+
+    {
+        static const size_t pieces[] = {1, 2, 3, 5, 7, 16, 100, 4096};
+        size_t i;
+
+        COMMENT("Decode in pieces of different sizes");
+        for (i = 0; i < sizeof(pieces) / sizeof(pieces[0]); i++)
+        {
+            pb_decoder_t decoder;
+            memset(&decoded, 0, sizeof(decoded));
+            TEST(pb_decoder_init(&decoder, AllTypes_fields, &decoded, NULL, 0, 0));
+            TEST(feed_pieces(&decoder, input, msglen, pieces[i]));
+            TEST(pb_decoder_finish(&decoder));
+            TEST(memcmp(&decoded, &expected, sizeof(decoded)) == 0);
+        }
+    }
+
+    {
+        size_t i;
+        bool ok = true;
+
+        COMMENT("Truncated message is detected at any position");
+        for (i = 1; i < msglen; i++)
+        {
+            pb_decoder_t decoder;
+            if (!pb_decoder_init(&decoder, AllTypes_fields, &decoded, NULL, 0, 0) ||
+                !feed_pieces(&decoder, input, i, 1))
+            {
+                ok = false;
+                break;
+            }
+
+            /* Cutting the message between fields leaves out a required
+             * field, otherwise the last field is incomplete. */
+            if (pb_decoder_finish(&decoder))
+            {
+                ok = false;
+                break;
+            }
+        }
+        TEST(ok);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
@@ -0,0 +1,44 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "resumable_decode.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(Leaf, Leaf, AUTO)
+
+
+PB_BIND(Branch, Branch, AUTO)
+
+
+PB_BIND(Tree, Tree, AUTO)
+
+
+PB_BIND(Extendable, Extendable, 2)
+
+
+/* Definition for extension field ext_name */
+typedef struct _ext_name_extmsg {
+    char ext_name[16];
+/* @@protoc_insertion_point(struct:ext_name_extmsg) */
+} ext_name_extmsg;
+#define ext_name_extmsg_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, STRING, ext_name, 100)
+#define ext_name_extmsg_CALLBACK NULL
+#define ext_name_extmsg_DEFAULT NULL
+#define ext_name_extmsg_DEFAULT_INSTANCE NULL
+#define ext_name_extmsg_FIELD_RECORDS NULL
+#define ext_name_extmsg_MSGFLAGS 0
+pb_byte_t ext_name_extmsg_default[] = {0x00};
+PB_BIND(ext_name_extmsg, ext_name_extmsg, 2)
+const pb_extension_type_t ext_name = {
+    NULL,
+    NULL,
+    &ext_name_extmsg_msg
+};
+
+
+/* @@protoc_insertion_point(eof) */
@@ -0,0 +1,153 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_RESUMABLE_DECODE_PB_H_INCLUDED
+#define PB_RESUMABLE_DECODE_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Extendable {
+    bool has_id;
+    uint32_t id;
+    pb_extension_t *extensions;
+/* @@protoc_insertion_point(struct:Extendable) */
+} Extendable;
+
+
+typedef struct _Leaf {
+    int32_t value;
+    bool has_text;
+    char text[16];
+/* @@protoc_insertion_point(struct:Leaf) */
+} Leaf;
+
+
+typedef struct _Branch {
+    pb_size_t leaves_count;
+    Leaf leaves[4];
+    pb_size_t packed_count;
+    int32_t packed[8];
+/* @@protoc_insertion_point(struct:Branch) */
+} Branch;
+
+
+typedef struct _Tree {
+    bool has_branch;
+    Branch branch;
+    pb_callback_t blob;
+    bool has_name;
+    pb_bytes_view_t name;
+    bool has_id;
+    uint32_t id;
+    pb_size_t which_choice;
+    union {
+        Leaf leaf;
+        uint64_t number;
+    } choice;
+/* @@protoc_insertion_point(struct:Tree) */
+} Tree;
+
+
+/* Extensions */
+extern const pb_extension_type_t ext_name; /* field type: char ext_name[16]; */
+
+/* Initializer values for message structs */
+#define Leaf_init_default                        {0, false, ""}
+#define Branch_init_default                      {0, {Leaf_init_default}, 0, {0}}
+#define Tree_init_default                        {false, Branch_init_default, {{NULL}, NULL}, false, {NULL, 0}, false, 0, 0, {Leaf_init_default}}
+#define Extendable_init_default                  {false, 0, NULL}
+#define Leaf_init_zero                           {0, false, ""}
+#define Branch_init_zero                         {0, {Leaf_init_zero}, 0, {0}}
+#define Tree_init_zero                           {false, Branch_init_zero, {{NULL}, NULL}, false, {NULL, 0}, false, 0, 0, {Leaf_init_zero}}
+#define Extendable_init_zero                     {false, 0, NULL}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Extendable_id_tag                        1
+#define Leaf_value_tag                           1
+#define Leaf_text_tag                            2
+#define Branch_leaves_tag                        1
+#define Branch_packed_tag                        2
+#define Tree_leaf_tag                            5
+#define Tree_number_tag                          6
+#define Tree_branch_tag                          1
+#define Tree_blob_tag                            2
+#define Tree_name_tag                            3
+#define Tree_id_tag                              4
+#define ext_name_tag                             100
+
+/* Struct field encoding specification for nanopb */
+#define Leaf_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, value, 1) \
+X(a, STATIC, OPTIONAL, STRING, text, 2)
+#define Leaf_CALLBACK NULL
+#define Leaf_DEFAULT NULL
+#define Leaf_DEFAULT_INSTANCE NULL
+#define Leaf_FIELD_RECORDS NULL
+#define Leaf_MSGFLAGS 0
+
+#define Branch_FIELDLIST(X, a) \
+X(a, STATIC, REPEATED, MESSAGE, leaves, 1) \
+X(a, STATIC, REPEATED, SINT32, packed, 2)
+#define Branch_CALLBACK NULL
+#define Branch_DEFAULT NULL
+#define Branch_DEFAULT_INSTANCE NULL
+#define Branch_FIELD_RECORDS NULL
+#define Branch_MSGFLAGS 0
+#define Branch_leaves_MSGTYPE Leaf
+
+#define Tree_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, MESSAGE, branch, 1) \
+X(a, CALLBACK, OPTIONAL, BYTES, blob, 2) \
+X(a, VIEW, OPTIONAL, STRING, name, 3) \
+X(a, STATIC, OPTIONAL, UINT32, id, 4) \
+X(a, STATIC, ONEOF, MESSAGE, (choice,leaf,choice.leaf), 5) \
+X(a, STATIC, ONEOF, FIXED64, (choice,number,choice.number), 6)
+#define Tree_CALLBACK pb_default_field_callback
+#define Tree_DEFAULT NULL
+#define Tree_DEFAULT_INSTANCE NULL
+#define Tree_FIELD_RECORDS NULL
+#define Tree_MSGFLAGS 0
+#define Tree_branch_MSGTYPE Branch
+#define Tree_choice_leaf_MSGTYPE Leaf
+
+#define Extendable_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, UINT32, id, 1) \
+X(a, CALLBACK, OPTIONAL, EXTENSION, extensions, 100)
+#define Extendable_CALLBACK pb_default_field_callback
+#define Extendable_DEFAULT NULL
+#define Extendable_DEFAULT_INSTANCE NULL
+#define Extendable_FIELD_RECORDS NULL
+#define Extendable_MSGFLAGS 0
+
+extern const pb_msgdesc_t Leaf_msg;
+extern const pb_msgdesc_t Branch_msg;
+extern const pb_msgdesc_t Tree_msg;
+extern const pb_msgdesc_t Extendable_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Leaf_fields &Leaf_msg
+#define Branch_fields &Branch_msg
+#define Tree_fields &Tree_msg
+#define Extendable_fields &Extendable_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Leaf_size                                28
+#define Branch_size                              168
+/* Tree_size depends on runtime parameters */
+#define Extendable_size                          6
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
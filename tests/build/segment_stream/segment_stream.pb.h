@@ -0,0 +1,100 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_SEGMENT_STREAM_PB_H_INCLUDED
+#define PB_SEGMENT_STREAM_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef PB_BYTES_ARRAY_T(512) Inner_payload_t;
+typedef struct _Inner {
+    Inner_payload_t payload;
+/* @@protoc_insertion_point(struct:Inner) */
+} Inner;
+
+
+typedef PB_BYTES_ARRAY_T(1024) Chunk_data_t;
+typedef PB_BYTES_ARRAY_T(256) Chunk_parts_t;
+typedef struct _Chunk {
+    uint32_t id;
+    Chunk_data_t data;
+    bool has_name;
+    char name[64];
+    pb_size_t parts_count;
+    Chunk_parts_t parts[4];
+    bool has_inner;
+    Inner inner;
+    bool has_digest;
+    pb_byte_t digest[32];
+    bool has_crc;
+    uint32_t crc;
+/* @@protoc_insertion_point(struct:Chunk) */
+} Chunk;
+
+
+/* Initializer values for message structs */
+#define Inner_init_default                       {{0, {0}}}
+#define Chunk_init_default                       {0, {0, {0}}, false, "", 0, {{0, {0}}}, false, Inner_init_default, false, {0}, false, 0}
+#define Inner_init_zero                          {{0, {0}}}
+#define Chunk_init_zero                          {0, {0, {0}}, false, "", 0, {{0, {0}}}, false, Inner_init_zero, false, {0}, false, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Inner_payload_tag                        1
+#define Chunk_id_tag                             1
+#define Chunk_data_tag                           2
+#define Chunk_name_tag                           3
+#define Chunk_parts_tag                          4
+#define Chunk_inner_tag                          5
+#define Chunk_digest_tag                         6
+#define Chunk_crc_tag                            7
+
+/* Struct field encoding specification for nanopb */
+#define Inner_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, BYTES, payload, 1)
+#define Inner_CALLBACK NULL
+#define Inner_DEFAULT NULL
+#define Inner_DEFAULT_INSTANCE NULL
+#define Inner_FIELD_RECORDS NULL
+#define Inner_MSGFLAGS 0
+
+#define Chunk_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT32, id, 1) \
+X(a, STATIC, REQUIRED, BYTES, data, 2) \
+X(a, STATIC, OPTIONAL, STRING, name, 3) \
+X(a, STATIC, REPEATED, BYTES, parts, 4) \
+X(a, STATIC, OPTIONAL, MESSAGE, inner, 5) \
+X(a, STATIC, OPTIONAL, FIXED_LENGTH_BYTES, digest, 6) \
+X(a, STATIC, OPTIONAL, UINT32, crc, 7)
+#define Chunk_CALLBACK NULL
+#define Chunk_DEFAULT NULL
+#define Chunk_DEFAULT_INSTANCE NULL
+#define Chunk_FIELD_RECORDS NULL
+#define Chunk_MSGFLAGS 0
+#define Chunk_inner_MSGTYPE Inner
+
+extern const pb_msgdesc_t Inner_msg;
+extern const pb_msgdesc_t Chunk_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Inner_fields &Inner_msg
+#define Chunk_fields &Chunk_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Inner_size                               515
+#define Chunk_size                               2692
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
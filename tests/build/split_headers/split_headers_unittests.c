@@ -0,0 +1,37 @@
+/* Uses only the header of SubMessage, which should not bring in the
+ * declarations of the other messages in alltypes.proto. */
+
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include "unittests.h"
+#include "alltypes_SubMessage.pb.h"
+
+#ifdef AllTypes_init_zero
+#error AllTypes should not be declared in SubMessage header
+#endif
+
+int main()
+{
+    int status = 0;
+    SubMessage msg = SubMessage_init_default;
+    SubMessage decoded = SubMessage_init_zero;
+    pb_byte_t buffer[SubMessage_size];
+    pb_ostream_t ostream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+    pb_istream_t istream;
+
+    COMMENT("Encode and decode using a single message header");
+    TEST(strcmp(msg.substuff1, "1") == 0);
+    msg.substuff2 = 42;
+    TEST(pb_encode(&ostream, SubMessage_fields, &msg));
+
+    istream = pb_istream_from_buffer(buffer, ostream.bytes_written);
+    TEST(pb_decode(&istream, SubMessage_fields, &decoded));
+    TEST(decoded.substuff2 == 42 && strcmp(decoded.substuff1, "1") == 0);
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
@@ -0,0 +1,26 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_SPLIT_LAZY_PB_H_INCLUDED
+#define PB_SPLIT_LAZY_PB_H_INCLUDED
+#include <pb.h>
+
+#include "split_lazy_Holder.pb.h"
+
+#include "split_lazy_Leaf.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,63 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_SPLIT_LAZY_HOLDER_PB_H_INCLUDED
+#define PB_SPLIT_LAZY_HOLDER_PB_H_INCLUDED
+#include <pb.h>
+
+#include "split_lazy_Leaf.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Holder {
+    int32_t id;
+    bool has_leaf;
+    pb_lazy_t leaf;
+/* @@protoc_insertion_point(struct:Holder) */
+} Holder;
+
+
+/* Initializer values for message structs */
+#define Holder_init_default                      {0, false, {{NULL, 0}, NULL}}
+#define Holder_init_zero                         {0, false, {{NULL, 0}, NULL}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Holder_id_tag                            1
+#define Holder_leaf_tag                          2
+
+/* Struct field encoding specification for nanopb */
+#define Holder_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, id, 1) \
+X(a, VIEW, OPTIONAL, MESSAGE, leaf, 2)
+#define Holder_CALLBACK NULL
+#define Holder_DEFAULT NULL
+#define Holder_DEFAULT_INSTANCE NULL
+#define Holder_FIELD_RECORDS NULL
+#define Holder_MSGFLAGS 0
+#define Holder_leaf_MSGTYPE Leaf
+
+extern const pb_msgdesc_t Holder_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Holder_fields &Holder_msg
+
+/* Accessors for lazily decoded submessages */
+#define Holder_leaf_get(msg, dest)               ((Leaf*)pb_decode_lazy(&(msg)->leaf, &Leaf_msg, (dest)))
+
+/* Maximum encoded size of messages (where known) */
+/* Holder_size depends on runtime parameters */
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,158 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_COM_EXAMPLE_NANOPB_FLATTEN_PB_H_INCLUDED
+#define PB_COM_EXAMPLE_NANOPB_FLATTEN_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Enum definitions */
+typedef enum _ShortIfNone {
+    ShortIfNone_IfNone_A = 1,
+    ShortIfNone_IfNone_B = 2
+} ShortIfNone;
+#define _ShortIfNone_MIN ShortIfNone_IfNone_A
+#define _ShortIfNone_MAX ShortIfNone_IfNone_B
+#define _ShortIfNone_ARRAYSIZE ((ShortIfNone)(ShortIfNone_IfNone_B+1))
+
+typedef enum _ShortIfStripPackage {
+    ShortIfStripPackage_IfPackage_A = 1,
+    ShortIfStripPackage_IfPackage_B = 2
+} ShortIfStripPackage;
+#define _ShortIfStripPackage_MIN ShortIfStripPackage_IfPackage_A
+#define _ShortIfStripPackage_MAX ShortIfStripPackage_IfPackage_B
+#define _ShortIfStripPackage_ARRAYSIZE ((ShortIfStripPackage)(ShortIfStripPackage_IfPackage_B+1))
+
+typedef enum _ShortIfFlatten {
+    IfFlatten_A = 1,
+    IfFlatten_B = 2
+} ShortIfFlatten;
+#define _ShortIfFlatten_MIN IfFlatten_A
+#define _ShortIfFlatten_MAX IfFlatten_B
+#define _ShortIfFlatten_ARRAYSIZE ((ShortIfFlatten)(IfFlatten_B+1))
+#define ShortIfFlatten_IfFlatten_A IfFlatten_A
+#define ShortIfFlatten_IfFlatten_B IfFlatten_B
+
+/* Struct definitions */
+typedef struct _NestedLevel3 {
+    uint32_t nothing;
+/* @@protoc_insertion_point(struct:NestedLevel3) */
+} NestedLevel3;
+
+
+typedef struct _NestedLevel2 {
+    NestedLevel3 nested;
+/* @@protoc_insertion_point(struct:NestedLevel2) */
+} NestedLevel2;
+
+
+typedef struct _NestedMessage {
+    NestedLevel2 nested;
+/* @@protoc_insertion_point(struct:NestedMessage) */
+} NestedMessage;
+
+
+typedef struct _TopLevelMessage {
+    uint32_t base_field;
+    NestedMessage nested;
+    bool has_short_if_none;
+    ShortIfNone short_if_none;
+    bool has_short_if_strip_package;
+    ShortIfStripPackage short_if_strip_package;
+    bool has_short_if_flatten;
+    ShortIfFlatten short_if_flatten;
+/* @@protoc_insertion_point(struct:TopLevelMessage) */
+} TopLevelMessage;
+
+
+/* Initializer values for message structs */
+#define TopLevelMessage_init_default             {0, NestedMessage_init_default, false, _ShortIfNone_MIN, false, _ShortIfStripPackage_MIN, false, _ShortIfFlatten_MIN}
+#define NestedMessage_init_default               {NestedLevel2_init_default}
+#define NestedLevel2_init_default                {NestedLevel3_init_default}
+#define NestedLevel3_init_default                {0}
+#define TopLevelMessage_init_zero                {0, NestedMessage_init_zero, false, _ShortIfNone_MIN, false, _ShortIfStripPackage_MIN, false, _ShortIfFlatten_MIN}
+#define NestedMessage_init_zero                  {NestedLevel2_init_zero}
+#define NestedLevel2_init_zero                   {NestedLevel3_init_zero}
+#define NestedLevel3_init_zero                   {0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define NestedLevel3_nothing_tag                 1
+#define NestedLevel2_nested_tag                  1
+#define NestedMessage_nested_tag                 1
+#define TopLevelMessage_base_field_tag           1
+#define TopLevelMessage_nested_tag               2
+#define TopLevelMessage_short_if_none_tag        3
+#define TopLevelMessage_short_if_strip_package_tag 4
+#define TopLevelMessage_short_if_flatten_tag     5
+
+/* Struct field encoding specification for nanopb */
+#define TopLevelMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT32, base_field, 1) \
+X(a, STATIC, REQUIRED, MESSAGE, nested, 2) \
+X(a, STATIC, OPTIONAL, UENUM, short_if_none, 3) \
+X(a, STATIC, OPTIONAL, UENUM, short_if_strip_package, 4) \
+X(a, STATIC, OPTIONAL, UENUM, short_if_flatten, 5)
+#define TopLevelMessage_CALLBACK NULL
+#define TopLevelMessage_DEFAULT NULL
+#define TopLevelMessage_DEFAULT_INSTANCE NULL
+#define TopLevelMessage_FIELD_RECORDS NULL
+#define TopLevelMessage_MSGFLAGS 0
+#define TopLevelMessage_nested_MSGTYPE NestedMessage
+
+#define NestedMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, nested, 1)
+#define NestedMessage_CALLBACK NULL
+#define NestedMessage_DEFAULT NULL
+#define NestedMessage_DEFAULT_INSTANCE NULL
+#define NestedMessage_FIELD_RECORDS NULL
+#define NestedMessage_MSGFLAGS 0
+#define NestedMessage_nested_MSGTYPE NestedLevel2
+
+#define NestedLevel2_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, nested, 1)
+#define NestedLevel2_CALLBACK NULL
+#define NestedLevel2_DEFAULT NULL
+#define NestedLevel2_DEFAULT_INSTANCE NULL
+#define NestedLevel2_FIELD_RECORDS NULL
+#define NestedLevel2_MSGFLAGS 0
+#define NestedLevel2_nested_MSGTYPE NestedLevel3
+
+#define NestedLevel3_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT32, nothing, 1)
+#define NestedLevel3_CALLBACK NULL
+#define NestedLevel3_DEFAULT NULL
+#define NestedLevel3_DEFAULT_INSTANCE NULL
+#define NestedLevel3_FIELD_RECORDS NULL
+#define NestedLevel3_MSGFLAGS 0
+
+extern const pb_msgdesc_t TopLevelMessage_msg;
+extern const pb_msgdesc_t NestedMessage_msg;
+extern const pb_msgdesc_t NestedLevel2_msg;
+extern const pb_msgdesc_t NestedLevel3_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define TopLevelMessage_fields &TopLevelMessage_msg
+#define NestedMessage_fields &NestedMessage_msg
+#define NestedLevel2_fields &NestedLevel2_msg
+#define NestedLevel3_fields &NestedLevel3_msg
+
+/* Maximum encoded size of messages (where known) */
+#define TopLevelMessage_size                     24
+#define NestedMessage_size                       10
+#define NestedLevel2_size                        8
+#define NestedLevel3_size                        6
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,27 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "package_initials.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(cen_TopLevelMessage, cen_TopLevelMessage, AUTO)
+
+
+PB_BIND(cen_TopLevelMessage_NestedMessage, cen_TopLevelMessage_NestedMessage, AUTO)
+
+
+PB_BIND(cen_TopLevelMessage_NestedMessage_NestedLevel2, cen_TopLevelMessage_NestedMessage_NestedLevel2, AUTO)
+
+
+PB_BIND(cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3, cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3, AUTO)
+
+
+
+
+
+
+/* @@protoc_insertion_point(eof) */
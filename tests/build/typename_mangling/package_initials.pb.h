@@ -0,0 +1,156 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_COM_EXAMPLE_NANOPB_PACKAGE_INITIALS_PB_H_INCLUDED
+#define PB_COM_EXAMPLE_NANOPB_PACKAGE_INITIALS_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Enum definitions */
+typedef enum _cen_TopLevelMessage_ShortIfNone {
+    cen_TopLevelMessage_ShortIfNone_IfNone_A = 1,
+    cen_TopLevelMessage_ShortIfNone_IfNone_B = 2
+} cen_TopLevelMessage_ShortIfNone;
+#define _cen_TopLevelMessage_ShortIfNone_MIN cen_TopLevelMessage_ShortIfNone_IfNone_A
+#define _cen_TopLevelMessage_ShortIfNone_MAX cen_TopLevelMessage_ShortIfNone_IfNone_B
+#define _cen_TopLevelMessage_ShortIfNone_ARRAYSIZE ((cen_TopLevelMessage_ShortIfNone)(cen_TopLevelMessage_ShortIfNone_IfNone_B+1))
+
+typedef enum _cen_TopLevelMessage_ShortIfStripPackage {
+    cen_TopLevelMessage_ShortIfStripPackage_IfPackage_A = 1,
+    cen_TopLevelMessage_ShortIfStripPackage_IfPackage_B = 2
+} cen_TopLevelMessage_ShortIfStripPackage;
+#define _cen_TopLevelMessage_ShortIfStripPackage_MIN cen_TopLevelMessage_ShortIfStripPackage_IfPackage_A
+#define _cen_TopLevelMessage_ShortIfStripPackage_MAX cen_TopLevelMessage_ShortIfStripPackage_IfPackage_B
+#define _cen_TopLevelMessage_ShortIfStripPackage_ARRAYSIZE ((cen_TopLevelMessage_ShortIfStripPackage)(cen_TopLevelMessage_ShortIfStripPackage_IfPackage_B+1))
+
+typedef enum _cen_TopLevelMessage_ShortIfFlatten {
+    cen_TopLevelMessage_ShortIfFlatten_IfFlatten_A = 1,
+    cen_TopLevelMessage_ShortIfFlatten_IfFlatten_B = 2
+} cen_TopLevelMessage_ShortIfFlatten;
+#define _cen_TopLevelMessage_ShortIfFlatten_MIN cen_TopLevelMessage_ShortIfFlatten_IfFlatten_A
+#define _cen_TopLevelMessage_ShortIfFlatten_MAX cen_TopLevelMessage_ShortIfFlatten_IfFlatten_B
+#define _cen_TopLevelMessage_ShortIfFlatten_ARRAYSIZE ((cen_TopLevelMessage_ShortIfFlatten)(cen_TopLevelMessage_ShortIfFlatten_IfFlatten_B+1))
+
+/* Struct definitions */
+typedef struct _cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3 {
+    uint32_t nothing;
+/* @@protoc_insertion_point(struct:cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3) */
+} cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3;
+
+
+typedef struct _cen_TopLevelMessage_NestedMessage_NestedLevel2 {
+    cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3 nested;
+/* @@protoc_insertion_point(struct:cen_TopLevelMessage_NestedMessage_NestedLevel2) */
+} cen_TopLevelMessage_NestedMessage_NestedLevel2;
+
+
+typedef struct _cen_TopLevelMessage_NestedMessage {
+    cen_TopLevelMessage_NestedMessage_NestedLevel2 nested;
+/* @@protoc_insertion_point(struct:cen_TopLevelMessage_NestedMessage) */
+} cen_TopLevelMessage_NestedMessage;
+
+
+typedef struct _cen_TopLevelMessage {
+    uint32_t base_field;
+    cen_TopLevelMessage_NestedMessage nested;
+    bool has_short_if_none;
+    cen_TopLevelMessage_ShortIfNone short_if_none;
+    bool has_short_if_strip_package;
+    cen_TopLevelMessage_ShortIfStripPackage short_if_strip_package;
+    bool has_short_if_flatten;
+    cen_TopLevelMessage_ShortIfFlatten short_if_flatten;
+/* @@protoc_insertion_point(struct:cen_TopLevelMessage) */
+} cen_TopLevelMessage;
+
+
+/* Initializer values for message structs */
+#define cen_TopLevelMessage_init_default         {0, cen_TopLevelMessage_NestedMessage_init_default, false, _cen_TopLevelMessage_ShortIfNone_MIN, false, _cen_TopLevelMessage_ShortIfStripPackage_MIN, false, _cen_TopLevelMessage_ShortIfFlatten_MIN}
+#define cen_TopLevelMessage_NestedMessage_init_default {cen_TopLevelMessage_NestedMessage_NestedLevel2_init_default}
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_init_default {cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_init_default}
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_init_default {0}
+#define cen_TopLevelMessage_init_zero            {0, cen_TopLevelMessage_NestedMessage_init_zero, false, _cen_TopLevelMessage_ShortIfNone_MIN, false, _cen_TopLevelMessage_ShortIfStripPackage_MIN, false, _cen_TopLevelMessage_ShortIfFlatten_MIN}
+#define cen_TopLevelMessage_NestedMessage_init_zero {cen_TopLevelMessage_NestedMessage_NestedLevel2_init_zero}
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_init_zero {cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_init_zero}
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_init_zero {0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_nothing_tag 1
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_nested_tag 1
+#define cen_TopLevelMessage_NestedMessage_nested_tag 1
+#define cen_TopLevelMessage_base_field_tag       1
+#define cen_TopLevelMessage_nested_tag           2
+#define cen_TopLevelMessage_short_if_none_tag    3
+#define cen_TopLevelMessage_short_if_strip_package_tag 4
+#define cen_TopLevelMessage_short_if_flatten_tag 5
+
+/* Struct field encoding specification for nanopb */
+#define cen_TopLevelMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT32, base_field, 1) \
+X(a, STATIC, REQUIRED, MESSAGE, nested, 2) \
+X(a, STATIC, OPTIONAL, UENUM, short_if_none, 3) \
+X(a, STATIC, OPTIONAL, UENUM, short_if_strip_package, 4) \
+X(a, STATIC, OPTIONAL, UENUM, short_if_flatten, 5)
+#define cen_TopLevelMessage_CALLBACK NULL
+#define cen_TopLevelMessage_DEFAULT NULL
+#define cen_TopLevelMessage_DEFAULT_INSTANCE NULL
+#define cen_TopLevelMessage_FIELD_RECORDS NULL
+#define cen_TopLevelMessage_MSGFLAGS 0
+#define cen_TopLevelMessage_nested_MSGTYPE cen_TopLevelMessage_NestedMessage
+
+#define cen_TopLevelMessage_NestedMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, nested, 1)
+#define cen_TopLevelMessage_NestedMessage_CALLBACK NULL
+#define cen_TopLevelMessage_NestedMessage_DEFAULT NULL
+#define cen_TopLevelMessage_NestedMessage_DEFAULT_INSTANCE NULL
+#define cen_TopLevelMessage_NestedMessage_FIELD_RECORDS NULL
+#define cen_TopLevelMessage_NestedMessage_MSGFLAGS 0
+#define cen_TopLevelMessage_NestedMessage_nested_MSGTYPE cen_TopLevelMessage_NestedMessage_NestedLevel2
+
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, nested, 1)
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_CALLBACK NULL
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_DEFAULT NULL
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_DEFAULT_INSTANCE NULL
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_FIELD_RECORDS NULL
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_MSGFLAGS 0
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_nested_MSGTYPE cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3
+
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT32, nothing, 1)
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_CALLBACK NULL
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_DEFAULT NULL
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_DEFAULT_INSTANCE NULL
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_FIELD_RECORDS NULL
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_MSGFLAGS 0
+
+extern const pb_msgdesc_t cen_TopLevelMessage_msg;
+extern const pb_msgdesc_t cen_TopLevelMessage_NestedMessage_msg;
+extern const pb_msgdesc_t cen_TopLevelMessage_NestedMessage_NestedLevel2_msg;
+extern const pb_msgdesc_t cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define cen_TopLevelMessage_fields &cen_TopLevelMessage_msg
+#define cen_TopLevelMessage_NestedMessage_fields &cen_TopLevelMessage_NestedMessage_msg
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_fields &cen_TopLevelMessage_NestedMessage_NestedLevel2_msg
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_fields &cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_msg
+
+/* Maximum encoded size of messages (where known) */
+#define cen_TopLevelMessage_size                 24
+#define cen_TopLevelMessage_NestedMessage_size   10
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_size 8
+#define cen_TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_size 6
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
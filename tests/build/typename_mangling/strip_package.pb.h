@@ -0,0 +1,158 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_COM_EXAMPLE_NANOPB_STRIP_PACKAGE_PB_H_INCLUDED
+#define PB_COM_EXAMPLE_NANOPB_STRIP_PACKAGE_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Enum definitions */
+typedef enum _TopLevelMessage_ShortIfNone {
+    TopLevelMessage_ShortIfNone_IfNone_A = 1,
+    TopLevelMessage_ShortIfNone_IfNone_B = 2
+} TopLevelMessage_ShortIfNone;
+#define _TopLevelMessage_ShortIfNone_MIN TopLevelMessage_ShortIfNone_IfNone_A
+#define _TopLevelMessage_ShortIfNone_MAX TopLevelMessage_ShortIfNone_IfNone_B
+#define _TopLevelMessage_ShortIfNone_ARRAYSIZE ((TopLevelMessage_ShortIfNone)(TopLevelMessage_ShortIfNone_IfNone_B+1))
+
+typedef enum _TopLevelMessage_ShortIfStripPackage {
+    TopLevelMessage_IfPackage_A = 1,
+    TopLevelMessage_IfPackage_B = 2
+} TopLevelMessage_ShortIfStripPackage;
+#define _TopLevelMessage_ShortIfStripPackage_MIN TopLevelMessage_IfPackage_A
+#define _TopLevelMessage_ShortIfStripPackage_MAX TopLevelMessage_IfPackage_B
+#define _TopLevelMessage_ShortIfStripPackage_ARRAYSIZE ((TopLevelMessage_ShortIfStripPackage)(TopLevelMessage_IfPackage_B+1))
+#define TopLevelMessage_ShortIfStripPackage_IfPackage_A TopLevelMessage_IfPackage_A
+#define TopLevelMessage_ShortIfStripPackage_IfPackage_B TopLevelMessage_IfPackage_B
+
+typedef enum _TopLevelMessage_ShortIfFlatten {
+    TopLevelMessage_ShortIfFlatten_IfFlatten_A = 1,
+    TopLevelMessage_ShortIfFlatten_IfFlatten_B = 2
+} TopLevelMessage_ShortIfFlatten;
+#define _TopLevelMessage_ShortIfFlatten_MIN TopLevelMessage_ShortIfFlatten_IfFlatten_A
+#define _TopLevelMessage_ShortIfFlatten_MAX TopLevelMessage_ShortIfFlatten_IfFlatten_B
+#define _TopLevelMessage_ShortIfFlatten_ARRAYSIZE ((TopLevelMessage_ShortIfFlatten)(TopLevelMessage_ShortIfFlatten_IfFlatten_B+1))
+
+/* Struct definitions */
+typedef struct _TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3 {
+    uint32_t nothing;
+/* @@protoc_insertion_point(struct:TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3) */
+} TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3;
+
+
+typedef struct _TopLevelMessage_NestedMessage_NestedLevel2 {
+    TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3 nested;
+/* @@protoc_insertion_point(struct:TopLevelMessage_NestedMessage_NestedLevel2) */
+} TopLevelMessage_NestedMessage_NestedLevel2;
+
+
+typedef struct _TopLevelMessage_NestedMessage {
+    TopLevelMessage_NestedMessage_NestedLevel2 nested;
+/* @@protoc_insertion_point(struct:TopLevelMessage_NestedMessage) */
+} TopLevelMessage_NestedMessage;
+
+
+typedef struct _TopLevelMessage {
+    uint32_t base_field;
+    TopLevelMessage_NestedMessage nested;
+    bool has_short_if_none;
+    TopLevelMessage_ShortIfNone short_if_none;
+    bool has_short_if_strip_package;
+    TopLevelMessage_ShortIfStripPackage short_if_strip_package;
+    bool has_short_if_flatten;
+    TopLevelMessage_ShortIfFlatten short_if_flatten;
+/* @@protoc_insertion_point(struct:TopLevelMessage) */
+} TopLevelMessage;
+
+
+/* Initializer values for message structs */
+#define TopLevelMessage_init_default             {0, TopLevelMessage_NestedMessage_init_default, false, _TopLevelMessage_ShortIfNone_MIN, false, _TopLevelMessage_ShortIfStripPackage_MIN, false, _TopLevelMessage_ShortIfFlatten_MIN}
+#define TopLevelMessage_NestedMessage_init_default {TopLevelMessage_NestedMessage_NestedLevel2_init_default}
+#define TopLevelMessage_NestedMessage_NestedLevel2_init_default {TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_init_default}
+#define TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_init_default {0}
+#define TopLevelMessage_init_zero                {0, TopLevelMessage_NestedMessage_init_zero, false, _TopLevelMessage_ShortIfNone_MIN, false, _TopLevelMessage_ShortIfStripPackage_MIN, false, _TopLevelMessage_ShortIfFlatten_MIN}
+#define TopLevelMessage_NestedMessage_init_zero  {TopLevelMessage_NestedMessage_NestedLevel2_init_zero}
+#define TopLevelMessage_NestedMessage_NestedLevel2_init_zero {TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_init_zero}
+#define TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_init_zero {0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_nothing_tag 1
+#define TopLevelMessage_NestedMessage_NestedLevel2_nested_tag 1
+#define TopLevelMessage_NestedMessage_nested_tag 1
+#define TopLevelMessage_base_field_tag           1
+#define TopLevelMessage_nested_tag               2
+#define TopLevelMessage_short_if_none_tag        3
+#define TopLevelMessage_short_if_strip_package_tag 4
+#define TopLevelMessage_short_if_flatten_tag     5
+
+/* Struct field encoding specification for nanopb */
+#define TopLevelMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT32, base_field, 1) \
+X(a, STATIC, REQUIRED, MESSAGE, nested, 2) \
+X(a, STATIC, OPTIONAL, UENUM, short_if_none, 3) \
+X(a, STATIC, OPTIONAL, UENUM, short_if_strip_package, 4) \
+X(a, STATIC, OPTIONAL, UENUM, short_if_flatten, 5)
+#define TopLevelMessage_CALLBACK NULL
+#define TopLevelMessage_DEFAULT NULL
+#define TopLevelMessage_DEFAULT_INSTANCE NULL
+#define TopLevelMessage_FIELD_RECORDS NULL
+#define TopLevelMessage_MSGFLAGS 0
+#define TopLevelMessage_nested_MSGTYPE TopLevelMessage_NestedMessage
+
+#define TopLevelMessage_NestedMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, nested, 1)
+#define TopLevelMessage_NestedMessage_CALLBACK NULL
+#define TopLevelMessage_NestedMessage_DEFAULT NULL
+#define TopLevelMessage_NestedMessage_DEFAULT_INSTANCE NULL
+#define TopLevelMessage_NestedMessage_FIELD_RECORDS NULL
+#define TopLevelMessage_NestedMessage_MSGFLAGS 0
+#define TopLevelMessage_NestedMessage_nested_MSGTYPE TopLevelMessage_NestedMessage_NestedLevel2
+
+#define TopLevelMessage_NestedMessage_NestedLevel2_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, nested, 1)
+#define TopLevelMessage_NestedMessage_NestedLevel2_CALLBACK NULL
+#define TopLevelMessage_NestedMessage_NestedLevel2_DEFAULT NULL
+#define TopLevelMessage_NestedMessage_NestedLevel2_DEFAULT_INSTANCE NULL
+#define TopLevelMessage_NestedMessage_NestedLevel2_FIELD_RECORDS NULL
+#define TopLevelMessage_NestedMessage_NestedLevel2_MSGFLAGS 0
+#define TopLevelMessage_NestedMessage_NestedLevel2_nested_MSGTYPE TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3
+
+#define TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT32, nothing, 1)
+#define TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_CALLBACK NULL
+#define TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_DEFAULT NULL
+#define TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_DEFAULT_INSTANCE NULL
+#define TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_FIELD_RECORDS NULL
+#define TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_MSGFLAGS 0
+
+extern const pb_msgdesc_t TopLevelMessage_msg;
+extern const pb_msgdesc_t TopLevelMessage_NestedMessage_msg;
+extern const pb_msgdesc_t TopLevelMessage_NestedMessage_NestedLevel2_msg;
+extern const pb_msgdesc_t TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define TopLevelMessage_fields &TopLevelMessage_msg
+#define TopLevelMessage_NestedMessage_fields &TopLevelMessage_NestedMessage_msg
+#define TopLevelMessage_NestedMessage_NestedLevel2_fields &TopLevelMessage_NestedMessage_NestedLevel2_msg
+#define TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_fields &TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_msg
+
+/* Maximum encoded size of messages (where known) */
+#define TopLevelMessage_size                     24
+#define TopLevelMessage_NestedMessage_size       10
+#define TopLevelMessage_NestedMessage_NestedLevel2_size 8
+#define TopLevelMessage_NestedMessage_NestedLevel2_NestedLevel3_size 6
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
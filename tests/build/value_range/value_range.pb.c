@@ -0,0 +1,62 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "value_range.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(Reading, Reading, AUTO)
+
+bool Reading_check_ranges(const Reading *msg)
+{
+    pb_size_t i;
+    if (msg->temperature < (-4000) || msg->temperature > 12500)
+        return false;
+    if (msg->percent > 100u)
+        return false;
+    if (msg->offset < (-1000) || msg->offset > 1000)
+        return false;
+    if (msg->has_counter && (msg->counter < 0 || msg->counter > 100000))
+        return false;
+    for (i = 0; i < msg->deltas_count; i++)
+        if (msg->deltas[i] < (-64) || msg->deltas[i] > 63)
+            return false;
+    if (msg->which_source == Reading_channel_tag && (msg->source.channel > 15u))
+        return false;
+    if (msg->which_source == Reading_other_tag && (msg->source.other < (-100) || msg->source.other > 100))
+        return false;
+    return true;
+}
+
+
+PB_BIND(Sample, Sample, AUTO)
+
+bool Sample_check_ranges(const Sample *msg)
+{
+    pb_size_t i;
+    if (!Reading_check_ranges(&msg->reading))
+        return false;
+    for (i = 0; i < msg->history_count; i++)
+        if (!Reading_check_ranges(&msg->history[i]))
+            return false;
+    return true;
+}
+
+
+PB_BIND(Extremes, Extremes, AUTO)
+
+bool Extremes_check_ranges(const Extremes *msg)
+{
+    if (msg->lowest > 0)
+        return false;
+    if (msg->negative < (-1000) || msg->negative > (-10))
+        return false;
+    return true;
+}
+
+
+
+/* @@protoc_insertion_point(eof) */
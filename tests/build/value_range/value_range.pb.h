@@ -0,0 +1,163 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_VALUE_RANGE_PB_H_INCLUDED
+#define PB_VALUE_RANGE_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Extremes {
+    int64_t lowest;
+    int16_t negative;
+/* @@protoc_insertion_point(struct:Extremes) */
+} Extremes;
+
+
+typedef struct _Reading {
+    int16_t temperature;
+    uint8_t percent;
+    int16_t offset;
+    bool has_counter;
+    int32_t counter;
+    uint16_t big;
+    pb_size_t deltas_count;
+    int8_t deltas[4];
+    pb_size_t which_source;
+    union {
+        uint8_t channel;
+        int8_t other;
+    } source;
+    int32_t unlimited;
+/* @@protoc_insertion_point(struct:Reading) */
+} Reading;
+
+
+typedef struct _Sample {
+    Reading reading;
+    pb_size_t history_count;
+    Reading history[2];
+    bool has_id;
+    uint32_t id;
+/* @@protoc_insertion_point(struct:Sample) */
+} Sample;
+
+
+/* Initializer values for message structs */
+#define Reading_init_default                     {0, 0, 0, false, 0, 0, 0, {0}, 0, {0}, 0}
+#define Sample_init_default                      {Reading_init_default, 0, {Reading_init_default}, false, 0}
+#define Extremes_init_default                    {0, 0}
+#define Reading_init_zero                        {0, 0, 0, false, 0, 0, 0, {0}, 0, {0}, 0}
+#define Sample_init_zero                         {Reading_init_zero, 0, {Reading_init_zero}, false, 0}
+#define Extremes_init_zero                       {0, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Extremes_lowest_tag                      1
+#define Extremes_negative_tag                    2
+#define Reading_channel_tag                      7
+#define Reading_other_tag                        8
+#define Reading_temperature_tag                  1
+#define Reading_percent_tag                      2
+#define Reading_offset_tag                       3
+#define Reading_counter_tag                      4
+#define Reading_big_tag                          5
+#define Reading_deltas_tag                       6
+#define Reading_unlimited_tag                    9
+#define Sample_reading_tag                       1
+#define Sample_history_tag                       2
+#define Sample_id_tag                            3
+
+/* Struct field encoding specification for nanopb */
+#define Reading_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, temperature, 1) \
+X(a, STATIC, REQUIRED, UINT32, percent, 2) \
+X(a, STATIC, REQUIRED, SINT32, offset, 3) \
+X(a, STATIC, OPTIONAL, INT64, counter, 4) \
+X(a, STATIC, REQUIRED, UINT64, big, 5) \
+X(a, STATIC, REPEATED, SINT32, deltas, 6) \
+X(a, STATIC, ONEOF, UINT32, (source,channel,source.channel), 7) \
+X(a, STATIC, ONEOF, INT32, (source,other,source.other), 8) \
+X(a, STATIC, REQUIRED, INT32, unlimited, 9)
+#define Reading_CALLBACK NULL
+#define Reading_DEFAULT NULL
+#define Reading_DEFAULT_INSTANCE NULL
+#define Reading_FIELD_RECORDS NULL
+#define Reading_MSGFLAGS 0
+
+#define Sample_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, reading, 1) \
+X(a, STATIC, REPEATED, MESSAGE, history, 2) \
+X(a, STATIC, OPTIONAL, UINT32, id, 3)
+#define Sample_CALLBACK NULL
+#define Sample_DEFAULT NULL
+#define Sample_DEFAULT_INSTANCE NULL
+#define Sample_FIELD_RECORDS NULL
+#define Sample_MSGFLAGS 0
+#define Sample_reading_MSGTYPE Reading
+#define Sample_history_MSGTYPE Reading
+
+#define Extremes_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT64, lowest, 1) \
+X(a, STATIC, REQUIRED, SINT32, negative, 2)
+#define Extremes_CALLBACK NULL
+#define Extremes_DEFAULT NULL
+#define Extremes_DEFAULT_INSTANCE NULL
+#define Extremes_FIELD_RECORDS NULL
+#define Extremes_MSGFLAGS 0
+
+extern const pb_msgdesc_t Reading_msg;
+extern const pb_msgdesc_t Sample_msg;
+extern const pb_msgdesc_t Extremes_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Reading_fields &Reading_msg
+#define Sample_fields &Sample_msg
+#define Extremes_fields &Extremes_msg
+
+/* Value ranges of integer fields */
+#define Reading_temperature_min_value            (-4000)
+#define Reading_temperature_max_value            12500
+#define Reading_temperature_scale                100.0
+#define Reading_percent_min_value                0u
+#define Reading_percent_max_value                100u
+#define Reading_offset_min_value                 (-1000)
+#define Reading_offset_max_value                 1000
+#define Reading_counter_min_value                0
+#define Reading_counter_max_value                100000
+#define Reading_big_min_value                    0u
+#define Reading_big_max_value                    65535u
+#define Reading_deltas_min_value                 (-64)
+#define Reading_deltas_max_value                 63
+#define Reading_channel_min_value                0u
+#define Reading_channel_max_value                15u
+#define Reading_other_min_value                  (-100)
+#define Reading_other_max_value                  100
+#define Extremes_lowest_min_value                (-9223372036854775807ll - 1)
+#define Extremes_lowest_max_value                0
+#define Extremes_negative_min_value              (-1000)
+#define Extremes_negative_max_value              (-10)
+
+/* Check that the field values are within min_value and max_value */
+bool Reading_check_ranges(const Reading *msg);
+bool Sample_check_ranges(const Sample *msg);
+bool Extremes_check_ranges(const Extremes *msg);
+
+/* Maximum encoded size of messages (where known) */
+#define Reading_size                             54
+#define Sample_size                              174
+#define Extremes_size                            14
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
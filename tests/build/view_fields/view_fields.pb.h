@@ -0,0 +1,111 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_VIEW_FIELDS_PB_H_INCLUDED
+#define PB_VIEW_FIELDS_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef PB_BYTES_ARRAY_T(16) StaticMessage_payload_t;
+typedef struct _StaticMessage {
+    char name[16];
+    bool has_payload;
+    StaticMessage_payload_t payload;
+    pb_size_t tags_count;
+    char tags[4][16];
+/* @@protoc_insertion_point(struct:StaticMessage) */
+} StaticMessage;
+
+
+typedef struct _ViewMessage {
+    pb_bytes_view_t name;
+    bool has_payload;
+    pb_bytes_view_t payload;
+    pb_size_t tags_count;
+    pb_bytes_view_t tags[4];
+    bool has_label;
+    pb_bytes_view_t label;
+    bool has_magic;
+    pb_bytes_view_t magic;
+    bool has_id;
+    int32_t id;
+    pb_size_t which_content;
+    union {
+        pb_bytes_view_t text;
+        int32_t number;
+    } content;
+/* @@protoc_insertion_point(struct:ViewMessage) */
+} ViewMessage;
+
+
+/* Initializer values for message structs */
+#define ViewMessage_init_default                 {{NULL, 0}, false, {NULL, 0}, 0, {{NULL, 0}}, false, {(const pb_byte_t*)"none", 4}, false, {(const pb_byte_t*)"\001\002\003", 3}, false, 0, 0, {{NULL, 0}}}
+#define StaticMessage_init_default               {"", false, {0, {0}}, 0, {""}}
+#define ViewMessage_init_zero                    {{NULL, 0}, false, {NULL, 0}, 0, {{NULL, 0}}, false, {NULL, 0}, false, {NULL, 0}, false, 0, 0, {{NULL, 0}}}
+#define StaticMessage_init_zero                  {"", false, {0, {0}}, 0, {""}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define StaticMessage_name_tag                   1
+#define StaticMessage_payload_tag                2
+#define StaticMessage_tags_tag                   3
+#define ViewMessage_text_tag                     7
+#define ViewMessage_number_tag                   8
+#define ViewMessage_name_tag                     1
+#define ViewMessage_payload_tag                  2
+#define ViewMessage_tags_tag                     3
+#define ViewMessage_label_tag                    4
+#define ViewMessage_magic_tag                    5
+#define ViewMessage_id_tag                       6
+
+/* Struct field encoding specification for nanopb */
+#define ViewMessage_FIELDLIST(X, a) \
+X(a, VIEW, REQUIRED, STRING, name, 1) \
+X(a, VIEW, OPTIONAL, BYTES, payload, 2) \
+X(a, VIEW, REPEATED, STRING, tags, 3) \
+X(a, VIEW, OPTIONAL, STRING, label, 4) \
+X(a, VIEW, OPTIONAL, BYTES, magic, 5) \
+X(a, STATIC, OPTIONAL, INT32, id, 6) \
+X(a, VIEW, ONEOF, STRING, (content,text,content.text), 7) \
+X(a, STATIC, ONEOF, INT32, (content,number,content.number), 8)
+#define ViewMessage_CALLBACK NULL
+#define ViewMessage_DEFAULT (const uint8_t*)"\x22\x04\x6e\x6f\x6e\x65\x2a\x03\x01\x02\x03\x00"
+#define ViewMessage_DEFAULT_INSTANCE NULL
+#define ViewMessage_FIELD_RECORDS NULL
+#define ViewMessage_MSGFLAGS 0
+
+#define StaticMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, STRING, name, 1) \
+X(a, STATIC, OPTIONAL, BYTES, payload, 2) \
+X(a, STATIC, REPEATED, STRING, tags, 3)
+#define StaticMessage_CALLBACK NULL
+#define StaticMessage_DEFAULT NULL
+#define StaticMessage_DEFAULT_INSTANCE NULL
+#define StaticMessage_FIELD_RECORDS NULL
+#define StaticMessage_MSGFLAGS 0
+
+extern const pb_msgdesc_t ViewMessage_msg;
+extern const pb_msgdesc_t StaticMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define ViewMessage_fields &ViewMessage_msg
+#define StaticMessage_fields &StaticMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+/* ViewMessage_size depends on runtime parameters */
+#define StaticMessage_size                       103
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
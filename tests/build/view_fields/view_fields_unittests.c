@@ -0,0 +1,114 @@
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include "unittests.h"
+#include "view_fields.pb.h"
+
+#define VIEW_EQUAL(v, s) ((v).size == strlen(s) && memcmp((v).ptr, s, strlen(s)) == 0)
+#define SET_VIEW(v, s) ((v).ptr = (const pb_byte_t*)(s), (v).size = (pb_size_t)strlen(s))
+
+static bool read_callback(pb_istream_t *stream, pb_byte_t *buf, size_t count)
+{
+    const pb_byte_t *source = (const pb_byte_t*)stream->state;
+    stream->state = (pb_byte_t*)stream->state + count;
+    memcpy(buf, source, count);
+    return true;
+}
+
+int main()
+{
+    int status = 0;
+    pb_byte_t buffer[128];
+    size_t msglen;
+
+    {
+        StaticMessage msg = StaticMessage_init_zero;
+        pb_ostream_t stream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+
+        COMMENT("Encode with static fields");
+        strcpy(msg.name, "hello");
+        msg.has_payload = true;
+        msg.payload.size = 3;
+        memcpy(msg.payload.bytes, "\x00\xFF\x10", 3);
+        msg.tags_count = 2;
+        strcpy(msg.tags[0], "a");
+        strcpy(msg.tags[1], "bc");
+        TEST(pb_encode(&stream, StaticMessage_fields, &msg));
+        msglen = stream.bytes_written;
+    }
+
+    {
+        ViewMessage msg = ViewMessage_init_zero;
+        pb_istream_t stream = pb_istream_from_buffer(buffer, msglen);
+
+        COMMENT("Decode into views");
+        TEST(pb_decode(&stream, ViewMessage_fields, &msg));
+        TEST(VIEW_EQUAL(msg.name, "hello"));
+        TEST(msg.name.ptr > buffer && msg.name.ptr < buffer + msglen);
+        TEST(msg.has_payload && msg.payload.size == 3);
+        TEST(memcmp(msg.payload.ptr, "\x00\xFF\x10", 3) == 0);
+        TEST(msg.tags_count == 2);
+        TEST(VIEW_EQUAL(msg.tags[0], "a"));
+        TEST(VIEW_EQUAL(msg.tags[1], "bc"));
+        TEST(!msg.has_label && VIEW_EQUAL(msg.label, "none"));
+        TEST(!msg.has_magic && msg.magic.size == 3 && msg.magic.ptr[2] == 3);
+        TEST(msg.which_content == 0);
+    }
+
+    {
+        ViewMessage msg = ViewMessage_init_default;
+        StaticMessage msg2 = StaticMessage_init_zero;
+        pb_byte_t buffer2[128];
+        pb_ostream_t ostream = pb_ostream_from_buffer(buffer2, sizeof(buffer2));
+        pb_istream_t istream;
+
+        COMMENT("Encode from views");
+        TEST(VIEW_EQUAL(msg.label, "none"));
+        SET_VIEW(msg.name, "world");
+        msg.tags_count = 3;
+        SET_VIEW(msg.tags[0], "x");
+        SET_VIEW(msg.tags[2], "zzz");
+        msg.which_content = ViewMessage_text_tag;
+        SET_VIEW(msg.content.text, "txt");
+        TEST(pb_encode(&ostream, ViewMessage_fields, &msg));
+
+        istream = pb_istream_from_buffer(buffer2, ostream.bytes_written);
+        TEST(pb_decode(&istream, StaticMessage_fields, &msg2));
+        TEST(strcmp(msg2.name, "world") == 0);
+        TEST(!msg2.has_payload);
+        TEST(msg2.tags_count == 3);
+        TEST(strcmp(msg2.tags[0], "x") == 0);
+        TEST(strcmp(msg2.tags[1], "") == 0);
+        TEST(strcmp(msg2.tags[2], "zzz") == 0);
+
+        istream = pb_istream_from_buffer(buffer2, ostream.bytes_written);
+        TEST(pb_decode(&istream, ViewMessage_fields, &msg));
+        TEST(msg.which_content == ViewMessage_text_tag);
+        TEST(VIEW_EQUAL(msg.content.text, "txt"));
+    }
+
+    {
+        ViewMessage msg = ViewMessage_init_zero;
+        pb_istream_t stream = {&read_callback, NULL, 0};
+
+        COMMENT("Views cannot be decoded from callback streams");
+        stream.state = buffer;
+        stream.bytes_left = msglen;
+        TEST(!pb_decode(&stream, ViewMessage_fields, &msg));
+        TEST(strcmp(PB_GET_ERROR(&stream), "view needs buffer stream") == 0);
+    }
+
+    {
+        ViewMessage msg = ViewMessage_init_zero;
+        pb_istream_t stream = pb_istream_from_buffer(buffer, msglen - 1);
+
+        COMMENT("Truncated input");
+        TEST(!pb_decode(&stream, ViewMessage_fields, &msg));
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
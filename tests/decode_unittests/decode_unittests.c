@@ -20,6 +20,68 @@ bool stream_callback(pb_istream_t *stream, uint8_t *buf, size_t count)
     return true;
 }
 
+/* Reads from a memory buffer like pb_istream_from_buffer(), but through a
+ * custom callback so that the generic decoding code paths are used. */
+bool memory_callback(pb_istream_t *stream, uint8_t *buf, size_t count)
+{
+    const uint8_t *source = (const uint8_t*)stream->state;
+    stream->state = (uint8_t*)stream->state + count;
+
+    if (buf != NULL)
+        memcpy(buf, source, count);
+    return true;
+}
+
+#define C(x) callback_stream((uint8_t*)x, sizeof(x) - 1)
+
+static pb_istream_t callback_stream(uint8_t *buf, size_t size)
+{
+    pb_istream_t stream = pb_istream_from_buffer(buf, size);
+    stream.callback = &memory_callback;
+    return stream;
+}
+
+/* Decodes the same varint through a buffer stream and a callback stream,
+ * and checks that the result, error message and eof flag all match. */
+static bool varint_paths_match(const char *data, size_t size)
+{
+    pb_istream_t s1 = pb_istream_from_buffer((const uint8_t*)data, size);
+    pb_istream_t s2 = callback_stream((uint8_t*)data, size);
+    uint32_t v1 = 0, v2 = 0;
+    uint64_t w1 = 0, w2 = 0;
+    bool eof1 = false, eof2 = false;
+    bool ok1, ok2;
+
+    ok1 = pb_decode_varint32_eof(&s1, &v1, &eof1);
+    ok2 = pb_decode_varint32_eof(&s2, &v2, &eof2);
+    if (ok1 != ok2 || v1 != v2 || eof1 != eof2 || strcmp(PB_GET_ERROR(&s1), PB_GET_ERROR(&s2)) != 0)
+        return false;
+    if (ok1 && s1.bytes_left != s2.bytes_left)
+        return false;
+
+    s1 = pb_istream_from_buffer((const uint8_t*)data, size);
+    s2 = callback_stream((uint8_t*)data, size);
+    ok1 = pb_decode_varint(&s1, &w1);
+    ok2 = pb_decode_varint(&s2, &w2);
+    if (ok1 != ok2 || w1 != w2 || strcmp(PB_GET_ERROR(&s1), PB_GET_ERROR(&s2)) != 0)
+        return false;
+    if (ok1 && s1.bytes_left != s2.bytes_left)
+        return false;
+
+    s1 = pb_istream_from_buffer((const uint8_t*)data, size);
+    s2 = callback_stream((uint8_t*)data, size);
+    ok1 = pb_skip_varint(&s1);
+    ok2 = pb_skip_varint(&s2);
+    if (ok1 != ok2 || strcmp(PB_GET_ERROR(&s1), PB_GET_ERROR(&s2)) != 0)
+        return false;
+    if (ok1 && s1.bytes_left != s2.bytes_left)
+        return false;
+
+    return true;
+}
+
+#define V(x) varint_paths_match(x, sizeof(x) - 1)
+
 /* Verifies that the stream passed to callback matches the byte array pointed to by arg. */
 bool callback_check(pb_istream_t *stream, const pb_field_t *field, void **arg)
 {
@@ -116,6 +178,39 @@ int main()
         TEST((s = S("\xFF"), !pb_skip_varint(&s)))
     }
 
+    {
+        pb_istream_t s;
+        uint32_t u;
+        uint64_t w;
+        bool eof;
+
+        COMMENT("Test varint decoding through callback stream");
+        TEST((s = C("\xAC\x02"), pb_decode_varint32(&s, &u) && u == 300 && s.bytes_left == 0));
+        TEST((s = C("\xFF\xFF\xFF\xFF\x10"), !pb_decode_varint32(&s, &u)));
+        TEST((s = C("\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\x01"),
+              pb_decode_varint(&s, &w) && w == UINT64_MAX));
+        TEST((s = C(""), eof = false, !pb_decode_varint32_eof(&s, &u, &eof) && eof));
+        TEST((s = S(""), eof = false, !pb_decode_varint32_eof(&s, &u, &eof) && eof));
+        TEST((s = S("\x80"), eof = false, !pb_decode_varint32_eof(&s, &u, &eof) && !eof));
+
+        COMMENT("Test that buffer and callback streams decode varints identically");
+        TEST(V(""));
+        TEST(V("\x00"));
+        TEST(V("\x7F"));
+        TEST(V("\x80"));
+        TEST(V("\x80\x01"));
+        TEST(V("\xAC\x02""foo"));
+        TEST(V("\xFF\xFF\xFF\xFF\x0F"));
+        TEST(V("\xFF\xFF\xFF\xFF\x1F"));
+        TEST(V("\xFF\xFF\xFF\xFF\x8F\x00"));
+        TEST(V("\xFF\xFF\xFF\xFF\x8F\x80\x80\x80\x80\x80\x80\x00"));
+        TEST(V("\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\x01"));
+        TEST(V("\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\x01"));
+        TEST(V("\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF"));
+        TEST(V("\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x00"));
+        TEST(V("\xFF\xFF\xFF\x7F\xFF\xFF\xFF\xFF\xFF\x01"));
+    }
+
     {
         pb_istream_t s;
         COMMENT("Test pb_skip_string")
@@ -0,0 +1,60 @@
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include "unittests.h"
+#include "dedup_descriptors.pb.h"
+
+int main()
+{
+    int status = 0;
+
+    COMMENT("Identical messages share the field descriptors");
+    TEST(dedup_Position_msg.field_info == dedup_Vec3_msg.field_info);
+    TEST(dedup_Position_msg.submsg_info == dedup_Vec3_msg.submsg_info);
+    TEST(dedup_Position_msg.default_instance == dedup_Vec3_msg.default_instance);
+    TEST(dedup_StampedCopy_msg.field_info == dedup_Stamped_msg.field_info);
+    TEST(dedup_StampedCopy_msg.submsg_info == dedup_Stamped_msg.submsg_info);
+
+    COMMENT("Different messages have their own descriptors");
+    TEST(dedup_Velocity_msg.field_info != dedup_Vec3_msg.field_info);
+    TEST(dedup_StampedPosition_msg.field_info != dedup_Stamped_msg.field_info);
+
+    {
+        dedup_StampedCopy msg = dedup_StampedCopy_init_zero;
+        dedup_StampedCopy decoded;
+        pb_byte_t buffer[64];
+        pb_ostream_t ostream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+        pb_istream_t istream;
+
+        COMMENT("Encode and decode with shared descriptor");
+        msg.time = 1234567;
+        msg.has_value = true;
+        msg.value.x = 1.5f;
+        msg.value.y = -2.0f;
+        msg.value.z = 3.25f;
+        TEST(pb_encode(&ostream, dedup_StampedCopy_fields, &msg));
+
+        istream = pb_istream_from_buffer(buffer, ostream.bytes_written);
+        TEST(pb_decode(&istream, dedup_StampedCopy_fields, &decoded));
+        TEST(decoded.time == 1234567 && decoded.has_value);
+        TEST(decoded.value.x == 1.5f && decoded.value.y == -2.0f && decoded.value.z == 3.25f);
+    }
+
+    {
+        dedup_Position msg;
+        pb_byte_t empty[1];
+        pb_istream_t istream = pb_istream_from_buffer(empty, 0);
+
+        COMMENT("Default values are shared");
+        memset(&msg, 0xFF, sizeof(msg));
+        TEST(!pb_decode(&istream, dedup_Position_fields, &msg));
+        TEST(strcmp(PB_GET_ERROR(&istream), "missing required field") == 0);
+        TEST(msg.x == 0.0f && msg.z == 1.0f);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
@@ -0,0 +1,62 @@
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include "unittests.h"
+#include "default_instance.pb.h"
+
+int main()
+{
+    int status = 0;
+
+    COMMENT("Default instance is used only for all-static messages");
+    TEST(Settings_msg.default_instance == &Settings_default_instance);
+    TEST(Config_msg.default_instance == &Config_default_instance);
+    TEST(Config_msg.struct_size == sizeof(Config));
+    TEST(WithCallback_msg.default_instance == NULL);
+    TEST(ContainsCallback_msg.default_instance == NULL);
+    TEST(NoInstance_msg.default_instance == NULL);
+
+    {
+        Config msg;
+        pb_byte_t data[] = {0x0A, 0x02, 0x08, 0x05};
+        pb_istream_t stream = pb_istream_from_buffer(data, sizeof(data));
+
+        COMMENT("Decoding initializes fields from the default instance");
+        memset(&msg, 0xAA, sizeof(msg));
+        TEST(pb_decode(&stream, Config_fields, &msg));
+        TEST(msg.settings.has_rate && msg.settings.rate == 5);
+        TEST(!msg.settings.has_name && strcmp(msg.settings.name, "sensor") == 0);
+        TEST(!msg.settings.has_mode && msg.settings.mode == Mode_MODE_SECOND);
+        TEST(msg.settings.values_count == 0);
+        TEST(!msg.has_gain && msg.gain == 1.5);
+        TEST(msg.which_choice == 0);
+    }
+
+    {
+        ContainsCallback msg;
+        pb_byte_t data[] = {0x0A, 0x00};
+        pb_istream_t stream = pb_istream_from_buffer(data, sizeof(data));
+
+        COMMENT("Callbacks are preserved in messages without default instance");
+        memset(&msg, 0, sizeof(msg));
+        msg.inner.name.arg = &msg;
+        TEST(pb_decode(&stream, ContainsCallback_fields, &msg));
+        TEST(msg.inner.rate == 100);
+        TEST(msg.inner.name.arg == &msg);
+    }
+
+    {
+        NoInstance msg;
+        pb_istream_t stream = pb_istream_from_buffer(NULL, 0);
+
+        COMMENT("Without the option, fields are initialized one by one");
+        memset(&msg, 0xAA, sizeof(msg));
+        TEST(pb_decode(&stream, NoInstance_fields, &msg));
+        TEST(!msg.has_rate && msg.rate == 100);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
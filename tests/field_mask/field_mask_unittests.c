@@ -0,0 +1,155 @@
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include "unittests.h"
+#include "field_mask.pb.h"
+
+static void set_point(Point *point, int32_t x, int32_t y, const char *label)
+{
+    point->x = x;
+    point->y = y;
+    point->has_label = true;
+    strcpy(point->label, label);
+}
+
+int main()
+{
+    int status = 0;
+    pb_byte_t buffer[512];
+    size_t msglen;
+
+    {
+        Shape msg = Shape_init_zero;
+        pb_ostream_t stream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+
+        msg.id = 42;
+        msg.has_name = true;
+        strcpy(msg.name, "a rather long name that is not needed");
+        msg.points_count = 3;
+        set_point(&msg.points[0], 1, 2, "first");
+        set_point(&msg.points[1], 3, 4, "second");
+        set_point(&msg.points[2], 5, 6, "third");
+        msg.has_center = true;
+        set_point(&msg.center, 7, 8, "center");
+        msg.which_kind = Shape_anchor_tag;
+        set_point(&msg.kind.anchor, 9, 10, "anchor");
+        msg.values_count = 4;
+        msg.values[0] = -1;
+        msg.values[1] = 1000;
+        msg.values[2] = 2;
+        msg.values[3] = 3;
+        TEST(pb_encode(&stream, Shape_fields, &msg));
+        msglen = stream.bytes_written;
+    }
+
+    {
+        Shape msg = Shape_init_zero;
+        uint32_t bits[Shape_MASK_WORDS] = {0};
+        pb_field_mask_t mask = {NULL, NULL};
+        pb_istream_t stream = pb_istream_from_buffer(buffer, msglen);
+
+        COMMENT("Decode a single field");
+        mask.bits = bits;
+        PB_SET_HAS_BIT(bits, Shape_id_index);
+        TEST(pb_decode_masked(&stream, Shape_fields, &msg, &mask, 0));
+        TEST(stream.bytes_left == 0);
+        TEST(msg.id == 42);
+        TEST(!msg.has_name && msg.name[0] == '\0');
+        TEST(msg.points_count == 0 && msg.values_count == 0);
+        TEST(!msg.has_center && msg.which_kind == 0);
+    }
+
+    {
+        Shape msg = Shape_init_zero;
+        uint32_t bits[Shape_MASK_WORDS] = {0};
+        uint32_t point_bits[Point_MASK_WORDS] = {0};
+        pb_field_mask_t point_mask = {NULL, NULL};
+        const pb_field_mask_t *submasks[Shape_MASK_WORDS * 32] = {NULL};
+        pb_field_mask_t mask = {NULL, NULL};
+        pb_istream_t stream = pb_istream_from_buffer(buffer, msglen);
+
+        COMMENT("Decode selected fields of submessages");
+        point_mask.bits = point_bits;
+        PB_SET_HAS_BIT(point_bits, Point_x_index);
+        mask.bits = bits;
+        mask.submasks = submasks;
+        PB_SET_HAS_BIT(bits, Shape_points_index);
+        PB_SET_HAS_BIT(bits, Shape_center_index);
+        PB_SET_HAS_BIT(bits, Shape_anchor_index);
+        submasks[Shape_points_index] = &point_mask;
+        submasks[Shape_anchor_index] = &point_mask;
+
+        TEST(pb_decode_masked(&stream, Shape_fields, &msg, &mask, 0));
+        TEST(msg.id == 0 && !msg.has_name);
+        TEST(msg.points_count == 3);
+        TEST(msg.points[0].x == 1 && msg.points[1].x == 3 && msg.points[2].x == 5);
+        TEST(msg.points[0].y == 0 && msg.points[2].y == 0);
+        TEST(!msg.points[1].has_label && msg.points[1].label[0] == '\0');
+        TEST(msg.has_center && msg.center.y == 8 && strcmp(msg.center.label, "center") == 0);
+        TEST(msg.which_kind == Shape_anchor_tag && msg.kind.anchor.x == 9);
+        TEST(msg.kind.anchor.y == 0 && !msg.kind.anchor.has_label);
+        TEST(msg.values_count == 0);
+    }
+
+    {
+        Shape expected = Shape_init_zero;
+        Shape msg = Shape_init_zero;
+        uint32_t bits[Shape_MASK_WORDS];
+        pb_field_mask_t mask = {NULL, NULL};
+        pb_istream_t stream;
+
+        COMMENT("Full mask gives the same result as pb_decode()");
+        memset(bits, 0xFF, sizeof(bits));
+        mask.bits = bits;
+        stream = pb_istream_from_buffer(buffer, msglen);
+        TEST(pb_decode(&stream, Shape_fields, &expected));
+        stream = pb_istream_from_buffer(buffer, msglen);
+        TEST(pb_decode_masked(&stream, Shape_fields, &msg, &mask, 0));
+        TEST(memcmp(&msg, &expected, sizeof(msg)) == 0);
+    }
+
+    {
+        /* Shape with only the name field, and the required id missing */
+        pb_byte_t data[] = {0x12, 0x02, 'h', 'i'};
+        Shape msg = Shape_init_zero;
+        uint32_t bits[Shape_MASK_WORDS] = {0};
+        pb_field_mask_t mask = {NULL, NULL};
+        pb_istream_t stream = pb_istream_from_buffer(data, sizeof(data));
+
+        COMMENT("Required fields are checked only inside the mask");
+        mask.bits = bits;
+        PB_SET_HAS_BIT(bits, Shape_name_index);
+        TEST(pb_decode_masked(&stream, Shape_fields, &msg, &mask, 0));
+        TEST(strcmp(msg.name, "hi") == 0);
+
+        PB_SET_HAS_BIT(bits, Shape_id_index);
+        stream = pb_istream_from_buffer(data, sizeof(data));
+        TEST(!pb_decode_masked(&stream, Shape_fields, &msg, &mask, 0));
+        TEST(strcmp(PB_GET_ERROR(&stream), "missing required field") == 0);
+    }
+
+    {
+        Shape msg = Shape_init_zero;
+        uint32_t bits[Shape_MASK_WORDS] = {0};
+        pb_field_mask_t mask = {NULL, NULL};
+        pb_byte_t data[sizeof(buffer) + 1];
+        pb_ostream_t ostream = pb_ostream_from_buffer(data, sizeof(data));
+        pb_istream_t stream;
+
+        COMMENT("Delimited message with flags");
+        TEST(pb_encode_varint(&ostream, msglen) && pb_write(&ostream, buffer, msglen));
+        mask.bits = bits;
+        PB_SET_HAS_BIT(bits, Shape_values_index);
+        stream = pb_istream_from_buffer(data, ostream.bytes_written);
+        TEST(pb_decode_masked(&stream, Shape_fields, &msg, &mask, PB_DECODE_DELIMITED));
+        TEST(stream.bytes_left == 0);
+        TEST(msg.values_count == 4 && msg.values[1] == 1000);
+        TEST(msg.points_count == 0);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
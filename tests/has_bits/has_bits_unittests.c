@@ -0,0 +1,108 @@
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include "unittests.h"
+#include "has_bits.pb.h"
+
+int main()
+{
+    int status = 0;
+    pb_byte_t buffer[128];
+    size_t msglen;
+
+    COMMENT("Presence bits take less space than has_ fields");
+    TEST(sizeof(FlagsBits) < sizeof(Flags));
+    TEST(sizeof(((FlagsBits*)0)->has_bits) == sizeof(uint32_t));
+
+    {
+        FlagsBits msg = FlagsBits_init_default;
+
+        COMMENT("Accessor macros");
+        TEST(!FlagsBits_has_f1(&msg) && !FlagsBits_has_f12(&msg));
+        TEST(msg.num == 7 && strcmp(msg.str, "x") == 0);
+        FlagsBits_set_has_f2(&msg);
+        FlagsBits_set_has_f12(&msg);
+        TEST(FlagsBits_has_f2(&msg) && FlagsBits_has_f12(&msg));
+        TEST(!FlagsBits_has_f1(&msg) && !FlagsBits_has_f3(&msg));
+        FlagsBits_clear_has_f2(&msg);
+        TEST(!FlagsBits_has_f2(&msg) && FlagsBits_has_f12(&msg));
+    }
+
+    {
+        Flags msg = Flags_init_zero;
+        pb_ostream_t stream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+
+        COMMENT("Encode message with has_ fields");
+        msg.has_f1 = true;
+        msg.f1 = true;
+        msg.has_f3 = true;
+        msg.f3 = false;
+        msg.req = -5;
+        msg.arr_count = 2;
+        msg.arr[0] = 1;
+        msg.arr[1] = 2;
+        msg.has_str = true;
+        strcpy(msg.str, "abc");
+        msg.has_inner = true;
+        msg.inner.has_value = true;
+        msg.inner.value = 9;
+        msg.which_choice = Flags_c2_tag;
+        msg.choice.c2 = true;
+        msg.has_f12 = true;
+        msg.f12 = true;
+        TEST(pb_encode(&stream, Flags_fields, &msg));
+        msglen = stream.bytes_written;
+    }
+
+    {
+        FlagsBits msg;
+        pb_byte_t buffer2[128];
+        pb_istream_t istream = pb_istream_from_buffer(buffer, msglen);
+        pb_ostream_t ostream = pb_ostream_from_buffer(buffer2, sizeof(buffer2));
+
+        COMMENT("Decode into presence bits");
+        memset(&msg, 0xAA, sizeof(msg));
+        TEST(pb_decode(&istream, FlagsBits_fields, &msg));
+        TEST(FlagsBits_has_f1(&msg) && msg.f1);
+        TEST(!FlagsBits_has_f2(&msg));
+        TEST(FlagsBits_has_f3(&msg) && !msg.f3);
+        TEST(!FlagsBits_has_f4(&msg));
+        TEST(!FlagsBits_has_num(&msg) && msg.num == 7);
+        TEST(msg.req == -5 && msg.arr_count == 2 && msg.arr[1] == 2);
+        TEST(FlagsBits_has_str(&msg) && strcmp(msg.str, "abc") == 0);
+        TEST(FlagsBits_has_inner(&msg) && msg.inner.has_value && msg.inner.value == 9);
+        TEST(msg.which_choice == FlagsBits_c2_tag && msg.choice.c2);
+        TEST(FlagsBits_has_f12(&msg) && msg.f12);
+        TEST(msg.has_bits[0] == 0x985);
+
+        COMMENT("Encoding from presence bits gives the same data");
+        TEST(pb_encode(&ostream, FlagsBits_fields, &msg));
+        TEST(ostream.bytes_written == msglen);
+        TEST(memcmp(buffer, buffer2, msglen) == 0);
+    }
+
+    {
+        FlagsBits msg = FlagsBits_init_zero;
+        Flags msg2 = Flags_init_zero;
+        pb_ostream_t ostream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+        pb_istream_t istream;
+
+        COMMENT("Fields without presence bit are not encoded");
+        msg.f1 = true;
+        msg.num = 10;
+        FlagsBits_set_has_f4(&msg);
+        msg.f4 = true;
+        TEST(pb_encode(&ostream, FlagsBits_fields, &msg));
+
+        istream = pb_istream_from_buffer(buffer, ostream.bytes_written);
+        TEST(pb_decode(&istream, Flags_fields, &msg2));
+        TEST(!msg2.has_f1 && !msg2.has_num);
+        TEST(msg2.has_f4 && msg2.f4);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
@@ -0,0 +1,57 @@
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include "unittests.h"
+#include "large_arrays.pb.h"
+
+static LargeArrays msg = LargeArrays_init_default;
+static LargeArrays decoded = LargeArrays_init_zero;
+static pb_byte_t buffer[LargeArrays_size];
+
+int main()
+{
+    int status = 0;
+    int i;
+
+    COMMENT("Zero-initialized tails of arrays");
+    TEST(msg.values_count == 0 && msg.values[4999] == 0);
+    TEST(msg.entries_count == 0 && msg.entries[999].weight == 0);
+    TEST(msg.names_count == 0 && msg.names[499][0] == '\0');
+    TEST(msg.fixed[0] == 0.0 && msg.fixed[1999] == 0.0);
+
+    COMMENT("Arrays of zero enums and submessages have compact initializers");
+    TEST(msg.modes[999] == Mode_OFF && msg.points[999].x == 0);
+
+    COMMENT("Fixed count arrays with non-zero defaults");
+    TEST(msg.levels[0] == Level_LOW && msg.levels[2] == Level_LOW);
+    TEST(msg.slots[0].weight == 5 && msg.slots[2].weight == 5);
+    TEST(decoded.levels[2] == Level_LOW && decoded.slots[2].weight == 0);
+
+    {
+        pb_ostream_t ostream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+        pb_istream_t istream;
+
+        COMMENT("Encode and decode large arrays");
+        msg.values_count = 5000;
+        for (i = 0; i < 5000; i++)
+            msg.values[i] = i;
+        msg.entries_count = 2;
+        msg.entries[1].id = 7;
+        msg.fixed[1999] = 1.5;
+        TEST(pb_encode(&ostream, LargeArrays_fields, &msg));
+
+        istream = pb_istream_from_buffer(buffer, ostream.bytes_written);
+        TEST(pb_decode(&istream, LargeArrays_fields, &decoded));
+        TEST(decoded.values_count == 5000 && decoded.values[4999] == 4999);
+        TEST(decoded.entries_count == 2 && decoded.entries[1].id == 7);
+        TEST(decoded.entries[1].weight == 5);
+        TEST(decoded.fixed[1999] == 1.5);
+        TEST(decoded.slots[2].weight == 5);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
@@ -0,0 +1,161 @@
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include "unittests.h"
+#include "lazy_submessage.pb.h"
+
+int main()
+{
+    int status = 0;
+    pb_byte_t buffer[128];
+    size_t msglen;
+
+    {
+        OuterStatic msg = OuterStatic_init_zero;
+        pb_ostream_t stream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+
+        COMMENT("Encode message with all submessages present");
+        msg.id = 1;
+        msg.has_lazy_inner = true;
+        msg.lazy_inner.value = 10;
+        msg.lazy_inner.has_s = true;
+        strcpy(msg.lazy_inner.s, "lazy");
+        msg.lazy_inner.has_extra = true;
+        msg.lazy_inner.extra = 1234;
+        msg.eager.value = 20;
+        msg.which_choice = OuterStatic_lazy_choice_tag;
+        msg.choice.lazy_choice.value = 30;
+        TEST(pb_encode(&stream, OuterStatic_fields, &msg));
+        msglen = stream.bytes_written;
+    }
+
+    {
+        Outer msg = Outer_init_zero;
+        pb_byte_t buffer2[128];
+        pb_istream_t istream = pb_istream_from_buffer(buffer, msglen);
+        pb_ostream_t ostream = pb_ostream_from_buffer(buffer2, sizeof(buffer2));
+
+        COMMENT("Untouched lazy fields are re-encoded verbatim");
+        TEST(pb_decode(&istream, Outer_fields, &msg));
+        TEST(msg.id == 1 && msg.eager.value == 20);
+        TEST(msg.has_lazy_inner && msg.lazy_inner.msg == NULL);
+        TEST(msg.lazy_inner.data.ptr > buffer && msg.lazy_inner.data.size > 0);
+        TEST(msg.which_choice == Outer_lazy_choice_tag);
+        TEST(pb_encode(&ostream, Outer_fields, &msg));
+        TEST(ostream.bytes_written == msglen);
+        TEST(memcmp(buffer, buffer2, msglen) == 0);
+    }
+
+    {
+        Outer msg = Outer_init_zero;
+        Inner storage = Inner_init_zero;
+        Inner storage2 = Inner_init_zero;
+        Inner choice = Inner_init_zero;
+        Inner *inner;
+        pb_istream_t istream = pb_istream_from_buffer(buffer, msglen);
+
+        COMMENT("Lazy fields are decoded on first access");
+        TEST(pb_decode(&istream, Outer_fields, &msg));
+        inner = Outer_lazy_inner_get(&msg, &storage);
+        TEST(inner == &storage);
+        TEST(inner->value == 10 && inner->has_s && strcmp(inner->s, "lazy") == 0);
+        TEST(msg.lazy_inner.msg == &storage);
+        TEST(Outer_lazy_inner_get(&msg, &storage2) == &storage);
+        TEST(storage2.value == 0);
+        inner = Outer_lazy_choice_get(&msg, &choice);
+        TEST(inner == &choice && choice.value == 30);
+
+        {
+            OuterStatic msg2 = OuterStatic_init_zero;
+            pb_byte_t buffer2[128];
+            pb_ostream_t ostream = pb_ostream_from_buffer(buffer2, sizeof(buffer2));
+
+            COMMENT("Accessed lazy fields are encoded from the struct");
+            storage.value = 11;
+            TEST(pb_encode(&ostream, Outer_fields, &msg));
+
+            istream = pb_istream_from_buffer(buffer2, ostream.bytes_written);
+            TEST(pb_decode(&istream, OuterStatic_fields, &msg2));
+            TEST(msg2.has_lazy_inner && msg2.lazy_inner.value == 11);
+            TEST(strcmp(msg2.lazy_inner.s, "lazy") == 0);
+            TEST(!msg2.lazy_inner.has_extra);
+            TEST(msg2.which_choice == OuterStatic_lazy_choice_tag);
+            TEST(msg2.choice.lazy_choice.value == 30);
+        }
+    }
+
+    {
+        Outer msg = Outer_init_zero;
+        Inner storage = Inner_init_zero;
+        OuterStatic msg2 = OuterStatic_init_zero;
+        pb_byte_t buffer2[128];
+        pb_ostream_t ostream = pb_ostream_from_buffer(buffer2, sizeof(buffer2));
+        pb_istream_t istream;
+
+        COMMENT("Encode lazy field set by the application");
+        storage.value = 42;
+        msg.has_lazy_inner = true;
+        msg.lazy_inner.msg = &storage;
+        msg.which_choice = Outer_number_tag;
+        msg.choice.number = 5;
+        TEST(pb_encode(&ostream, Outer_fields, &msg));
+
+        istream = pb_istream_from_buffer(buffer2, ostream.bytes_written);
+        TEST(pb_decode(&istream, OuterStatic_fields, &msg2));
+        TEST(msg2.has_lazy_inner && msg2.lazy_inner.value == 42);
+        TEST(msg2.which_choice == OuterStatic_number_tag && msg2.choice.number == 5);
+    }
+
+    {
+        Outer msg = Outer_init_zero;
+        Inner storage = Inner_init_zero;
+        pb_byte_t invalid[] = {0x08, 0x01, 0x12, 0x02, 0x08, 0x80, 0x1A, 0x02, 0x08, 0x01};
+        pb_istream_t istream = pb_istream_from_buffer(invalid, sizeof(invalid));
+
+        COMMENT("Errors in lazy fields are detected on access");
+        TEST(pb_decode(&istream, Outer_fields, &msg));
+        TEST(Outer_lazy_inner_get(&msg, &storage) == NULL);
+        TEST(msg.lazy_inner.msg == NULL);
+    }
+
+    {
+        Outer msg = Outer_init_zero;
+        pb_byte_t split[] = {0x08, 0x01, 0x12, 0x02, 0x08, 0x0A, 0x1A, 0x02, 0x08, 0x14,
+                             0x12, 0x06, 0x12, 0x04, 'l', 'a', 'z', 'y'};
+        pb_istream_t istream = pb_istream_from_buffer(split, sizeof(split));
+
+        COMMENT("Split lazy submessage is detected");
+        TEST(!pb_decode(&istream, Outer_fields, &msg));
+        TEST(strcmp(PB_GET_ERROR(&istream), "lazy submessage repeated") == 0);
+    }
+
+    {
+        Outer msg = Outer_init_zero;
+        pb_byte_t split[] = {0x08, 0x01, 0x1A, 0x02, 0x08, 0x14,
+                             0x22, 0x02, 0x08, 0x1E, 0x22, 0x02, 0x08, 0x1F};
+        pb_istream_t istream = pb_istream_from_buffer(split, sizeof(split));
+
+        COMMENT("Split lazy submessage in a oneof is detected");
+        TEST(!pb_decode(&istream, Outer_fields, &msg));
+        TEST(strcmp(PB_GET_ERROR(&istream), "lazy submessage repeated") == 0);
+    }
+
+    {
+        Outer msg = Outer_init_zero;
+        Inner storage = Inner_init_zero;
+        pb_byte_t data[] = {0x08, 0x01, 0x12, 0x00, 0x1A, 0x02, 0x08, 0x14,
+                            0x12, 0x02, 0x08, 0x0A, 0x28, 0x05, 0x22, 0x02, 0x08, 0x1E};
+        pb_istream_t istream = pb_istream_from_buffer(data, sizeof(data));
+
+        COMMENT("Empty occurrence before the data and changed oneof member");
+        TEST(pb_decode(&istream, Outer_fields, &msg));
+        TEST(Outer_lazy_inner_get(&msg, &storage) == &storage && storage.value == 10);
+        TEST(msg.which_choice == Outer_lazy_choice_tag);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
@@ -10,6 +10,14 @@ int main()
     uint8_t buffer[512];
     size_t size;
     
+    /* Check the number of required fields computed for the descriptors */
+    if (AllFields_msg.required_field_count != 64 ||
+        MissingField_msg.required_field_count != 63)
+    {
+        printf("Wrong required field count.\n");
+        return 4;
+    }
+
     /* Create a message with one missing field */
     {
         MissingField msg = {0};
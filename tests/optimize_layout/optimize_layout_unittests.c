@@ -0,0 +1,83 @@
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include "unittests.h"
+#include "optimize_layout.pb.h"
+
+int main()
+{
+    int status = 0;
+    pb_byte_t buffer1[Telemetry_size];
+    pb_byte_t buffer2[TelemetryOptimized_size];
+    size_t msglen;
+
+    COMMENT("Reordered struct has less padding");
+    TEST(sizeof(TelemetryOptimized) < sizeof(Telemetry));
+    TEST(Telemetry_size == TelemetryOptimized_size);
+
+    COMMENT("Reordering never makes the struct larger");
+    TEST(sizeof(OptionalsOptimized) <= sizeof(Optionals));
+
+    {
+        TelemetryOptimized msg = TelemetryOptimized_init_default;
+
+        COMMENT("Initializers follow the struct order");
+        TEST(!msg.valid && msg.timestamp == 0);
+        TEST(!msg.has_voltage && msg.voltage == 12.5);
+        TEST(!msg.has_label && strcmp(msg.label, "bat") == 0);
+        TEST(msg.cells_count == 0 && !msg.has_inner && msg.which_source == 0);
+    }
+
+    {
+        Telemetry msg1 = Telemetry_init_zero;
+        TelemetryOptimized msg2 = TelemetryOptimized_init_zero;
+        pb_ostream_t stream1 = pb_ostream_from_buffer(buffer1, sizeof(buffer1));
+        pb_ostream_t stream2 = pb_ostream_from_buffer(buffer2, sizeof(buffer2));
+
+        COMMENT("Encoded data is the same for both layouts");
+        msg1.valid = msg2.valid = true;
+        msg1.timestamp = msg2.timestamp = 1234.5;
+        msg1.has_sequence = msg2.has_sequence = true;
+        msg1.sequence = msg2.sequence = 200;
+        msg1.charging = msg2.charging = true;
+        msg1.cells_count = msg2.cells_count = 2;
+        msg1.cells[1] = msg2.cells[1] = 3.5f;
+        msg1.has_label = msg2.has_label = true;
+        strcpy(msg1.label, "abcd");
+        strcpy(msg2.label, "abcd");
+        msg1.energy = msg2.energy = -5;
+        msg1.has_inner = msg2.has_inner = true;
+        msg1.inner.value = msg2.inner.value = 7;
+        msg1.which_source = Telemetry_current_tag;
+        msg2.which_source = TelemetryOptimized_current_tag;
+        msg1.source.current = msg2.source.current = -1.25;
+
+        TEST(pb_encode(&stream1, Telemetry_fields, &msg1));
+        TEST(pb_encode(&stream2, TelemetryOptimized_fields, &msg2));
+        TEST(stream1.bytes_written == stream2.bytes_written);
+        TEST(memcmp(buffer1, buffer2, stream1.bytes_written) == 0);
+        msglen = stream1.bytes_written;
+    }
+
+    {
+        TelemetryOptimized msg = TelemetryOptimized_init_zero;
+        pb_istream_t stream = pb_istream_from_buffer(buffer1, msglen);
+
+        COMMENT("Decode into reordered struct");
+        TEST(pb_decode(&stream, TelemetryOptimized_fields, &msg));
+        TEST(msg.valid && msg.charging && msg.timestamp == 1234.5);
+        TEST(msg.has_sequence && msg.sequence == 200);
+        TEST(!msg.has_voltage && msg.voltage == 12.5);
+        TEST(msg.cells_count == 2 && msg.cells[1] == 3.5f);
+        TEST(msg.has_label && strcmp(msg.label, "abcd") == 0);
+        TEST(msg.energy == -5);
+        TEST(msg.has_inner && msg.inner.value == 7);
+        TEST(msg.which_source == TelemetryOptimized_current_tag && msg.source.current == -1.25);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
@@ -0,0 +1,64 @@
+#include <stdio.h>
+#include <string.h>
+#include <pb_common.h>
+#include "unittests.h"
+
+/* Descriptors generated by PB_BIND in the alltypes test case */
+extern const pb_msgdesc_t AllTypes_msg;
+extern const pb_msgdesc_t SubMessage_msg;
+extern const pb_msgdesc_t Limits_msg;
+
+/* Same messages generated with --plain-descriptors */
+extern const pb_msgdesc_t plain_AllTypes_msg;
+extern const pb_msgdesc_t plain_SubMessage_msg;
+extern const pb_msgdesc_t plain_Limits_msg;
+
+static bool descriptors_equal(const pb_msgdesc_t *a, const pb_msgdesc_t *b)
+{
+    pb_size_t i;
+    pb_size_t words = 0;
+
+    if (a->field_count != b->field_count ||
+        a->required_field_count != b->required_field_count ||
+        a->struct_size != b->struct_size ||
+        a->flags != b->flags)
+    {
+        return false;
+    }
+
+    for (i = 0; i < a->field_count; i++)
+    {
+        /* Lowest bits of the first word give the width of the entry */
+        words = (pb_size_t)(words + (1 << (a->field_info[words] & 3)));
+    }
+
+    if (memcmp(a->field_info, b->field_info, words * sizeof(uint32_t)) != 0)
+        return false;
+
+    for (i = 0; a->submsg_info[i] != NULL; i++)
+    {
+        if (b->submsg_info[i] == NULL ||
+            a->submsg_info[i]->struct_size != b->submsg_info[i]->struct_size)
+        {
+            return false;
+        }
+    }
+
+    return b->submsg_info[i] == NULL;
+}
+
+int main()
+{
+    int status = 0;
+
+    COMMENT("Plain descriptors are identical to PB_BIND output");
+    TEST(descriptors_equal(&SubMessage_msg, &plain_SubMessage_msg));
+    TEST(descriptors_equal(&Limits_msg, &plain_Limits_msg));
+    TEST(descriptors_equal(&AllTypes_msg, &plain_AllTypes_msg));
+    TEST(plain_AllTypes_msg.submsg_info[0] == &plain_SubMessage_msg);
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
@@ -0,0 +1,284 @@
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include "unittests.h"
+#include "resumable_decode.pb.h"
+
+typedef struct
+{
+    pb_byte_t data[32];
+    size_t size;
+} blob_t;
+
+static bool encode_blob(pb_ostream_t *stream, const pb_field_t *field, void * const *arg)
+{
+    const blob_t *blob = (const blob_t*)*arg;
+    return pb_encode_tag_for_field(stream, field) &&
+           pb_encode_string(stream, blob->data, blob->size);
+}
+
+static bool decode_blob(pb_istream_t *stream, const pb_field_t *field, void **arg)
+{
+    blob_t *blob = (blob_t*)*arg;
+    PB_UNUSED(field);
+    blob->size = stream->bytes_left;
+    return pb_read(stream, blob->data, stream->bytes_left);
+}
+
+/* Feed the data one byte at a time, returning the final status */
+static pb_decoder_status_t feed_bytes(pb_decoder_t *decoder, const pb_byte_t *data, size_t size)
+{
+    pb_decoder_status_t result = PB_DECODER_NEED_MORE;
+    size_t i;
+
+    for (i = 0; i < size && result == PB_DECODER_NEED_MORE; i++)
+        result = pb_decoder_feed(decoder, data + i, 1, NULL);
+
+    return result;
+}
+
+/* Decode the data both with pb_decode() and with pb_decoder_t fed one byte
+ * at a time. Returns true if both succeed or both fail, and the result of
+ * pb_decode() in *ok. */
+static bool same_result(const pb_byte_t *data, size_t size, Tree *msg1, Tree *msg2, bool *ok)
+{
+    pb_istream_t stream = pb_istream_from_buffer(data, size);
+    pb_byte_t scratch[64];
+    pb_decoder_t decoder;
+    bool status;
+
+    *ok = pb_decode(&stream, Tree_fields, msg1);
+    status = pb_decoder_init(&decoder, Tree_fields, msg2, scratch, sizeof(scratch), 0) &&
+             feed_bytes(&decoder, data, size) != PB_DECODER_ERROR &&
+             pb_decoder_finish(&decoder);
+    return status == *ok;
+}
+
+int main()
+{
+    int status = 0;
+    pb_byte_t buffer[256];
+    size_t msglen;
+    blob_t blob = {"\x00\x01\x02 blob data", 14};
+
+    {
+        Tree msg = Tree_init_zero;
+        pb_ostream_t stream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+
+        msg.has_branch = true;
+        msg.branch.leaves_count = 2;
+        msg.branch.leaves[0].value = 1;
+        msg.branch.leaves[1].value = -200000;
+        msg.branch.leaves[1].has_text = true;
+        strcpy(msg.branch.leaves[1].text, "second");
+        msg.branch.packed_count = 3;
+        msg.branch.packed[0] = -1;
+        msg.branch.packed[1] = 1000000;
+        msg.branch.packed[2] = 3;
+        msg.blob.funcs.encode = encode_blob;
+        msg.blob.arg = &blob;
+        msg.has_name = true;
+        msg.name.ptr = (const pb_byte_t*)"view";
+        msg.name.size = 4;
+        msg.has_id = true;
+        msg.id = 42;
+        msg.which_choice = Tree_leaf_tag;
+        msg.choice.leaf.value = 5;
+        TEST(pb_encode_delimited(&stream, Tree_fields, &msg));
+        msglen = stream.bytes_written;
+    }
+
+    {
+        Tree msg = Tree_init_zero;
+        blob_t result = {{0}, 0};
+        pb_byte_t scratch[32];
+        pb_decoder_t decoder;
+
+        COMMENT("Nested, packed, callback and view fields");
+        msg.blob.funcs.decode = decode_blob;
+        msg.blob.arg = &result;
+        TEST(pb_decoder_init(&decoder, Tree_fields, &msg, scratch, sizeof(scratch), PB_DECODE_DELIMITED | PB_DECODE_NOINIT));
+        TEST(feed_bytes(&decoder, buffer, msglen) == PB_DECODER_DONE);
+        TEST(decoder.pos == msglen);
+        TEST(pb_decoder_finish(&decoder));
+        TEST(msg.has_branch && msg.branch.leaves_count == 2);
+        TEST(msg.branch.leaves[1].value == -200000 && strcmp(msg.branch.leaves[1].text, "second") == 0);
+        TEST(!msg.branch.leaves[0].has_text);
+        TEST(msg.branch.packed_count == 3 && msg.branch.packed[1] == 1000000);
+        TEST(result.size == blob.size && memcmp(result.data, blob.data, blob.size) == 0);
+        TEST(msg.has_name && msg.name.size == 4 && memcmp(msg.name.ptr, "view", 4) == 0);
+        TEST(msg.name.ptr >= scratch && msg.name.ptr < scratch + sizeof(scratch));
+        TEST(msg.has_id && msg.id == 42);
+        TEST(msg.which_choice == Tree_leaf_tag && msg.choice.leaf.value == 5);
+    }
+
+    {
+        pb_byte_t stream[512];
+        pb_byte_t scratch[32];
+        pb_decoder_t decoder;
+        Tree msg = Tree_init_zero;
+        size_t used;
+        size_t pos;
+        int count = 0;
+
+        COMMENT("Consecutive delimited messages in one piece");
+        memcpy(stream, buffer, msglen);
+        memcpy(stream + msglen, buffer, msglen);
+
+        for (pos = 0; pos < 2 * msglen; pos += used)
+        {
+            TEST(pb_decoder_init(&decoder, Tree_fields, &msg, scratch, sizeof(scratch), PB_DECODE_DELIMITED));
+            TEST(pb_decoder_feed(&decoder, stream + pos, 2 * msglen - pos, &used) == PB_DECODER_DONE);
+            TEST(used == msglen);
+            count++;
+        }
+        TEST(count == 2 && msg.id == 42);
+    }
+
+    {
+        Tree msg = Tree_init_zero;
+        pb_byte_t scratch[8];
+        pb_decoder_t decoder;
+
+        COMMENT("Scratch buffer too small");
+        TEST(pb_decoder_init(&decoder, Tree_fields, &msg, scratch, sizeof(scratch), PB_DECODE_DELIMITED));
+        TEST(feed_bytes(&decoder, buffer, msglen) == PB_DECODER_ERROR);
+        TEST(strcmp(PB_GET_ERROR(&decoder), "scratch full") == 0);
+        TEST(pb_decoder_feed(&decoder, buffer, 1, NULL) == PB_DECODER_ERROR);
+    }
+
+    {
+        /* Leaf without the required value */
+        pb_byte_t data[] = {0x2A, 0x04, 0x12, 0x02, 'h', 'i'};
+        Tree msg = Tree_init_zero;
+        pb_decoder_t decoder;
+
+        COMMENT("Missing required field in submessage");
+        TEST(pb_decoder_init(&decoder, Tree_fields, &msg, NULL, 0, 0));
+        TEST(pb_decoder_feed(&decoder, data, sizeof(data), NULL) == PB_DECODER_ERROR);
+        TEST(strcmp(PB_GET_ERROR(&decoder), "missing required field") == 0);
+    }
+
+    {
+        /* Submessage length goes past the end of the message */
+        pb_byte_t data[] = {0x06, 0x0A, 0x08, 0x0A, 0x02, 0x08, 0x01};
+        Tree msg = Tree_init_zero;
+        pb_decoder_t decoder;
+
+        COMMENT("Invalid submessage length");
+        TEST(pb_decoder_init(&decoder, Tree_fields, &msg, NULL, 0, PB_DECODE_DELIMITED));
+        TEST(pb_decoder_feed(&decoder, data, sizeof(data), NULL) == PB_DECODER_ERROR);
+        TEST(strcmp(PB_GET_ERROR(&decoder), "parent stream too short") == 0);
+    }
+
+    {
+        /* Five packed values for leaves[4] is fine, nine values overflow */
+        pb_byte_t data[] = {0x0A, 0x0B, 0x12, 0x09, 1, 2, 3, 4, 5, 6, 7, 8, 9};
+        Tree msg = Tree_init_zero;
+        pb_decoder_t decoder;
+
+        COMMENT("Packed array overflow");
+        TEST(pb_decoder_init(&decoder, Tree_fields, &msg, NULL, 0, 0));
+        TEST(feed_bytes(&decoder, data, sizeof(data)) == PB_DECODER_ERROR);
+        TEST(strcmp(PB_GET_ERROR(&decoder), "array overflow") == 0);
+        TEST(msg.branch.packed_count == 8);
+    }
+
+    {
+        /* id with wire type 3, and the fixed64 oneof member with wire type 0 */
+        pb_byte_t data[] = {0x23, 0x05, 0x30, 1, 2, 3, 4, 5, 6, 7, 8};
+        Tree msg1 = Tree_init_zero;
+        Tree msg2 = Tree_init_zero;
+        bool ok;
+
+        COMMENT("Wire type mismatches are handled like in pb_decode()");
+        TEST(same_result(data, sizeof(data), &msg1, &msg2, &ok) && ok);
+        TEST(msg1.id == 5 && msg2.id == 5);
+        TEST(msg2.which_choice == Tree_number_tag && msg2.choice.number == msg1.choice.number);
+    }
+
+    {
+        /* Length-delimited data for id is read as a varint, and the rest
+         * as the following tags */
+        pb_byte_t data[] = {0x22, 0x02, 0x20, 0x07};
+        pb_byte_t data2[] = {0x22, 0x01, 0x05};
+        Tree msg1 = Tree_init_zero;
+        Tree msg2 = Tree_init_zero;
+        bool ok;
+
+        COMMENT("Length-delimited data for a scalar field");
+        TEST(same_result(data, sizeof(data), &msg1, &msg2, &ok) && ok);
+        TEST(msg1.id == 7 && msg2.id == 7);
+        TEST(same_result(data2, sizeof(data2), &msg1, &msg2, &ok) && !ok);
+    }
+
+    {
+        /* Packed array, and a submessage that contains a zero tag */
+        pb_byte_t data[] = {0x0A, 0x05, 0x12, 0x03, 0x02, 0x04, 0x06};
+        pb_byte_t data2[] = {0x0A, 0x05, 0x0A, 0x03, 0x08, 0x01, 0x00};
+        Tree msg1 = Tree_init_zero;
+        Tree msg2 = Tree_init_zero;
+        bool ok;
+
+        COMMENT("Packed and malformed submessage data");
+        TEST(same_result(data, sizeof(data), &msg1, &msg2, &ok) && ok);
+        TEST(msg2.branch.packed_count == 3 && msg2.branch.packed[2] == 3);
+        TEST(same_result(data2, sizeof(data2), &msg1, &msg2, &ok) && !ok);
+    }
+
+    {
+        /* id = 7, unknown tag 291 = "abcd", ext_name = "ext" */
+        pb_byte_t data[] = {0x08, 0x07, 0x9A, 0x12, 0x04, 'a', 'b', 'c', 'd',
+                            0xA2, 0x06, 0x03, 'e', 'x', 't'};
+        Extendable msg = Extendable_init_zero;
+        pb_decoder_t decoder;
+
+        COMMENT("Unknown tags in extension range are skipped without scratch");
+        TEST(pb_decoder_init(&decoder, Extendable_fields, &msg, NULL, 0, 0));
+        TEST(feed_bytes(&decoder, data, 9) == PB_DECODER_NEED_MORE);
+        TEST(pb_decoder_finish(&decoder));
+        TEST(msg.id == 7);
+
+        COMMENT("Registered extensions are still decoded");
+        {
+            pb_byte_t scratch[4];
+            char ext_name_value[16] = "";
+            pb_extension_t ext;
+            memset(&ext, 0, sizeof(ext));
+            ext.type = &ext_name;
+            ext.dest = ext_name_value;
+            msg.extensions = &ext;
+            TEST(pb_decoder_init(&decoder, Extendable_fields, &msg, scratch, sizeof(scratch), PB_DECODE_NOINIT));
+            TEST(feed_bytes(&decoder, data, sizeof(data)) == PB_DECODER_NEED_MORE);
+            TEST(pb_decoder_finish(&decoder));
+            TEST(ext.found && strcmp(ext_name_value, "ext") == 0);
+        }
+    }
+
+    {
+        Tree msg1 = Tree_init_zero;
+        Tree msg2 = Tree_init_zero;
+        size_t mismatches = 0;
+        size_t failures = 0;
+        size_t i;
+        bool ok;
+
+        COMMENT("Truncated messages give the same result as pb_decode()");
+        TEST(buffer[0] == msglen - 1);
+        for (i = 0; i < msglen; i++)
+        {
+            if (!same_result(buffer + 1, i, &msg1, &msg2, &ok))
+                mismatches++;
+            if (!ok)
+                failures++;
+        }
+        TEST(mismatches == 0);
+        TEST(failures > 0);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
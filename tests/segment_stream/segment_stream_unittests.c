@@ -0,0 +1,133 @@
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include "unittests.h"
+#include "segment_stream.pb.h"
+
+static Chunk msg;
+static Chunk decoded;
+static pb_byte_t expected[Chunk_size];
+static pb_byte_t joined[Chunk_size];
+
+/* Copy the segments after each other into joined[] */
+static size_t join_segments(const pb_ostream_segments_t *state)
+{
+    size_t i;
+    size_t pos = 0;
+    for (i = 0; i < state->segment_count; i++)
+    {
+        memcpy(joined + pos, state->segments[i].data, state->segments[i].size);
+        pos += state->segments[i].size;
+    }
+    return pos;
+}
+
+static void fill_message(Chunk *chunk)
+{
+    int i;
+    memset(chunk, 0, sizeof(*chunk));
+    chunk->id = 7;
+    chunk->data.size = 1000;
+    for (i = 0; i < 1000; i++)
+        chunk->data.bytes[i] = (pb_byte_t)i;
+    chunk->has_name = true;
+    strcpy(chunk->name, "short name");
+    chunk->parts_count = 2;
+    chunk->parts[0].size = 200;
+    memset(chunk->parts[0].bytes, 'A', 200);
+    chunk->parts[1].size = 3;
+    memset(chunk->parts[1].bytes, 'B', 3);
+    chunk->has_inner = true;
+    chunk->inner.payload.size = 300;
+    memset(chunk->inner.payload.bytes, 'C', 300);
+    chunk->has_digest = true;
+    memset(chunk->digest, 'D', 32);
+    chunk->has_crc = true;
+    chunk->crc = 12345;
+}
+
+int main()
+{
+    int status = 0;
+    size_t msglen;
+
+    {
+        pb_ostream_t stream = pb_ostream_from_buffer(expected, sizeof(expected));
+        fill_message(&msg);
+        TEST(pb_encode(&stream, Chunk_fields, &msg));
+        msglen = stream.bytes_written;
+    }
+
+    {
+        pb_segment_t segments[16];
+        pb_byte_t scratch[128];
+        pb_ostream_segments_t state;
+        pb_ostream_t stream = pb_ostream_segments(&state, segments, 16, scratch, sizeof(scratch), 100);
+        pb_istream_t istream;
+
+        COMMENT("Large fields are referenced");
+        TEST(pb_encode(&stream, Chunk_fields, &msg));
+        TEST(stream.bytes_written == msglen);
+        TEST(state.segment_count == 7);
+        TEST(segments[1].data == msg.data.bytes && segments[1].size == 1000);
+        TEST(segments[3].data == msg.parts[0].bytes && segments[3].size == 200);
+        TEST(segments[5].data == msg.inner.payload.bytes && segments[5].size == 300);
+        TEST(segments[0].data == scratch && segments[2].data == segments[0].data + segments[0].size);
+        TEST(state.scratch_used < 100);
+
+        COMMENT("Joined segments match normal encoding");
+        TEST(join_segments(&state) == msglen);
+        TEST(memcmp(joined, expected, msglen) == 0);
+
+        istream = pb_istream_from_buffer(joined, msglen);
+        TEST(pb_decode(&istream, Chunk_fields, &decoded));
+        TEST(decoded.inner.payload.size == 300 && decoded.parts[1].bytes[2] == 'B');
+    }
+
+    {
+        pb_segment_t segments[16];
+        pb_byte_t scratch[128];
+        pb_ostream_segments_t state;
+        pb_ostream_t stream = pb_ostream_segments(&state, segments, 16, scratch, sizeof(scratch), 1);
+
+        COMMENT("Threshold 1 references all field data");
+        TEST(pb_encode(&stream, Chunk_fields, &msg));
+        TEST(join_segments(&state) == msglen);
+        TEST(memcmp(joined, expected, msglen) == 0);
+        TEST(segments[3].data == (const pb_byte_t*)msg.name);
+    }
+
+    {
+        pb_segment_t segments[16];
+        pb_byte_t scratch[sizeof(expected)];
+        pb_ostream_segments_t state;
+        pb_ostream_t stream = pb_ostream_segments(&state, segments, 16, scratch, sizeof(scratch), (size_t)-1);
+
+        COMMENT("Without references, everything is a single segment");
+        TEST(pb_encode(&stream, Chunk_fields, &msg));
+        TEST(state.segment_count == 1 && segments[0].size == msglen);
+        TEST(memcmp(scratch, expected, msglen) == 0);
+    }
+
+    {
+        pb_segment_t segments[4];
+        pb_byte_t scratch[128];
+        pb_ostream_segments_t state;
+        pb_ostream_t stream = pb_ostream_segments(&state, segments, 4, scratch, sizeof(scratch), 100);
+
+        COMMENT("Running out of segments");
+        TEST(!pb_encode(&stream, Chunk_fields, &msg));
+        TEST(strcmp(PB_GET_ERROR(&stream), "too many segments") == 0);
+
+        COMMENT("Running out of scratch space");
+        stream = pb_ostream_segments(&state, segments, 4, scratch, 4, 100);
+        TEST(!pb_encode(&stream, Chunk_fields, &msg));
+        TEST(strcmp(PB_GET_ERROR(&stream), "scratch full") == 0);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
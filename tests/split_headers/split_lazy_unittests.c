@@ -0,0 +1,28 @@
+/* Uses only the header of Holder, which should still bring in the
+ * declarations needed by the accessor of its lazy field. */
+
+#include <stdio.h>
+#include <pb_decode.h>
+#include "unittests.h"
+#include "split_lazy_Holder.pb.h"
+
+int main()
+{
+    int status = 0;
+    pb_byte_t buffer[] = {0x08, 0x01, 0x12, 0x02, 0x08, 0x05};
+    Holder msg = Holder_init_zero;
+    Leaf storage = Leaf_init_zero;
+    Leaf *leaf;
+    pb_istream_t stream = pb_istream_from_buffer(buffer, sizeof(buffer));
+
+    COMMENT("Lazy field accessor with a single message header");
+    TEST(pb_decode(&stream, Holder_fields, &msg));
+    TEST(msg.id == 1 && msg.has_leaf);
+    leaf = Holder_leaf_get(&msg, &storage);
+    TEST(leaf == &storage && leaf->value == 5);
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
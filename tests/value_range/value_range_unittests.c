@@ -0,0 +1,112 @@
+#include <stdio.h>
+#include <string.h>
+#include <pb_decode.h>
+#include <pb_encode.h>
+#include "unittests.h"
+#include "value_range.pb.h"
+
+int main()
+{
+    int status = 0;
+
+    {
+        Reading msg;
+
+        COMMENT("Smallest integer type is selected from the range");
+        TEST(sizeof(msg.temperature) == 2);
+        TEST(sizeof(msg.percent) == 1);
+        TEST(sizeof(msg.offset) == 2);
+        TEST(sizeof(msg.counter) == 4);
+        TEST(sizeof(msg.big) == 2);
+        TEST(sizeof(msg.deltas[0]) == 1);
+        TEST(sizeof(msg.source.channel) == 1);
+        TEST(sizeof(msg.unlimited) == 4);
+        TEST(Reading_temperature_max_value == 12500);
+        TEST(Reading_temperature_scale == 100.0);
+    }
+
+    {
+        Reading msg = Reading_init_zero;
+        pb_byte_t buffer[Reading_size];
+        pb_ostream_t stream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+
+        COMMENT("Values at the ends of the range fit in Reading_size");
+        TEST(Reading_size == 54);
+        msg.temperature = -4000;
+        msg.percent = 100;
+        msg.offset = -1000;
+        msg.has_counter = true;
+        msg.counter = 100000;
+        msg.big = 65535;
+        msg.deltas_count = 4;
+        msg.deltas[0] = -64;
+        msg.deltas[1] = 63;
+        msg.deltas[2] = -64;
+        msg.deltas[3] = 63;
+        msg.which_source = Reading_other_tag;
+        msg.source.other = -100;
+        msg.unlimited = -1;
+        TEST(Reading_check_ranges(&msg));
+        TEST(pb_encode(&stream, Reading_fields, &msg));
+        TEST(stream.bytes_written <= Reading_size);
+    }
+
+    {
+        Sample msg = Sample_init_zero;
+
+        COMMENT("Out of range values are detected");
+        msg.history_count = 2;
+        TEST(Sample_check_ranges(&msg));
+
+        msg.reading.temperature = 12501;
+        TEST(!Sample_check_ranges(&msg));
+        msg.reading.temperature = 12500;
+        TEST(Sample_check_ranges(&msg));
+
+        msg.history[1].percent = 101;
+        TEST(!Sample_check_ranges(&msg));
+        msg.history_count = 1;
+        TEST(Sample_check_ranges(&msg));
+
+        msg.reading.counter = -1;
+        TEST(Sample_check_ranges(&msg));
+        msg.reading.has_counter = true;
+        TEST(!Sample_check_ranges(&msg));
+        msg.reading.counter = 0;
+
+        msg.reading.source.channel = 16;
+        TEST(Sample_check_ranges(&msg));
+        msg.reading.which_source = Reading_channel_tag;
+        TEST(!Sample_check_ranges(&msg));
+        msg.reading.source.channel = 15;
+
+        msg.reading.deltas[3] = 64;
+        TEST(Sample_check_ranges(&msg));
+        msg.reading.deltas_count = 4;
+        TEST(!Sample_check_ranges(&msg));
+    }
+
+    {
+        Extremes msg = Extremes_init_zero;
+
+        COMMENT("Negative limits can be used in expressions");
+        TEST(Extremes_lowest_min_value == INT64_MIN);
+        TEST(1000-Extremes_negative_min_value == 2000);
+        TEST(-Extremes_negative_max_value == 10);
+        msg.lowest = INT64_MIN;
+        msg.negative = -10;
+        TEST(Extremes_check_ranges(&msg));
+        msg.negative = -9;
+        TEST(!Extremes_check_ranges(&msg));
+        msg.negative = -1001;
+        TEST(!Extremes_check_ranges(&msg));
+        msg.negative = -1000;
+        msg.lowest = 1;
+        TEST(!Extremes_check_ranges(&msg));
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}